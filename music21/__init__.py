@@ -192,83 +192,31 @@ from music21.base import VERSION_STR  # noqa: E402
 
 __version__ = VERSION_STR
 
-from music21.test.testRunner import mainTest  # noqa: E402
-
 # -----------------------------------------------------------------------------
-# now import all modules to make them accessible from "import music21"
-from music21 import abcFormat  # noqa: E402
-from music21 import alpha  # noqa: E402
-from music21 import analysis  # noqa: E402
-from music21 import audioSearch  # noqa: E402
-from music21 import braille  # noqa: E402
-from music21 import capella  # noqa: E402
-from music21 import chord  # noqa: E402
+# Submodules and subpackages are imported on first attribute access
+# (PEP 562), so that `import music21` or `from music21 import note` does not
+# pay for loading converter, corpus, analysis, braille, etc.  Modules that
+# base.py depends on are already loaded at this point.  `from music21 import *`
+# still imports everything listed in __all__.
 from music21 import common  # noqa: E402
-from music21 import converter  # noqa: E402
-from music21 import corpus  # noqa: E402
-from music21 import features  # noqa: E402
-from music21 import figuredBass  # noqa: E402
-from music21 import graph  # noqa: E402
-from music21 import humdrum  # noqa: E402
-from music21 import ipython21  # noqa: E402
-from music21 import languageExcerpts  # noqa: E402
-from music21 import lily  # noqa: E402
-from music21 import mei  # noqa: E402
-from music21 import metadata  # noqa: E402
-from music21 import meter  # noqa: E402
-from music21 import midi  # noqa: E402
-from music21 import musedata  # noqa: E402
-from music21 import musicxml  # noqa: E402
-from music21 import noteworthy  # noqa: E402
-from music21 import omr  # noqa: E402
-from music21 import romanText  # noqa: E402
-from music21 import scale  # noqa: E402
-from music21 import search  # noqa: E402
-from music21 import stream  # noqa: E402
-from music21 import test  # noqa: E402
-from music21 import tree  # noqa: E402
-from music21 import vexflow  # noqa: E402
-
-# individual modules
-from music21 import articulations  # noqa: E402
-from music21 import bar  # noqa: E402
-# base already imported
-from music21 import beam  # noqa: E402
-from music21 import clef  # noqa: E402
-from music21 import configure  # noqa: E402
-from music21 import defaults  # noqa: E402
-from music21 import derivation  # noqa: E402
-from music21 import duration  # noqa: E402
-from music21 import dynamics  # noqa: E402
-from music21 import editorial  # noqa: E402
-from music21 import environment  # noqa: E402
-from music21 import exceptions21  # noqa: E402
-from music21 import expressions  # noqa: E402
-from music21 import freezeThaw  # noqa: E402
-from music21 import harmony  # noqa: E402
-from music21 import instrument  # noqa: E402
-from music21 import interval  # noqa: E402
-from music21 import key  # noqa: E402
-from music21 import layout  # noqa: E402
-from music21 import note  # noqa: E402
-from music21 import percussion  # noqa: E402
-from music21 import pitch  # noqa: E402
-# prebase already imported
-from music21 import repeat  # noqa: E402
-from music21 import roman  # noqa: E402
-from music21 import serial  # noqa: E402
-from music21 import sieve  # noqa: E402
-# sites already imported
-from music21 import sorting  # noqa: E402
-from music21 import spanner  # noqa: E402
-from music21 import style  # noqa: E402
-from music21 import tablature  # noqa: E402
-from music21 import tempo  # noqa: E402
-from music21 import text  # noqa: E402
-from music21 import tie  # noqa: E402
-from music21 import tinyNotation  # noqa: E402
-from music21 import variant  # noqa: E402
-from music21 import voiceLeading  # noqa: E402
-from music21 import volpiano  # noqa: E402
-from music21 import volume  # noqa: E402
+
+
+def __getattr__(name: str):
+    if name == 'mainTest':
+        # loading the test runner imports the music21.test package
+        from music21.test.testRunner import mainTest
+        return mainTest
+    if name in __all__:
+        import importlib
+        return importlib.import_module('music21.' + name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if common.runningInNotebook():
+    # ipython21 sets up its extension when it is imported
+    from music21 import ipython21  # noqa: E402
 
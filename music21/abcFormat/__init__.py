@@ -59,11 +59,14 @@ __all__ = [
     'ABCNote', 'ABCChord',
     'ABCHandler', 'ABCHandlerBar',
     'mergeLeadingMetaData',
+    'ABCReferenceIndex',
     'ABCFile',
 ]
 
 from collections.abc import Sequence
 import io
+import json
+import pathlib
 import re
 import typing as t
 import unittest
@@ -77,7 +80,6 @@ from music21 import prebase
 from music21.abcFormat import translate
 
 if t.TYPE_CHECKING:
-    import pathlib
     from music21 import bar
     from music21 import clef
     from music21 import duration
@@ -127,6 +129,7 @@ reChordSymbol = re.compile('"[^"]*"')  # non-greedy
 reChord = re.compile('[.*?]')  # non-greedy
 reAbcVersion = re.compile(r'%abc-(\d+)\.(\d+)\.?(\d+)?')
 reDirective = re.compile(r'^%%([a-z\-]+)\s+(\S+)(.*)')
+reReferenceNumberLine = re.compile(rb'^[ \t]*X:[ \t]*(\d+)', re.MULTILINE)
 
 
 # ------------------------------------------------------------------------------
@@ -1831,6 +1834,47 @@ class ABCChord(ABCNote):
         self.quarterLength = outer_lengthModifier * inner_quarterLength
 
 
+# ------------------------------------------------------------------------------
+# tables for ABCHandler.tokenize()
+
+# the barlines of ABC_BARS as one pattern; alternatives are tried in the same order
+reBarline = re.compile('|'.join(re.escape(barSymbol) for barSymbol, unused_name in ABC_BARS))
+# what follows the pitch letter of a note: register (octave) modifications and rhythm
+reNoteSuffix = re.compile(r"[0-9,/']*")
+reSpaces = re.compile(r'[ \n\t\r]+')
+
+_SINGLE_CHARACTER_TOKENS: dict[str, type[ABCToken]] = {
+    ')': ABCParenStop,
+    '-': ABCTie,
+    '.': ABCStaccato,
+    'u': ABCUpbow,
+    '{': ABCGraceStart,
+    '}': ABCGraceStop,
+    'v': ABCDownbow,
+    'K': ABCAccent,
+    'k': ABCStraccent,
+    'M': ABCTenuto,
+}
+
+_EXCLAMATION_TOKENS: dict[str, type[ABCToken]] = {
+    '!crescendo(!': ABCCrescStart,
+    '!crescendo)!': ABCParenStop,
+    '!diminuendo(!': ABCDimStart,
+    '!diminuendo)!': ABCParenStop,
+}
+
+# note events that are not (yet) supported, or are errors in encoded files
+_SKIPPED_NOTE_EVENTS = frozenset([
+    'w', 'u', 'v', 'v.', 'h', 'H', 'vk',
+    'uk', 'U', '~',
+    '.', '=', 'V', 'v.', 'S', 's',
+    'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
+    'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
+    'l', 'L', 'R',
+    'y', 'T', 't', 'x', 'Z',
+])
+
+
 # ------------------------------------------------------------------------------
 class ABCHandler:
     '''
@@ -1936,11 +1980,10 @@ class ABCHandler:
         >>> inputString[ah._getNextLineBreak(inputString, 0):]
         '\n wer bfg\n'
         '''
-        lastIndex = len(strSrc) - 1
-        for j in range(i + 1, lastIndex + 1):
-            if strSrc[j] == '\n':
-                return j
-        return lastIndex + 1
+        j = strSrc.find('\n', i + 1)
+        if j == -1:
+            return len(strSrc)
+        return j
 
     @staticmethod
     def barlineTokenFilter(token: str) -> list[ABCBar]:
@@ -2155,6 +2198,10 @@ class ABCHandler:
         '''
         Walk the abc string, creating ABC objects along the way.
 
+        The string is read in a single pass: each token is recognized from
+        its first character, and its extent is found with the precompiled
+        patterns `reBarline`, `reNoteSuffix` and `reSpaces` where possible.
+
         This may be called separately from process(), in the case
         that pre-/post-parse processing is not needed.
 
@@ -2184,241 +2231,70 @@ class ABCHandler:
         >>> abch.tokenize('(6::2f')
         >>> abch.tokens
         [<music21.abcFormat.ABCTuplet '(6::2'>, <music21.abcFormat.ABCNote 'f'>]
+
+        * Changed in v9.3: rewritten as a single pass over the string.
         '''
-        self.srcLen = len(strSrc)
+        self.srcLen = srcLen = len(strSrc)
         self.strSrc = strSrc
-        self.pos = -1
-        self.currentCollectStr = ''
         self.skipAhead = 0
+        tokens = self.tokens
         # noinspection SpellCheckingInspection
         accidentalsAndDecorations = '.~^=_HLMOPSTuv'
         accidentals = '^=_'
+        singleCharacterTokens = _SINGLE_CHARACTER_TOKENS
+        propagation = self._accidentalPropagation()
 
         activeChordSymbol = ''  # accumulate, then prepend
         accidentalized: dict[str, str] = {}
         accidental: str = ''
         abcPitch: str = ''  # ABC substring defining any pitch within the current token
-
-        while self.pos < self.srcLen - 1:
-            self.pos += 1
-            self.pos += self.skipAhead
-            self.skipAhead = 0
-            if self.pos > self.srcLen - 1:
-                break
-
-            q = self._getLinearContext(self.strSrc, self.pos)
-            unused_cPrev, c, cNext, cNextNext = q
-            # cPrevNotSpace, cPrev, c, cNext, cNextNotSpace, cNextNext = q
+        collected = ''
+
+        pos = 0
+        while pos < srcLen:
+            c = strSrc[pos]
+            # white space: can be used to determine beam groups
+            # no action: normal continuation
+            if c in ' \n\t\r':
+                spaces = reSpaces.match(strSrc, pos)
+                if t.TYPE_CHECKING:
+                    assert spaces is not None
+                pos = spaces.end()
+                continue
+            cNext = strSrc[pos + 1] if pos + 1 < srcLen else None
 
             # comment lines, also encoding defs
             if c == '%':
+                self.pos = pos
                 self.processComment()
+                pos += self.skipAhead + 1
+                self.skipAhead = 0
+                propagation = self._accidentalPropagation()
                 continue
 
-            if self.startsMetadata(c, cNext, cNextNext):
-                # collect until end of line; add one to get line break
-                j = self._getNextLineBreak(self.strSrc, self.pos)
-                self.skipAhead = j - (self.pos + 1)
-                self.currentCollectStr = self.strSrc[self.pos:j].strip()
-                # environLocal.printDebug(['got metadata:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCMetadata(self.currentCollectStr))
+            if cNext == ':' and self.startsMetadata(c, cNext,
+                                                    strSrc[pos + 2] if pos + 2 < srcLen else None):
+                # collect until end of line
+                j = self._getNextLineBreak(strSrc, pos)
+                collected = strSrc[pos:j].strip()
+                tokens.append(ABCMetadata(collected))
+                pos = j
                 continue
 
-            # get bars: if not a space and not alphanumeric
-            if not c.isspace() and not c.isalnum() and c not in ('~', '('):
-                matchBars = False
-                for barIndex in range(len(ABC_BARS)):
-                    # first of bars tuple is symbol to match
-                    # three possible sizes of bar indications: 3, 2, 1
-                    barTokenArchetype = ABC_BARS[barIndex][0]
-                    if len(barTokenArchetype) == 3:
-                        if (cNext is not None
-                                and cNextNext is not None
-                                and c + cNext + cNextNext == barTokenArchetype):
-                            self.skipAhead = 2
-                            matchBars = True
-                            break
-                    elif cNext is not None and (len(barTokenArchetype) == 2):
-                        if c + cNext == barTokenArchetype:
-                            self.skipAhead = 1
-                            matchBars = True
-                            break
-                    elif len(barTokenArchetype) == 1:
-                        if c == barTokenArchetype:
-                            self.skipAhead = 0
-                            matchBars = True
-                            break
-                if matchBars is True:
+            # get bars
+            if c in ':|[':
+                barMatch = reBarline.match(strSrc, pos)
+                if barMatch is not None:
                     accidentalized = {}
                     accidental = ''
-                    j = self.pos + self.skipAhead + 1
-                    self.currentCollectStr = self.strSrc[self.pos:j]
+                    collected = barMatch.group()
                     # filter and replace with 2 tokens if necessary
-                    for tokenSub in self.barlineTokenFilter(self.currentCollectStr):
-                        self.tokens.append(tokenSub)
-                    # environLocal.printDebug(['got bars:', repr(self.currentCollectStr)])
-                    # if self.currentCollectStr == '::':
-                    #     # create a start and an end
-                    #     self.tokens.append(ABCBar(':|'))
-                    #     self.tokens.append(ABCBar('|:'))
-                    # else:
-                    #     self.tokens.append(ABCBar(self.currentCollectStr))
+                    tokens.extend(self.barlineTokenFilter(collected))
+                    pos = barMatch.end()
                     continue
 
-            # get tuplet indicators: (2, (3, (p:q:r or (3::
-            if c == '(' and cNext is not None and cNext.isdigit():
-                self.skipAhead = 1
-                j = self.pos + self.skipAhead + 1  # always two characters
-                unused1, possibleColon, qChar, unused2 = self._getLinearContext(self.strSrc, j)
-                if possibleColon == ':':
-                    j += 1
-                    self.skipAhead += 1
-                    if qChar is not None and qChar.isdigit():
-                        j += 1
-                        self.skipAhead += 1
-                    unused1, possibleColon, rChar, unused2 = self._getLinearContext(self.strSrc, j)
-                    if possibleColon == ':':
-                        j += 1  # include the r characters
-                        self.skipAhead += 1
-                        if rChar is not None and rChar.isdigit():
-                            j += 1
-                            self.skipAhead += 1
-
-                self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got tuplet start:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCTuplet(self.currentCollectStr))
-                continue
-
-            # get broken rhythm modifiers: < or >, >>, up to <<<
-            if c in '<>':
-                j = self.pos + 1
-                while j < self.srcLen - 1 and self.strSrc[j] in '<>':
-                    j += 1
-                self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(
-                #     ['got bidrectional rhythm mod:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCBrokenRhythmMarker(self.currentCollectStr))
-                self.skipAhead = j - (self.pos + 1)
-                continue
-
-            # get dynamics. skip over the open paren to avoid confusion.
-            # NB: Nested crescendos are not an issue (not proper grammar).
-            if c == '!':
-                exclaimDict = {'!crescendo(!': ABCCrescStart,
-                               '!crescendo)!': ABCParenStop,
-                               '!diminuendo(!': ABCDimStart,
-                               '!diminuendo)!': ABCParenStop,
-                               }
-                j = self.pos + 1
-                while j < self.pos + 20 and j < self.srcLen:  # a reasonable upper bound
-                    if self.strSrc[j] == '!':
-                        if self.strSrc[self.pos:j + 1] in exclaimDict:
-                            exclaimClass = exclaimDict[self.strSrc[self.pos:j + 1]]
-                            exclaimObject = exclaimClass(c)
-                            self.tokens.append(exclaimObject)
-                            self.skipAhead = j - self.pos  # not + 1
-                            break
-                        # NB: We're currently skipping over all other '!' expressions
-                        else:
-                            self.skipAhead = j - self.pos  # not + 1
-                            break
-                    j += 1
-                # not found, continue...
-                continue
-
-            # get slurs, ensuring that they're not confused for tuplets
-            if c == '(' and cNext is not None and not cNext.isdigit():
-                self.tokens.append(ABCSlurStart(c))
-                continue
-
-            # get slur/tuplet ending; treat it as a general parenthesis stop
-            if c == ')':
-                self.tokens.append(ABCParenStop(c))
-                continue
-
-            # get ties between two notes
-            if c == '-':
-                self.tokens.append(ABCTie(c))
-                continue
-
-            # get chord symbols / guitar chords; collected and joined with
-            # chord or notes
-            if c == '"':
-                j = self.pos + 1
-                while j < self.srcLen - 1 and self.strSrc[j] != '"':
-                    j += 1
-                j += 1  # need character that caused break
-                # there may be more than one chord symbol: need to accumulate
-                activeChordSymbol += self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got chord symbol:', repr(activeChordSymbol)])
-                self.skipAhead = j - (self.pos + 1)
-                continue
-
-            # get chords
-            if c == '[':
-                j = self.pos + 1
-
-                # find closing chord bracket
-                while j < self.srcLen - 1 and self.strSrc[j] != ']':
-                    j += 1
-
-                j += 1  # need character that caused break
-
-                # find outer chord length modifier
-                while j < self.srcLen and (self.strSrc[j].isdigit() or self.strSrc[j] in '/'):
-                    j += 1
-
-                # prepend chord symbol
-                if activeChordSymbol != '':
-                    self.currentCollectStr = activeChordSymbol + self.strSrc[self.pos:j]
-                    activeChordSymbol = ''  # reset
-                else:
-                    self.currentCollectStr = self.strSrc[self.pos:j]
-
-                # environLocal.printDebug(['got chord:', repr(self.currentCollectStr)])
-                self.tokens.append(ABCChord(self.currentCollectStr))
-                self.skipAhead = j - (self.pos + 1)
-                # TODO: Chords need to be aware of accidentals too.
-                # Also what happens to prefixes and suffixes attached to chords,
-                # like ties.
-                continue
-
-            if c == '.':
-                self.tokens.append(ABCStaccato(c))
-                continue
-
-            if c == 'u':
-                self.tokens.append(ABCUpbow(c))
-                continue
-
-            if c == '{':
-                self.tokens.append(ABCGraceStart(c))
-                continue
-
-            if c == '}':
-                self.tokens.append(ABCGraceStop(c))
-                continue
-
-            if c == 'v':
-                self.tokens.append(ABCDownbow(c))
-                continue
-
-            if c == 'K':
-                self.tokens.append(ABCAccent(c))
-                continue
-
-            if c == 'k':
-                self.tokens.append(ABCStraccent(c))
-                continue
-
-            if c == 'M':
-                self.tokens.append(ABCTenuto(c))
-                continue
-
             # get the start of a note event: alpha, decoration, or accidental
-            if c.isalpha() or c in '~^=_':
-                # condition where we start with an alpha that is not an alpha
-                # that comes before a pitch indication
+            if (c.isalpha() and c not in 'KkMuv') or c in '~^=_':
                 # From the 2.2 draft standard, we see the following "decorations"
                 # defined:
                 #     .       staccato mark
@@ -2444,41 +2320,52 @@ class ABCHandler:
                     abcPitch = c
                 if c in accidentals:
                     accidental = c
-                j = self.pos + 1
-
-                while j <= self.srcLen - 1:
+                j = pos + 1
+                if foundPitchAlpha:
+                    # after the pitch, only register (octave) modifications
+                    # and rhythm indications continue the note
+                    suffix = reNoteSuffix.match(strSrc, j)
+                    if t.TYPE_CHECKING:
+                        assert suffix is not None
+                    j = suffix.end()
+                    if j > pos + 1:
+                        for suffixChar in strSrc[pos + 1:j]:
+                            if suffixChar in ",'":
+                                abcPitch += suffixChar
+
+                while j <= srcLen - 1:
                     # if we have not found pitch alpha
                     # decorations and/or accidentals may precede note names
-                    if not foundPitchAlpha and self.strSrc[j] in accidentalsAndDecorations:
+                    if not foundPitchAlpha and strSrc[j] in accidentalsAndDecorations:
                         j += 1
-                        if self.strSrc[j] in accidentals:
-                            accidental += self.strSrc[j]
+                        if strSrc[j] in accidentals:
+                            accidental += strSrc[j]
                         continue
                     # only allow one pitch, alpha, to be a "continue" condition
-                    elif (not foundPitchAlpha and self.strSrc[j].isalpha()
+                    elif (not foundPitchAlpha and strSrc[j].isalpha()
                           # noinspection SpellCheckingInspection
-                          and self.strSrc[j] not in '~wuvhHLTSN'):
+                          and strSrc[j] not in '~wuvhHLTSN'):
                         foundPitchAlpha = True
-                        abcPitch = self.strSrc[j]
+                        abcPitch = strSrc[j]
                         j += 1
                         continue
                     # continue conditions after alpha:
                     # , register modification (, ') or number, rhythm indication
                     # number, /,
-                    elif self.strSrc[j].isdigit() or self.strSrc[j] in ",/,'":
-                        if self.strSrc[j] in ",'":  # Register (octave) modification
-                            abcPitch += self.strSrc[j]
+                    elif strSrc[j].isdigit() or strSrc[j] in ",/,'":
+                        if strSrc[j] in ",'":  # Register (octave) modification
+                            abcPitch += strSrc[j]
                         j += 1
                         continue
                     else:  # space, all else: break
                         break
                 # prepend chord symbol
                 if activeChordSymbol != '':
-                    self.currentCollectStr = activeChordSymbol + self.strSrc[self.pos:j]
+                    collected = activeChordSymbol + strSrc[pos:j]
                     activeChordSymbol = ''  # reset
                 else:
-                    self.currentCollectStr = self.strSrc[self.pos:j]
-                # environLocal.printDebug(['got note event:', repr(self.currentCollectStr)])
+                    collected = strSrc[pos:j]
+                pos = j
 
                 # NOTE: skipping a number of articulations and other markers
                 # that are not yet supported
@@ -2487,35 +2374,27 @@ class ABCHandler:
                 # v is up bow; might be: "^Segno"v which also should be dropped
                 # H is fermata
                 # . dot may be staccato, but should be attached to pitch
-                if self.currentCollectStr in ('w', 'u', 'v', 'v.', 'h', 'H', 'vk',
-                               'uk', 'U', '~',
-                               '.', '=', 'V', 'v.', 'S', 's',
-                               'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
-                               'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
-                               'l', 'L', 'R',
-                               'y', 'T', 't', 'x', 'Z'):
+                first = collected[0]
+                if collected in _SKIPPED_NOTE_EVENTS:
                     pass
                 # these are bad chords, or other problematic notations like
                 # "D.C."x
-                elif (self.currentCollectStr.startswith('"')
-                      and (self.currentCollectStr[-1] in ('u', 'v', 'k', 'K', 'Q', '.',
-                                                          'y', 'T', 'w', 'h', 'x',)
-                           or self.currentCollectStr.endswith('v.'))):
+                elif (first == '"'
+                      and (collected[-1] in ('u', 'v', 'k', 'K', 'Q', '.',
+                                             'y', 'T', 'w', 'h', 'x',)
+                           or collected.endswith('v.'))):
                     pass
-                elif (self.currentCollectStr.startswith('x')
-                      or self.currentCollectStr.startswith('H')
-                      or self.currentCollectStr.startswith('Z')):
+                elif first in 'xHZ':
                     pass
                 # not sure what =20 refers to
-                elif (len(self.currentCollectStr) > 1
-                      and self.currentCollectStr.startswith('=')
-                      and self.currentCollectStr[1].isdigit()):
+                elif (first == '='
+                      and len(collected) > 1
+                      and collected[1].isdigit()):
                     pass
-                # only let valid self.currentCollectStr strings be parsed
+                # only let valid collected strings be parsed
                 elif abcPitch:
                     pitchClass: str = abcPitch[0].upper()
                     carriedAccidental = ''
-                    propagation = self._accidentalPropagation()
                     if accidental:
                         # Remember the active accidentals in the measure
                         if propagation == 'octave':
@@ -2528,16 +2407,110 @@ class ABCHandler:
                             carriedAccidental = accidentalized[pitchClass]
                         elif propagation == 'octave' and abcPitch in accidentalized:
                             carriedAccidental = accidentalized[abcPitch]
-                    abcNote = ABCNote(self.currentCollectStr, carriedAccidental=carriedAccidental)
-                    self.tokens.append(abcNote)
+                    tokens.append(ABCNote(collected, carriedAccidental=carriedAccidental))
                 else:
-                    self.tokens.append(ABCNote(self.currentCollectStr))
+                    tokens.append(ABCNote(collected))
+                continue
 
-                self.skipAhead = j - (self.pos + 1)
+            # get tuplet indicators: (2, (3, (p:q:r or (3::
+            if c == '(' and cNext is not None and cNext.isdigit():
+                j = pos + 2  # always two characters
+                unused1, possibleColon, qChar, unused2 = self._getLinearContext(strSrc, j)
+                if possibleColon == ':':
+                    j += 1
+                    if qChar is not None and qChar.isdigit():
+                        j += 1
+                    unused1, possibleColon, rChar, unused2 = self._getLinearContext(strSrc, j)
+                    if possibleColon == ':':
+                        j += 1  # include the r characters
+                        if rChar is not None and rChar.isdigit():
+                            j += 1
+                collected = strSrc[pos:j]
+                tokens.append(ABCTuplet(collected))
+                pos = j
                 continue
-            # look for white space: can be used to determine beam groups
-            # no action: normal continuation of 1 char
-            pass
+
+            # get broken rhythm modifiers: < or >, >>, up to <<<
+            if c in '<>':
+                j = pos + 1
+                while j < srcLen - 1 and strSrc[j] in '<>':
+                    j += 1
+                collected = strSrc[pos:j]
+                tokens.append(ABCBrokenRhythmMarker(collected))
+                pos = j
+                continue
+
+            # get dynamics. skip over the open paren to avoid confusion.
+            # NB: Nested crescendos are not an issue (not proper grammar).
+            if c == '!':
+                j = strSrc.find('!', pos + 1, pos + 20)  # a reasonable upper bound
+                if j == -1:
+                    # not found, continue...
+                    pos += 1
+                    continue
+                exclaimClass = _EXCLAMATION_TOKENS.get(strSrc[pos:j + 1])
+                # NB: We're currently skipping over all other '!' expressions
+                if exclaimClass is not None:
+                    tokens.append(exclaimClass(c))
+                pos = j + 1
+                continue
+
+            # get slurs, ensuring that they're not confused for tuplets
+            if c == '(':
+                if cNext is not None:
+                    tokens.append(ABCSlurStart(c))
+                pos += 1
+                continue
+
+            # get chord symbols / guitar chords; collected and joined with
+            # chord or notes
+            if c == '"':
+                j = pos + 1
+                while j < srcLen - 1 and strSrc[j] != '"':
+                    j += 1
+                j += 1  # need character that caused break
+                # there may be more than one chord symbol: need to accumulate
+                activeChordSymbol += strSrc[pos:j]
+                pos = j
+                continue
+
+            # get chords
+            if c == '[':
+                j = pos + 1
+
+                # find closing chord bracket
+                while j < srcLen - 1 and strSrc[j] != ']':
+                    j += 1
+
+                j += 1  # need character that caused break
+
+                # find outer chord length modifier
+                while j < srcLen and (strSrc[j].isdigit() or strSrc[j] in '/'):
+                    j += 1
+
+                # prepend chord symbol
+                if activeChordSymbol != '':
+                    collected = activeChordSymbol + strSrc[pos:j]
+                    activeChordSymbol = ''  # reset
+                else:
+                    collected = strSrc[pos:j]
+
+                tokens.append(ABCChord(collected))
+                pos = j
+                # TODO: Chords need to be aware of accidentals too.
+                # Also what happens to prefixes and suffixes attached to chords,
+                # like ties.
+                continue
+
+            # slur/tuplet endings (treated as a general parenthesis stop),
+            # ties between two notes, and articulations
+            tokenClass = singleCharacterTokens.get(c)
+            if tokenClass is not None:
+                tokens.append(tokenClass(c))
+            pos += 1
+
+        self.pos = pos
+        self.currentCollectStr = collected
 
     def tokenProcess(self) -> None:
         '''
@@ -3388,7 +3361,182 @@ def mergeLeadingMetaData(barHandlers: list[ABCHandlerBar]) -> list[ABCHandlerBar
 
     return mergedHandlers
 
+
 # ------------------------------------------------------------------------------
+# indices of ABC files, keyed by str(filePath); values are
+# ((st_mtime_ns, st_size), ABCReferenceIndex)
+_referenceIndexCache: dict[str, tuple[tuple[int, int], ABCReferenceIndex]] = {}
+
+
+class ABCReferenceIndex(prebase.ProtoM21Object):
+    r'''
+    The byte offsets of the tunes in a file of ABC data, keyed by reference
+    number (the number on each tune's `X:` line), so that a single tune
+    can be read from a large collection without reading the rest of the file.
+
+    >>> data = b'%abc-2.1\nO: Irish\n\nX:1\nT:Hello\nK:C\nCDE\n\nX:02\nT:Aloha\nK:G\nGAB\n'
+    >>> index = abcFormat.ABCReferenceIndex.fromBytes(data)
+    >>> index
+    <music21.abcFormat.ABCReferenceIndex 2 tunes>
+    >>> index.numbers
+    [1, 2]
+    >>> index.offsets[2]
+    (40, 61)
+    >>> data[40:61]
+    b'X:02\nT:Aloha\nK:G\nGAB\n'
+
+    Everything before the first tune is the file header, which applies to all tunes:
+
+    >>> data[:index.headerEnd]
+    b'%abc-2.1\nO: Irish\n\n'
+
+    If a reference number is used more than once, only the first tune is
+    indexed (as in :meth:`ABCFile.extractReferenceNumber`) and `hasDuplicates`
+    is True.
+
+    >>> index.hasDuplicates
+    False
+
+    Indices of files are built with :meth:`forFile`.
+
+    * New in v9.3.
+    '''
+    def __init__(self,
+                 headerEnd: int = 0,
+                 offsets: dict[int, tuple[int, int]] | None = None,
+                 hasDuplicates: bool = False):
+        self.headerEnd: int = headerEnd
+        self.offsets: dict[int, tuple[int, int]] = offsets if offsets is not None else {}
+        self.hasDuplicates: bool = hasDuplicates
+
+    def _reprInternal(self):
+        return f'{len(self.offsets)} tunes'
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, number):
+        return number in self.offsets
+
+    @property
+    def numbers(self) -> list[int]:
+        '''
+        The reference numbers in the index, sorted.
+        '''
+        return sorted(self.offsets)
+
+    @classmethod
+    def fromBytes(cls, data: bytes) -> ABCReferenceIndex:
+        '''
+        Build an index by scanning ABC data, given as bytes, for `X:` lines.
+        '''
+        starts = [(m.start(), int(m.group(1))) for m in reReferenceNumberLine.finditer(data)]
+        offsets: dict[int, tuple[int, int]] = {}
+        for i, (start, number) in enumerate(starts):
+            if number in offsets:
+                continue
+            end = starts[i + 1][0] if i + 1 < len(starts) else len(data)
+            offsets[number] = (start, end)
+        headerEnd = starts[0][0] if starts else len(data)
+        return cls(headerEnd, offsets, hasDuplicates=len(offsets) != len(starts))
+
+    @classmethod
+    def forFile(cls, filePath: str | pathlib.Path) -> ABCReferenceIndex:
+        '''
+        Return the index of an ABC file.
+
+        The index is built once and kept in memory and, for files with more than
+        one tune, in a small file in the music21 scratch directory, so later
+        sessions do not need to scan the file again.  It is rebuilt whenever the
+        file's modification time or size changes.
+
+        >>> fp = common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc'
+        >>> index = abcFormat.ABCReferenceIndex.forFile(fp)
+        >>> len(index)
+        554
+        >>> abcFormat.ABCReferenceIndex.forFile(fp) is index
+        True
+        '''
+        filePath = pathlib.Path(filePath)
+        stat = filePath.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cacheKey = str(filePath)
+        cached = _referenceIndexCache.get(cacheKey)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        indexFp = cls._indexFilePath(filePath)
+        index = cls._readIndexFile(indexFp, stamp)
+        if index is None:
+            index = cls.fromBytes(filePath.read_bytes())
+            if len(index) > 1:
+                index._writeIndexFile(indexFp, stamp)
+        _referenceIndexCache[cacheKey] = (stamp, index)
+        return index
+
+    @staticmethod
+    def _indexFilePath(filePath: pathlib.Path) -> pathlib.Path:
+        baseName = 'm21-abcIndex-' + common.getMd5(str(filePath.resolve())) + '.json'
+        return environLocal.getRootTempDir() / baseName
+
+    @classmethod
+    def _readIndexFile(cls,
+                       indexFp: pathlib.Path,
+                       stamp: tuple[int, int]) -> ABCReferenceIndex | None:
+        try:
+            with open(indexFp, encoding='utf-8') as f:
+                stored = json.load(f)
+            if tuple(stored['stamp']) != stamp:
+                return None
+            offsets = {number: (start, end) for number, start, end in stored['offsets']}
+            return cls(stored['headerEnd'], offsets, stored['hasDuplicates'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _writeIndexFile(self, indexFp: pathlib.Path, stamp: tuple[int, int]) -> None:
+        stored = {
+            'stamp': stamp,
+            'headerEnd': self.headerEnd,
+            'hasDuplicates': self.hasDuplicates,
+            'offsets': [(number, start, end) for number, (start, end) in self.offsets.items()],
+        }
+        try:
+            with open(indexFp, 'w', encoding='utf-8') as f:
+                json.dump(stored, f)
+        except OSError:  # pragma: no cover
+            environLocal.printDebug(f'could not write ABC index {indexFp}')
+
+    @staticmethod
+    def _decode(data: bytes) -> str:
+        # the same newline handling as reading the file in text mode
+        return data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+    def readTune(self, filePath: str | pathlib.Path, number: int) -> str:
+        '''
+        Read the ABC data of the tune with reference number `number` from
+        `filePath`, which must be the file that was indexed.
+
+        >>> fp = common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc'
+        >>> index = abcFormat.ABCReferenceIndex.forFile(fp)
+        >>> print(index.readTune(fp, 3)[:20])
+        X:3
+        T: Tian xin shun
+        '''
+        start, end = self.offsets[number]
+        with open(filePath, 'rb') as f:
+            f.seek(start)
+            return self._decode(f.read(end - start))
+
+    def readTunes(self, filePath: str | pathlib.Path) -> tuple[str, list[tuple[int, str]]]:
+        '''
+        Read the whole file and return its header and a list of
+        (reference number, ABC data) pairs, one for each tune, sorted by number.
+        '''
+        with open(filePath, 'rb') as f:
+            data = f.read()
+        header = self._decode(data[:self.headerEnd])
+        return header, [(number, self._decode(data[start:end]))
+                        for number, (start, end) in sorted(self.offsets.items())]
 
 
 class ABCFile(prebase.ProtoM21Object):
@@ -3437,7 +3585,19 @@ class ABCFile(prebase.ProtoM21Object):
         which processes all tokens.
 
         If `number` is given, a work number will be extracted if possible.
+        If the file was opened with :meth:`open`, only that work is read
+        from disk, using the file's :class:`ABCReferenceIndex`.
+
+        * Changed in v9.3: single works are read directly from the file.
         '''
+        if number is not None and self.filename:
+            index = ABCReferenceIndex.forFile(self.filename)
+            try:
+                number = int(number)
+            except (TypeError, ValueError):
+                pass
+            if number in index:
+                return self.readstr(index.readTune(self.filename, number))
         return self.readstr(self.file.read(), number)
 
     @staticmethod
@@ -3559,6 +3719,28 @@ class Test(unittest.TestCase):
             self.assertEqual(countNotes, noteTokens)
             self.assertEqual(countChords, chordTokens)
 
+    def testTokenizeMixed(self):
+        handler = ABCHandler(abcVersion=(2, 1, 0))
+        handler.tokenize('%%propagate-accidentals octave\n'
+                         'K:G\n'
+                         '"Am"^c2 c/ C,3/2 (3abc !crescendo(!d>e!crescendo)! '
+                         "[ceg]2 -|:~g' u_B |1 =B :|2 z4|]")
+        self.assertEqual(
+            [(type(token).__name__, token.src) for token in handler.tokens],
+            [('ABCMetadata', 'K:G'), ('ABCNote', '"Am"^c2'), ('ABCNote', 'c/'),
+             ('ABCNote', 'C,3/2'), ('ABCTuplet', '(3'), ('ABCNote', 'a'),
+             ('ABCNote', 'b'), ('ABCNote', 'c'), ('ABCCrescStart', '!'),
+             ('ABCNote', 'd'), ('ABCBrokenRhythmMarker', '>'), ('ABCNote', 'e'),
+             ('ABCParenStop', '!'), ('ABCChord', '[ceg]2'), ('ABCTie', '-'),
+             ('ABCBar', '|:'), ('ABCNote', "~g'"), ('ABCUpbow', 'u'),
+             ('ABCNote', '_B'), ('ABCBar', '|'), ('ABCBar', '[1'), ('ABCNote', '=B'),
+             ('ABCBar', ':|'), ('ABCBar', '[2'), ('ABCNote', 'z4'), ('ABCBar', '|]')])
+        # accidentals carry to the same pitch and octave until the barline
+        self.assertEqual([token.carriedAccidental for token in handler.tokens
+                          if isinstance(token, ABCNote) and token.src in ('c/', 'c', 'C,3/2')],
+                         ['^', '', '^'])
+        self.assertEqual(handler.abcDirectives, {'propagate-accidentals': 'octave'})
+
     def testRe(self):
 
         src = 'A: this is a test'
@@ -4013,10 +4195,53 @@ class Test(unittest.TestCase):
         ah.process(testFiles.guineapigTest)
         self.assertEqual(len(ah), 105)
 
+    def testReferenceIndexReadsSingleTune(self):
+        fp = common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc'
+        index = ABCReferenceIndex.forFile(fp)
+        self.assertFalse(index.hasDuplicates)
+        with open(fp, encoding='utf-8') as f:
+            fileData = f.read()
+        for number in (1, 200, index.numbers[-1]):
+            expected = ABCFile.extractReferenceNumber(fileData, number)
+            self.assertEqual(index.readTune(fp, number).rstrip('\n'), expected.rstrip('\n'))
+
+        af = ABCFile()
+        af.open(fp)
+        ah = af.read(number=200)
+        af.close()
+        self.assertEqual(ah.getReferenceNumber(), '200')
+
+    def testReferenceIndexInvalidatedByChange(self):
+        import os
+        import tempfile
+        from music21.abcFormat import testFiles
+
+        with tempfile.TemporaryDirectory() as tempDir:
+            fp = pathlib.Path(tempDir) / 'collection.abc'
+            fp.write_text(testFiles.mysteryReel + '\n' + testFiles.kitchGirl, encoding='utf-8')
+            index = ABCReferenceIndex.forFile(fp)
+            self.assertEqual(index.numbers, [57, 254])
+            self.assertIs(ABCReferenceIndex.forFile(fp), index)
+
+            # the same data from the index file, not the memory cache
+            del _referenceIndexCache[str(fp)]
+            fromDisk = ABCReferenceIndex.forFile(fp)
+            self.assertIsNot(fromDisk, index)
+            self.assertEqual(fromDisk.offsets, index.offsets)
+
+            with open(fp, 'a', encoding='utf-8') as f:
+                f.write('\n' + testFiles.williamAndNancy)
+            stat = fp.stat()
+            os.utime(fp, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            newIndex = ABCReferenceIndex.forFile(fp)
+            self.assertEqual(newIndex.numbers, [31, 57, 254])
+            self.assertIn('William and Nancy', newIndex.readTune(fp, 31))
+            os.remove(ABCReferenceIndex._indexFilePath(fp))
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [ABCFile, ABCHandler, ABCHandlerBar]
+_DOC_ORDER = [ABCFile, ABCHandler, ABCHandlerBar, ABCReferenceIndex]
 
 
 if __name__ == '__main__':
@@ -571,6 +571,76 @@ def abcToStreamOpus(abcHandler, inputM21=None, number=None):
     return opus
 
 
+# multi-tune files with at least this many tunes are parsed in parallel
+# by abcFileToStreamOpus
+PARALLEL_TUNE_MINIMUM = 100
+
+
+def _abcTuneToScore(abcData: str):
+    '''
+    Parse the ABC data for one tune, preceded by the file header, into a Score,
+    or return None if the tune cannot be parsed.
+    '''
+    from music21 import abcFormat
+
+    abcHandler = abcFormat.ABCFile().readstr(abcData)
+    number, tuneHandler = next(iter(abcHandler.splitByReferenceNumber().items()))
+    try:
+        return abcToStreamScore(tuneHandler)
+    except IndexError:
+        environLocal.warn(f'Failure for piece number {number}')
+        return None
+
+
+def abcFileToStreamOpus(filePath, index=None, inputM21=None, *, parallel=True):
+    '''
+    Parse every tune in a multi-tune ABC file into a Score and pack them
+    into an Opus, in order of reference number.
+
+    Each tune is read with the file's
+    :class:`~music21.abcFormat.ABCReferenceIndex` (found with
+    :meth:`~music21.abcFormat.ABCReferenceIndex.forFile` if not given) and
+    parsed on its own, with the file header in front of it, so tunes can
+    be parsed in parallel.  That happens when `parallel` is True and the
+    file has at least `PARALLEL_TUNE_MINIMUM` tunes.
+
+    >>> fp = common.getSourceFilePath() / 'corpus' / 'josquin' / 'laPlusDesPlus.abc'
+    >>> op = abcFormat.translate.abcFileToStreamOpus(fp)
+    >>> op
+    <music21.stream.Opus 0x...>
+    >>> [sc.metadata.number for sc in op.scores]
+    ['1', '2', '3']
+
+    * New in v9.3.
+    '''
+    from music21 import abcFormat
+
+    if index is None:
+        index = abcFormat.ABCReferenceIndex.forFile(filePath)
+    if inputM21 is None:
+        opus = stream.Opus()
+    else:
+        opus = inputM21
+
+    header, tunes = index.readTunes(filePath)
+    tuneData = [header + abcData for unused_number, abcData in tunes]
+    scores = []
+    if parallel and len(tuneData) >= PARALLEL_TUNE_MINIMUM:
+        for sc in common.runParallel(tuneData, _abcTuneToScore, freezeStreams=True):
+            if sc is not None:
+                scores.append(sc)
+    else:
+        for abcData in tuneData:
+            sc = _abcTuneToScore(abcData)
+            if sc is not None:
+                scores.append(sc)
+
+    for sc in scores:
+        opus.coreAppend(sc, setActiveSite=False)
+    opus.coreElementsChanged()
+    return opus
+
+
 def reBar(music21Part, *, inPlace=False):
     # noinspection PyShadowingNames,SpellCheckingInspection
     '''
@@ -55,7 +55,7 @@ from music21.common.numberTools import opFrac
 from music21.common.types import OffsetQL, OffsetQLIn
 from music21 import defaults
 from music21.derivation import Derivation
-from music21.duration import Duration, DurationException
+from music21.duration import Duration, DurationException, FrozenDuration
 from music21.editorial import Editorial  # import class directly to not conflict with property.
 from music21 import environment
 from music21 import exceptions21
@@ -425,11 +425,6 @@ class Music21Object(prebase.ProtoM21Object):
 
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR: dict[str, str] = {
-        'groups': '''An instance of a :class:`~music21.base.Groups`
-            object which describes
-            arbitrary `Groups` that this object belongs to.''',
-        'sites': '''a :class:`~music21.sites.Sites` object that stores
-            references to Streams that hold this object.''',
         'isStream': '''Boolean value for quickly identifying
             :class:`~music21.stream.Stream` objects (False by default).''',
         'classSortOrder': '''Property which returns an number (int or otherwise)
@@ -498,15 +493,17 @@ class Music21Object(prebase.ProtoM21Object):
 
         # private duration storage; managed by property
         self._duration: Duration | None = duration
-        if duration is not None:
+        if duration is not None and not isinstance(duration, FrozenDuration):
             duration.client = self
         self._priority = 0  # default is zero
 
         # store cached values here:
         self._cache: dict[str, t.Any] = {}
 
-        self.groups = groups or Groups()
-        self.sites = sites or Sites()
+        # created on first use by the .groups and .sites properties:
+        # many objects (such as the notes in a chord) never need them.
+        self._groups: Groups | None = groups or None
+        self._sites: Sites | None = sites or None
 
         # a duration object is not created until the .duration property is
         # accessed with _getDuration(); this is a performance optimization
@@ -535,6 +532,54 @@ class Music21Object(prebase.ProtoM21Object):
         '''
         return id(self) >> 4
 
+    @property
+    def groups(self) -> Groups:
+        '''
+        An instance of a :class:`~music21.base.Groups`
+        object which describes
+        arbitrary `Groups` that this object belongs to.
+
+        >>> n = note.Note()
+        >>> n.groups
+        []
+        >>> n.groups.append('flute')
+        >>> n.groups
+        ['flute']
+
+        * Changed in v9.3: created on first use.
+        '''
+        if self._groups is None:
+            self._groups = Groups()
+        return self._groups
+
+    @groups.setter
+    def groups(self, new: Groups):
+        self._groups = new
+
+    @property
+    def sites(self) -> Sites:
+        '''
+        A :class:`~music21.sites.Sites` object that stores
+        references to Streams that hold this object.
+
+        >>> n = note.Note()
+        >>> len(n.sites)  # just the None site
+        1
+        >>> s = stream.Stream()
+        >>> s.insert(0, n)
+        >>> s in n.sites
+        True
+
+        * Changed in v9.3: created on first use.
+        '''
+        if self._sites is None:
+            self._sites = Sites()
+        return self._sites
+
+    @sites.setter
+    def sites(self, new: Sites):
+        self._sites = new
+
     @property
     def id(self) -> int | str:
         '''
@@ -594,9 +639,9 @@ class Music21Object(prebase.ProtoM21Object):
         * Changed in v9: removeFromIgnore removed;
           never used and this is performance critical.
         '''
-        defaultIgnoreSet = {'_derivation', '_activeSite', '_sites', '_cache'}
-        if not self.groups:
-            defaultIgnoreSet.add('groups')
+        defaultIgnoreSet = {'_derivation', '_activeSite', '_cache'}
+        if not self._groups:
+            defaultIgnoreSet.add('_groups')
         # duration is smart enough to do itself.
         # sites is smart enough to do itself
 
@@ -607,9 +652,6 @@ class Music21Object(prebase.ProtoM21Object):
 
         new = common.defaultDeepcopy(self, memo, ignoreAttributes=ignoreAttributes)
         setattr(new, '_cache', {})
-        setattr(new, '_sites', Sites())
-        if 'groups' in defaultIgnoreSet:
-            new.groups = Groups()
 
         # was: keep the old ancestor but need to update the client
         # 2.1 : NO, add a derivation of __deepcopy__ to the client
@@ -672,6 +714,11 @@ class Music21Object(prebase.ProtoM21Object):
         return state
 
     def __setstate__(self, state: dict[str, t.Any]):
+        # objects pickled before v9.3 stored .groups and .sites directly.
+        if 'sites' in state:
+            state['_sites'] = state.pop('sites')
+        if 'groups' in state:
+            state['_groups'] = state.pop('groups')
         # defining self.__dict__ upon initialization currently breaks everything
         object.__setattr__(self, '__dict__', state)
 
@@ -822,6 +869,9 @@ class Music21Object(prebase.ProtoM21Object):
         >>> n.quarterLength
         Fraction(1, 3)
         '''
+        d = self._duration
+        if isinstance(d, FrozenDuration):  # read a shared duration without copying it
+            return d.quarterLength
         return self.duration.quarterLength
 
     @quarterLength.setter
@@ -1292,6 +1342,7 @@ class Music21Object(prebase.ProtoM21Object):
         sortByCreationTime=False,
         followDerivation=True,
         priorityTargetOnly=False,
+        useContextMap=True,
     ) -> _M21T | None:
         return None  # until Astroid #1015
 
@@ -1304,6 +1355,7 @@ class Music21Object(prebase.ProtoM21Object):
         sortByCreationTime=False,
         followDerivation=True,
         priorityTargetOnly=False,
+        useContextMap=True,
     ) -> Music21Object | None:
         return None  # until Astroid #1015
 
@@ -1315,6 +1367,7 @@ class Music21Object(prebase.ProtoM21Object):
         sortByCreationTime=False,
         followDerivation=True,
         priorityTargetOnly=False,
+        useContextMap=True,
     ) -> _M21T | Music21Object | None:
         # noinspection PyShadowingNames
         '''
@@ -1526,12 +1579,25 @@ class Music21Object(prebase.ProtoM21Object):
         Raises `ValueError` for incompatible values `followDerivation=True`
         and `priorityTargetOnly=True`.
 
+        Searches are answered from a :class:`~music21.stream.core.ContextMap` that
+        each Stream in the hierarchy caches for the requested class, so that
+        looking up the context of every note in a score needs only a binary search
+        per containing Stream.  The maps are discarded whenever the elements of the
+        Stream change.  Sites on the chain of `.activeSite` are searched directly,
+        before the rest of the sites from `.contextSites()`.  To search the
+        element trees exactly as in earlier versions, pass `useContextMap=False`:
+
+        >>> b.getContextByClass(note.Note, getElementMethod=ElementSearch.BEFORE,
+        ...                     useContextMap=False)
+        <music21.note.Note A>
+
         * Changed in v5.7: added followDerivation=False and made
           everything but the class keyword only
         * New in v6: added priorityTargetOnly -- see contextSites for description.
         * New in v7: added getElementMethod `all` and `ElementSearch` enum.
         * Changed in v8: class-based calls return properly typed items.  Putting
           multiple types into className (never documented) is no longer allowed.
+        * New in v9.3: useContextMap; lookups use cached context maps.
 
         OMIT_FROM_DOCS
 
@@ -1588,8 +1654,6 @@ class Music21Object(prebase.ProtoM21Object):
 
             flatten can be True, 'semiFlat', or False.
             '''
-            classList = None if not className else (className,)
-            siteTree = checkSite.asTree(flatten=flatten, classList=classList)
             if getElementMethod in OFFSET_METHODS:
                 # these methods match only by offset.  Used in .getBeat among other places
                 if getElementMethod in (ElementSearch.BEFORE_OFFSET,
@@ -1598,6 +1662,15 @@ class Music21Object(prebase.ProtoM21Object):
                 else:
                     innerPositionStart = ZeroSortTupleHigh.modify(offset=innerPositionStart.offset)
 
+            if useContextMap:
+                contextMap = checkSite.coreContextMap(className, flatten=flatten)
+                if getElementMethod in BEFORE_METHODS:
+                    return contextMap.before(innerPositionStart)
+                else:
+                    return contextMap.after(innerPositionStart)
+
+            classList = None if not className else (className,)
+            siteTree = checkSite.asTree(flatten=flatten, classList=classList)
             if getElementMethod in BEFORE_METHODS:
                 contextNode = siteTree.getNodeBefore(innerPositionStart)
             else:
@@ -1694,6 +1767,12 @@ class Music21Object(prebase.ProtoM21Object):
             for say a single measure or .getElementsByOffset(), etc., so that when leaving
             this extracted section, one wants to see how that fits into a larger stream hierarchy.
             '''
+            if (id(self) not in checkSite._offsetDict
+                    and self not in checkSite._endElements
+                    and (self._derivation is None or self._derivation.origin is None)):
+                # self.sortTuple(checkSite) would raise a SitesException (see below);
+                # raising and formatting it is the slowest part of a search.
+                return True
             try:
                 selfSortTuple = self.sortTuple(checkSite, raiseExceptionOnMiss=True)
                 contextSortTuple = checkContextEl.sortTuple(checkSite, raiseExceptionOnMiss=True)
@@ -1724,23 +1803,31 @@ class Music21Object(prebase.ProtoM21Object):
         if getElementMethod in AT_METHODS and className in self.classSet:
             return self
 
-        for site, positionStart, searchType in self.contextSites(
-            returnSortTuples=True,
-            sortByCreationTime=sortByCreationTime,
-            followDerivation=followDerivation,
-            priorityTargetOnly=priorityTargetOnly,
-        ):
+        def setActiveSite(contextEl, site):
+            '''
+            Make site the activeSite of contextEl if contextEl is in site itself
+            (and not just somewhere in its hierarchy).
+            '''
+            if id(contextEl) not in site._offsetDict:
+                return
+            try:
+                site.coreSelfActiveSite(contextEl)
+            except SitesException:
+                pass
+
+        def searchSite(site, positionStart, searchType):
+            '''
+            Search one site from contextSites (or from the activeSite chain)
+            and return a tuple of whether the search is finished and the context found.
+            '''
             if searchType in ('elementsOnly', 'elementsFirst'):
                 contextEl = payloadExtractor(site,
                                              flatten=False,
                                              innerPositionStart=positionStart)
 
                 if contextEl is not None and wellFormed(contextEl, site):
-                    try:
-                        site.coreSelfActiveSite(contextEl)
-                    except SitesException:
-                        pass
-                    return contextEl
+                    setActiveSite(contextEl, site)
+                    return True, contextEl
                 # otherwise, continue to check for flattening...
 
             if searchType != 'elementsOnly':  # flatten or elementsFirst
@@ -1751,17 +1838,14 @@ class Music21Object(prebase.ProtoM21Object):
                         pass
                     elif getElementMethod not in NOT_SELF_METHODS:  # for 'After' we can't do the
                         # containing site because that comes before.
-                        return site  # if the site itself is the context, return it...
+                        return True, site  # if the site itself is the context, return it...
 
                 contextEl = payloadExtractor(site,
                                              flatten='semiFlat',
                                              innerPositionStart=positionStart)
                 if contextEl is not None and wellFormed(contextEl, site):
-                    try:
-                        site.coreSelfActiveSite(contextEl)
-                    except SitesException:
-                        pass
-                    return contextEl
+                    setActiveSite(contextEl, site)
+                    return True, contextEl
 
                 if (getElementMethod in BEFORE_METHODS
                         and (not className
@@ -1769,9 +1853,51 @@ class Music21Object(prebase.ProtoM21Object):
                     if getElementMethod in NOT_SELF_METHODS and self is site:
                         pass
                     else:
-                        return site  # if the site itself is the context, return it...
+                        return True, site  # if the site itself is the context, return it...
+
+            # otherwise, continue to check in next contextSite.
+            return False, None
+
+        searchedSiteIds: set[int] = set()
+        if useContextMap and not sortByCreationTime and not self.isStream:
+            # The activeSite chain is what contextSites() yields first, in the
+            # same order and with the same positions, so search it without
+            # building the generator.
+            from music21 import stream
+            child: Music21Object = self
+            site = self.activeSite
+            position = None
+            while site is not None and id(site) not in searchedSiteIds:
+                if isinstance(site, stream.SpannerStorage):
+                    break
+                try:
+                    offsetInSite = site.elementOffset(child)
+                except SitesException:
+                    break
+                if position is None:
+                    position = self.sortTuple(site).modify(offset=offsetInSite)
+                else:
+                    position = position.modify(offset=opFrac(offsetInSite + position.offset))
+                finished, contextEl = searchSite(site, position, site.recursionType)
+                if finished:
+                    return contextEl
+                searchedSiteIds.add(id(site))
+                if priorityTargetOnly:
+                    break
+                child = site
+                site = site.activeSite
 
-                # otherwise, continue to check in next contextSite.
+        for site, positionStart, searchType in self.contextSites(
+            returnSortTuples=True,
+            sortByCreationTime=sortByCreationTime,
+            followDerivation=followDerivation,
+            priorityTargetOnly=priorityTargetOnly,
+        ):
+            if id(site) in searchedSiteIds:
+                continue
+            finished, contextEl = searchSite(site, positionStart, searchType)
+            if finished:
+                return contextEl
 
         # nothing found...
         return None
@@ -2726,7 +2852,13 @@ class Music21Object(prebase.ProtoM21Object):
             atEnd = 0
 
         # avoids expensive duration computation for streams, which can never be grace notes
-        isNotGrace = 1 if self.isStream or not self.duration.isGrace else 0
+        if self.isStream:
+            isNotGrace = 1
+        else:
+            d = self._duration
+            if not isinstance(d, FrozenDuration):  # read a shared duration without copying it
+                d = self.duration
+            isNotGrace = 0 if d.isGrace else 1
 
         if self.sites.hasSiteId(id(useSite)):
             insertIndex = self.sites.siteDict[id(useSite)].globalSiteIndex
@@ -2743,28 +2875,44 @@ class Music21Object(prebase.ProtoM21Object):
     def duration(self) -> Duration:
         '''
         Get and set the duration of this object as a Duration object.
-        '''
-        # lazy duration creation
-        if self._duration is None:
-            self._duration = Duration(0)
 
-        d_out = self._duration
-        if t.TYPE_CHECKING:
-            assert d_out is not None
+        A :class:`~music21.duration.FrozenDuration` can be shared among many
+        objects; each object makes its own copy of it the first time that
+        `.duration` is accessed, so that it can be changed:
 
+        >>> fd = duration.internDuration('half')
+        >>> n1 = note.Note(duration=fd)
+        >>> n2 = note.Note(duration=fd)
+        >>> n1.duration
+        <music21.duration.Duration 2.0>
+        >>> n1.duration.dots = 1
+        >>> n1.quarterLength, n2.quarterLength
+        (3.0, 2.0)
+
+        * Changed in v9.3: FrozenDurations are copied on first access.
+        '''
+        d_out = self._duration
+        # lazy duration creation
+        if d_out is None:
+            d_out = self._duration = Duration(0)
+        elif isinstance(d_out, FrozenDuration):
+            d_out = self._duration = d_out.unfrozen()
+            d_out.client = self
         return d_out
 
     @duration.setter
     def duration(self, durationObj: Duration):
         durationObjAlreadyExists = False
         if self._duration is not None:
-            self._duration.client = None
+            if not isinstance(self._duration, FrozenDuration):
+                self._duration.client = None
             durationObjAlreadyExists = True
 
         try:
             ql = durationObj.quarterLength
             self._duration = durationObj
-            durationObj.client = self
+            if not isinstance(durationObj, FrozenDuration):
+                durationObj.client = self
             if durationObjAlreadyExists:
                 self.informSites({'changedElement': 'duration', 'quarterLength': ql})
 
@@ -2787,7 +2935,7 @@ class Music21Object(prebase.ProtoM21Object):
         for s in self.sites.get():
             if hasattr(s, 'coreElementsChanged'):
                 # noinspection PyCallingNonCallable
-                s.coreElementsChanged(updateIsFlat=False, keepIndex=True)
+                s.coreElementsChanged(updateIsFlat=False, keepIndex=True, changedElement=self)
 
     def _getPriority(self):
         return self._priority
@@ -27,6 +27,7 @@ from music21 import beam
 from music21 import common
 from music21.common.decorators import cacheMethod
 from music21 import derivation
+from music21 import duration
 from music21.duration import Duration
 from music21 import environment
 from music21 import exceptions21
@@ -221,7 +222,10 @@ class ChordBase(note.NotRest):
         # should be taken from the first note of the list.
         quickDuration = False
         if useDuration is None:
-            useDuration = self.duration
+            # a shared FrozenDuration can be given to the notes without copying it.
+            useDuration = self._duration
+            if not isinstance(useDuration, duration.FrozenDuration):
+                useDuration = self.duration
             quickDuration = True
 
         newNote: note.NotRest
@@ -238,13 +242,19 @@ class ChordBase(note.NotRest):
                 for newNote in n._notes:
                     self._notes.append(copy.deepcopy(newNote))
                 if quickDuration is True:
-                    self.duration = n.duration
+                    if isinstance(n._duration, duration.FrozenDuration):
+                        self.duration = n._duration
+                    else:
+                        self.duration = n.duration
                     useDuration = None
                     quickDuration = False
             elif isinstance(n, note.NotRest):
                 self._notes.append(n)
                 if quickDuration is True:
-                    self.duration = n.duration
+                    if isinstance(n._duration, duration.FrozenDuration):
+                        self.duration = n._duration
+                    else:
+                        self.duration = n.duration
                     useDuration = None
                     quickDuration = False
             elif isinstance(n, (str, int)):
@@ -5060,6 +5070,15 @@ class Chord(ChordBase):
             # pitchZeroDuration = self._notes[0]['pitch'].duration
             pitchZeroDuration = self._notes[0].duration
             self._duration = pitchZeroDuration
+        elif isinstance(d, duration.FrozenDuration):
+            # shared durations are copied on first access, as in Music21Object;
+            # notes that shared the chord's duration share the copy.
+            newDuration = d.unfrozen()
+            newDuration.client = self
+            for n in self._notes:
+                if n._duration is d:
+                    n._duration = newDuration
+            self._duration = newDuration
 
         d_out = self._duration
         if t.TYPE_CHECKING:
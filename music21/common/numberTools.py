@@ -34,6 +34,8 @@ __all__ = [
     'numToIntOrFloat',
 
     'opFrac', 'mixedNumeral',
+    'TICKS_PER_QUARTER', 'quarterLengthToTicks', 'ticksToQuarterLength',
+    'quarterLengthGCD',
     'roundToHalfInteger',
     'addFloatPrecision', 'strTrimFloat',
     'nearestMultiple',
@@ -358,6 +360,122 @@ def opFrac(num: OffsetQLIn | None) -> OffsetQL | None:
         raise TypeError(f'Cannot convert num: {num}')
 
 
+# Ticks per quarter note for integer time arithmetic: exactly divisible by every
+# power of two down to 1/1024 and by tuplets of 3, 5, 7, and 9 (nested triplets).
+TICKS_PER_QUARTER = 2 ** 10 * 3 ** 2 * 5 * 7
+
+
+def quarterLengthToTicks(num: OffsetQLIn) -> int:
+    '''
+    Convert an offset or quarterLength to an exact integer number of ticks
+    where there are :data:`TICKS_PER_QUARTER` ticks per quarter note.
+    Sums, differences, comparisons, and greatest common divisors of ticks are
+    plain integer arithmetic, which is much faster than working with Fractions.
+
+    >>> common.TICKS_PER_QUARTER
+    322560
+    >>> common.quarterLengthToTicks(1.5)
+    483840
+    >>> from fractions import Fraction
+    >>> common.quarterLengthToTicks(Fraction(1, 3))
+    107520
+    >>> common.quarterLengthToTicks(2)
+    645120
+
+    Floats that are not exactly representable are converted with
+    :func:`~music21.common.numberTools.opFrac` first:
+
+    >>> common.quarterLengthToTicks(1/3)
+    107520
+
+    Values that are not a whole number of ticks raise a ValueError:
+
+    >>> common.quarterLengthToTicks(Fraction(1, 11))
+    Traceback (most recent call last):
+    ValueError: 1/11 cannot be represented exactly in ticks
+    >>> common.quarterLengthToTicks(2 ** -11)
+    Traceback (most recent call last):
+    ValueError: 1/2048 cannot be represented exactly in ticks
+
+    * New in v9.3.
+    '''
+    numType = type(num)
+    if numType is int:
+        return num * TICKS_PER_QUARTER  # type: ignore
+    if numType is float:
+        ticks = num * TICKS_PER_QUARTER
+        if ticks.is_integer():  # type: ignore
+            return int(ticks)
+    if numType is not Fraction:
+        num = opFrac(num)
+        if not isinstance(num, Fraction):
+            # a float that opFrac keeps, but finer than a tick, such as 2 ** -11
+            num = Fraction(num)
+    d = num.denominator  # type: ignore
+    if TICKS_PER_QUARTER % d:
+        raise ValueError(f'{num} cannot be represented exactly in ticks')
+    return num.numerator * (TICKS_PER_QUARTER // d)  # type: ignore
+
+
+def ticksToQuarterLength(ticks: int) -> OffsetQL:
+    '''
+    Convert a number of ticks back to an offset or quarterLength, returning
+    a float if the value is binary expressible and a Fraction otherwise, as
+    :func:`~music21.common.numberTools.opFrac` does.
+
+    >>> common.ticksToQuarterLength(483840)
+    1.5
+    >>> common.ticksToQuarterLength(107520)
+    Fraction(1, 3)
+    >>> common.ticksToQuarterLength(common.quarterLengthToTicks(0.125) * 3)
+    0.375
+
+    * New in v9.3.
+    '''
+    divisor = gcd(ticks, TICKS_PER_QUARTER)
+    n = ticks // divisor
+    d = TICKS_PER_QUARTER // divisor
+    if (d & (d - 1)) == 0:  # power of two...
+        return n / (d + 0.0)
+    return Fraction(n, d)
+
+
+def quarterLengthGCD(values: Iterable[OffsetQLIn]) -> OffsetQL:
+    '''
+    Return the exact greatest common divisor of a collection of offsets or
+    quarterLengths, computed on integer ticks.
+
+    >>> common.quarterLengthGCD([2.5, 10, 0.25])
+    0.25
+    >>> common.quarterLengthGCD([1.5, 5, 2, 7])
+    0.5
+    >>> common.quarterLengthGCD([5/3, 2/3, 5/6, 3/6])
+    Fraction(1, 6)
+
+    Unlike :func:`~music21.common.numberTools.approximateGCD`, mixtures of
+    tuplets are no problem:
+
+    >>> from fractions import Fraction
+    >>> common.quarterLengthGCD([Fraction(1, 3), Fraction(1, 5), 0.25])
+    Fraction(1, 60)
+
+    Raises a ValueError if any value cannot be represented in ticks or
+    if all values are zero.
+
+    >>> common.quarterLengthGCD([0, 0.0])
+    Traceback (most recent call last):
+    ValueError: cannot find a common divisor
+
+    * New in v9.3.
+    '''
+    ticks = 0
+    for v in values:
+        ticks = gcd(ticks, quarterLengthToTicks(v))
+    if ticks == 0:
+        raise ValueError('cannot find a common divisor')
+    return ticksToQuarterLength(ticks)
+
+
 def mixedNumeral(expr: numbers.Real,
                  limitDenominator=defaults.limitOffsetDenominator):
     '''
@@ -16,13 +16,15 @@ __all__ = [
     'cpus',
 ]
 
+from functools import partial
 import multiprocessing
 import unittest
 
 
 def runParallel(iterable, parallelFunction, *,
                 updateFunction=None, updateMultiply=3,
-                unpackIterable=False, updateSendsIterable=False):
+                unpackIterable=False, updateSendsIterable=False,
+                freezeStreams=False):
     '''
     runs parallelFunction over iterable in parallel, optionally calling updateFunction after
     each common.cpus * updateMultiply calls.
@@ -50,7 +52,10 @@ def runParallel(iterable, parallelFunction, *,
     must all be pickleable, and that if pickling the contents or
     unpickling the results takes a lot of time, you won't get nearly the speedup
     from this function as you might expect.  The big culprit here is definitely
-    music21 streams.
+    music21 streams.  If parallelFunction returns Streams, set freezeStreams=True:
+    each Stream is then frozen in the worker with the compact binary format of
+    :mod:`~music21.freezeThaw` and thawed again here, which is much faster (and
+    smaller) than pickling it.  Other results are returned unchanged.
 
     >>> files = ['bach/bwv66.6', 'schoenberg/opus19', 'AcaciaReel']
     >>> def countNotes(fn):
@@ -103,6 +108,8 @@ def runParallel(iterable, parallelFunction, *,
     >>> outputs = common.runNonParallel(inputs, pitchesAbove, unpackIterable=True) #_DOCS_HIDE
     >>> outputs
     [99, 11, 123]
+
+    * Changed in v9.3: added freezeStreams.
     '''
     numCpus = cpus()
 
@@ -111,7 +118,8 @@ def runParallel(iterable, parallelFunction, *,
                               updateFunction=updateFunction,
                               updateMultiply=updateMultiply,
                               unpackIterable=unpackIterable,
-                              updateSendsIterable=updateSendsIterable)
+                              updateSendsIterable=updateSendsIterable,
+                              freezeStreams=freezeStreams)
 
     iterLength = len(iterable)
     totalRun = 0
@@ -144,6 +152,9 @@ def runParallel(iterable, parallelFunction, *,
     callUpdate(0)
     from joblib import Parallel, delayed  # type: ignore
 
+    if freezeStreams:
+        parallelFunction = partial(_callAndFreezeStream, parallelFunction)
+
     with Parallel(n_jobs=numCpus) as para:
         delayFunction = delayed(parallelFunction)
         while totalRun < iterLength:
@@ -156,6 +167,8 @@ def runParallel(iterable, parallelFunction, *,
                 _r = para(delayFunction(iterable[i]) for i in rangeGen)
 
             totalRun = endPosition
+            if freezeStreams:
+                _r = [_thawStream(r) for r in _r]
             resultsList.extend(_r)
             callUpdate(totalRun)
 
@@ -164,10 +177,12 @@ def runParallel(iterable, parallelFunction, *,
 
 def runNonParallel(iterable, parallelFunction, *,
                    updateFunction=None, updateMultiply=3,
-                   unpackIterable=False, updateSendsIterable=False):
+                   unpackIterable=False, updateSendsIterable=False,
+                   freezeStreams=False):  # pylint: disable=unused-argument
     '''
     This is intended to be a perfect drop in replacement for runParallel, except that
-    it runs on one core only, and not in parallel.
+    it runs on one core only, and not in parallel.  (freezeStreams is accepted
+    but ignored, since nothing has to leave the process.)
 
     Used automatically if we're already in a parallelized function.
     '''
@@ -220,6 +235,41 @@ def cpus():
     else:
         return cpuCount
 
+class _FrozenStream:
+    '''
+    A Stream frozen in a worker process by :func:`_callAndFreezeStream`.
+    '''
+    __slots__ = ('data',)
+
+    def __init__(self, data: bytes):
+        self.data = data
+
+
+def _callAndFreezeStream(parallelFunction, *args):
+    '''
+    Call parallelFunction and freeze its result if it is a Stream, for
+    runParallel(freezeStreams=True).
+    '''
+    from music21 import freezeThaw
+    from music21 import stream
+
+    result = parallelFunction(*args)
+    if isinstance(result, stream.Stream):
+        # the Stream is thrown away here afterward, so no need to copy it.
+        freezer = freezeThaw.StreamFreezer(result, fastButUnsafe=True)
+        return _FrozenStream(freezer.writeStr(fmt='binary'))
+    return result
+
+
+def _thawStream(result):
+    if not isinstance(result, _FrozenStream):
+        return result
+    from music21 import freezeThaw
+    thawer = freezeThaw.StreamThawer()
+    thawer.openStr(result.data)
+    return thawer.stream
+
+
 # Not shown to work.
 # def pickleCopy(obj):
 #     '''
@@ -237,6 +287,11 @@ def _countN(fn):
     return len(c.recurse().notes)
 
 
+def _parseN(fn):
+    from music21 import corpus
+    return corpus.parse(fn)
+
+
 def _countUnpacked(i, fn):
     if i >= 3:
         return False
@@ -263,6 +318,18 @@ class Test(unittest.TestCase):
         self.assertEqual(len(passed), 3)
         self.assertNotIn(False, passed)
 
+    def testFreezeStreams(self):
+        from music21.common.parallel import (
+            _callAndFreezeStream, _countN, _FrozenStream, _parseN, _thawStream)
+        frozen = _callAndFreezeStream(_parseN, 'bach/bwv66.6')
+        self.assertIsInstance(frozen, _FrozenStream)
+        self.assertIsInstance(frozen.data, bytes)
+        sc = _thawStream(frozen)
+        self.assertEqual(len(sc.recurse().notes), 165)
+        self.assertEqual(len(sc.parts), 4)
+        # anything that is not a Stream passes through.
+        self.assertEqual(_thawStream(_callAndFreezeStream(_countN, 'bach/bwv66.6')), 165)
+
     # testing functions
     def _customUpdate1(self, i, total, output):
         self.assertEqual(total, 3)
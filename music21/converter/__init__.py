@@ -649,7 +649,7 @@ class Converter:
                 environLocal.printDebug('Freezing Pickle')
                 s = self.stream
                 sf = freezeThaw.StreamFreezer(s, fastButUnsafe=True)
-                sf.write(fp=fpPickle, zipType='zlib')
+                sf.write(fmt='binary', fp=fpPickle, zipType='zlib')
 
                 environLocal.printDebug('Replacing self.stream')
                 # get a new stream
@@ -1469,8 +1469,10 @@ def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib') ->
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
 
-    The serialization format is defined by the `fmt` argument; 'pickle' (the default) is only one
-    presently supported.  'json' or 'jsonnative' will be used once jsonpickle is good enough.
+    The serialization format is defined by the `fmt` argument; 'pickle' (the default)
+    or 'binary', a compact format that can later be thawed in part (see
+    :func:`~music21.converter.thaw`).  'json' or 'jsonnative' will be used once
+    jsonpickle is good enough.
 
     If no file path is given, a temporary file is used.
 
@@ -1514,17 +1516,37 @@ def freeze(streamObj, fmt=None, fp=None, fastButUnsafe=False, zipType='zlib') ->
     return v.write(fmt=fmt, fp=fp, zipType=zipType)  # returns fp
 
 
-def thaw(fp, zipType='zlib'):
+def thaw(fp, zipType='zlib', *, parts=None, measures=None):
     '''
     Given a file path of a serialized Stream, defrost the file into a Stream.
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
 
     See the documentation for :meth:`~music21.converter.freeze` for demos.
+
+    Files written in the 'binary' format can be thawed in part: `parts` is a
+    list of part indices to keep and `measures` a (start, end) pair of
+    measure numbers, inclusive.  Everything else is skipped without being
+    decoded.
+
+    >>> b = corpus.parse('bwv66.6')
+    >>> fp = converter.freeze(b, fmt='binary')
+    >>> excerpt = converter.thaw(fp, parts=[0], measures=(1, 2))
+    >>> len(excerpt.parts)
+    1
+    >>> [m.number for m in excerpt.parts[0].getElementsByClass(stream.Measure)]
+    [1, 2]
+
+    OMIT_FROM_DOCS
+
+    >>> import os
+    >>> os.remove(fp)
+
+    * Changed in v9.3: added `parts` and `measures`.
     '''
     from music21 import freezeThaw
     v = freezeThaw.StreamThawer()
-    v.open(fp, zipType=zipType)
+    v.open(fp, zipType=zipType, parts=parts, measures=measures)
     return v.stream
 
 
@@ -1537,8 +1559,8 @@ def freezeStr(streamObj, fmt=None):
     :class:`~music21.converter.StreamFreezer` object.
 
     The serialization format is defined by
-    the `fmt` argument; 'pickle' (the default),
-    is the only one presently supported.
+    the `fmt` argument; 'pickle' (the default)
+    or 'binary', which returns bytes.
 
 
     >>> c = converter.parse('tinyNotation: 4/4 c4 d e f', makeNotation=False)
@@ -1565,15 +1587,20 @@ def freezeStr(streamObj, fmt=None):
     return v.writeStr(fmt=fmt)  # returns a string
 
 
-def thawStr(strData):
+def thawStr(strData, *, parts=None, measures=None):
     '''
     Given a serialization string, defrost into a Stream.
 
     This function is based on the :class:`~music21.converter.StreamFreezer` object.
+
+    `parts` and `measures` work as in :func:`~music21.converter.thaw` for data
+    in the 'binary' format.
+
+    * Changed in v9.3: added `parts` and `measures`.
     '''
     from music21 import freezeThaw
     v = freezeThaw.StreamThawer()
-    v.openStr(strData)
+    v.openStr(strData, parts=parts, measures=measures)
     return v.stream
 
 
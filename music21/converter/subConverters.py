@@ -1113,10 +1113,23 @@ class ConverterABC(SubConverter):
 
         If `number` is provided, and this ABC file defines multiple works
         with an X: tag, just the specified work will be returned.
+
+        Files that define multiple works are parsed work by work, in parallel
+        for large collections, unless the keyword `parallel` is False.
+
+        * Changed in v9.3: multiple works are parsed separately, and
+          can be parsed in parallel.
         '''
         # environLocal.printDebug(['ConverterABC.parseFile: got number', number])
         from music21 import abcFormat
 
+        if number is None:
+            index = abcFormat.ABCReferenceIndex.forFile(filePath)
+            if len(index) > 1 and not index.hasDuplicates:
+                self.stream = abcFormat.translate.abcFileToStreamOpus(
+                    filePath, index, parallel=keywords.get('parallel', True))
+                return
+
         af = abcFormat.ABCFile()
         af.open(filePath)
         # returns a handler instance of parse tokens
@@ -3111,6 +3111,22 @@ class FrozenDuration(common.objects.FrozenObject, Duration):
     >>> import copy
     >>> copy.deepcopy(fd) is fd
     True
+
+    A FrozenDuration can be assigned to the `.duration` of many objects at once.
+    Each object makes its own (mutable) copy the first time its `.duration`
+    is accessed, so changing one does not change the others:
+
+    >>> n1 = note.Note()
+    >>> n2 = note.Note()
+    >>> n1.duration = fd
+    >>> n2.duration = fd
+    >>> n1.duration.dots = 0
+    >>> n1.duration
+    <music21.duration.Duration 2.0>
+    >>> n2.quarterLength
+    3.5
+
+    * Changed in v9.3: can be assigned to the duration of Music21Objects.
     '''
     __slots__ = ()
 
@@ -3125,6 +3141,60 @@ class FrozenDuration(common.objects.FrozenObject, Duration):
         '''
         return self
 
+    def unfrozen(self) -> Duration:
+        '''
+        Return a new, mutable Duration equal to this one.
+
+        >>> fd = duration.FrozenDuration(1/3)
+        >>> d = fd.unfrozen()
+        >>> d
+        <music21.duration.Duration 1/3>
+        >>> d == duration.Duration(1/3)
+        True
+        >>> d.tuplets[0] is fd.tuplets[0]
+        False
+
+        * New in v9.3.
+        '''
+        new = Duration.__new__(Duration)
+        for slot in Duration.__slots__:
+            setattr(new, slot, getattr(self, slot))
+        if self._tuplets:
+            new._tuplets = tuple(copy.deepcopy(tup) for tup in self._tuplets)
+        new.client = None
+        return new
+
+
+@lru_cache(1024)
+def internDuration(typeOrQuarterLength: str | OffsetQLIn = 1.0, dots: int = 0) -> FrozenDuration:
+    '''
+    Return a shared :class:`FrozenDuration` for a type and number of dots
+    or for a quarterLength.  Asking again for the same values returns the
+    same object, so notes created in bulk need not each make a Duration.
+
+    >>> fd = duration.internDuration('eighth', 1)
+    >>> fd
+    <music21.duration.FrozenDuration 0.75>
+    >>> duration.internDuration('eighth', 1) is fd
+    True
+    >>> duration.internDuration(1/3)
+    <music21.duration.FrozenDuration 1/3>
+
+    As with creating a Duration, giving a quarterLength sets `expressionIsInferred`:
+
+    >>> duration.internDuration(0.75).expressionIsInferred
+    True
+    >>> fd.expressionIsInferred
+    False
+
+    See :func:`~music21.note.internedValues` for creating notes with shared durations.
+
+    * New in v9.3.
+    '''
+    if isinstance(typeOrQuarterLength, str):
+        return FrozenDuration(typeOrQuarterLength, dots=dots)
+    return FrozenDuration(quarterLength=typeOrQuarterLength)
+
 class GraceDuration(Duration):
     '''
     A Duration that, no matter how it is created, always has a quarter length
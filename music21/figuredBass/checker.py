@@ -340,6 +340,58 @@ def checkConsecutivePossibilities(music21Stream, functionToApply, color='#FF0000
         for lineInfo in debugInfo:
             print(lineInfo)
 
+
+def checkVoiceLeading(music21Stream, rules=voiceLeading.VOICE_LEADING_RULES,
+                      color='#FF0000', debug=False):
+    # noinspection PyShadowingNames
+    '''
+    Checks every pair of parts in a :class:`~music21.stream.Score` against all
+    of the given voice-leading `rules` at once with
+    :func:`~music21.voiceLeading.findVoiceLeadingErrorsInArrays`, which is much
+    faster than calling :func:`checkConsecutivePossibilities` once per rule on
+    long scores.  Changes the color of the notes involved in each error (for
+    errors between two moments, the notes of both moments) and returns the list of
+    :class:`~music21.voiceLeading.VoiceLeadingError` records.
+
+    >>> music21Stream = corpus.parse('theoryExercises/checker_demo.xml')
+    >>> from music21.figuredBass import checker
+    >>> errors = checker.checkVoiceLeading(music21Stream, rules=('parallelOctave',), debug=True)
+    Rules: parallelOctave
+    Measure:  Offset:  Part Numbers:  Rule:
+    1         2.0      (2, 4)         parallelOctave
+    2         3.0      (2, 4)         parallelOctave
+    4         9.0      (1, 3)         parallelOctave
+    >>> errors[0]
+    VoiceLeadingError(measure=1, offset=2.0, voices=(2, 4), rule='parallelOctave')
+
+    * New in v9.3.
+    '''
+    offsets, measures, ps, steps = voiceLeading.getVoicePitchArrays(music21Stream)
+    errors = voiceLeading.findVoiceLeadingErrorsInArrays(offsets, ps, steps, measures,
+                                                         rules=rules)
+    if color is not None:
+        allParts = [p.flatten() for p in music21Stream.getElementsByClass(stream.Part)]
+        offsetList = offsets.tolist()
+        for error in errors:
+            errorOffsets = [error.offset]
+            if error.rule != 'voiceCrossing':
+                errorOffsets.insert(0, offsetList[offsetList.index(error.offset) - 1])
+            for partNumber in error.voices:
+                for offset in errorOffsets:
+                    n = allParts[partNumber - 1].getElementsByOffset(
+                        offset, offset, mustBeginInSpan=False).notes.first()
+                    if n is not None:
+                        n.style.color = color
+
+    if debug is True:
+        print('Rules: ' + ', '.join(rules))
+        print('Measure:  Offset:  Part Numbers:  Rule:')
+        if not errors:
+            print('No violations to report.')
+        for error in errors:
+            print(f'{error.measure!s:10}{error.offset!s:9}{error.voices!s:15}{error.rule}')
+    return errors
+
 # ------------------------------------------------------------------------------
 # Single Possibility Rule-Checking Methods
 
@@ -728,7 +780,8 @@ def generalNoteToPitch(music21GeneralNote):
 
 
 _DOC_ORDER = [extractHarmonies, getVoiceLeadingMoments,
-              checkConsecutivePossibilities, checkSinglePossibilities]
+              checkConsecutivePossibilities, checkSinglePossibilities,
+              checkVoiceLeading]
 # -----------------------------------------------------------------------------
 
 
@@ -44,6 +44,8 @@ from __future__ import annotations
 
 import collections
 import copy
+import heapq
+import itertools
 import random
 import typing as t
 import unittest
@@ -388,7 +390,7 @@ class FiguredBassLine:
     def overlayPart(self, music21Part):
         self._overlaidParts.append(music21Part)
 
-    def realize(self, fbRules=None, numParts=4, maxPitch=None):
+    def realize(self, fbRules=None, numParts=4, maxPitch=None, *, buildMovements=True):
         # noinspection PyShadowingNames
         '''
         Creates a :class:`~music21.figuredBass.segment.Segment`
@@ -410,6 +412,15 @@ class FiguredBassLine:
 
         if `maxPitch` is None, uses pitch.Pitch('B5')
 
+        If `buildMovements` is False, the correct (possibA, possibB) pairs between
+        Segments are not all found up front. Instead, the Realization searches through
+        the Segments when asked for a progression, checking each pair of possibilities
+        only when it is reached and remembering the answer.  This is much faster
+        and smaller for long bass lines, especially with
+        :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`
+        or :meth:`~music21.figuredBass.realizer.Realization.getRandomPossibilityProgression`,
+        and finds the same solutions.
+
         >>> from music21.figuredBass import realizer
         >>> from music21.figuredBass import rules
         >>> fbLine = realizer.FiguredBassLine(key.Key('B'), meter.TimeSignature('3/4'))
@@ -424,6 +435,9 @@ class FiguredBassLine:
         >>> r2 = fbLine.realize(fbRules)
         >>> r2.getNumSolutions()
         7908
+        >>> r3 = fbLine.realize(fbRules, buildMovements=False)
+        >>> r3.getNumSolutions()
+        7908
 
         OMIT_FROM_DOCS
         >>> fbLine3 = realizer.FiguredBassLine(key.Key('C'), meter.TimeSignature('2/4'))
@@ -492,7 +506,11 @@ class FiguredBassLine:
         else:
             segmentList = self.retrieveSegments(fbRules, numParts, maxPitch)
 
-        if len(segmentList) >= 2:
+        if not segmentList:
+            raise FiguredBassLineException('No (bassNote, notationString) pairs to realize.')
+        elif not buildMovements:
+            pass
+        elif len(segmentList) >= 2:
             for segmentIndex in range(len(segmentList) - 1):
                 segmentA = segmentList[segmentIndex]
                 segmentB = segmentList[segmentIndex + 1]
@@ -505,12 +523,10 @@ class FiguredBassLine:
         elif len(segmentList) == 1:
             segmentA = segmentList[0]
             segmentA.correctA = list(segmentA.allCorrectSinglePossibilities())
-        elif not segmentList:
-            raise FiguredBassLineException('No (bassNote, notationString) pairs to realize.')
 
         return Realization(realizedSegmentList=segmentList, inKey=self.inKey,
                            inTime=self.inTime, overlaidParts=self._overlaidParts[0:-1],
-                           paddingLeft=self._paddingLeft)
+                           paddingLeft=self._paddingLeft, movementsBuilt=buildMovements)
 
     def _trimAllMovements(self, segmentList):
         '''
@@ -563,7 +579,9 @@ class Realization:
     '''
     _DOC_ORDER = ['getNumSolutions', 'generateRandomRealization',
                   'generateRandomRealizations', 'generateAllRealizations',
+                  'generateBestRealizations',
                   'getAllPossibilityProgressions', 'getRandomPossibilityProgression',
+                  'getBestPossibilityProgressions',
                   'generateRealizationFromPossibilityProgression']
     _DOC_ATTR: dict[str, str] = {
         'keyboardStyleOutput': '''
@@ -586,8 +604,15 @@ class Realization:
             self._overlaidParts = fbLineOutputs['overlaidParts']
         if 'paddingLeft' in fbLineOutputs:
             self._paddingLeft = fbLineOutputs['paddingLeft']
+        self._movementsBuilt = fbLineOutputs.get('movementsBuilt', True)
+        self._search: PossibilitySearch | None = None
         self.keyboardStyleOutput = True
 
+    def _getSearch(self) -> PossibilitySearch:
+        if self._search is None:
+            self._search = PossibilitySearch(self._segmentList)
+        return self._search
+
     def getNumSolutions(self):
         '''
         Returns the number of solutions (unique realizations) to a Realization by calculating
@@ -605,6 +630,8 @@ class Realization:
         >>> fbRealization2.getNumSolutions()
         833
         '''
+        if not self._movementsBuilt:
+            return self._getSearch().getNumSolutions()
         if len(self._segmentList) == 1:
             return len(self._segmentList[0].correctA)
         # What if there's only one (bassNote, notationString)?
@@ -639,6 +666,8 @@ class Realization:
         .. warning:: This method is unoptimized, and may take a prohibitive amount
             of time for a Realization which has more than 200,000 solutions.
         '''
+        if not self._movementsBuilt:
+            return list(self._getSearch().iterateProgressions())
         progressions = []
         if len(self._segmentList) == 1:
             for possibA in self._segmentList[0].correctA:
@@ -666,7 +695,20 @@ class Realization:
     def getRandomPossibilityProgression(self):
         '''
         Returns a random unique possibility progression.
+
+        If the Realization was made with `buildMovements=False`, the progression is
+        found by walking forward through the Segments, choosing a random correct
+        possibility at each step and backing up from possibilities that lead nowhere,
+        so no other progressions need to be found first.
+
+        * Changed in v9.3: works without movements.
         '''
+        if not self._movementsBuilt:
+            progression = self._getSearch().getRandomProgression()
+            if progression is None:
+                raise FiguredBassLineException('Zero solutions')
+            return progression
+
         progression = []
         if len(self._segmentList) == 1:
             possibA = random.sample(self._segmentList[0].correctA, 1)[0]
@@ -687,6 +729,52 @@ class Realization:
 
         return progression
 
+    def getBestPossibilityProgressions(self, amountToGenerate=1, costFunction=None,
+                                       beamWidth=None):
+        # noinspection PyShadowingNames
+        '''
+        Returns a list of the `amountToGenerate` possibility progressions with the
+        lowest total cost, lowest first, where the cost of a progression is the sum of
+        `costFunction(possibA, possibB)` over its consecutive possibilities.
+        `costFunction` defaults to :func:`~music21.figuredBass.realizer.voiceMovementCost`,
+        preferring realizations in which the upper parts move as little as possible.
+
+        The progressions are found by dynamic programming through the Segments, keeping
+        only the best partial progressions ending on each possibility, so they do not all
+        need to be listed first.  If `beamWidth` is given, only that many of the
+        best possibilities of each Segment (among those which can lead to the end of the
+        bass line) are carried on to the next, which is much faster for long bass lines
+        but may miss the best progressions.
+
+        >>> from music21.figuredBass import examples, realizer
+        >>> fbLine = examples.exampleB()
+        >>> fbRealization = fbLine.realize(buildMovements=False)
+        >>> best = fbRealization.getBestPossibilityProgressions(3)
+        >>> len(best)
+        3
+        >>> [str(p) for p in best[0][0]]
+        ['A4', 'F4', 'D4', 'D3']
+        >>> def totalCost(progression):
+        ...     return sum(realizer.voiceMovementCost(possibA, possibB)
+        ...                for possibA, possibB in zip(progression, progression[1:]))
+        >>> [totalCost(progression) for progression in best]
+        [29.0, 29.0, 29.0]
+
+        A narrow beam is faster but may settle for a worse progression:
+
+        >>> [totalCost(progression)
+        ...      for progression in fbRealization.getBestPossibilityProgressions(beamWidth=3)]
+        [32.0]
+        >>> [totalCost(progression)
+        ...      for progression in fbRealization.getBestPossibilityProgressions(beamWidth=10)]
+        [29.0]
+
+        * New in v9.3.
+        '''
+        if costFunction is None:
+            costFunction = voiceMovementCost
+        return self._getSearch().getBestProgressions(amountToGenerate, costFunction, beamWidth)
+
     def generateRealizationFromPossibilityProgression(self, possibilityProgression):
         '''
         Generates a realization as a :class:`~music21.stream.Score` given a possibility progression.
@@ -766,8 +854,25 @@ class Realization:
         .. warning:: This method is unoptimized, and may take a prohibitive amount
             of time for a Realization which has more than 100 solutions.
         '''
-        allSols = stream.Score()
         possibilityProgressions = self.getAllPossibilityProgressions()
+        return self._generateRealizationsFromPossibilityProgressions(possibilityProgressions)
+
+    def generateBestRealizations(self, amountToGenerate=1, costFunction=None, beamWidth=None):
+        '''
+        Generates the *amountToGenerate* best realizations, one after another, as a
+        :class:`~music21.stream.Score`.  See
+        :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`
+        for `costFunction` and `beamWidth`.
+
+        * New in v9.3.
+        '''
+        possibilityProgressions = self.getBestPossibilityProgressions(amountToGenerate,
+                                                                      costFunction,
+                                                                      beamWidth)
+        return self._generateRealizationsFromPossibilityProgressions(possibilityProgressions)
+
+    def _generateRealizationsFromPossibilityProgressions(self, possibilityProgressions):
+        allSols = stream.Score()
         if not possibilityProgressions:
             raise FiguredBassLineException('Zero solutions')
         sol0 = self.generateRealizationFromPossibilityProgression(possibilityProgressions[0])
@@ -815,8 +920,291 @@ class Realization:
         return allSols
 
 
+def voiceMovementCost(possibA, possibB) -> float:
+    '''
+    The default cost of moving from possibA to possibB used by
+    :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`:
+    the total number of semitones moved by the upper parts.
+
+    >>> from music21.figuredBass import realizer
+    >>> possibA = (pitch.Pitch('E5'), pitch.Pitch('G4'), pitch.Pitch('C4'), pitch.Pitch('C3'))
+    >>> possibB = (pitch.Pitch('D5'), pitch.Pitch('G4'), pitch.Pitch('B3'), pitch.Pitch('G2'))
+    >>> realizer.voiceMovementCost(possibA, possibB)
+    3.0
+
+    * New in v9.3.
+    '''
+    return sum(abs(pitchB.ps - pitchA.ps) for pitchA, pitchB in zip(possibA[:-1], possibB[:-1]))
+
+
+class PossibilitySearch:
+    '''
+    Finds possibility progressions through a list of
+    :class:`~music21.figuredBass.segment.Segment` objects on demand, used by a
+    :class:`~music21.figuredBass.realizer.Realization` made with
+    `buildMovements=False`.
+
+    The correct single possibilities of each Segment are found once, the first time they
+    are needed.  Whether a (possibA, possibB) pair passes the consecutive possibility rules
+    is only checked when the search reaches it, and the answer is remembered for every
+    Segment with the same rules, so repeated harmonies in a bass line are cheap.  Possibilities
+    which cannot lead to the end of the bass line are remembered too, so that the search
+    never explores them twice.
+
+    >>> from music21.figuredBass import realizer
+    >>> fbLine = realizer.FiguredBassLine()
+    >>> fbLine.addElement(note.Note('C3'))
+    >>> fbLine.addElement(note.Note('D3'), '4,3')
+    >>> fbLine.addElement(note.Note('C3', quarterLength=2.0))
+    >>> search = realizer.PossibilitySearch(fbLine.retrieveSegments())
+    >>> search.getNumSolutions()
+    30
+    >>> len(list(search.iterateProgressions()))
+    30
+
+    * New in v9.3.
+    '''
+    def __init__(self, segmentList):
+        self.segmentList = segmentList
+        self._candidates: dict[int, list] = {}
+        self._candidateSets: dict[int, set] = {}
+        self._resolutions: dict[int, dict | None] = {}
+        self._ruleKeys: dict[int, tuple] = {}
+        self._compatible: dict[tuple, bool] = {}
+        self._deadEnds: set[tuple] = set()
+        self._liveEnds: set[tuple] = set()
+
+    def candidates(self, segmentIndex):
+        '''
+        Returns the list of correct single possibilities of the Segment at `segmentIndex`.
+        '''
+        if segmentIndex not in self._candidates:
+            segmentA = self.segmentList[segmentIndex]
+            self._candidates[segmentIndex] = list(segmentA.allCorrectSinglePossibilities())
+            self._candidateSets[segmentIndex] = set(self._candidates[segmentIndex])
+        return self._candidates[segmentIndex]
+
+    def successors(self, segmentIndex, possibA):
+        '''
+        Returns a list of the possibilities of the Segment after `segmentIndex` which
+        possibA can move to, in the same order as
+        :meth:`~music21.figuredBass.segment.Segment.allCorrectConsecutivePossibilities`
+        would give them.
+        '''
+        resolutions = self._getResolutions(segmentIndex)
+        if resolutions is not None:
+            possibBList = resolutions.get(possibA, [])
+            if segmentIndex + 2 < len(self.segmentList):
+                self.candidates(segmentIndex + 1)
+                candidateSet = self._candidateSets[segmentIndex + 1]
+                possibBList = [possibB for possibB in possibBList if possibB in candidateSet]
+            return possibBList
+
+        segmentA = self.segmentList[segmentIndex]
+        ruleKey = self._ruleKeys[segmentIndex]
+        compatible = self._compatible
+        possibBList = []
+        for possibB in self.candidates(segmentIndex + 1):
+            pairKey = (ruleKey, possibA, possibB)
+            isCorrect = compatible.get(pairKey)
+            if isCorrect is None:
+                isCorrect = segmentA._isCorrectConsecutivePossibility(possibA, possibB)
+                compatible[pairKey] = isCorrect
+            if isCorrect:
+                possibBList.append(possibB)
+        return possibBList
+
+    def getNumSolutions(self) -> int:
+        '''
+        Returns the number of possibility progressions, counting backwards from the
+        last Segment so that only the number of progressions from each possibility
+        of one Segment needs to be kept at a time.
+        '''
+        numSegments = len(self.segmentList)
+        if numSegments == 1:
+            return len(self.candidates(0))
+        pathCounts: dict = {}
+        for segmentIndex in range(numSegments - 2, -1, -1):
+            newPathCounts = {}
+            for possibA in self.candidates(segmentIndex):
+                possibBList = self.successors(segmentIndex, possibA)
+                if segmentIndex == numSegments - 2:
+                    numPaths = len(possibBList)
+                else:
+                    numPaths = sum(pathCounts.get(possibB, 0) for possibB in possibBList)
+                if numPaths:
+                    newPathCounts[possibA] = numPaths
+                else:
+                    self._deadEnds.add((segmentIndex, possibA))
+            pathCounts = newPathCounts
+        return sum(pathCounts.values())
+
+    def iterateProgressions(self):
+        '''
+        Yields every possibility progression as a list, in the same order as
+        :meth:`~music21.figuredBass.realizer.Realization.getAllPossibilityProgressions`
+        gives them when movements are built.
+        '''
+        numSegments = len(self.segmentList)
+        if numSegments == 1:
+            for possibA in self.candidates(0):
+                yield [possibA]
+            return
+
+        # breadth first, to keep the same order as getAllPossibilityProgressions
+        progressions = [[possibA] for possibA in self.candidates(0)
+                        if self._leadsToEnd(0, possibA)]
+        for segmentIndex in range(numSegments - 1):
+            isLast = (segmentIndex == numSegments - 2)
+            newProgressions = []
+            for progression in progressions:
+                for possibB in self.successors(segmentIndex, progression[-1]):
+                    if isLast or self._leadsToEnd(segmentIndex + 1, possibB):
+                        newProgressions.append(progression + [possibB])
+            progressions = newProgressions
+        yield from progressions
+
+    def getRandomProgression(self, rng=None):
+        '''
+        Returns a random possibility progression as a list, or None if there are none.
+        `rng` is a :class:`random.Random` object to use; if None, the `random` module
+        is used.
+
+        Possibilities are chosen one Segment at a time, backing up whenever a possibility
+        turns out to lead nowhere, so that each progression is correct without the others
+        being found.  Like the progressions chosen by a Realization with movements, the
+        choice is not weighted by the number of progressions through each possibility.
+        '''
+        if rng is None:
+            rng = random
+        numSegments = len(self.segmentList)
+        if numSegments == 1:
+            possibilities = self.candidates(0)
+            return [rng.choice(possibilities)] if possibilities else None
+
+        def shuffled(possibilities):
+            possibilities = list(possibilities)
+            rng.shuffle(possibilities)
+            return possibilities
+
+        progression = []
+        choicesStack = [shuffled(self.candidates(0))]
+        while choicesStack:
+            segmentIndex = len(progression)
+            choices = choicesStack[-1]
+            if not choices:
+                choicesStack.pop()
+                if progression:
+                    self._deadEnds.add((segmentIndex - 1, progression.pop()))
+                continue
+            possibA = choices.pop()
+            if (segmentIndex, possibA) in self._deadEnds:
+                continue
+            progression.append(possibA)
+            if segmentIndex == numSegments - 1:
+                return progression
+            choicesStack.append(shuffled(self.successors(segmentIndex, possibA)))
+        return None
+
+    def getBestProgressions(self, amountToGenerate=1, costFunction=None, beamWidth=None):
+        '''
+        Returns a list of up to `amountToGenerate` possibility progressions with
+        the lowest total `costFunction(possibA, possibB)`, lowest first.  See
+        :meth:`~music21.figuredBass.realizer.Realization.getBestPossibilityProgressions`.
+        '''
+        if costFunction is None:
+            costFunction = voiceMovementCost
+        numSegments = len(self.segmentList)
+        # each entry is (cost, tieBreak, possibility, previousEntry)
+        tieBreak = itertools.count()
+        frontier = {possibA: [(0.0, next(tieBreak), possibA, None)]
+                    for possibA in self.candidates(0)}
+        for segmentIndex in range(numSegments - 1):
+            if beamWidth is not None and len(frontier) > beamWidth:
+                # only keep possibilities that can finish, so the beam cannot empty
+                frontier = {possibA: entries for possibA, entries in frontier.items()
+                            if self._leadsToEnd(segmentIndex, possibA)}
+                bestPossibilities = heapq.nsmallest(beamWidth, frontier,
+                                                    key=lambda p: frontier[p][0][:2])
+                frontier = {possibA: frontier[possibA] for possibA in bestPossibilities}
+            newFrontier = collections.defaultdict(list)
+            for possibA, entries in frontier.items():
+                for possibB in self.successors(segmentIndex, possibA):
+                    moveCost = costFunction(possibA, possibB)
+                    for entry in entries:
+                        newFrontier[possibB].append(
+                            (entry[0] + moveCost, next(tieBreak), possibB, entry))
+            frontier = {possibB: heapq.nsmallest(amountToGenerate, entries)
+                        for possibB, entries in newFrontier.items()}
+
+        allEntries = [entry for entries in frontier.values() for entry in entries]
+        progressions = []
+        for entry in heapq.nsmallest(amountToGenerate, allEntries):
+            progression = []
+            while entry is not None:
+                progression.append(entry[2])
+                entry = entry[3]
+            progression.reverse()
+            progressions.append(progression)
+        return progressions
+
+    def _getResolutions(self, segmentIndex):
+        '''
+        Returns a dict of possibA to the list of its resolutions if the Segment at
+        `segmentIndex` resolves specially to the next one, or None if it is ordinary,
+        in which case its consecutive possibility rules are compiled.
+        '''
+        if segmentIndex in self._resolutions:
+            return self._resolutions[segmentIndex]
+
+        segmentA = self.segmentList[segmentIndex]
+        segmentB = self.segmentList[segmentIndex + 1]
+        specialResolutions = segment._compileRules(
+            segmentA.specialResolutionRules(segmentA.fbRules), 3)
+        resolutions = None
+        if specialResolutions[True]:
+            # a special Segment pairs each possibility with a single resolution
+            resolutions = collections.defaultdict(list)
+            for possibA, possibB in segmentA.allCorrectConsecutivePossibilities(segmentB):
+                resolutions[possibA].append(possibB)
+        else:
+            segmentA._consecutivePossibilityRuleChecking = segment._compileRules(
+                segmentA.consecutivePossibilityRules(segmentA.fbRules))
+            self._ruleKeys[segmentIndex] = tuple(
+                (method, isCorrect, repr(args))
+                for (method, isCorrect, args)
+                in segmentA._consecutivePossibilityRuleChecking[True])
+        self._resolutions[segmentIndex] = resolutions
+        return resolutions
+
+    def _leadsToEnd(self, segmentIndex, possibA):
+        '''
+        Returns True if at least one progression leads from possibA in the Segment at
+        `segmentIndex` to the last Segment, remembering the answer for every
+        possibility visited.
+        '''
+        lastIndex = len(self.segmentList) - 1
+        stack = [(segmentIndex, possibA, None)]
+        while stack:
+            thisIndex, thisPossib, remaining = stack[-1]
+            if thisIndex == lastIndex or (thisIndex, thisPossib) in self._liveEnds:
+                for (pathIndex, pathPossib, unused_remaining) in stack:
+                    self._liveEnds.add((pathIndex, pathPossib))
+                return True
+            if remaining is None:
+                remaining = [possibB for possibB in self.successors(thisIndex, thisPossib)
+                             if (thisIndex + 1, possibB) not in self._deadEnds]
+                stack[-1] = (thisIndex, thisPossib, remaining)
+            if not remaining:
+                stack.pop()
+                self._deadEnds.add((thisIndex, thisPossib))
+                continue
+            stack.append((thisIndex + 1, remaining.pop(), None))
+        return False
+
+
 _DOC_ORDER = [figuredBassFromStream, addLyricsToBassNote,
-              FiguredBassLine, Realization]
+              FiguredBassLine, Realization, PossibilitySearch, voiceMovementCost]
 
 
 class FiguredBassLineException(exceptions21.Music21Exception):
@@ -855,6 +1243,49 @@ class Test(unittest.TestCase):
                 unused_fb = figuredBassFromStream(s)
                 self.assertEqual(third_note.editorial.notationString, single_symbol)
 
+    def testSearchWithoutMovements(self):
+        from music21.figuredBass import examples
+
+        fbRules = rules.Rules()
+        fbRules.partMovementLimits = [(1, 2), (2, 12), (3, 12)]
+        for fbLine in (examples.exampleB(), examples.exampleD()):
+            withMovements = fbLine.realize(fbRules)
+            withoutMovements = fbLine.realize(fbRules, buildMovements=False)
+            allProgressions = withMovements.getAllPossibilityProgressions()
+            self.assertEqual(withoutMovements.getNumSolutions(), len(allProgressions))
+            self.assertEqual(withoutMovements.getAllPossibilityProgressions(), allProgressions)
+
+            allProgressionSet = {tuple(progression) for progression in allProgressions}
+            for unused_i in range(5):
+                progression = withoutMovements.getRandomPossibilityProgression()
+                self.assertIn(tuple(progression), allProgressionSet)
+
+            def totalCost(progression):
+                return sum(voiceMovementCost(possibA, possibB)
+                           for possibA, possibB in zip(progression, progression[1:]))
+
+            expectedCosts = sorted(totalCost(progression) for progression in allProgressions)
+            best = withoutMovements.getBestPossibilityProgressions(4)
+            self.assertEqual([totalCost(progression) for progression in best],
+                             expectedCosts[:4])
+            for progression in best:
+                self.assertIn(tuple(progression), allProgressionSet)
+            self.assertEqual(withMovements.getBestPossibilityProgressions(4), best)
+
+    def testSearchZeroSolutions(self):
+        # the upper parts cannot move, so cannot fit the D minor triad
+        fbLine = FiguredBassLine()
+        fbLine.addElement(note.Note('C3'))
+        fbLine.addElement(note.Note('C3'))
+        fbLine.addElement(note.Note('D3'))
+        fbRules = rules.Rules()
+        fbRules.partMovementLimits = [(1, 0), (2, 0), (3, 0)]
+        realization = fbLine.realize(fbRules, buildMovements=False)
+        self.assertEqual(realization.getNumSolutions(), 0)
+        self.assertEqual(realization.getBestPossibilityProgressions(), [])
+        with self.assertRaises(FiguredBassLineException):
+            realization.getRandomPossibilityProgression()
+
 
 if __name__ == '__main__':
     import music21
@@ -69,22 +69,36 @@ exist in the Python namespace.
 from __future__ import annotations
 
 import copy
+import copyreg
+from fractions import Fraction
+import importlib
 import io
 import os
 import pathlib
 import pickle
+import struct
 import time
+import typing as t
 import unittest
 import zlib
 
 from music21 import base
+from music21 import beam
 from music21 import common
+from music21.common.enums import OffsetSpecial
 from music21 import derivation
+from music21 import duration
 from music21 import environment
 from music21 import exceptions21
+from music21 import pitch
+from music21 import sites
 from music21 import spanner
+from music21 import tie
 from music21 import variant
 
+if t.TYPE_CHECKING:
+    from music21 import stream
+
 environLocal = environment.Environment('freezeThaw')
 
 # -----------------------------------------------------------------------------
@@ -116,6 +130,9 @@ class StreamFreezeThawBase:
     def getJsonFp(self, directory: str | pathlib.Path) -> pathlib.Path:
         return self.getPickleFp(directory).with_suffix('.p.json')
 
+    def getBinaryFp(self, directory: str | pathlib.Path) -> pathlib.Path:
+        return self.getPickleFp(directory).with_suffix('.m21b')
+
 
 # -----------------------------------------------------------------------------
 class StreamFreezer(StreamFreezeThawBase):
@@ -215,12 +232,47 @@ class StreamFreezer(StreamFreezeThawBase):
 
         if streamObj is not None and fastButUnsafe is False:
             # deepcopy necessary because we mangle sites in the objects
-            # before serialization
-            self.stream = copy.deepcopy(streamObj)
-            # self.stream = streamObj
+            # before serialization.  It is made on first use of .stream,
+            # since the binary format does not alter the Stream.
+            self._streamToCopy = streamObj
         elif streamObj is not None:
             self.stream = streamObj
 
+    @property
+    def stream(self):
+        if self._stream is None and self._streamToCopy is not None:
+            self._stream = copy.deepcopy(self._streamToCopy)
+            self._streamToCopy = None
+        return self._stream
+
+    @stream.setter
+    def stream(self, streamObj):
+        self._stream = streamObj
+        self._streamToCopy = None
+
+    def packStreamBinary(self, streamObj=None) -> bytes:
+        '''
+        Return the Stream in the compact binary format.
+
+        Notes, rests, and chords are written as compact records; everything
+        else is pickled, with references to elements of the Stream stored
+        as indices.  Unlike :meth:`packStream`, the Stream is not altered,
+        so no copy of it is made.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note('C#4', type='eighth'), 4)
+        >>> data = freezeThaw.StreamFreezer(s).packStreamBinary()
+        >>> data[:4]
+        b'M21B'
+
+        * New in v9.3.
+        '''
+        if streamObj is None:
+            streamObj = self._streamToCopy if self._streamToCopy is not None else self._stream
+        if streamObj is None or not getattr(streamObj, 'isStream', False):
+            raise FreezeThawException('The binary format can only store Streams')
+        return _BinaryEncoder().encode(streamObj)
+
     def packStream(self, streamObj=None):
         '''
         Prepare the passed in Stream in place, return storage
@@ -608,6 +660,8 @@ class StreamFreezer(StreamFreezeThawBase):
         'pickle'
         >>> sf.parseWriteFmt('JSON')
         'jsonpickle'
+        >>> sf.parseWriteFmt('m21b')
+        'binary'
 
         Anything else returns 'pickle' as a default:
 
@@ -621,18 +675,24 @@ class StreamFreezer(StreamFreezeThawBase):
             return 'pickle'
         elif fmt in ['jsonpickle', 'json']:
             return 'jsonpickle'
+        elif fmt in ['binary', 'b', 'm21b']:
+            return 'binary'
         else:
             return 'pickle'
 
     def write(self, fmt='pickle', fp=None, zipType=None, **keywords):
         '''
         For a supplied Stream, write a serialized version to
-        disk in either 'pickle' or 'jsonpickle' format and
+        disk in 'pickle', 'jsonpickle', or 'binary' format and
         return the filepath to the file.
 
         jsonpickle is the better format for transporting from
         one computer to another, but slower and may have some bugs.
 
+        The compact 'binary' format is smaller and faster to write and
+        read than pickle, and it can be read back in part: see
+        :meth:`StreamThawer.open`.
+
         If zipType == 'zlib' then zlib compression is done after serializing.
         No other compression types are currently supported.
         '''
@@ -645,6 +705,8 @@ class StreamFreezer(StreamFreezeThawBase):
             directory = environLocal.getRootTempDir()
             if fmt.startswith('json'):
                 fp = self.getJsonFp(directory)
+            elif fmt == 'binary':
+                fp = self.getBinaryFp(directory)
             else:
                 fp = self.getPickleFp(directory)
         else:
@@ -654,11 +716,22 @@ class StreamFreezer(StreamFreezeThawBase):
             if isinstance(fp, pathlib.Path) and not fp.is_absolute():  # assume it's a complete path
                 fp = environLocal.getRootTempDir() / fp
 
-        storage = self.packStream(self.stream)
-
         if isinstance(fp, pathlib.Path):
             environLocal.printDebug(['writing fp', str(fp)])
 
+        if fmt == 'binary':
+            data = self.packStreamBinary()
+            if zipType == 'zlib':
+                data = zlib.compress(data)
+            if not isinstance(fp, io.BytesIO):
+                with open(fp, 'wb') as f:
+                    f.write(data)
+            else:
+                fp.write(data)
+            return fp
+
+        storage = self.packStream(self.stream)
+
         if fmt == 'pickle':
             # previously used highest protocol, but now protocols are changing too
             # fast, and might not be compatible for sharing.
@@ -691,9 +764,11 @@ class StreamFreezer(StreamFreezeThawBase):
     def writeStr(self, fmt=None, **keywords):
         '''
         Convert the object to a pickled/jsonpickled string
-        and return the string
+        or binary bytes and return it.
         '''
         fmt = self.parseWriteFmt(fmt)
+        if fmt == 'binary':
+            return self.packStreamBinary()
         storage = self.packStream(self.stream)
 
         if fmt == 'pickle':
@@ -890,7 +965,9 @@ class StreamThawer(StreamFreezeThawBase):
         Look at the file and determine the format
         '''
         if isinstance(storage, bytes):
-            if storage.startswith(b'{"'):  # pragma: no cover
+            if storage.startswith(BINARY_MAGIC):
+                return 'binary'
+            elif storage.startswith(b'{"'):  # pragma: no cover
                 # was m21Version": {"py/tuple" but order of dict may change
                 return 'jsonpickle'
             else:
@@ -902,9 +979,35 @@ class StreamThawer(StreamFreezeThawBase):
             else:  # pragma: no cover
                 return 'pickle'
 
-    def open(self, fp, zipType=None):
+    def unpackStreamBinary(self, data: bytes, *, parts=None, measures=None):
+        '''
+        Convert bytes in the binary format to a Stream.
+
+        If `parts` is a collection of part indices, only those parts of a
+        Score are read.  If `measures` is a (start, end) tuple of measure
+        numbers, only measures in that range (inclusive) are read; either
+        may be None to leave that end open.  Spanners left without any
+        elements are dropped.
+
+        >>> c = corpus.parse('bach/bwv66.6')
+        >>> data = freezeThaw.StreamFreezer(c).packStreamBinary()
+        >>> st = freezeThaw.StreamThawer()
+        >>> s = st.unpackStreamBinary(data, parts=[1], measures=(2, 3))
+        >>> len(s.parts)
+        1
+        >>> [m.number for m in s.parts[0].getElementsByClass(stream.Measure)]
+        [2, 3]
+
+        * New in v9.3.
+        '''
+        return _BinaryDecoder(data, parts=parts, measures=measures).decode()
+
+    def open(self, fp, zipType=None, *, parts=None, measures=None):
         '''
         For a supplied file path to a pickled stream, unpickle
+
+        `parts` and `measures` read only part of a Stream in the binary
+        format: see :meth:`unpackStreamBinary`.
         '''
         if not os.path.exists(fp):  # pragma: no cover
             directory = environLocal.getRootTempDir()
@@ -913,7 +1016,21 @@ class StreamThawer(StreamFreezeThawBase):
         with open(fp, 'rb') as f:
             fileData = f.read()  # TODO: do not read entire file
 
+        if zipType == 'zlib':
+            try:
+                start = zlib.decompressobj().decompress(fileData, len(BINARY_MAGIC))
+            except zlib.error:
+                start = b''
+            if start == BINARY_MAGIC:
+                fileData = zlib.decompress(fileData)
+
         fmt = self.parseOpenFmt(fileData)
+        if fmt == 'binary':
+            self.stream = self.unpackStreamBinary(fileData, parts=parts, measures=measures)
+            return
+        elif parts is not None or measures is not None:
+            raise FreezeThawException('Only the binary format can be read in part')
+
         if fmt == 'pickle':
             common.restorePathClassesAfterUnpickling()
             # environLocal.printDebug(['opening fp', fp])
@@ -945,9 +1062,9 @@ class StreamThawer(StreamFreezeThawBase):
             raise FreezeThawException(f'bad StreamFreezer format: {fmt!r}')
 
 
-    def openStr(self, fileData: bytes, pickleFormat=None):
+    def openStr(self, fileData: bytes, pickleFormat=None, *, parts=None, measures=None):
         '''
-        Take bytes representing a Frozen(pickled/jsonpickled)
+        Take bytes representing a Frozen(pickled/jsonpickled/binary)
         Stream and convert it to a normal Stream.
 
         if format is None then the format is automatically
@@ -955,12 +1072,21 @@ class StreamThawer(StreamFreezeThawBase):
 
         The name of the function is a legacy of Py2.  With
         pickle (not jsonpickle), it works on bytes, not strings.
+
+        `parts` and `measures` read only part of a Stream in the binary
+        format: see :meth:`unpackStreamBinary`.
         '''
         if pickleFormat is not None:
             fmt = pickleFormat
         else:
             fmt = self.parseOpenFmt(fileData)
 
+        if fmt == 'binary':
+            self.stream = self.unpackStreamBinary(fileData, parts=parts, measures=measures)
+            return
+        elif parts is not None or measures is not None:
+            raise FreezeThawException('Only the binary format can be read in part')
+
         if fmt == 'pickle':
             storage = pickle.loads(fileData)
         elif fmt == 'jsonpickle':
@@ -971,7 +1097,917 @@ class StreamThawer(StreamFreezeThawBase):
         environLocal.printDebug(f'StreamThawer:openStr: storage is: {storage}')
         self.stream = self.unpackStream(storage)
 
-# -------------------------------------------------------------------------------
+
+# -----------------------------------------------------------------------------
+# Compact binary format
+#
+# A frozen Stream in the binary format is laid out as:
+#
+#     BINARY_MAGIC, format version (one byte),
+#     the string table, the class table,
+#     the hierarchy of the Stream, with notes, rests, and chords stored as records,
+#     and a pickle of everything that does not have a record.
+#
+# Every element in the hierarchy gets an index in depth-first order (the
+# frozen Stream is index 0).  The pickle refers to elements by these indices
+# instead of storing them again, so spanners, variants, and anything else
+# that points at notes just store the index of each note.
+#
+# All integers are unsigned LEB128 varints; signed values are zigzag encoded.
+
+BINARY_MAGIC = b'M21B'
+BINARY_FORMAT_VERSION = 1
+
+_CHILD_RECORD = 0
+_CHILD_OBJECT = 1
+_CHILD_STREAM = 2
+_CHILD_REFERENCE = 3
+
+# quarterLengths and offsets: the low two bits of the first varint say
+# how the rest is stored.
+_QL_SCALE = 4096  # floats that are a multiple of 1/4096 are stored as integers
+_QL_SCALED_FLOAT = 0
+_QL_FRACTION = 1
+_QL_INT = 2
+_QL_SPECIAL = 3
+_SPECIAL_FLOAT = 0
+_SPECIAL_AT_END = 1
+
+_SCALAR_NONE = 0
+_SCALAR_FALSE = 1
+_SCALAR_TRUE = 2
+_SCALAR_INT = 3
+_SCALAR_STR = 4
+_SCALAR_FLOAT = 5
+
+_HAS_PITCH = 1
+_HAS_DURATION = 2
+_HAS_TIE = 4
+_HAS_BEAMS = 8
+_HAS_SCALARS = 16
+_SHARES_CHORD_DURATION = 32
+
+# keys of note, rest, and chord __dict__s that are reset rather than stored
+_RESET_KEYS = frozenset(['_activeSite', '_activeSiteStoredOffset',
+                         '_derivation', '_cache', '_sites'])
+_SCHEMA_KEYS = frozenset(['_pitch', '_duration', '_tie', '_beams', '_notes'])
+_SCALAR_TYPES = (type(None), bool, int, float, str)
+_STEPS = 'CDEFGAB'
+_MISSING = object()
+
+
+def _writeVarint(buffer: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _allSlots(cls) -> tuple[str, ...]:
+    return tuple(name
+                 for klass in cls.__mro__
+                 for name in getattr(klass, '__slots__', ())
+                 if name not in ('__dict__', '__weakref__'))
+
+
+def _recordPrototypes() -> dict[type, dict[str, t.Any]]:
+    '''
+    The __dict__ of a new Note, Rest, and Chord, less the attributes
+    that every record provides.  Values that are not stored in a record
+    are assumed to have these defaults.
+    '''
+    from music21 import chord
+    from music21 import note
+    out: dict[type, dict[str, t.Any]] = {}
+    for cls in (note.Note, note.Rest, chord.Chord):
+        protoDict = dict(cls().__dict__)
+        for key in ('_pitch', '_duration', '_notes'):
+            protoDict.pop(key, None)
+        out[cls] = protoDict
+    return out
+
+
+def _restoreStreamState(streamObj, state) -> None:
+    '''
+    State setter for Streams that are pickled by value in the binary format
+    (spanner storage, variants, ...): the elements are kept aside as
+    `_storedElementOffsetTuples`, as with the pickle format, and are
+    inserted once every element exists.
+    '''
+    streamState, elementOffsetTuples = state
+    streamObj.__setstate__(streamState)
+    streamObj._storedElementOffsetTuples = elementOffsetTuples
+
+
+class _BinaryPickler(pickle.Pickler):
+    '''
+    Pickles everything in a frozen Stream that does not have a record,
+    storing elements of the hierarchy by their index.
+    '''
+    def __init__(self, file, elementIds: dict[int, t.Any]):
+        super().__init__(file, protocol=4)
+        self.elementIds = elementIds
+
+    def persistent_id(self, obj):
+        if type(obj) is sites.Sites:
+            return 'sites'  # sites are rebuilt on thawing
+        return self.elementIds.get(id(obj))
+
+    def reducer_override(self, obj):
+        from music21 import stream
+        if not isinstance(obj, stream.Stream):
+            return NotImplemented
+        # a Stream outside the hierarchy, such as a spanner's storage
+        state = obj.__getstate__()
+        state['_elements'] = []
+        state['_endElements'] = []
+        state['_offsetDict'] = {}
+        state['_cache'] = {}
+        offsetDict = obj._offsetDict
+        elementOffsetTuples = [(el, offsetDict[id(el)][0]) for el in obj._elements]
+        elementOffsetTuples.extend((el, 'end') for el in obj._endElements)
+        return (copyreg.__newobj__, (type(obj),), (state, elementOffsetTuples),
+                None, None, _restoreStreamState)
+
+
+class _BinaryUnpickler(pickle.Unpickler):
+    def __init__(self, file, elements: dict[t.Any, t.Any]):
+        super().__init__(file)
+        self.elements = elements
+        self.storedStreams: list[stream.Stream] = []
+
+    def persistent_load(self, pid):
+        if pid == 'sites':
+            return None
+        # elements that were not thawed (partial loading) become None
+        return self.elements.get(pid)
+
+    def find_class(self, module, name):
+        if module == __name__ and name == '_restoreStreamState':
+            return self.restoreStreamState
+        return super().find_class(module, name)
+
+    def restoreStreamState(self, streamObj, state):
+        _restoreStreamState(streamObj, state)
+        self.storedStreams.append(streamObj)
+
+
+class _BinaryEncoder:
+    '''
+    Writes a Stream in the binary format.  The Stream is not altered.
+    '''
+    def __init__(self):
+        from music21 import chord
+        from music21 import note
+        self.buffer = bytearray()
+        self.strings: dict[str, int] = {}
+        self.classes: dict[type, int] = {}
+        self.elementIds: dict[int, t.Any] = {}
+        self.nextIndex = 0
+        self.objectStates: list[tuple[int, dict[str, t.Any]]] = []
+        self.extras: dict[t.Any, dict[str, t.Any]] = {}
+        self.prototypes = _recordPrototypes()
+        self.noteClass = note.Note
+        self.chordClass = chord.Chord
+        self.accidentalNames: dict[str, tuple[t.Any, t.Any]] = {}
+        self.stringIndex(str(base.VERSION))  # always string 0
+
+    def encode(self, streamObj) -> bytes:
+        self.elementIds[id(streamObj)] = 0
+        self.nextIndex = 1
+        self.classes[type(streamObj)] = 0
+        _writeVarint(self.buffer, 0)
+        self.writeStream(streamObj)
+        self.objectStates.append((0, self.streamState(streamObj)))
+        hierarchy = self.buffer
+
+        pickled = io.BytesIO()
+        _BinaryPickler(pickled, self.elementIds).dump((self.objectStates, self.extras))
+
+        out = bytearray(BINARY_MAGIC)
+        out.append(BINARY_FORMAT_VERSION)
+        self.buffer = bytearray()
+        for cls in self.classes:  # may add strings
+            self.writeString(cls.__module__)
+            self.writeString(cls.__qualname__)
+        classTable = self.buffer
+        _writeVarint(out, len(self.strings))
+        for s in self.strings:
+            encoded = s.encode('utf-8')
+            _writeVarint(out, len(encoded))
+            out += encoded
+        _writeVarint(out, len(self.classes))
+        out += classTable
+        out += hierarchy
+        pickledBytes = pickled.getvalue()
+        _writeVarint(out, len(pickledBytes))
+        out += pickledBytes
+        return bytes(out)
+
+    # primitives
+    def stringIndex(self, value: str) -> int:
+        try:
+            return self.strings[value]
+        except KeyError:
+            index = self.strings[value] = len(self.strings)
+            return index
+
+    def writeString(self, value: str) -> None:
+        _writeVarint(self.buffer, self.stringIndex(value))
+
+    def writeOptionalString(self, value: str | None) -> None:
+        _writeVarint(self.buffer, 0 if value is None else self.stringIndex(value) + 1)
+
+    def writeQuarterLength(self, value) -> None:
+        buffer = self.buffer
+        valueType = type(value)
+        if valueType is float:
+            scaled = value * _QL_SCALE
+            if scaled.is_integer() and abs(scaled) < 2 ** 52:
+                _writeVarint(buffer, _zigzag(int(scaled)) << 2 | _QL_SCALED_FLOAT)
+                return
+        elif valueType is Fraction:
+            _writeVarint(buffer, _zigzag(value.numerator) << 2 | _QL_FRACTION)
+            _writeVarint(buffer, value.denominator)
+            return
+        elif valueType is int:
+            _writeVarint(buffer, _zigzag(value) << 2 | _QL_INT)
+            return
+        elif value == OffsetSpecial.AT_END:
+            _writeVarint(buffer, _SPECIAL_AT_END << 2 | _QL_SPECIAL)
+            return
+        _writeVarint(buffer, _SPECIAL_FLOAT << 2 | _QL_SPECIAL)
+        buffer += struct.pack('<d', value)
+
+    def writeScalar(self, key: str, value) -> None:
+        buffer = self.buffer
+        keyIndex = self.stringIndex(key) << 3
+        if value is None:
+            _writeVarint(buffer, keyIndex | _SCALAR_NONE)
+        elif value is True:
+            _writeVarint(buffer, keyIndex | _SCALAR_TRUE)
+        elif value is False:
+            _writeVarint(buffer, keyIndex | _SCALAR_FALSE)
+        elif type(value) is int:
+            _writeVarint(buffer, keyIndex | _SCALAR_INT)
+            _writeVarint(buffer, _zigzag(value))
+        elif type(value) is str:
+            _writeVarint(buffer, keyIndex | _SCALAR_STR)
+            self.writeString(value)
+        else:
+            _writeVarint(buffer, keyIndex | _SCALAR_FLOAT)
+            buffer += struct.pack('<d', value)
+
+    # hierarchy
+    def streamState(self, streamObj) -> dict[str, t.Any]:
+        state = streamObj.__getstate__()
+        state['_elements'] = []
+        state['_endElements'] = []
+        state['_offsetDict'] = {}
+        state['_cache'] = {}
+        return state
+
+    def writeStream(self, streamObj) -> None:
+        '''
+        Write a Stream's class, measure number, and contents, prefixed by the
+        length of the contents in bytes and the number of elements in them,
+        so that a reader can skip over the Stream.
+        '''
+        outer = self.buffer
+        self.buffer = bytearray()
+        firstIndex = self.nextIndex
+        offsetDict = streamObj._offsetDict
+        elements = streamObj._elements
+        _writeVarint(self.buffer, len(elements) + len(streamObj._endElements))
+        for el in elements:
+            self.writeChild(el, offsetDict[id(el)][0])
+        for el in streamObj._endElements:
+            self.writeChild(el, OffsetSpecial.AT_END)
+        contents = self.buffer
+        self.buffer = outer
+
+        number = getattr(streamObj, 'number', 0)
+        _writeVarint(outer, _zigzag(number if type(number) is int else 0))
+        _writeVarint(outer, len(contents))
+        _writeVarint(outer, self.nextIndex - firstIndex)
+        outer += contents
+
+    def writeChild(self, el, offset) -> None:
+        buffer = self.buffer
+        index = self.elementIds.get(id(el))
+        if type(index) is int:  # already in the hierarchy somewhere else
+            _writeVarint(buffer, index << 2 | _CHILD_REFERENCE)
+            self.writeQuarterLength(offset)
+            return
+
+        index = self.nextIndex
+        self.nextIndex += 1
+        self.elementIds[id(el)] = index
+        cls = type(el)
+        try:
+            classIndex = self.classes[cls]
+        except KeyError:
+            classIndex = self.classes[cls] = len(self.classes)
+
+        if cls in self.prototypes and self.canWriteRecord(el):
+            _writeVarint(buffer, classIndex << 2 | _CHILD_RECORD)
+            self.writeQuarterLength(offset)
+            self.writeRecord(el, index)
+        elif el.isStream:
+            _writeVarint(buffer, classIndex << 2 | _CHILD_STREAM)
+            self.writeQuarterLength(offset)
+            self.writeStream(el)
+            self.objectStates.append((index, self.streamState(el)))
+        else:
+            _writeVarint(buffer, classIndex << 2 | _CHILD_OBJECT)
+            self.writeQuarterLength(offset)
+            state = el.__getstate__()
+            if '_cache' in state:
+                state['_cache'] = {}
+            self.objectStates.append((index, state))
+
+    def canWriteRecord(self, el) -> bool:
+        if type(el) is not self.chordClass:
+            return True
+        return all(type(n) is self.noteClass for n in el._notes)
+
+    # records
+    def writeRecord(self, el, key, chordObj=None, chordDurationWritten=False) -> None:
+        '''
+        Write a Note, Rest, Chord, or note of a Chord.  Pitch, duration,
+        tie, and beams are stored in the record if they are simple enough
+        to be rebuilt exactly; other attributes that differ from those of
+        a new object are stored as scalars or, failing that, pickled.
+        '''
+        elDict = el.__dict__
+        proto = self.prototypes[type(el)]
+        extras = {}
+        flags = 0
+
+        p = elDict.get('_pitch')
+        if p is not None:
+            if self.isSimplePitch(p, el):
+                flags |= _HAS_PITCH
+            else:
+                extras['_pitch'] = p
+
+        d = elDict['_duration']
+        if chordDurationWritten and d is chordObj._duration:
+            flags |= _SHARES_CHORD_DURATION
+        elif self.isSimpleDuration(d, el, elDict.get('_notes')):
+            flags |= _HAS_DURATION
+        else:
+            extras['_duration'] = d
+
+        tieObj = elDict.get('_tie')
+        if tieObj is not None:
+            if self.isSimpleTie(tieObj):
+                flags |= _HAS_TIE
+            else:
+                extras['_tie'] = tieObj
+
+        beams = elDict.get('_beams')
+        if beams is not None:
+            if self.isSimpleBeams(beams):
+                flags |= _HAS_BEAMS
+            else:
+                extras['_beams'] = beams
+
+        scalars = []
+        for k, v in elDict.items():
+            if k in _SCHEMA_KEYS or k in _RESET_KEYS:
+                continue
+            if k == '_chordAttached' and chordObj is not None and v is chordObj:
+                continue
+            default = proto.get(k, _MISSING)
+            if v is default:
+                continue
+            valueType = type(v)
+            if valueType in _SCALAR_TYPES:
+                if type(default) is not valueType or v != default:
+                    scalars.append((k, v))
+            elif valueType in (list, dict) and not v and (
+                    default is None or (type(default) is valueType and not default)):
+                continue  # an empty list or dict is the same as one not yet created
+            else:
+                extras[k] = v
+        if scalars:
+            flags |= _HAS_SCALARS
+        if extras:
+            self.extras[key] = extras
+
+        _writeVarint(self.buffer, flags)
+        if flags & _HAS_PITCH:
+            self.writePitch(p, el)
+        if flags & _HAS_DURATION:
+            self.writeDuration(d, el, elDict.get('_notes'))
+        if flags & _HAS_TIE:
+            self.writeTie(tieObj)
+        if flags & _HAS_BEAMS:
+            self.writeBeams(beams)
+        if scalars:
+            _writeVarint(self.buffer, len(scalars))
+            for k, v in scalars:
+                self.writeScalar(k, v)
+
+        notes = elDict.get('_notes')
+        if notes is not None:
+            _writeVarint(self.buffer, len(notes))
+            for i, n in enumerate(notes):
+                self.elementIds[id(n)] = (key, i)
+            for i, n in enumerate(notes):
+                self.writeRecord(n, (key, i), chordObj=el,
+                                 chordDurationWritten=bool(flags & _HAS_DURATION))
+
+    def accidentalValues(self, name: str) -> tuple[t.Any, t.Any]:
+        try:
+            return self.accidentalNames[name]
+        except KeyError:
+            acc = pitch.Accidental(name)
+            values = self.accidentalNames[name] = (acc._alter, acc._modifier)
+            return values
+
+    def isSimplePitch(self, p, owner) -> bool:
+        if (type(p) is not pitch.Pitch
+                or p.__dict__
+                or p._microtone is not None
+                or p._groups
+                or p._overridden_freq440 is not None
+                or p.fundamental is not None
+                or (p._client is not owner and p._client is not None)):
+            return False
+        acc = p._accidental
+        if acc is None:
+            return True
+        return (type(acc) is pitch.Accidental
+                and (acc._client is p or acc._client is None)
+                and acc.displayLocation == 'normal'
+                and acc.displaySize == 'full'
+                and acc.displayStyle == 'normal'
+                and acc._style is None
+                and acc._editorial is None
+                and type(acc._displayType) is str
+                and self.accidentalValues(acc._name) == (acc._alter, acc._modifier))
+
+    def writePitch(self, p, owner) -> None:
+        buffer = self.buffer
+        acc = p._accidental
+        octave = p._octave
+        _writeVarint(buffer, (_STEPS.index(p._step)
+                              | (octave is not None) << 3
+                              | bool(p.spellingIsInferred) << 4
+                              | (acc is not None) << 5
+                              | (p._client is owner) << 6))
+        if octave is not None:
+            _writeVarint(buffer, _zigzag(octave))
+        if acc is not None:
+            status = acc._displayStatus
+            statusCode = 0 if status is None else (1 if status else 2)
+            _writeVarint(buffer, (self.stringIndex(acc._name) << 3
+                                  | statusCode << 1
+                                  | (acc._client is p)))
+            self.writeString(acc._displayType)
+
+    def isSimpleDuration(self, d, owner, notes) -> bool:
+        if (type(d) is not duration.Duration
+                or not d._linked
+                or d._tuplets
+                or d._unlinkedType is not None
+                or d._dotGroups != (0,)):
+            return False
+        client = d.client
+        if (client is not owner
+                and client is not None
+                and not (notes and any(n is client for n in notes))):
+            return False
+        for dt in d._components:
+            try:
+                if dt.dots > 7 or dt != duration.durationTupleFromTypeDots(dt.type, dt.dots):
+                    return False
+            except (duration.DurationException, TypeError, KeyError):
+                return False
+        return True
+
+    def writeDuration(self, d, owner, notes) -> None:
+        buffer = self.buffer
+        client = d.client
+        if client is owner:
+            clientCode = 0
+        elif client is None:
+            clientCode = 1
+        else:  # a note of the chord that owns the duration
+            clientCode = 2 + next(i for i, n in enumerate(notes) if n is client)
+        _writeVarint(buffer, (bool(d.expressionIsInferred)
+                              | bool(d._componentsNeedUpdating) << 1
+                              | bool(d._quarterLengthNeedsUpdating) << 2
+                              | bool(d._typeNeedsUpdating) << 3
+                              | clientCode << 4))
+        self.writeQuarterLength(d._qtrLength)
+        _writeVarint(buffer, len(d._components))
+        for dt in d._components:
+            _writeVarint(buffer, self.stringIndex(dt.type) << 3 | dt.dots)
+
+    def isSimpleTie(self, tieObj) -> bool:
+        return (type(tieObj) is tie.Tie
+                and type(tieObj.id) is int
+                and type(tieObj.type) is str
+                and type(tieObj.style) is str
+                and (tieObj.placement is None or type(tieObj.placement) is str))
+
+    def writeTie(self, tieObj) -> None:
+        self.writeString(tieObj.type)
+        self.writeString(tieObj.style)
+        self.writeOptionalString(tieObj.placement)
+
+    def isSimpleBeams(self, beams) -> bool:
+        if type(beams) is not beam.Beams or type(beams.id) is not int:
+            return False
+        for b in beams.beamsList:
+            if (type(b) is not beam.Beam
+                    or type(b.id) is not int
+                    or b._style is not None
+                    or b._editorial is not None
+                    or b.independentAngle is not None
+                    or type(b.type) is not str
+                    or (b.direction is not None and type(b.direction) is not str)
+                    or (b.number is not None and type(b.number) is not int)):
+                return False
+        return type(beams.feathered) is bool
+
+    def writeBeams(self, beams) -> None:
+        buffer = self.buffer
+        _writeVarint(buffer, len(beams.beamsList) << 1 | beams.feathered)
+        for b in beams.beamsList:
+            self.writeString(b.type)
+            _writeVarint(buffer, 0 if b.number is None else _zigzag(b.number) + 1)
+            self.writeOptionalString(b.direction)
+
+
+class _BinaryDecoder:
+    '''
+    Reads a Stream written by _BinaryEncoder.
+    '''
+    def __init__(self, data: bytes, *, parts=None, measures=None):
+        from music21 import chord
+        from music21 import note
+        if not data.startswith(BINARY_MAGIC):
+            raise FreezeThawException('data is not in the music21 binary format')
+        if data[len(BINARY_MAGIC)] != BINARY_FORMAT_VERSION:
+            raise FreezeThawException(
+                f'cannot read version {data[len(BINARY_MAGIC)]} of the binary format')
+        self.data = data
+        self.pos = len(BINARY_MAGIC) + 1
+        self.parts = None if parts is None else set(parts)
+        if measures is not None:
+            start, end = measures
+            measures = (float('-inf') if start is None else start,
+                        float('inf') if end is None else end)
+        self.measures = measures
+        self.strings: list[str] = []
+        self.classes: list[t.Any] = []
+        self.elements: dict[t.Any, t.Any] = {}
+        self.nextIndex = 0
+        self.insertions: list[tuple[stream.Stream, list[tuple[base.Music21Object, t.Any]]]] = []
+        self.prototypes = _recordPrototypes()
+        self.freshKeys = {cls: [k for k, v in proto.items() if type(v) in (list, dict)]
+                          for cls, proto in self.prototypes.items()}
+        pitchPrototype = pitch.Pitch()
+        self.pitchDefaults = [(slot, getattr(pitchPrototype, slot))
+                              for slot in _allSlots(pitch.Pitch)]
+        self.accidentalDefaults: dict[str, list[tuple[str, t.Any]]] = {}
+        self.noteClass = note.Note
+        self.chordClass = chord.Chord
+
+    def decode(self):
+        from music21 import stream
+
+        try:
+            self.readTables()
+            version = self.strings[0]
+            if version != str(base.VERSION):  # pragma: no cover
+                environLocal.warn('this frozen file is out of date and may not function properly.')
+            rootClass = self.classes[self.readVarint()]
+            root = rootClass.__new__(rootClass)
+            self.elements[0] = root
+            self.nextIndex = 1
+            self.readStreamHeader()
+            self.readStreamContents(root, isRoot=True)
+
+            size = self.readVarint()
+            unpickler = _BinaryUnpickler(io.BytesIO(self.data[self.pos:self.pos + size]),
+                                         self.elements)
+            try:
+                objectStates, extras = unpickler.load()
+            finally:
+                common.restorePathClassesAfterUnpickling()
+        except (IndexError, ValueError, KeyError,
+                pickle.UnpicklingError, AttributeError, ImportError) as e:
+            raise FreezeThawException(f'Problem in decoding: {e}') from e
+
+        elements = self.elements
+        for index, state in objectStates:
+            obj = elements.get(index)
+            if obj is not None:
+                obj.__setstate__(state)
+        for key, attributes in extras.items():
+            obj = elements.get(key)
+            if obj is not None:
+                obj.__dict__.update(attributes)
+
+        for streamObj, children in self.insertions:
+            for el, offset in children:
+                if offset == OffsetSpecial.AT_END:
+                    streamObj.coreStoreAtEnd(el)
+                else:
+                    streamObj.coreInsert(offset, el, ignoreSort=True)
+            streamObj.coreElementsChanged(clearIsSorted=False)
+
+        emptied = []
+        for streamObj in unpickler.storedStreams:
+            elementOffsetTuples = streamObj._storedElementOffsetTuples
+            del streamObj._storedElementOffsetTuples
+            for el, offset in elementOffsetTuples:
+                if el is None:  # not thawed
+                    continue
+                if offset == 'end':
+                    streamObj.coreStoreAtEnd(el)
+                else:
+                    streamObj.coreInsert(offset, el, ignoreSort=True)
+            streamObj.coreElementsChanged()
+            if (isinstance(streamObj, stream.SpannerStorage)
+                    and elementOffsetTuples
+                    and not streamObj._elements):
+                emptied.append(streamObj.client)
+        # a spanner whose elements were all left out of a partial load is removed
+        for sp in emptied:
+            site = sp.activeSite
+            if site is not None:
+                site.remove(sp)
+        return root
+
+    # primitives
+    def readVarint(self) -> int:
+        data = self.data
+        pos = self.pos
+        b = data[pos]
+        pos += 1
+        if b < 0x80:
+            self.pos = pos
+            return b
+        result = b & 0x7F
+        shift = 7
+        while True:
+            b = data[pos]
+            pos += 1
+            result |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return result
+
+    def readOptionalString(self) -> str | None:
+        index = self.readVarint()
+        return None if index == 0 else self.strings[index - 1]
+
+    def readQuarterLength(self):
+        value = self.readVarint()
+        kind = value & 3
+        value >>= 2
+        if kind == _QL_SCALED_FLOAT:
+            return _unzigzag(value) / _QL_SCALE
+        elif kind == _QL_FRACTION:
+            return Fraction(_unzigzag(value), self.readVarint())
+        elif kind == _QL_INT:
+            return _unzigzag(value)
+        elif value == _SPECIAL_AT_END:
+            return OffsetSpecial.AT_END
+        out = struct.unpack_from('<d', self.data, self.pos)[0]
+        self.pos += 8
+        return out
+
+    def readScalar(self) -> tuple[str, t.Any]:
+        value = self.readVarint()
+        key = self.strings[value >> 3]
+        kind = value & 7
+        if kind == _SCALAR_NONE:
+            return key, None
+        elif kind == _SCALAR_FALSE:
+            return key, False
+        elif kind == _SCALAR_TRUE:
+            return key, True
+        elif kind == _SCALAR_INT:
+            return key, _unzigzag(self.readVarint())
+        elif kind == _SCALAR_STR:
+            return key, self.strings[self.readVarint()]
+        out = struct.unpack_from('<d', self.data, self.pos)[0]
+        self.pos += 8
+        return key, out
+
+    def readTables(self) -> None:
+        data = self.data
+        for _ in range(self.readVarint()):
+            size = self.readVarint()
+            self.strings.append(data[self.pos:self.pos + size].decode('utf-8'))
+            self.pos += size
+        for _ in range(self.readVarint()):
+            moduleName = self.strings[self.readVarint()]
+            qualname = self.strings[self.readVarint()]
+            obj = importlib.import_module(moduleName)
+            for name in qualname.split('.'):
+                obj = getattr(obj, name)
+            self.classes.append(obj)
+
+    # hierarchy
+    def includeStream(self, cls, number: int, parentIsRoot: bool, partNumber: int) -> bool:
+        from music21 import stream
+        if (self.parts is not None
+                and parentIsRoot
+                and issubclass(cls, stream.Part)
+                and partNumber not in self.parts):
+            return False
+        if self.measures is not None and issubclass(cls, stream.Measure):
+            start, end = self.measures
+            return start <= number <= end
+        return True
+
+    def readStreamHeader(self) -> tuple[int, int, int]:
+        '''
+        Return the measure number (0 if not a Measure), the size in bytes
+        of the contents, and the number of elements in the contents.
+        '''
+        return _unzigzag(self.readVarint()), self.readVarint(), self.readVarint()
+
+    def readStreamContents(self, streamObj, isRoot=False) -> None:
+        from music21 import stream
+
+        children = []
+        partNumber = 0
+        elements = self.elements
+        classes = self.classes
+        for _ in range(self.readVarint()):
+            head = self.readVarint()
+            kind = head & 3
+            if kind == _CHILD_REFERENCE:
+                offset = self.readQuarterLength()
+                el = elements.get(head >> 2)
+                if el is not None:
+                    children.append((el, offset))
+                continue
+
+            cls = classes[head >> 2]
+            offset = self.readQuarterLength()
+            index = self.nextIndex
+            self.nextIndex += 1
+            if kind == _CHILD_RECORD:
+                el = self.readRecord(cls, index)
+            elif kind == _CHILD_OBJECT:
+                el = cls.__new__(cls)
+            else:
+                number, size, count = self.readStreamHeader()
+                include = self.includeStream(cls, number, isRoot, partNumber)
+                if issubclass(cls, stream.Part):
+                    partNumber += 1
+                if not include:
+                    self.pos += size
+                    self.nextIndex += count
+                    continue
+                el = cls.__new__(cls)
+                elements[index] = el
+                self.readStreamContents(el)
+            elements[index] = el
+            children.append((el, offset))
+        self.insertions.append((streamObj, children))
+
+    # records
+    def readRecord(self, cls, key, chordObj=None):
+        el = cls.__new__(cls)
+        elDict = self.prototypes[cls].copy()
+        for k in self.freshKeys[cls]:
+            elDict[k] = type(elDict[k])()
+        flags = self.readVarint()
+        if flags & _HAS_PITCH:
+            elDict['_pitch'] = self.readPitch(el)
+        if flags & _HAS_DURATION:
+            d, clientCode = self.readDuration(el)
+            elDict['_duration'] = d
+        elif flags & _SHARES_CHORD_DURATION:
+            elDict['_duration'] = chordObj._duration
+        if flags & _HAS_TIE:
+            elDict['_tie'] = self.readTie()
+        if flags & _HAS_BEAMS:
+            elDict['_beams'] = self.readBeams()
+        if flags & _HAS_SCALARS:
+            for _ in range(self.readVarint()):
+                k, v = self.readScalar()
+                elDict[k] = v
+        if chordObj is not None:
+            elDict['_chordAttached'] = chordObj
+        el.__dict__.update(elDict)
+
+        if cls is self.chordClass:
+            notes = []
+            noteClass = self.noteClass
+            for i in range(self.readVarint()):
+                n = self.readRecord(noteClass, (key, i), chordObj=el)
+                self.elements[(key, i)] = n
+                notes.append(n)
+            el._notes = notes
+            if flags & _HAS_DURATION and clientCode >= 2:
+                el._duration.client = notes[clientCode - 2]
+        return el
+
+    def readPitch(self, owner):
+        value = self.readVarint()
+        p = pitch.Pitch.__new__(pitch.Pitch)
+        for slot, default in self.pitchDefaults:
+            setattr(p, slot, default)
+        p._step = _STEPS[value & 7]
+        p._octave = _unzigzag(self.readVarint()) if value & 8 else None
+        p.spellingIsInferred = bool(value & 16)
+        p._client = owner if value & 64 else None
+        if value & 32:
+            accValue = self.readVarint()
+            name = self.strings[accValue >> 3]
+            acc = pitch.Accidental.__new__(pitch.Accidental)
+            for slot, default in self.accidentalValues(name):
+                setattr(acc, slot, default)
+            statusCode = (accValue >> 1) & 3
+            acc._displayStatus = None if statusCode == 0 else statusCode == 1
+            acc._client = p if accValue & 1 else None
+            acc._displayType = self.strings[self.readVarint()]
+            p._accidental = acc
+        else:
+            p._accidental = None
+        return p
+
+    def accidentalValues(self, name: str) -> list[tuple[str, t.Any]]:
+        try:
+            return self.accidentalDefaults[name]
+        except KeyError:
+            acc = pitch.Accidental(name)
+            values = self.accidentalDefaults[name] = [(slot, getattr(acc, slot))
+                                                      for slot in _allSlots(pitch.Accidental)]
+            return values
+
+    def readDuration(self, owner):
+        value = self.readVarint()
+        d = duration.Duration.__new__(duration.Duration)
+        d._linked = True
+        d._tuplets = ()
+        d._unlinkedType = None
+        d._dotGroups = (0,)
+        d.expressionIsInferred = bool(value & 1)
+        d._componentsNeedUpdating = bool(value & 2)
+        d._quarterLengthNeedsUpdating = bool(value & 4)
+        d._typeNeedsUpdating = bool(value & 8)
+        clientCode = value >> 4
+        d.client = owner if clientCode == 0 else None
+        d._qtrLength = self.readQuarterLength()
+        components = []
+        for _ in range(self.readVarint()):
+            componentValue = self.readVarint()
+            components.append(duration.durationTupleFromTypeDots(
+                self.strings[componentValue >> 3], componentValue & 7))
+        d._components = tuple(components)
+        return d, clientCode
+
+    def readTie(self):
+        tieObj = tie.Tie.__new__(tie.Tie)
+        tieObj.id = id(tieObj)
+        tieObj.type = self.strings[self.readVarint()]
+        tieObj.style = self.strings[self.readVarint()]
+        tieObj.placement = self.readOptionalString()
+        return tieObj
+
+    def readBeams(self):
+        beams = beam.Beams.__new__(beam.Beams)
+        beams.id = id(beams)
+        value = self.readVarint()
+        beams.feathered = bool(value & 1)
+        beamsList = []
+        for _ in range(value >> 1):
+            b = beam.Beam.__new__(beam.Beam)
+            b.id = id(b)
+            b._style = None
+            b._editorial = None
+            b.independentAngle = None
+            b.type = self.strings[self.readVarint()]
+            number = self.readVarint()
+            b.number = None if number == 0 else _unzigzag(number - 1)
+            b.direction = self.readOptionalString()
+            beamsList.append(b)
+        beams.beamsList = beamsList
+        return beams
+
 
 # -----------------------------------------------------------------------------
 
@@ -1228,6 +2264,120 @@ class Test(unittest.TestCase):
             d.parts[1].flatten().notes[20].volume.client,
             note.NotRest)
 
+    def testBinarySpannerAndChord(self):
+        from music21 import chord
+        from music21 import note
+        from music21 import stream
+        s = stream.Stream()
+        sDummy = stream.Stream()
+        n = note.Note('E-5', quarterLength=1.5)
+        n.tie = tie.Tie('start')
+        n.lyric = 'la'
+        ch = chord.Chord(['C4', 'G#4'], type='eighth')
+        ch.notes[1].pitch.accidental.displayStatus = True
+        sl1 = spanner.Slur([n, ch])
+        s.insert(0.0, sl1)
+        s.insert(2.0, n)
+        s.insert(3.5, ch)
+        sDummy.insert(3.0, n)
+
+        data = StreamFreezer(s).writeStr(fmt='binary')
+        self.assertEqual(data[:4], BINARY_MAGIC)
+        del s
+        del sDummy
+
+        st = StreamThawer()
+        st.openStr(data)
+        outStream = st.stream
+        self.assertEqual(len(outStream), 3)
+        nOut, chOut = outStream.notes
+        self.assertEqual(nOut.offset, 2.0)
+        self.assertEqual(nOut.nameWithOctave, 'E-5')
+        self.assertEqual(nOut.quarterLength, 1.5)
+        self.assertEqual(nOut.tie.type, 'start')
+        self.assertEqual(nOut.lyric, 'la')
+        self.assertEqual(chOut.pitchNames, ['C', 'G#'])
+        self.assertIs(chOut.notes[1].pitch.accidental.displayStatus, True)
+        self.assertIs(chOut.notes[0].duration, chOut.duration)
+        self.assertEqual(chOut.duration.type, 'eighth')
+        self.assertEqual(nOut.getOffsetBySite(outStream), 2.0)
+        self.assertIs(outStream.spanners[0].getFirst(), nOut)
+        self.assertIs(outStream.spanners[0].getLast(), chOut)
+
+    def testBinaryCorpusRoundTrip(self):
+        from music21 import converter
+        from music21 import corpus
+        c = corpus.parse('luca/gloria')
+        data = converter.freezeStr(c, fmt='binary')
+        d = converter.thawStr(data)
+        self.assertEqual(len(d.parts), len(c.parts))
+        cFlat = c.flatten()
+        dFlat = d.flatten()
+        self.assertEqual([(e.classes[0], e.offset, e.quarterLength) for e in cFlat],
+                         [(e.classes[0], e.offset, e.quarterLength) for e in dFlat])
+        self.assertEqual([p.nameWithOctave for p in cFlat.pitches],
+                         [p.nameWithOctave for p in dFlat.pitches])
+        self.assertEqual(len(d.spanners), len(c.spanners))
+        for sp in d.recurse().getElementsByClass(spanner.Spanner):
+            for el in sp:
+                self.assertIsNotNone(el.activeSite)
+
+    def testBinaryVariant(self):
+        from music21 import corpus
+        from music21 import stream
+        from music21 import note
+
+        c = corpus.parse('luca/gloria')
+        stream2 = stream.Stream()
+        m = stream.Measure()
+        for pitchName, durType in [('f', 'eighth'), ('c', 'quarter'),
+                                   ('a', 'eighth'), ('a', 'quarter')]:
+            m.append(note.Note(pitchName, type=durType))
+        stream2.append(m)
+        variant.addVariant(c.parts[0], 6.0, stream2,
+                           variantName='rhythmic_switch', replacementDuration=3.0)
+
+        d = StreamFreezer(c, fastButUnsafe=True).writeStr(fmt='binary')
+        st = StreamThawer()
+        st.openStr(d)
+        v2 = st.stream.parts[0].getElementsByClass(variant.Variant).first()
+        self.assertIn('rhythmic_switch', v2.groups)
+        self.assertEqual(v2._stream[0][1].offset, 0.5)
+
+    def testBinaryPartialThaw(self):
+        from music21 import corpus
+        from music21 import stream
+        c = corpus.parse('bwv66.6')
+        data = StreamFreezer(c).writeStr(fmt='binary')
+
+        st = StreamThawer()
+        st.openStr(data, parts=[0, 3], measures=(4, None))
+        s = st.stream
+        self.assertEqual(len(s.parts), 2)
+        self.assertEqual(s.parts[1].partName, c.parts[3].partName)
+        measureNumbers = [m.number for m in s.parts[0].getElementsByClass(stream.Measure)]
+        self.assertEqual(measureNumbers, list(range(4, 10)))
+        self.assertEqual(s.metadata.title, c.metadata.title)
+
+        st = StreamThawer()
+        with self.assertRaises(FreezeThawException):
+            st.openStr(StreamFreezer(c).writeStr(fmt='pickle'), parts=[0])
+
+    def testBinaryFileZlib(self):
+        import os
+        from music21 import converter
+        from music21 import corpus
+        c = corpus.parse('bwv66.6')
+        fp = converter.freeze(c, fmt='binary', zipType='zlib')
+        try:
+            self.assertEqual(fp.suffix, '.m21b')
+            d = converter.thaw(fp, zipType='zlib')
+            self.assertEqual(len(d.recurse().notes), len(c.recurse().notes))
+            self.assertEqual([n.pitch.ps for n in d.recurse().notes],
+                             [n.pitch.ps for n in c.recurse().notes])
+        finally:
+            os.remove(fp)
+
 
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
@@ -65,6 +65,7 @@ from music21 import expressions
 from music21 import instrument
 from music21 import key
 from music21 import note
+from music21 import pitch
 from music21 import meter
 from music21 import metadata
 from music21 import roman
@@ -478,64 +479,52 @@ class HumdrumDataCollection(prebase.ProtoM21Object):
             self.parseEventListFromDataStream()
 
         # we make two lists: one of ProtoSpines (vertical slices) and
-        # one of Events(horizontal slices)
-        returnProtoSpines = []
+        # one of Events(horizontal slices), filling both in one pass over the lines.
+        maxSpines = self.maxSpines
+        protoSpineEventLists = [[] for unused_j in range(maxSpines)]
         returnEventCollections = []
-        protoSpineEventList = []
+        lastEventCollection = None
 
-        # noinspection PyShadowingNames
-        def doOneCell(i, j):
-            # get the currentEventCollection
-            thisEventCollection = returnEventCollections[i]
-
-            # parse this cell
-            if self.eventList[i].isSpineLine is True:
-                # not a global event
-                if len(self.eventList[i].spineData) > j:
+        for i in range(self.fileLength if maxSpines else 0):
+            thisLine = self.eventList[i]
+            thisEventCollection = EventCollection(maxSpines)
+            returnEventCollections.append(thisEventCollection)
+
+            if thisLine.isSpineLine is True:
+                spineData = thisLine.spineData
+                numCells = len(spineData)
+            else:  # Global event -- either GlobalCommentLine or GlobalReferenceLine
+                thisEventCollection.addGlobalEvent(thisLine)
+                spineData = ()
+                numCells = 0
+
+            for j in range(maxSpines):
+                if j < numCells:
                     # are there actually this many spines at this point?
                     # thus, is there an event here? True
-                    thisEvent = SpineEvent(self.eventList[i].spineData[j])
-                    thisEvent.position = i
+                    thisEvent = SpineEvent(spineData[j], i)
                     thisEvent.protoSpineId = j
-                    if thisEvent.contents in spinePathIndicators:
+                    contents = thisEvent.contents
+                    if contents in spinePathIndicators:
                         thisEventCollection.spinePathData = True
 
-                    protoSpineEventList.append(thisEvent)
+                    protoSpineEventLists[j].append(thisEvent)
                     thisEventCollection.addSpineEvent(j, thisEvent)
-                    if thisEvent.contents == '.' and i > 0:
-                        lastEvent = returnEventCollections[i - 1].events[j]
-                        if lastEvent is not None:
-                            thisEventCollection.addLastSpineEvent(
-                                j,
-                                returnEventCollections[i - 1].getSpineOccurring(j)
-                            )
-                else:  # no data here
-                    thisEvent = SpineEvent(None)
-                    thisEvent.position = i
+                    if (contents == '.'
+                            and lastEventCollection is not None
+                            and lastEventCollection.events[j] is not None):
+                        thisEventCollection.addLastSpineEvent(
+                            j,
+                            lastEventCollection.getSpineOccurring(j)
+                        )
+                else:  # no data here, or a global event
+                    thisEvent = SpineEvent(None, i)
                     thisEvent.protoSpineId = j
                     thisEventCollection.addSpineEvent(j, thisEvent)
+                    protoSpineEventLists[j].append(None)
+            lastEventCollection = thisEventCollection
 
-                    protoSpineEventList.append(None)
-            else:  # Global event -- either GlobalCommentLine or GlobalReferenceLine
-                if j == 0:  # adds to all spines but just runs the first time.
-                    thisEventCollection.addGlobalEvent(self.eventList[i])
-                thisEvent = SpineEvent(None)
-                thisEvent.position = i
-                thisEvent.protoSpineId = j
-                thisEventCollection.addSpineEvent(j, thisEvent)
-                protoSpineEventList.append(None)
-
-        # end doOneCell
-        for j in range(self.maxSpines):
-            protoSpineEventList = []
-
-            for i in range(self.fileLength):
-                if j == 0:
-                    returnEventCollections.append(EventCollection(self.maxSpines))
-
-                doOneCell(i, j)
-
-            returnProtoSpines.append(ProtoSpine(protoSpineEventList))
+        returnProtoSpines = [ProtoSpine(eventList) for eventList in protoSpineEventLists]
 
         self.protoSpines = returnProtoSpines
         self.eventCollections = returnEventCollections
@@ -1261,6 +1250,9 @@ class HumdrumSpine(prebase.ProtoM21Object):
         specific Spine subclasses.
         '''
         lastContainer = hdStringToMeasure('=0')
+        # appended after parsing, so that changes to the previous measure
+        # do not clear the cached highestTime of self.stream every bar.
+        parsedObjects = []
 
         for event in self.eventList:
             eventC = str(event.contents)
@@ -1281,7 +1273,10 @@ class HumdrumSpine(prebase.ProtoM21Object):
                 thisObject.humdrumPosition = event.position
 
             if thisObject is not None:
-                self.stream.coreAppend(thisObject)
+                parsedObjects.append(thisObject)
+
+        for thisObject in parsedObjects:
+            self.stream.coreAppend(thisObject)
         self.stream.coreElementsChanged()
 
 
@@ -1308,6 +1303,11 @@ class KernSpine(HumdrumSpine):
         self.currentBeamNumbers = 0
         self.currentTupletDuration = 0.0
         self.desiredTupletDuration = 0.0
+        # Objects are appended only after the whole spine is parsed: closing a
+        # measure or a tuplet changes an object that is already parsed, which
+        # would otherwise clear the cached highestTime of self.stream and make
+        # each coreAppend walk the whole spine.
+        parsedObjects = []
 
         for event in self.eventList:
             # event is a SpineEvent object
@@ -1336,7 +1336,7 @@ class KernSpine(HumdrumSpine):
                 if thisObject is not None:
                     thisObject.humdrumPosition = event.position
                     thisObject.priority = event.position
-                    self.stream.coreAppend(thisObject)
+                    parsedObjects.append(thisObject)
             except Exception as e:  # pylint: disable=broad-exception-caught  # pragma: no cover
                 import traceback
                 environLocal.warn(
@@ -1348,6 +1348,8 @@ class KernSpine(HumdrumSpine):
                 environLocal.printDebug(f'Traceback for the exception: \n{tb}')
                 # traceback... environLocal.printDebug()
 
+        for thisObject in parsedObjects:
+            self.stream.coreAppend(thisObject)
         self.stream.coreElementsChanged()
         # still to be done later... move things before first measure to first measure!
 
@@ -2119,6 +2121,305 @@ class EventCollection:
         return retEvents
 
 
+def _connectedTurn() -> expressions.Turn:
+    t1 = expressions.Turn()
+    t1.connectedToPrevious = True  # true by default, but explicitly
+    return t1
+
+
+class KernNoteToken:
+    '''
+    Everything that :func:`hdStringToNote` reads from a single kern note or
+    rest token: pitch, duration, tie, ornaments, articulations, stem
+    direction, grace type, and beams.
+
+    Kern files repeat the same few hundred tokens thousands of times, so
+    each distinct token is parsed only once by :meth:`fromString`; every
+    later call to :meth:`makeNote` just builds new objects from the stored
+    values.
+
+    >>> kt = humdrum.spineParser.KernNoteToken.fromString('8cc#L')
+    >>> (kt.step, kt.octave, kt.accidental)
+    ('c', 5, '#')
+    >>> kt.beams
+    (('start', None),)
+    >>> humdrum.spineParser.KernNoteToken.fromString('8cc#L') is kt
+    True
+
+    >>> n = kt.makeNote()
+    >>> n
+    <music21.note.Note C#>
+    >>> n.duration.type
+    'eighth'
+    >>> kt.makeNote() is n
+    False
+
+    * New in v9.3.
+    '''
+    __slots__ = ('isRest', 'step', 'octave', 'accidental', 'tieType',
+                 'expressionMakers', 'articulationClasses', 'stemDirection',
+                 'durationType', 'dots', 'tuplet', 'duration', 'grace', 'beams')
+
+    # tokens already parsed, keyed by (token, JRP flavor)
+    _cache: dict[tuple[str, bool], KernNoteToken] = {}
+    _cacheLimit = 20_000
+
+    def __init__(self, contents: str):
+        # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
+
+        # 3.2.1 Pitches and 3.3 Rests
+        self.step: str | None = None
+        self.octave: int | None = None
+
+        # Detect rests first, because rests can contain manual positioning information,
+        # which is also detected by the `matchedNote` variable above.
+        matchedNote = re.search('([a-gA-G]+)', contents)
+        self.isRest = 'r' in contents
+        if self.isRest:
+            pass
+        elif matchedNote:
+            kernNoteName = matchedNote.group(1)
+            step = kernNoteName[0].lower()
+            if step == kernNoteName[0]:  # middle C or higher
+                self.octave = 3 + len(kernNoteName)
+            else:  # below middle C
+                self.octave = 4 - len(kernNoteName)
+            self.step = step
+        else:
+            raise HumdrumException(f'Could not parse {contents} for note information')
+
+        matchedSharp = re.search(r'(#+)', contents)
+        matchedFlat = re.search(r'(-+)', contents)
+
+        self.accidental: str | None = None
+        if matchedSharp:
+            self.accidental = matchedSharp.group(0)
+        elif matchedFlat:
+            self.accidental = matchedFlat.group(0)
+        elif 'n' in contents:
+            self.accidental = 'n'
+        if self.isRest and self.accidental is not None:
+            raise HumdrumException(f'Could not parse {contents}: rests cannot have accidentals')
+
+        # 3.2.2 -- Slurs, Ties, Phrases
+        # TODO: add music21 phrase information ({ and }) and slurs (( and ))
+        self.tieType: str | None = None
+        if '[' in contents:
+            self.tieType = 'start'
+        elif ']' in contents:
+            self.tieType = 'stop'
+        elif '_' in contents:
+            self.tieType = 'continue'
+
+        # 3.2.3 Ornaments
+        expressionMakers: list[t.Callable[[], expressions.Expression]] = []
+        if 't' in contents:
+            expressionMakers.append(expressions.HalfStepTrill)
+        elif 'T' in contents:
+            expressionMakers.append(expressions.WholeStepTrill)
+
+        if 'w' in contents:
+            expressionMakers.append(expressions.HalfStepInvertedMordent)
+        elif 'W' in contents:
+            expressionMakers.append(expressions.WholeStepInvertedMordent)
+        elif 'm' in contents:
+            expressionMakers.append(expressions.HalfStepMordent)
+        elif 'M' in contents:
+            expressionMakers.append(expressions.WholeStepMordent)
+
+        if 'S' in contents:
+            expressionMakers.append(expressions.Turn)
+        elif '$' in contents:
+            expressionMakers.append(expressions.InvertedTurn)
+        elif 'R' in contents:
+            expressionMakers.append(_connectedTurn)
+
+        # TODO: deal with arpeggiation (':') -- should have been in a chord structure
+
+        if 'O' in contents:
+            expressionMakers.append(expressions.Ornament)
+            # generic ornament
+
+        # 3.2.4 Articulation Marks
+        articulationClasses: list[type[articulations.Articulation]] = []
+        if "'" in contents:
+            articulationClasses.append(articulations.Staccato)
+        if '"' in contents:
+            articulationClasses.append(articulations.Pizzicato)
+        if '`' in contents:
+            # called 'attacca' mark but means staccatissimo:
+            # http://www.music-cog.ohio-state.edu/Humdrum/representations/kern.rep.html
+            articulationClasses.append(articulations.Staccatissimo)
+        if '~' in contents:
+            articulationClasses.append(articulations.Tenuto)
+        if '^' in contents:
+            articulationClasses.append(articulations.Accent)
+        if ';' in contents:
+            expressionMakers.append(expressions.Fermata)
+
+        # 3.2.5 Up & Down Bows
+        if 'v' in contents:
+            articulationClasses.append(articulations.UpBow)
+        elif 'u' in contents:
+            articulationClasses.append(articulations.DownBow)
+
+        self.expressionMakers = tuple(expressionMakers)
+        self.articulationClasses = tuple(articulationClasses)
+
+        # 3.2.6 Stem Directions
+        self.stemDirection: str | None = None
+        if '/' in contents:
+            self.stemDirection = 'up'
+        elif '\\' in contents:
+            self.stemDirection = 'down'
+
+        # 3.2.7 Duration +
+        # 3.2.8 N-Tuplets
+        self.durationType: str | None = None
+        self.dots = contents.count('.')
+        # (numberNotesActual, numberNotesNormal, durationNormal dots) of an N-tuplet
+        self.tuplet: tuple[int, int, int] | None = None
+        # rational durations are kept here and copied
+        self.duration: duration.Duration | None = None
+        self._parseDuration(contents)
+
+        # 3.2.9 Grace Notes and Groupettos
+        self.grace: str | None = None
+        for graceChar in 'qQP':
+            if graceChar in contents:
+                self.grace = graceChar
+                break
+        # 'p' ends an appoggiatura duration -- not needed in music21...
+
+        # 3.2.10 Beaming
+        # TODO: Support really complex beams
+        self.beams = (
+            (('start', None),) * contents.count('L')
+            + (('stop', None),) * contents.count('J')
+            + (('partial', 'right'),) * (contents.count('k') + contents.count('K'))
+        )
+
+    def _parseDuration(self, contents: str) -> None:
+        foundNumber = re.search(r'(\d+)', contents)
+        if not foundNumber:
+            return
+        foundRational = re.search(r'(\d+)%(\d+)', contents)
+        if foundRational:
+            durationFirst = int(foundRational.group(1))
+            durationSecond = float(foundRational.group(2))
+            d = duration.Duration(1.0)
+            d.quarterLength = 4 * durationSecond / durationFirst
+            if self.dots:
+                d.dots = self.dots
+            self.duration = d
+            return
+
+        durationType = int(foundNumber.group(1))
+        if durationType == 0:
+            durationString = foundNumber.group(1)
+            if durationString == '000':
+                # for larger values, see https://extras.humdrum.org/man/rscale/
+                self.durationType = 'maxima'
+            elif durationString == '00':
+                self.durationType = 'longa'
+            else:
+                self.durationType = 'breve'
+        elif durationType in duration.typeFromNumDict:
+            self.durationType = duration.typeFromNumDict[durationType]
+        else:
+            dT = int(durationType) + 0.0
+            (unused_remainder, exponents) = math.modf(math.log2(dT))
+            baseValue = 2 ** exponents
+            self.durationType = duration.typeFromNumDict[int(baseValue)]
+
+            gcd = math.gcd(int(dT), int(baseValue))
+            normalDots = 0
+            # The Josquin Research Project uses an incorrect definition of
+            # humdrum tuplets that breaks normal usage.  TODO: Refactor adding a Flavor = 'JRP'
+            # code that uses this other method...
+            if flavors['JRP'] is False:
+                normalDots = self.dots
+                self.dots = 0
+            self.tuplet = (int(dT / gcd), int(float(baseValue) / gcd), normalDots)
+            # call Duration.TupletFixer after to correct this.
+
+    @classmethod
+    def fromString(cls, contents: str) -> KernNoteToken:
+        '''
+        Return the parsed KernNoteToken for `contents`, parsing it only if
+        it has not been seen before (with the current `flavors`).
+        '''
+        key = (contents, flavors['JRP'])
+        try:
+            return cls._cache[key]
+        except KeyError:
+            pass
+        kt = cls(contents)
+        if len(cls._cache) >= cls._cacheLimit:
+            cls._cache.clear()
+        cls._cache[key] = kt
+        return kt
+
+    def makeDuration(self) -> duration.Duration | None:
+        '''
+        Return a new Duration for this token, or None if the token
+        does not give a duration.
+        '''
+        if self.tuplet is not None:
+            numberNotesActual, numberNotesNormal, normalDots = self.tuplet
+            d = duration.Duration(self.durationType)
+            d.appendTuplet(duration.Tuplet(
+                numberNotesActual,
+                numberNotesNormal,
+                duration.durationTupleFromTypeDots(self.durationType, 0),
+                duration.durationTupleFromTypeDots(self.durationType, normalDots),
+            ))
+            if self.dots:
+                d.dots = self.dots
+            return d
+        if self.durationType is not None:
+            if note.INTERN_VALUES:
+                return duration.internDuration(self.durationType, self.dots)
+            return duration.Duration(self.durationType, dots=self.dots)
+        if self.duration is not None:
+            return copy.deepcopy(self.duration)
+        return None
+
+    def makeNote(self):
+        '''
+        Return a new Note (or Rest, or grace note) for this token.
+        '''
+        d = self.makeDuration()
+        if self.isRest:
+            thisObject = note.Rest(duration=d)
+        else:
+            p = pitch.Pitch(step=self.step, octave=self.octave, accidental=self.accidental)
+            thisObject = note.Note(p, duration=d)
+
+        if self.tieType is not None:
+            thisObject.tie = tie.Tie(self.tieType)
+        for expressionMaker in self.expressionMakers:
+            thisObject.expressions.append(expressionMaker())
+        for articulationClass in self.articulationClasses:
+            thisObject.articulations.append(articulationClass())
+        if self.stemDirection is not None:
+            thisObject.stemDirection = self.stemDirection
+
+        if self.grace == 'q':
+            thisObject = thisObject.getGrace()
+            thisObject.duration.type = 'eighth'
+        elif self.grace == 'Q':
+            thisObject = thisObject.getGrace()
+            thisObject.duration.slash = False
+            thisObject.duration.type = 'eighth'
+        elif self.grace == 'P':
+            thisObject = thisObject.getGrace(appoggiatura=True)
+
+        for beamType, direction in self.beams:
+            thisObject.beams.append(beamType, direction)
+        return thisObject
+
+
 def hdStringToNote(contents):
     '''
     returns a :class:`~music21.note.Note` (or Rest or Unpitched, etc.)
@@ -2198,211 +2499,10 @@ def hdStringToNote(contents):
 
     >>> humdrum.spineParser.flavors['JRP'] = storedFlavors  #_DOCS_HIDE
 
+    * Changed in v9.3: each distinct token is parsed only once; see
+      :class:`~music21.humdrum.spineParser.KernNoteToken`.
     '''
-
-    # http://www.lib.virginia.edu/artsandmedia/dmmc/Music/Humdrum/kern_hlp.html#kern
-
-    # 3.2.1 Pitches and 3.3 Rests
-
-    matchedNote = re.search('([a-gA-G]+)', contents)
-    thisObject = None
-
-    # Detect rests first, because rests can contain manual positioning information,
-    # which is also detected by the `matchedNote` variable above.
-    if contents.count('r'):
-        thisObject = note.Rest()
-
-    elif matchedNote:
-        kernNoteName = matchedNote.group(1)
-        step = kernNoteName[0].lower()
-        if step == kernNoteName[0]:  # middle C or higher
-            octave = 3 + len(kernNoteName)
-        else:  # below middle C
-            octave = 4 - len(kernNoteName)
-        thisObject = note.Note(octave=octave)
-        thisObject.step = step
-
-    else:
-        raise HumdrumException(f'Could not parse {contents} for note information')
-
-    matchedSharp = re.search(r'(#+)', contents)
-    matchedFlat = re.search(r'(-+)', contents)
-
-    if matchedSharp:
-        thisObject.pitch.accidental = matchedSharp.group(0)
-    elif matchedFlat:
-        thisObject.pitch.accidental = matchedFlat.group(0)
-    elif contents.count('n'):
-        thisObject.pitch.accidental = 'n'
-
-    # 3.2.2 -- Slurs, Ties, Phrases
-    # TODO: add music21 phrase information
-    if contents.count('{'):
-        for i in range(contents.count('{')):
-            pass  # phraseMark start
-    if contents.count('}'):
-        for i in range(contents.count('}')):
-            pass  # phraseMark end
-    if contents.count('('):
-        for i in range(contents.count('(')):
-            pass  # slur start
-    if contents.count(')'):
-        for i in range(contents.count(')')):
-            pass  # slur end
-    if contents.count('['):
-        thisObject.tie = tie.Tie('start')
-    elif contents.count(']'):
-        thisObject.tie = tie.Tie('stop')
-    elif contents.count('_'):
-        thisObject.tie = tie.Tie('continue')
-
-    # 3.2.3 Ornaments
-    if contents.count('t'):
-        thisObject.expressions.append(expressions.HalfStepTrill())
-    elif contents.count('T'):
-        thisObject.expressions.append(expressions.WholeStepTrill())
-
-    if contents.count('w'):
-        thisObject.expressions.append(expressions.HalfStepInvertedMordent())
-    elif contents.count('W'):
-        thisObject.expressions.append(expressions.WholeStepInvertedMordent())
-    elif contents.count('m'):
-        thisObject.expressions.append(expressions.HalfStepMordent())
-    elif contents.count('M'):
-        thisObject.expressions.append(expressions.WholeStepMordent())
-
-    if contents.count('S'):
-        thisObject.expressions.append(expressions.Turn())
-    elif contents.count('$'):
-        thisObject.expressions.append(expressions.InvertedTurn())
-    elif contents.count('R'):
-        t1 = expressions.Turn()
-        t1.connectedToPrevious = True  # true by default, but explicitly
-        thisObject.expressions.append(t1)
-
-    if contents.count(':'):
-        # TODO: deal with arpeggiation -- should have been in a
-        #  chord structure
-        pass
-
-    if contents.count('O'):
-        thisObject.expressions.append(expressions.Ornament())
-        # generic ornament
-
-    # 3.2.4 Articulation Marks
-    if contents.count("'"):
-        thisObject.articulations.append(articulations.Staccato())
-    if contents.count('"'):
-        thisObject.articulations.append(articulations.Pizzicato())
-    if contents.count('`'):
-        # called 'attacca' mark but means staccatissimo:
-        # http://www.music-cog.ohio-state.edu/Humdrum/representations/kern.rep.html
-        thisObject.articulations.append(articulations.Staccatissimo())
-    if contents.count('~'):
-        thisObject.articulations.append(articulations.Tenuto())
-    if contents.count('^'):
-        thisObject.articulations.append(articulations.Accent())
-    if contents.count(';'):
-        thisObject.expressions.append(expressions.Fermata())
-
-    # 3.2.5 Up & Down Bows
-    if contents.count('v'):
-        thisObject.articulations.append(articulations.UpBow())
-    elif contents.count('u'):
-        thisObject.articulations.append(articulations.DownBow())
-
-    # 3.2.6 Stem Directions
-    if contents.count('/'):
-        thisObject.stemDirection = 'up'
-    elif contents.count('\\'):
-        thisObject.stemDirection = 'down'
-
-    # 3.2.7 Duration +
-    # 3.2.8 N-Tuplets
-
-    # TODO: SPEEDUP -- only search for rational after foundNumber...
-    foundRational = re.search(r'(\d+)%(\d+)', contents)
-    foundNumber = re.search(r'(\d+)', contents)
-    if foundRational:
-        durationFirst = int(foundRational.group(1))
-        durationSecond = float(foundRational.group(2))
-        thisObject.duration.quarterLength = 4 * durationSecond / durationFirst
-        if contents.count('.'):
-            thisObject.duration.dots = contents.count('.')
-
-    elif foundNumber:
-        durationType = int(foundNumber.group(1))
-        if durationType == 0:
-            durationString = foundNumber.group(1)
-            if durationString == '000':
-                # for larger values, see https://extras.humdrum.org/man/rscale/
-                thisObject.duration.type = 'maxima'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
-            elif durationString == '00':
-                # for larger values, see https://extras.humdrum.org/man/rscale/
-                thisObject.duration.type = 'longa'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
-            else:
-                thisObject.duration.type = 'breve'
-                if contents.count('.'):
-                    thisObject.duration.dots = contents.count('.')
-        elif durationType in duration.typeFromNumDict:
-            thisObject.duration.type = duration.typeFromNumDict[durationType]
-            if contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
-        else:
-            dT = int(durationType) + 0.0
-            (unused_remainder, exponents) = math.modf(math.log2(dT))
-            baseValue = 2 ** exponents
-            thisObject.duration.type = duration.typeFromNumDict[int(baseValue)]
-            newTup = duration.Tuplet()
-            newTup.durationActual = duration.durationTupleFromTypeDots(thisObject.duration.type, 0)
-            newTup.durationNormal = duration.durationTupleFromTypeDots(thisObject.duration.type, 0)
-
-            gcd = math.gcd(int(dT), int(baseValue))
-            newTup.numberNotesActual = int(dT / gcd)
-            newTup.numberNotesNormal = int(float(baseValue) / gcd)
-
-            # The Josquin Research Project uses an incorrect definition of
-            # humdrum tuplets that breaks normal usage.  TODO: Refactor adding a Flavor = 'JRP'
-            # code that uses this other method...
-            JRP = flavors['JRP']
-            if JRP is False and contents.count('.'):
-                newTup.durationNormal = duration.durationTupleFromTypeDots(
-                    newTup.durationNormal.type, contents.count('.'))
-
-            thisObject.duration.appendTuplet(newTup)
-            if JRP is True and contents.count('.'):
-                thisObject.duration.dots = contents.count('.')
-            # call Duration.TupletFixer after to correct this.
-
-    # 3.2.9 Grace Notes and Groupettos
-    if contents.count('q'):
-        thisObject = thisObject.getGrace()
-        thisObject.duration.type = 'eighth'
-    elif contents.count('Q'):
-        thisObject = thisObject.getGrace()
-        thisObject.duration.slash = False
-        thisObject.duration.type = 'eighth'
-    elif contents.count('P'):
-        thisObject = thisObject.getGrace(appoggiatura=True)
-    elif contents.count('p'):
-        pass  # end appoggiatura duration -- not needed in music21...
-
-    # 3.2.10 Beaming
-    # TODO: Support really complex beams
-    for i in range(contents.count('L')):
-        thisObject.beams.append('start')
-    for i in range(contents.count('J')):
-        thisObject.beams.append('stop')
-    for i in range(contents.count('k')):
-        thisObject.beams.append('partial', 'right')
-    for i in range(contents.count('K')):
-        thisObject.beams.append('partial', 'right')
-
-    return thisObject
+    return KernNoteToken.fromString(contents).makeNote()
 
 
 def hdStringToMeasure(contents, previousMeasure=None):
@@ -2907,6 +3007,28 @@ class Test(unittest.TestCase):
         self.assertEqual(b.duration.dots, 0)
         self.assertEqual(b.duration.tuplets[0].durationNormal.dots, 2)
 
+    def testRepeatedTokensMakeNewObjects(self):
+        n1 = hdStringToNote('12cc#[L^')
+        n1.duration.tuplets[0].type = 'start'
+        n1.beams.beamsList[0].type = 'continue'
+        n1.tie.type = 'stop'
+        n1.articulations.append(articulations.Tenuto())
+        n1.pitch.octave = 2
+
+        n2 = hdStringToNote('12cc#[L^')
+        self.assertEqual(n2.nameWithOctave, 'C#5')
+        self.assertIsNone(n2.duration.tuplets[0].type)
+        self.assertEqual(n2.beams.getTypes(), ['start'])
+        self.assertEqual(n2.tie.type, 'start')
+        self.assertEqual(len(n2.articulations), 1)
+
+        with note.internedValues():
+            n3 = hdStringToNote('8cc#')
+            n4 = hdStringToNote('8cc#')
+        self.assertIs(n3._duration, n4._duration)
+        n3.duration.dots = 1
+        self.assertEqual(n4.quarterLength, 0.5)
+
     def testMeasureBoundaries(self):
         m0 = stream.Measure()
         m1 = hdStringToMeasure('=29a;:|:', m0)
@@ -57,6 +57,12 @@ MIN_DENOMINATOR_TYPE = '128th'
 _meterSequenceAccentArchetypes: dict[tuple[str, t.Any, int], MeterSequence] = {}
 _meterSequenceAccentArchetypesNoneCache = ('', -1, -1)  # a cache key representing None
 
+# store a module-level dictionary of the display, beam, beat, and accent
+# MeterSequences made by TimeSignature.load() for each value with default
+# divisions, so that each meter is only partitioned once
+_timeSignatureArchetypes: dict[str, tuple[MeterSequence, MeterSequence,
+                                          MeterSequence, MeterSequence]] = {}
+
 def bestTimeSignature(meas: stream.Stream) -> 'music21.meter.TimeSignature':
     # noinspection PyShadowingNames
     '''
@@ -603,6 +609,14 @@ class TimeSignature(TimeSignatureBase):
             value = '2/2'
             self.symbol = 'cut'
 
+        if divisions is None and value in _timeSignatureArchetypes:
+            (self.displaySequence,
+             self.beamSequence,
+             self.beatSequence,
+             self.accentSequence) = [copy.deepcopy(ms)
+                                     for ms in _timeSignatureArchetypes[value]]
+            return
+
         self.displaySequence = MeterSequence(value)
 
         # get simple representation; presently, only slashToTuple
@@ -635,6 +649,11 @@ class TimeSignature(TimeSignatureBase):
             except MeterException:
                 environLocal.printDebug(['cannot set default accents for:', self])
 
+            _timeSignatureArchetypes[value] = (copy.deepcopy(self.displaySequence),
+                                               copy.deepcopy(self.beamSequence),
+                                               copy.deepcopy(self.beatSequence),
+                                               copy.deepcopy(self.accentSequence))
+
     @property
     def ratioString(self):
         '''
@@ -1405,6 +1424,13 @@ class TimeSignature(TimeSignatureBase):
         beamsList = beam.Beams.naiveBeams(srcList)  # hold maximum Beams objects, all with type None
         beamsList = beam.Beams.removeSandwichedUnbeamables(beamsList)
 
+        def levelSpanAt(depth, qLenPos):
+            indexAndSpan = self.beamSequence._offsetToLevelSpan(qLenPos, depth)
+            if indexAndSpan is None:
+                # out of range: get the exception from an archetype of the level
+                return self.beamSequence.getLevel(depth).offsetToSpan(qLenPos)
+            return indexAndSpan[1:]
+
         def fixBeamsOneElementDepth(i, el, depth):
             beams = beamsList[i]
             if beams is None:
@@ -1429,19 +1455,16 @@ class TimeSignature(TimeSignatureBase):
             beamNext = beamsList[i + 1] if not isLast else None
             beamPrevious = beamsList[i - 1] if not isFirst else None
 
-            # get an archetype of the MeterSequence for this level.
-            # level is the depth, starting at zero
-            archetype = self.beamSequence.getLevel(depth)
             # span is the quarter note duration points for each partition
-            # at this level
-            archetypeSpanStart, archetypeSpanEnd = archetype.offsetToSpan(start)
+            # of the beamSequence at this level. level is the depth, starting at zero
+            archetypeSpanStart, archetypeSpanEnd = levelSpanAt(depth, start)
             # environLocal.printDebug(['at level, got archetype span', depth,
             #                         archetypeSpan])
 
             if beamNext is None:  # last note or before a non-beamable note (half, whole, etc.)
                 archetypeSpanNextStart = 0.0
             else:
-                archetypeSpanNextStart = archetype.offsetToSpan(startNext)[0]
+                archetypeSpanNextStart = levelSpanAt(depth, startNext)[0]
 
             # watch for a special case where a duration completely fills
             # the archetype; this generally should not be beamed
@@ -1775,7 +1798,6 @@ class TimeSignature(TimeSignatureBase):
         # getting it here
         minWeight = min(
             [mt.weight for mt in self.accentSequence]) * 0.5
-        msLevel = self.accentSequence.getLevel(level)
 
         if permitMeterModulus:
             environLocal.printDebug(
@@ -1783,15 +1805,21 @@ class TimeSignature(TimeSignatureBase):
                  'self.barDuration.quarterLength', self.barDuration.quarterLength])
             qLenPos = qLenPos % self.barDuration.quarterLength
 
+        indexAndSpan = self.accentSequence._offsetToLevelSpan(qLenPos, level)
+        if indexAndSpan is None:
+            # out of range: let the full level MeterSequence raise the exception
+            msLevel = self.accentSequence.getLevel(level)
+            if forcePositionMatch:
+                msLevel.offsetToSpan(qLenPos, permitMeterModulus=permitMeterModulus)
+            return msLevel[msLevel.offsetToIndex(qLenPos)].weight
+
+        index, spanStart, unused_spanEnd = indexAndSpan
         if forcePositionMatch:
             # only return values for qLen positions that are at the start
             # of a span; for those that are not, we need to return a minWeight
-            localSpan = msLevel.offsetToSpan(qLenPos,
-                                             permitMeterModulus=permitMeterModulus)
-
-            if qLenPos != localSpan[0]:
+            if qLenPos != spanStart:
                 return minWeight
-        return msLevel[msLevel.offsetToIndex(qLenPos)].weight
+        return self.accentSequence.getLevelList(level)[index].weight
 
     def getBeat(self, offset):
         '''
@@ -15,10 +15,12 @@ This module defines two component objects for defining nested metrical structure
 '''
 from __future__ import annotations
 
+import bisect
 import copy
 
 from music21 import prebase
 from music21.common.numberTools import opFrac
+from music21.common.types import OffsetQL
 from music21.common.objects import SlottedObjectMixin
 from music21 import common
 from music21 import duration
@@ -28,6 +30,10 @@ from music21.meter import tools
 
 environLocal = environment.Environment('meter.core')
 
+# keys of MeterSequence._levelListCache entries holding (immutable) spans,
+# which copies of the MeterSequence can share.
+_SPAN_CACHE_KEYS = ('levelSpan', 'levelEnds', 'partitionSpans', 'partitionEnds')
+
 # -----------------------------------------------------------------------------
 
 class MeterTerminal(prebase.ProtoM21Object, SlottedObjectMixin):
@@ -72,7 +78,7 @@ class MeterTerminal(prebase.ProtoM21Object, SlottedObjectMixin):
             self._numerator = values.numerator
             self._denominator = values.denominator
 
-        self._ratioChanged()  # sets self._duration
+        self._ratioChanged()  # clears self._duration
 
         # this will set the underlying weight attribute directly for data checking
         # explicitly calling base class method to avoid problems
@@ -316,27 +322,32 @@ class MeterTerminal(prebase.ProtoM21Object, SlottedObjectMixin):
 
     def _ratioChanged(self):
         '''
-        If ratio has been changed, call this to update duration
+        If ratio has been changed, call this to update duration.
+
+        The Duration itself is only created when it is first asked for,
+        so that copying meters (which is done for every TimeSignature)
+        does not need to build Durations that are never read.
         '''
         # NOTE: this is a performance critical method and should only be
         # called when necessary
+        self._duration = None
+
+    def _makeDuration(self) -> duration.Duration | None:
         if self.numerator is None or self.denominator is None:
-            self._duration = None
-        else:
-            self._duration = duration.Duration()
-            try:
-                self._duration.quarterLength = (
-                    (4.0 * self.numerator) / self.denominator
-                )
-            except duration.DurationException:
-                environLocal.printDebug(
-                    ['DurationException encountered',
-                     'numerator/denominator',
-                     self.numerator,
-                     self.denominator
-                     ]
-                )
-                self._duration = None
+            return None
+        d = duration.Duration()
+        try:
+            d.quarterLength = (4.0 * self.numerator) / self.denominator
+        except duration.DurationException:
+            environLocal.printDebug(
+                ['DurationException encountered',
+                 'numerator/denominator',
+                 self.numerator,
+                 self.denominator
+                 ]
+            )
+            return None
+        return d
 
     def _getDuration(self):
         '''
@@ -357,8 +368,9 @@ class MeterTerminal(prebase.ProtoM21Object, SlottedObjectMixin):
 
         if self._overriddenDuration:
             return self._overriddenDuration
-        else:
-            return self._duration
+        if self._duration is None:
+            self._duration = self._makeDuration()
+        return self._duration
 
     def _setDuration(self, value):
         self._overriddenDuration = value
@@ -425,8 +437,8 @@ class MeterSequence(MeterTerminal):
         Defining a custom __deepcopy__ here is a performance boost,
         particularly in not copying _duration and other benefits.
 
-        Notably, self._levelListCache is not copied,
-        which may not be needed in the copy and may be large.
+        Notably, self._levelListCache is not copied (except for the tables of
+        spans, which are shared), since it may not be needed in the copy and may be large.
 
 
         >>> from copy import deepcopy
@@ -448,6 +460,9 @@ class MeterSequence(MeterTerminal):
         new._overriddenDuration = self._overriddenDuration
         new.summedNumerator = self.summedNumerator
         new.parenthesis = self.parenthesis
+        # the span tables are small and immutable, so the copy can share them.
+        new._levelListCache = {k: v for k, v in self._levelListCache.items()
+                               if k[0] in _SPAN_CACHE_KEYS}
 
         return new
 
@@ -1502,6 +1517,12 @@ class MeterSequence(MeterTerminal):
         >>> b.getLevelSpan(2)
         [(0.0, 1.0), (1.0, 1.5), (1.5, 2.0), (2.0, 3.0), (3.0, 3.25), (3.25, 3.5), (3.5, 4.0)]
         '''
+        cacheKey = ('levelSpan', level)
+        try:
+            return list(self._levelListCache[cacheKey])
+        except KeyError:
+            pass
+
         ms = self.getLevelList(level, flat=True)
         mapping = []
         pos = 0.0
@@ -1511,8 +1532,75 @@ class MeterSequence(MeterTerminal):
             end = opFrac(pos + ms[i].duration.quarterLength)
             mapping.append((start, end))
             pos = end
+        self._levelListCache[cacheKey] = tuple(mapping)
+        self._levelListCache[('levelEnds', level)] = tuple(end for unused, end in mapping)
         return mapping
 
+    def _offsetToLevelSpan(
+        self,
+        qLenPos: OffsetQL,
+        level: int = 0
+    ) -> tuple[int, OffsetQL, OffsetQL] | None:
+        '''
+        Return the index, start, and end of the partition at `level` (as in
+        `getLevelSpan`) that contains `qLenPos`, or None if qLenPos is not
+        within this MeterSequence.  This gives the same results as
+        `.getLevel(level).offsetToSpan(qLenPos)` without making a new MeterSequence.
+
+        >>> ms = meter.MeterSequence('4/4', 4)
+        >>> ms[1] = ms[1].subdivide(2)
+        >>> ms._offsetToLevelSpan(1.5, 1)
+        (2, 1.5, 2.0)
+        >>> ms._offsetToLevelSpan(1.5, 0)
+        (1, 1.0, 2.0)
+        >>> ms._offsetToLevelSpan(4.0) is None
+        True
+        '''
+        try:
+            ends = self._levelListCache[('levelEnds', level)]
+        except KeyError:
+            self.getLevelSpan(level)
+            ends = self._levelListCache[('levelEnds', level)]
+        if qLenPos < 0 or not ends or qLenPos >= ends[-1]:
+            return None
+        i = bisect.bisect_right(ends, qLenPos)
+        start, end = self._levelListCache[('levelSpan', level)][i]
+        return i, start, end
+
+    def _partitionSpans(self) -> tuple[tuple[OffsetQL, OffsetQL], ...]:
+        '''
+        Return the (start, end) of each top-level partition, as used by
+        `offsetToIndex` and `offsetToSpan`.  Cached until the partition changes.
+
+        >>> ms = meter.MeterSequence('3/4', 3)
+        >>> ms._partitionSpans()
+        ((0, 1.0), (1.0, 2.0), (2.0, 3.0))
+        '''
+        try:
+            return self._levelListCache[('partitionSpans',)]
+        except KeyError:
+            pass
+        spans = []
+        pos: OffsetQL = 0
+        for mt in self._partition:
+            end = opFrac(pos + mt.duration.quarterLength)
+            spans.append((pos, end))
+            pos = end
+        spansTuple = tuple(spans)
+        self._levelListCache[('partitionSpans',)] = spansTuple
+        self._levelListCache[('partitionEnds',)] = tuple(end for unused, end in spans)
+        return spansTuple
+
+    def _partitionEnds(self) -> tuple[OffsetQL, ...]:
+        '''
+        Return the end of each top-level partition.  Cached with `_partitionSpans`.
+        '''
+        try:
+            return self._levelListCache[('partitionEnds',)]
+        except KeyError:
+            self._partitionSpans()
+            return self._levelListCache[('partitionEnds',)]
+
     def getLevelWeight(self, level=0):
         '''
         The weightList is an array of weights found in the components.
@@ -1627,24 +1715,20 @@ class MeterSequence(MeterTerminal):
                 + f'where total duration is {self.duration.quarterLength}'
             )
 
-        qPos = 0
-        match = -1  # no match -- will not happen.
-        for i in range(len(self)):
-            start = qPos
-            end = opFrac(qPos + self[i].duration.quarterLength)
-            # if adjoining ends are permitted, first match is found
-            if includeCoincidentBoundaries:
-                if start <= qLenPos <= end:
-                    match = i
-                    break
-            else:
-                # note that this is <=, meaning that the first boundary
-                # is coincident.
-                if start <= qLenPos < end:
-                    match = i
-                    break
-            qPos = opFrac(qPos + self[i].duration.quarterLength)
-        return match
+        if not includeCoincidentBoundaries:
+            # note that the start boundary is coincident, so this is
+            # the first partition whose end is after qLenPos.
+            ends = self._partitionEnds()
+            match = bisect.bisect_right(ends, qLenPos)
+            if match == len(ends):
+                return -1  # no match -- will not happen.
+            return match
+
+        # if adjoining ends are permitted, first match is found
+        for i, (start, end) in enumerate(self._partitionSpans()):
+            if start <= qLenPos <= end:
+                return i
+        return -1
 
     def offsetToAddress(self, qLenPos, includeCoincidentBoundaries=False):
         '''
@@ -1746,18 +1830,9 @@ class MeterSequence(MeterTerminal):
             # environLocal.printDebug(['offsetToSpan', 'got qLenPos old', qLenPos])
 
         iMatch = self.offsetToIndex(qLenPos)
-        pos = 0
-        start = None
-        end = None
-        for i in range(len(self)):
-            # print(i, iMatch, self[i])
-            if i == iMatch:
-                start = pos
-                end = opFrac(pos + self[i].duration.quarterLength)
-            else:
-                pos = opFrac(pos + self[i].duration.quarterLength)
-        # environLocal.printDebug(['start, end', start, end])
-        return start, end
+        if iMatch == -1:
+            return None, None
+        return self._partitionSpans()[iMatch]
 
     def offsetToWeight(self, qLenPos):
         '''
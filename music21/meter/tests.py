@@ -660,6 +660,43 @@ class Test(unittest.TestCase):
         self.assertNotEqual(note.Note(), TimeSignature())
         # NB: not self.assertRaises(AttributeError). Do we want that instead?
 
+    def testTimeSignatureArchetypesAreIndependent(self):
+        '''
+        TimeSignatures made from the cached archetype of a value
+        must not share MeterSequences with each other.
+        '''
+        ts1 = TimeSignature('4/4')
+        ts1.beamSequence.partition(['3/8', '5/8'])
+        ts1.accentSequence[0].weight = 0.25
+        ts2 = TimeSignature('4/4')
+        self.assertEqual(str(ts2.beamSequence), '{{1/8+1/8}+{1/8+1/8}+{1/8+1/8}+{1/8+1/8}}')
+        self.assertEqual(ts2.accentSequence[0].weight, 1.0)
+        self.assertIsNot(ts1.displaySequence, ts2.displaySequence)
+
+        # a different partition request is not taken from the cache
+        ts3 = TimeSignature('4/4')
+        ts3.load('4/4', divisions=2)
+        self.assertEqual(str(ts3.beamSequence), '{1/2+1/2}')
+
+    def testCachedSpansSameAsLevels(self):
+        '''
+        The cached spans used by getBeams and getAccentWeight must
+        agree with the spans of each level's MeterSequence,
+        including after the sequence is repartitioned.
+        '''
+        for ratio in ('4/4', '6/8', '7/8', '2+3/8', '9/16'):
+            ts = TimeSignature(ratio)
+            for ms in (ts.beamSequence, ts.accentSequence):
+                for unused in range(2):
+                    for level in range(ms.depth):
+                        levelMs = ms.getLevel(level)
+                        for i in range(int(ms.duration.quarterLength * 12)):
+                            qLenPos = common.opFrac(i / 12)
+                            index, start, end = ms._offsetToLevelSpan(qLenPos, level)
+                            self.assertEqual(index, levelMs.offsetToIndex(qLenPos))
+                            self.assertEqual((start, end), levelMs.offsetToSpan(qLenPos))
+                    ms.partition(1)
+
 
 if __name__ == '__main__':
     import music21
@@ -36,6 +36,7 @@ from music21 import meter
 from music21 import note
 from music21 import percussion
 from music21 import pitch
+from music21 import repeat
 from music21 import stream
 from music21 import tempo
 
@@ -45,6 +46,7 @@ from music21.midi.percussion import MIDIPercussionException, PercussionMapper
 if t.TYPE_CHECKING:
     from music21 import base
     from music21 import midi
+    from music21.common.types import OffsetQL
 
 
 environLocal = environment.Environment('midi.translate')
@@ -306,7 +308,9 @@ def _constructOrUpdateNotRestSubclass(
         raise TypeError(f'Expected subclass of note.NotRest; got {returnClass}')
 
     nr: note.NotRest
-    if (tOff - tOn) != 0:
+    if (tOff - tOn) != 0 and note.INTERN_VALUES:
+        nr = returnClass(duration=duration.internDuration((tOff - tOn) / ticksPerQuarter))
+    elif (tOff - tOn) != 0:
         nr = returnClass(duration=ticksToDuration(tOff - tOn,
                                                      ticksPerQuarter=ticksPerQuarter))
     else:
@@ -407,7 +411,10 @@ def midiEventsToNote(
     )
 
     if isinstance(nr, note.Note):
-        nr.pitch.midi = eOn.pitch
+        if note.INTERN_VALUES:
+            nr.pitch = pitch.internPitch(midi=eOn.pitch)
+        else:
+            nr.pitch.midi = eOn.pitch
     elif isinstance(nr, note.Unpitched):
         try:
             i = PERCUSSION_MAPPER.midiPitchToInstrument(eOn.pitch)
@@ -623,8 +630,11 @@ def midiEventsToChord(
         if eOn.channel == 10:
             any_channel_10 = True
         tOff, unused_eOff = offPair
-        p = pitch.Pitch()
-        p.midi = eOn.pitch
+        if note.INTERN_VALUES:
+            p = pitch.internPitch(midi=eOn.pitch)
+        else:
+            p = pitch.Pitch()
+            p.midi = eOn.pitch
         pitches.append(p)
         v = volume.Volume(velocity=eOn.velocity)
         v.velocityIsRelative = False  # velocity is absolute coming from
@@ -1326,6 +1336,8 @@ def streamToPackets(
     s: stream.Stream,
     trackId: int = 1,
     addStartDelay: bool = False,
+    *,
+    expander: repeat.Expander | None = None,
 ) -> list[dict[str, t.Any]]:
     '''
     Convert a (flattened, sorted) Stream to packets.
@@ -1337,6 +1349,11 @@ def streamToPackets(
     In converting from a Stream to MIDI, this is called first,
     resulting in a collection of packets by offset.
     Then, packets to events is called.
+
+    If an :class:`~music21.repeat.Expander` is given, the elements of `s` are
+    read in the performed order of its repeats, without copying anything.
+
+    * New in v9.3: expander
     '''
     from music21 import midi as midiModule
     # store all events by offset without delta times
@@ -1344,10 +1361,16 @@ def streamToPackets(
     packetsByOffset = []
     lastInstrument = None
 
+    performed: t.Iterable[tuple[base.Music21Object, OffsetQL]]
+    if expander is None:
+        performed = ((el, s.elementOffset(el)) for el in s)
+    else:
+        performed = ((el, o) for el, o, unused_pass in expander.playbackElements(s))
+
     # s should already be flat and sorted
-    for el in s:
+    for el, elOffset in performed:
         midiEventList = elementToMidiEventList(el)
-        if 'Instrument' in el.classes:
+        if isinstance(el, instrument.Instrument):
             lastInstrument = el  # store last instrument
 
         if midiEventList is None:
@@ -1368,9 +1391,9 @@ def streamToPackets(
                 firstNotePlayed = True
 
             if firstNotePlayed is False:
-                o = offsetToMidiTicks(s.elementOffset(el), addStartDelay=False)
+                o = offsetToMidiTicks(elOffset, addStartDelay=False)
             else:
-                o = offsetToMidiTicks(s.elementOffset(el), addStartDelay=addStartDelay)
+                o = offsetToMidiTicks(elOffset, addStartDelay=addStartDelay)
 
             if midiEvent.type != midiModule.ChannelVoiceMessages.NOTE_OFF:
                 # use offset
@@ -2112,12 +2135,13 @@ def midiTrackToStream(
     return s
 
 
-def prepareStreamForMidi(s) -> stream.Stream:
+def prepareStreamForMidi(s, *, expandRepeats: bool = True) -> stream.Stream:
     # noinspection PyShadowingNames
     '''
     Given a score, prepare it for MIDI processing, and return a new Stream:
 
-    1. Expand repeats.
+    1. Expand repeats (unless `expandRepeats` is False, in which case
+       the repeats are left to be read lazily; see :func:`streamToPackets`).
 
     2. Make changes that will let us later create a conductor (tempo) track
     by placing `MetronomeMark`, `TimeSignature`, and `KeySignature`
@@ -2142,10 +2166,12 @@ def prepareStreamForMidi(s) -> stream.Stream:
     {0.0} <music21.stream.Part 0x10b043c10>
         {0.0} <music21.stream.Measure 1 offset=0.0>
             {0.0} <music21.note.Note C>
+
+    * Changed in v9.3: added expandRepeats
     '''
     from music21 import volume
 
-    if s[stream.Measure]:
+    if expandRepeats and s[stream.Measure]:
         s = s.expandRepeats()  # makes a deep copy
     else:
         s = s.coreCopyAsDerivation('prepareStreamForMidi')
@@ -2368,6 +2394,7 @@ def packetStorageFromSubstreamList(
     substreamList: list[stream.Part],
     *,
     addStartDelay=False,
+    lazyRepeats=False,
 ) -> dict[int, dict[str, t.Any]]:
     # noinspection PyShadowingNames
     r'''
@@ -2435,9 +2462,24 @@ def packetStorageFromSubstreamList(
                          'obj': <music21.note.Note C>,
                          'offset': 40320,
                          'trackId': 1}]}}
+
+    If `lazyRepeats` is True, each substream with measures is read in the performed
+    order of its repeats (see :meth:`~music21.repeat.Expander.playbackElements`);
+    substreams without measures, such as the conductor track, follow the
+    repeats of the first substream that has them.
+
+    * Changed in v9.3: added lazyRepeats
     '''
     packetStorage = {}
 
+    expanders: list[repeat.Expander | None] = [None] * len(substreamList)
+    if lazyRepeats:
+        for i, subs in enumerate(substreamList):
+            if subs.getElementsByClass(stream.Measure):
+                expanders[i] = repeat.Expander(subs)
+        firstExpander = next((ex for ex in expanders if ex is not None), None)
+        expanders = [ex if ex is not None else firstExpander for ex in expanders]
+
     for trackId, subs in enumerate(substreamList):  # Conductor track is track 0
         subs = subs.flatten()
 
@@ -2463,7 +2505,10 @@ def packetStorageFromSubstreamList(
             # maybe prepareStreamForMidi() wasn't run; create Conductor instance
             instObj = Conductor()
 
-        trackPackets = streamToPackets(subs, trackId=trackId, addStartDelay=addStartDelay)
+        trackPackets = streamToPackets(subs,
+                                       trackId=trackId,
+                                       addStartDelay=addStartDelay,
+                                       expander=expanders[trackId])
         # store packets in dictionary; keys are trackIds
         packetStorage[trackId] = {
             'rawPackets': trackPackets,
@@ -2507,6 +2552,7 @@ def streamHierarchyToMidiTracks(
     *,
     acceptableChannelList=None,
     addStartDelay=False,
+    lazyRepeats=False,
 ):
     '''
     Given a Stream, Score, Part, etc., that may have substreams (i.e.,
@@ -2530,11 +2576,18 @@ def streamHierarchyToMidiTracks(
 
     2. we make a list of all instruments that are being used in the piece.
 
+    If `lazyRepeats` is True, repeats are not expanded into copies of their measures;
+    instead the measures are read again for each pass (see
+    :func:`packetStorageFromSubstreamList`).  This saves memory on long repeated forms.
+    Dynamics are realized in written order, so a dynamic at the end of a repeated
+    section does not carry over into the start of the next pass.
+
     * Changed in v6: acceptableChannelList is keyword only.  addStartDelay is new.
     * Changed in v6.5: Track 0 (tempo/conductor track) always exported.
+    * Changed in v9.3: added lazyRepeats
     '''
     # makes a deepcopy
-    s = prepareStreamForMidi(inputM21)
+    s = prepareStreamForMidi(inputM21, expandRepeats=not lazyRepeats)
     channelByInstrument, channelsDynamic = channelInstrumentData(s, acceptableChannelList)
 
     # return a list of MidiTrack objects
@@ -2557,7 +2610,9 @@ def streamHierarchyToMidiTracks(
     for subs in substreamList:
         subs.stripTies(inPlace=True, matchByPitch=True)
 
-    packetStorage = packetStorageFromSubstreamList(substreamList, addStartDelay=addStartDelay)
+    packetStorage = packetStorageFromSubstreamList(substreamList,
+                                                   addStartDelay=addStartDelay,
+                                                   lazyRepeats=lazyRepeats)
     updatePacketStorageWithChannelInfo(packetStorage, channelByInstrument)
 
     initTrackIdToChannelMap = {}
@@ -2642,6 +2697,7 @@ def streamToMidiFile(
     *,
     addStartDelay: bool = False,
     acceptableChannelList: list[int] | None = None,
+    lazyRepeats: bool = False,
 ) -> midi.MidiFile:
     # noinspection PyShadowingNames
     '''
@@ -2667,7 +2723,10 @@ def streamToMidiFile(
     >>> #_DOCS_SHOW mf.write()
     >>> #_DOCS_SHOW mf.close()
 
-    See :func:`channelInstrumentData` for documentation on `acceptableChannelList`.
+    See :func:`channelInstrumentData` for documentation on `acceptableChannelList`
+    and :func:`streamHierarchyToMidiTracks` for `lazyRepeats`.
+
+    * Changed in v9.3: added lazyRepeats
     '''
     from music21 import midi as midiModule
 
@@ -2675,6 +2734,7 @@ def streamToMidiFile(
     midiTracks = streamHierarchyToMidiTracks(s,
                                              addStartDelay=addStartDelay,
                                              acceptableChannelList=acceptableChannelList,
+                                             lazyRepeats=lazyRepeats,
                                              )
 
     # may need to update channel information
@@ -4137,6 +4197,29 @@ class Test(unittest.TestCase):
         self.assertEqual(len(note_ons), 3)
         self.assertEqual([ev.pitch for ev in note_ons], [67, 60, 60])
 
+    def testLazyRepeats(self):
+        from music21 import bar
+        from music21 import converter
+        from music21 import corpus
+        from music21 import midi as midiModule
+
+        s = corpus.parse('ryansMammoth/BanjoReel')
+        eager = streamHierarchyToMidiTracks(copy.deepcopy(s))
+        lazy = streamHierarchyToMidiTracks(s, lazyRepeats=True)
+        self.assertEqual(len(eager), len(lazy))
+        # the conductor tracks differ only in how often the key is restated
+        self.assertEqual(eager[1].getBytes(), lazy[1].getBytes())
+
+        # a tempo change inside a repeat is sounded on each pass
+        p = converter.parse('tinyNotation: 2/4 c2 d2 e2')
+        p.measure(2).insert(0, tempo.MetronomeMark(number=60))
+        p.measure(2).rightBarline = bar.Repeat(direction='end')
+        for lazyRepeats in (False, True):
+            tracks = streamHierarchyToMidiTracks(p, lazyRepeats=lazyRepeats)
+            tempoEvents = [ev for ev in tracks[0].events
+                           if ev.type == midiModule.MetaEvents.SET_TEMPO]
+            self.assertEqual(len(tempoEvents), 2)
+
 
 # ------------------------------------------------------------------------------
 _DOC_ORDER = [streamToMidiFile, midiFileToStream]
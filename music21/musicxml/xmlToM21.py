@@ -2770,7 +2770,7 @@ class MeasureParser(SoundTagMixin, XMLParserBase):
             self.updateLyricsFromList(n, mxNote.findall('lyric'))
             self.addToStaffReference(mxNote, n)
             self.insertInMeasureOrVoice(mxNote, n)
-            offsetIncrement = n.duration.quarterLength
+            offsetIncrement = n.quarterLength
             self.nLast = n  # update
 
         # if we have notes in the note list and the next
@@ -2940,8 +2940,10 @@ class MeasureParser(SoundTagMixin, XMLParserBase):
         mxUnpitched = mxNote.find('unpitched')
         if mxUnpitched is None:
             # send whole note since accidental display not in <pitch>
-            n = note.Note(duration=d)
-            self.xmlToPitch(mxNote, n.pitch)
+            p = self.xmlToPitch(mxNote, pitch.Pitch())
+            if note.INTERN_VALUES and p.accidental is None:
+                p = pitch.internPitch(p.nameWithOctave)
+            n = note.Note(p, duration=d)
         else:
             n = note.Unpitched(duration=d)
             self.xmlToUnpitched(mxUnpitched, n)
@@ -3615,6 +3617,12 @@ class MeasureParser(SoundTagMixin, XMLParserBase):
             forceRaw = True
             # TODO: empty-placement
 
+        if (d is None and not forceRaw and not tuplets and note.INTERN_VALUES
+                and duration.durationTupleFromTypeDots(durationType, numDots).quarterLength
+                == qLen):
+            # raw == cooked, so a shared duration will do
+            return duration.internDuration(qLen)
+
         # two ways to create durations, raw (from qLen) and cooked (from type, time-mod, dots)
         if d is not None:
             # N.B. music21's parser executes this branch just for grace note corrections
@@ -17,6 +17,7 @@ and used to configure, :class:`~music21.note.Note` objects.
 '''
 from __future__ import annotations
 
+import contextlib
 import copy
 import typing as t
 from typing import overload  # PyCharm bug
@@ -25,12 +26,12 @@ import unittest
 from music21 import base
 from music21 import beam
 from music21 import common
-from music21.duration import Duration
+from music21.duration import Duration, FrozenDuration, internDuration
 from music21 import environment
 from music21 import exceptions21
 from music21 import expressions
 from music21 import interval
-from music21.pitch import Pitch
+from music21.pitch import FrozenPitch, Pitch, internPitch
 from music21 import prebase
 from music21 import style
 from music21 import tie
@@ -40,7 +41,9 @@ if t.TYPE_CHECKING:
     from collections.abc import Iterable, Sequence
     from music21.common.types import StepName, OffsetQLIn
     from music21 import articulations
+    from music21.articulations import Articulation
     from music21 import chord
+    from music21.expressions import Expression
     from music21 import instrument
     from music21 import percussion
     _NotRestType = t.TypeVar('_NotRestType', bound='NotRest')
@@ -94,11 +97,16 @@ def __dir__():
     out.remove('unittest')
     out.remove('overload')
     out.remove('environLocal')
+    out.remove('contextlib')
     out.remove('copy')
     out.remove('_DOC_ORDER')
 
     out.remove('Duration')
+    out.remove('FrozenDuration')
+    out.remove('internDuration')
     out.remove('Pitch')
+    out.remove('FrozenPitch')
+    out.remove('internPitch')
     out.remove('base')
     out.remove('beam')
     out.remove('common')
@@ -128,6 +136,80 @@ class NotRestException(exceptions21.Music21Exception):
 
 
 # ------------------------------------------------------------------------------
+# When True, notes, rests, and chords share interned, immutable pitches and
+# durations instead of creating their own; see internedValues()
+INTERN_VALUES = False
+
+# keywords that Note passes to Pitch; notes given any of these get their own Pitch
+_PITCH_KEYWORDS = frozenset(['step', 'octave', 'accidental', 'microtone',
+                             'pitchClass', 'midi', 'ps', 'fundamental'])
+
+
+@contextlib.contextmanager
+def internedValues(active: bool = True) -> t.Generator[None, None, None]:
+    '''
+    Within this context, Notes, Rests, and Chords created from pitch names or
+    numbers and from duration types or quarterLengths share interned
+    :class:`~music21.pitch.FrozenPitch` and :class:`~music21.duration.FrozenDuration`
+    objects (see :func:`~music21.pitch.internPitch` and
+    :func:`~music21.duration.internDuration`) instead of each making and
+    storing their own.  This saves time and memory when creating many notes,
+    such as when parsing large MIDI or MusicXML files.
+
+    >>> with note.internedValues():
+    ...     n1 = note.Note('C#4', type='eighth')
+    ...     n2 = note.Note('C#4', type='eighth')
+    >>> n1._pitch is n2._pitch
+    True
+    >>> n1._duration is n2._duration
+    True
+
+    A note makes its own copy of its pitch or duration the first time that
+    `.pitch` or `.duration` is accessed, so it can be changed without
+    changing any other note:
+
+    >>> n1.pitch.octave = 5
+    >>> n1.duration.dots = 1
+    >>> n1.nameWithOctave, n1.quarterLength
+    ('C#5', 0.75)
+    >>> n2.nameWithOctave, n2.quarterLength
+    ('C#4', 0.5)
+
+    To keep sharing on outside of a `with` block, set `note.INTERN_VALUES` to True.
+
+    * New in v9.3.
+    '''
+    global INTERN_VALUES
+    previous = INTERN_VALUES
+    INTERN_VALUES = active
+    try:
+        yield
+    finally:
+        INTERN_VALUES = previous
+
+
+def _internedDurationFromKeywords(keywords: dict[str, t.Any]) -> FrozenDuration | None:
+    '''
+    Return the interned duration for the `type` and `dots` or the `quarterLength`
+    in keywords, or None if these keywords need a Duration of their own.
+
+    >>> note._internedDurationFromKeywords({'type': 'half', 'dots': 1})
+    <music21.duration.FrozenDuration 3.0>
+    >>> note._internedDurationFromKeywords({'quarterLength': 0.5})
+    <music21.duration.FrozenDuration 0.5>
+    >>> note._internedDurationFromKeywords({'quarterLength': 0}) is None
+    True
+    '''
+    if 'components' in keywords or 'durationTuple' in keywords:
+        return None
+    if 'type' in keywords:
+        return internDuration(keywords['type'], keywords.get('dots', 0))
+    quarterLength = keywords['quarterLength']
+    if not quarterLength:  # zero-length notes get a default duration
+        return None
+    return internDuration(quarterLength)
+
+
 SyllabicChoices = t.Literal[None, 'begin', 'single', 'end', 'middle', 'composite']
 
 SYLLABIC_CHOICES: list[SyllabicChoices] = [
@@ -592,12 +674,6 @@ class GeneralNote(base.Music21Object):
     # documentation for all attributes (not properties or methods)
     _DOC_ATTR: dict[str, str] = {
         'isChord': 'Boolean read-only value describing if this object is a Chord.',
-        'lyrics': 'A list of :class:`~music21.note.Lyric` objects.',
-        'expressions': '''a list of expressions (such
-            as :class:`~music21.expressions.Fermata`, etc.)
-            that are stored on this Note.''',
-        'articulations': '''a list of articulations such
-            as :class:`~music21.articulations.Staccato`, etc.) that are stored on this Note.'''
     }
 
     def __init__(self,
@@ -606,30 +682,34 @@ class GeneralNote(base.Music21Object):
                  lyric: None | str | Lyric = None,
                  **keywords
                  ):
+        tempDuration: Duration | None
         if duration is None:
             # ensure music21base not automatically create a zero duration before we can.
             if not keywords or ('type' not in keywords and 'quarterLength' not in keywords):
-                tempDuration = Duration(1.0)
+                tempDuration = internDuration(1.0) if INTERN_VALUES else Duration(1.0)
             else:
-                tempDuration = Duration(**keywords)
+                tempDuration = _internedDurationFromKeywords(keywords) if INTERN_VALUES else None
+                if tempDuration is None:
+                    tempDuration = Duration(**keywords)
+                    # only apply default if components are empty
+                    # looking at currentComponents so as not to trigger
+                    # _updateComponents
+                    if (tempDuration.quarterLength == 0
+                            and not tempDuration.currentComponents()):
+                        tempDuration.quarterLength = 1.0
                 if 'quarterLength' in keywords:
                     del keywords['quarterLength']
                 if 'type' in keywords:
                     del keywords['type']
-                # only apply default if components are empty
-                # looking at currentComponents so as not to trigger
-                # _updateComponents
-                if (tempDuration.quarterLength == 0
-                        and not tempDuration.currentComponents()):
-                    tempDuration.quarterLength = 1.0
         else:
             tempDuration = duration
         # this sets the stored duration defined in Music21Object
         super().__init__(duration=tempDuration, **keywords)
 
-        self.lyrics: list[Lyric] = []  # a list of lyric objects
-        self.expressions: list[expressions.Expression] = []
-        self.articulations: list[articulations.Articulation] = []
+        # lists created on first use by the properties
+        self._lyrics: list[Lyric] | None = None
+        self._expressions: list[expressions.Expression] | None = None
+        self._articulations: list[articulations.Articulation] | None = None
 
         if lyric is not None:
             self.addLyric(lyric)
@@ -660,6 +740,13 @@ class GeneralNote(base.Music21Object):
     def __hash__(self):
         return super().__hash__()
 
+    def __setstate__(self, state: dict[str, t.Any]):
+        # objects pickled before v9.3 stored these lists directly.
+        for attr in ('lyrics', 'expressions', 'articulations'):
+            if attr in state:
+                state['_' + attr] = state.pop(attr)
+        super().__setstate__(state)
+
     # --------------------------------------------------------------------------
     @property
     def tie(self) -> tie.Tie | None:
@@ -677,6 +764,62 @@ class GeneralNote(base.Music21Object):
     def tie(self, value: tie.Tie | None):
         self._tie = value
 
+    @property
+    def lyrics(self) -> list[Lyric]:
+        '''
+        A list of :class:`~music21.note.Lyric` objects.
+
+        >>> n = note.Note()
+        >>> n.lyrics
+        []
+        >>> n.lyrics.append(note.Lyric('la'))
+        >>> n.lyrics
+        [<music21.note.Lyric number=1 syllabic=single text='la'>]
+
+        * Changed in v9.3: the list is created on first use.
+        '''
+        if self._lyrics is None:
+            self._lyrics = []
+        return self._lyrics
+
+    @lyrics.setter
+    def lyrics(self, value: list[Lyric]):
+        self._lyrics = value
+
+    @property
+    def expressions(self) -> list[Expression]:
+        '''
+        A list of expressions (such
+        as :class:`~music21.expressions.Fermata`, etc.)
+        that are stored on this Note.
+
+        * Changed in v9.3: the list is created on first use.
+        '''
+        if self._expressions is None:
+            self._expressions = []
+        return self._expressions
+
+    @expressions.setter
+    def expressions(self, value: list[Expression]):
+        self._expressions = value
+
+    @property
+    def articulations(self) -> list[Articulation]:
+        '''
+        A list of articulations (such
+        as :class:`~music21.articulations.Staccato`, etc.)
+        that are stored on this Note.
+
+        * Changed in v9.3: the list is created on first use.
+        '''
+        if self._articulations is None:
+            self._articulations = []
+        return self._articulations
+
+    @articulations.setter
+    def articulations(self, value: list[Articulation]):
+        self._articulations = value
+
     def _getLyric(self) -> str | None:
         if not self.lyrics:
             return None
@@ -1000,12 +1143,6 @@ class NotRest(GeneralNote):
     # unspecified means that there may be a stem, but its orientation
     # has not been declared.
 
-    _DOC_ATTR: dict[str, str] = {
-        'beams': '''
-            A :class:`~music21.beam.Beams` object that contains
-            information about the beaming of this note.''',
-    }
-
     # Should volume be here too?  and _chordAttached?
     equalityAttributes: tuple[str, ...] = (
         'notehead', 'noteheadFill', 'noteheadParenthesis', 'beams'
@@ -1020,10 +1157,8 @@ class NotRest(GeneralNote):
         self._noteheadParenthesis: bool = False
         self._stemDirection: str = 'unspecified'
         self._volume: volume.Volume | None = None  # created on demand
-        if beams is not None:
-            self.beams = beams
-        else:
-            self.beams = beam.Beams()
+        # created on first use by the .beams property
+        self._beams: beam.Beams | None = beams
         self._storedInstrument: instrument.Instrument | None = None
         self._chordAttached: chord.ChordBase | None = None
 
@@ -1063,6 +1198,12 @@ class NotRest(GeneralNote):
         # environLocal.printDebug(['calling NotRest.__deepcopy__', self])
         return self._deepcopySubclassable(memo=memo)
 
+    def __setstate__(self, state: dict[str, t.Any]):
+        # objects pickled before v9.3 stored .beams directly.
+        if 'beams' in state:
+            state['_beams'] = state.pop('beams')
+        super().__setstate__(state)
+
     def _getStemDirection(self) -> str:
         return self._stemDirection
 
@@ -1113,6 +1254,29 @@ class NotRest(GeneralNote):
         'unspecified'
         ''')
 
+    @property
+    def beams(self) -> beam.Beams:
+        '''
+        A :class:`~music21.beam.Beams` object that contains
+        information about the beaming of this note.
+
+        >>> n = note.Note(type='eighth')
+        >>> n.beams
+        <music21.beam.Beams>
+        >>> n.beams.fill('eighth', type='start')
+        >>> n.beams
+        <music21.beam.Beams <music21.beam.Beam 1/start>>
+
+        * Changed in v9.3: created on first use.
+        '''
+        if self._beams is None:
+            self._beams = beam.Beams()
+        return self._beams
+
+    @beams.setter
+    def beams(self, value: beam.Beams):
+        self._beams = value
+
     @property
     def notehead(self) -> str:
         '''
@@ -1521,9 +1685,6 @@ class Note(NotRest):
     _DOC_ATTR: dict[str, str] = {
         'isNote': 'Boolean read-only value describing if this Note is a Note (True).',
         'isRest': 'Boolean read-only value describing if this Note is a Rest (False).',
-        'pitch': '''A :class:`~music21.pitch.Pitch` object containing all the
-                information about the note's pitch.  Many `.pitch` properties and
-                methods are also made `Note` properties also''',
     }
 
     # Accepts an argument for pitch
@@ -1536,20 +1697,25 @@ class Note(NotRest):
         super().__init__(**keywords)
         self._chordAttached: chord.Chord | None
 
-        if pitch is not None:
-            if isinstance(pitch, Pitch):
-                self.pitch = pitch
-            else:  # assume first argument is pitch
-                self.pitch = Pitch(pitch, **keywords)
-        else:  # supply a default pitch
+        if pitch is None:  # supply a default pitch
             if nameWithOctave is not None:
-                name = nameWithOctave
-            elif not name:
-                name = 'C4'
-            self.pitch = Pitch(name, **keywords)
+                pitch = nameWithOctave
+            elif name:
+                pitch = name
+            else:
+                pitch = 'C4'
 
-        # noinspection PyProtectedMember
-        self.pitch._client = self
+        self._pitch: Pitch
+        if isinstance(pitch, Pitch):
+            self._pitch = pitch
+        elif INTERN_VALUES and _PITCH_KEYWORDS.isdisjoint(keywords):
+            self._pitch = internPitch(pitch)
+        else:
+            self._pitch = Pitch(pitch, **keywords)
+
+        if not isinstance(self._pitch, FrozenPitch):
+            # noinspection PyProtectedMember
+            self._pitch._client = self
 
     # --------------------------------------------------------------------------
     # operators, representations, and transformations
@@ -1560,7 +1726,7 @@ class Note(NotRest):
 
     def __lt__(self, other):
         try:
-            return self.pitch < other.pitch
+            return self._pitch < other.pitch
         except AttributeError:
             return NotImplemented
 
@@ -1568,19 +1734,19 @@ class Note(NotRest):
     # the equal part of __le__ and __ge__
     def __gt__(self, other):
         try:
-            return self.pitch > other.pitch
+            return self._pitch > other.pitch
         except AttributeError:
             return NotImplemented
 
     def __le__(self, other):
         try:
-            return self.pitch <= other.pitch
+            return self._pitch <= other.pitch
         except AttributeError:
             return NotImplemented
 
     def __ge__(self, other):
         try:
-            return self.pitch >= other.pitch
+            return self._pitch >= other.pitch
         except AttributeError:
             return NotImplemented
 
@@ -1589,15 +1755,57 @@ class Note(NotRest):
         After doing a deepcopy of the pitch, be sure to set the client
         '''
         new = self._deepcopySubclassable(memo)
-        # noinspection PyProtectedMember
-        new.pitch._client = new
+        # a FrozenPitch is shared, not copied, and has no client.
+        if not isinstance(new._pitch, FrozenPitch):
+            # noinspection PyProtectedMember
+            new._pitch._client = new
         return new
 
+    def __setstate__(self, state: dict[str, t.Any]):
+        # Notes pickled before v9.3 stored .pitch directly.
+        if 'pitch' in state:
+            state['_pitch'] = state.pop('pitch')
+        super().__setstate__(state)
+
     # --------------------------------------------------------------------------
     # property access
 
+    @property
+    def pitch(self) -> Pitch:
+        '''
+        The :class:`~music21.pitch.Pitch` object containing all the
+        information about the note's pitch.  Many `.pitch` properties and
+        methods are also made `Note` properties also.
+
+        >>> n = note.Note('E-5')
+        >>> n.pitch
+        <music21.pitch.Pitch E-5>
+        >>> n.pitch = pitch.Pitch('D4')
+        >>> n.nameWithOctave
+        'D4'
+
+        A :class:`~music21.pitch.FrozenPitch` can be shared among many notes;
+        each note makes its own copy of it the first time `.pitch` is accessed
+        (see :func:`~music21.note.internedValues`):
+
+        >>> n.pitch = pitch.internPitch('F#3')
+        >>> n.pitch
+        <music21.pitch.Pitch F#3>
+
+        * Changed in v9.3: a property.  FrozenPitches are copied on first access.
+        '''
+        p = self._pitch
+        if isinstance(p, FrozenPitch):
+            p = self._pitch = p.unfrozen()
+            p._client = self
+        return p
+
+    @pitch.setter
+    def pitch(self, value: Pitch):
+        self._pitch = value
+
     def _getName(self) -> str:
-        return self.pitch.name
+        return self._pitch.name
 
     def _setName(self, value: str):
         self.pitch.name = value
@@ -1610,7 +1818,7 @@ class Note(NotRest):
         ''')
 
     def _getNameWithOctave(self) -> str:
-        return self.pitch.nameWithOctave
+        return self._pitch.nameWithOctave
 
     def _setNameWithOctave(self, value: str):
         self.pitch.nameWithOctave = value
@@ -1628,14 +1836,14 @@ class Note(NotRest):
         Return or set the pitch step from the :class:`~music21.pitch.Pitch` object.
         See :attr:`~music21.pitch.Pitch.step`.
         '''
-        return self.pitch.step
+        return self._pitch.step
 
     @step.setter
     def step(self, value: StepName):
         self.pitch.step = value
 
     def _getOctave(self) -> int | None:
-        return self.pitch.octave
+        return self._pitch.octave
 
     def _setOctave(self, value: int | None):
         self.pitch.octave = value
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 from collections import OrderedDict
 import copy
+from functools import lru_cache
 import itertools
 import math
 import typing as t
@@ -163,6 +164,36 @@ def _sortModifiers():
 
 accidentalModifiersSorted = _sortModifiers()
 
+accidentalNameToAlter: dict[str, float] = {
+    'natural': 0.0,
+    'sharp': 1.0,
+    'double-sharp': 2.0,
+    'triple-sharp': 3.0,
+    'quadruple-sharp': 4.0,
+    'flat': -1.0,
+    'double-flat': -2.0,
+    'triple-flat': -3.0,
+    'quadruple-flat': -4.0,
+    'half-sharp': 0.5,
+    'one-and-a-half-sharp': 1.5,
+    'half-flat': -0.5,
+    'one-and-a-half-flat': -1.5,
+}
+
+# every accidental name, modifier, and alternate name mapped to its standard name
+_standardAccidentalNames: dict[str, str] = {}
+for _accName, _accModifier in accidentalNameToModifier.items():
+    _standardAccidentalNames[_accName] = _accName
+    _standardAccidentalNames[_accModifier] = _accName
+_standardAccidentalNames.update(alternateNameToAccidentalName)
+
+# everything that Accidental.set() accepts as a standard specifier (a lowercase
+# string other than the empty natural modifier, or an alter) mapped to the standard name
+_accidentalSpecifierToName: dict[str | float, str] = {
+    k: v for k, v in _standardAccidentalNames.items() if k
+}
+_accidentalSpecifierToName.update({v: k for k, v in accidentalNameToAlter.items()})
+
 def isValidAccidentalName(name: str) -> bool:
     '''
     Check if name is a valid accidental name string that can
@@ -188,19 +219,7 @@ def isValidAccidentalName(name: str) -> bool:
     >>> pitch.isValidAccidentalName('two flats')
     False
     '''
-    # check against official names
-    if name in accidentalNameToModifier:
-        return True
-
-    # check against official modifiers
-    if name in accidentalNameToModifier.values():
-        return True
-
-    # check against alternate supported names
-    if name in alternateNameToAccidentalName:
-        return True
-
-    return False
+    return name in _standardAccidentalNames
 
 def standardizeAccidentalName(name: str) -> str:
     '''
@@ -220,20 +239,28 @@ def standardizeAccidentalName(name: str) -> str:
     Traceback (most recent call last):
     music21.pitch.AccidentalException: 'two flats' is not a supported accidental type
     '''
-    if name in accidentalNameToModifier:
-        # it is already standardized, just return it
-        return name
-
-    if name in modifierToAccidentalName:
-        # it is a modifier, look up standardized name
-        return modifierToAccidentalName[name]
-
-    if name in alternateNameToAccidentalName:
-        # it is an alternate name, look up standardized name
-        return alternateNameToAccidentalName[name]
-
-    raise AccidentalException(f"'{name}' is not a supported accidental type")
-
+    try:
+        return _standardAccidentalNames[name]
+    except KeyError:
+        raise AccidentalException(f"'{name}' is not a supported accidental type")
+
+
+# every standard spelled pitch name, with or without an octave from 0 to 9,
+# mapped to its step, accidental modifier (or None), and octave (or None).
+# Pitch.name uses this to avoid parsing common names character by character.
+_spelledPitchNames: dict[str, tuple[StepName, str | None, int | None]] = {}
+for _step in STEPREF:
+    for _accModifier in accidentalNameToModifier.values():
+        for _octave in (None, *range(10)):
+            _spelling = (_step, _accModifier or None, _octave)
+            _octaveStr = str(_octave) if _octave is not None else ''
+            _spelledPitchNames[_step + _accModifier + _octaveStr] = _spelling
+            _spelledPitchNames[_step.lower() + _accModifier + _octaveStr] = _spelling
+
+# frequencies of twelve-tone pitch space values in equal temperament with A4 = 440Hz
+_freq440FromPs: dict[int, float] = {
+    ps: 440.0 * (TWELFTH_ROOT_OF_TWO ** float(ps - 69)) for ps in range(-24, 156)
+}
 
 
 # ------------------------------------------------------------------------------
@@ -466,6 +493,22 @@ def _convertPsToStep(
     return name, acc, microObj, octShift
 
 
+def _schoolYardRounding(x: int | float) -> int:
+    '''
+    This is round "up" at 0.5 (regardless of negative or positive)
+
+    Python 3 now uses rounding mechanisms so that odd numbers round one way, even another.
+    But we needed a consistent direction for all half-sharps/flats to go,
+    and now long after Python 2 is no longer supported, this behavior is grandfathered in.
+
+    >>> pitch._schoolYardRounding(60.5)
+    61
+    >>> pitch._schoolYardRounding(-0.5)
+    0
+    '''
+    return math.floor(x + 0.5)
+
+
 def _convertCentsToAlterAndCents(shift) -> tuple[float, float]:
     '''
     Given any floating point value, split into accidental and microtone components.
@@ -553,6 +596,69 @@ def _convertHarmonicToCents(value: int | float) -> int:
 # -----------------------------------------------------------------------------
 
 
+def _spellingKey(p: Pitch) -> tuple[str, str | None, int | None, float]:
+    '''
+    A hashable key for the step, accidental, octave, and microtone of a Pitch.
+
+    >>> pitch._spellingKey(pitch.Pitch('E-4'))
+    ('E', 'flat', 4, 0.0)
+    >>> pitch._spellingKey(pitch.Pitch('C'))
+    ('C', None, None, 0.0)
+    '''
+    acc = p._accidental
+    micro = p._microtone
+    return (p._step,
+            acc.name if acc is not None else None,
+            p._octave,
+            micro.alter if micro is not None else 0.0)
+
+
+# (ratio penalty, triad award) for pairs of spellings; see _dissonancePairScores
+_dissonancePairCache: dict[tuple, tuple[float, float]] = {}
+
+
+def _dissonancePairScores(p1: Pitch, p2: Pitch) -> tuple[float, float]:
+    '''
+    Return the Pythagorean ratio penalty (infinite if the interval has no
+    Pythagorean ratio) and the triad award (-1.0 for a third or a sixth
+    that can be part of a triad) of the interval from `p1` to `p2`, which
+    _dissonanceScore sums over all pairs of pitches.
+
+    The values depend only on the spellings, so they are cached.
+
+    >>> pitch._dissonancePairScores(pitch.Pitch('C4'), pitch.Pitch('E4'))
+    (0.3154..., -1.0)
+    >>> pitch._dissonancePairScores(pitch.Pitch('C4'), pitch.Pitch('F#4'))
+    (0.4731..., 0.0)
+    '''
+    cacheKey = (_spellingKey(p1), p1.implicitOctave, _spellingKey(p2), p2.implicitOctave)
+    if cacheKey in _dissonancePairCache:
+        return _dissonancePairCache[cacheKey]
+
+    # an IntervalException here is raised to the caller, and not cached.
+    this_interval = interval.Interval(noteStart=p1, noteEnd=p2)
+    try:
+        ratio = interval.intervalToPythagoreanRatio(this_interval)
+        penalty = (math.log(ratio.numerator * ratio.denominator / ratio)
+                   / 26.366694928034633)  # d2 is 1.0
+    except interval.IntervalException:
+        penalty = math.inf
+
+    simple_directed = this_interval.generic.simpleDirected
+    interval_semitones = this_interval.chromatic.semitones % 12
+    if simple_directed == 3 and interval_semitones in (3, 4):
+        triad = -1.0
+    elif simple_directed == 6 and interval_semitones in (8, 9):
+        triad = -1.0
+    else:
+        triad = 0.0
+
+    if len(_dissonancePairCache) > 100_000:
+        _dissonancePairCache.clear()
+    _dissonancePairCache[cacheKey] = (penalty, triad)
+    return penalty, triad
+
+
 def _dissonanceScore(pitches, smallPythagoreanRatio=True, accidentalPenalty=True, triadAward=True):
     r'''
     Calculates the 'dissonance' of a list of pitches based on three criteria:
@@ -578,26 +684,18 @@ def _dissonanceScore(pitches, smallPythagoreanRatio=True, accidentalPenalty=True
         for p1, p2 in itertools.combinations(pitches, 2):
             # does not accept weird intervals, e.g. with semitones
             try:
-                this_interval = interval.Interval(noteStart=p1, noteEnd=p2)
-                ratio = interval.intervalToPythagoreanRatio(this_interval)
-                penalty = (math.log(ratio.numerator * ratio.denominator / ratio)
-                                        / 26.366694928034633)  # d2 is 1.0
-                score_ratio += penalty
+                score_ratio += _dissonancePairScores(p1, p2)[0]
             except interval.IntervalException:
                 return math.inf
+            if score_ratio == math.inf:
+                return math.inf
 
         score_ratio = score_ratio / len(pitches)
 
     if triadAward:
         # score_triad = number of thirds per pitch (avoid double-base-thirds)
         for p1, p2 in itertools.combinations(pitches, 2):
-            this_interval = interval.Interval(noteStart=p1, noteEnd=p2)
-            simple_directed = this_interval.generic.simpleDirected
-            interval_semitones = this_interval.chromatic.semitones % 12
-            if simple_directed == 3 and interval_semitones in (3, 4):
-                score_triad -= 1.0
-            elif simple_directed == 6 and interval_semitones in (8, 9):
-                score_triad -= 1.0
+            score_triad += _dissonancePairScores(p1, p2)[1]
         score_triad /= len(pitches)
 
     return (score_accidentals + score_ratio + score_triad) / int(smallPythagoreanRatio
@@ -623,6 +721,12 @@ def _greedyEnharmonicsSearch(oldPitches, scoreFunc=_dissonanceScore):
     return newPitches
 
 
+# choices made by simplifyMultipleEnharmonics with the default criterion, keyed
+# on the spellings of the pitches (including any key context); each choice is None
+# to keep the pitch, or the step, accidental, octave, and microtone to change it to.
+_simplifiedEnharmonicsCache: dict[tuple, tuple] = {}
+
+
 def simplifyMultipleEnharmonics(pitches, criterion=_dissonanceScore, keyContext=None):
     r'''
     Tries to simplify the enharmonic spelling of a list of pitches, pitch-
@@ -678,6 +782,10 @@ def simplifyMultipleEnharmonics(pitches, criterion=_dissonanceScore, keyContext=
 
     >>> pitch.simplifyMultipleEnharmonics([pitch.Pitch('B5')], keyContext=key.Key('D'))
     [<music21.pitch.Pitch B5>]
+
+    * Changed in v9.3: with the default criterion, the spellings chosen for
+      a list of pitches are remembered, so simplifying the same pitches again
+      does not repeat the search.
     '''
 
     oldPitches = [p if isinstance(p, Pitch) else Pitch(p) for p in pitches]
@@ -688,10 +796,41 @@ def simplifyMultipleEnharmonics(pitches, criterion=_dissonanceScore, keyContext=
     else:
         remove_first = False
 
-    if len(oldPitches) < 5:
-        simplifiedPitches = _bruteForceEnharmonicsSearch(oldPitches, criterion)
+    # the choices made with the default criterion depend only on the spellings,
+    #    so they are remembered for plain pitches
+    cacheKey: tuple | None = None
+    if criterion is _dissonanceScore and all(
+        p.__class__ is Pitch and p.fundamental is None and p._overridden_freq440 is None
+        for p in oldPitches
+    ):
+        cacheKey = tuple(_spellingKey(p) for p in oldPitches)
+
+    if cacheKey is not None and cacheKey in _simplifiedEnharmonicsCache:
+        simplifiedPitches = []
+        for oldP, spelling in zip(oldPitches, _simplifiedEnharmonicsCache[cacheKey]):
+            if spelling is None:
+                simplifiedPitches.append(oldP)
+            else:
+                newP = copy.deepcopy(oldP)
+                newP._step, accidental, newP._octave, microtone = spelling
+                newP._accidental = copy.deepcopy(accidental)
+                newP._microtone = copy.deepcopy(microtone)
+                simplifiedPitches.append(newP)
     else:
-        simplifiedPitches = _greedyEnharmonicsSearch(oldPitches, criterion)
+        if len(oldPitches) < 5:
+            simplifiedPitches = _bruteForceEnharmonicsSearch(oldPitches, criterion)
+        else:
+            simplifiedPitches = _greedyEnharmonicsSearch(oldPitches, criterion)
+        if cacheKey is not None:
+            if len(_simplifiedEnharmonicsCache) > 20_000:
+                _simplifiedEnharmonicsCache.clear()
+            _simplifiedEnharmonicsCache[cacheKey] = tuple(
+                None if newP is oldP else (newP._step,
+                                           copy.deepcopy(newP._accidental),
+                                           newP._octave,
+                                           copy.deepcopy(newP._microtone))
+                for oldP, newP in zip(oldPitches, simplifiedPitches)
+            )
 
     # Preserve value of spellingIsInferred
     for oldP, newP in zip(oldPitches, simplifiedPitches):
@@ -1215,60 +1354,13 @@ class Accidental(prebase.ProtoM21Object, style.StyleMixin):
         '''
         if isinstance(name, str):
             name = name.lower()  # sometimes args get capitalized
-        if name in ('natural', 'n', 0):
-            self._name = 'natural'
-            self._alter = 0.0
-        elif name in ('sharp', accidentalNameToModifier['sharp'], 'is', 1):
-            self._name = 'sharp'
-            self._alter = 1.0
-        elif name in ('double-sharp', accidentalNameToModifier['double-sharp'],
-                      'isis', 2):
-            self._name = 'double-sharp'
-            self._alter = 2.0
-        elif name in ('flat', accidentalNameToModifier['flat'], 'es', 'b', -1):
-            self._name = 'flat'
-            self._alter = -1.0
-        elif name in ('double-flat', accidentalNameToModifier['double-flat'],
-                      'eses', -2):
-            self._name = 'double-flat'
-            self._alter = -2.0
-
-        elif name in ('half-sharp', accidentalNameToModifier['half-sharp'],
-                      'quarter-sharp', 'ih', 'semisharp', 0.5):
-            self._name = 'half-sharp'
-            self._alter = 0.5
-        elif name in ('one-and-a-half-sharp',
-                      accidentalNameToModifier['one-and-a-half-sharp'],
-                      'three-quarter-sharp', 'three-quarters-sharp', 'isih',
-                      'sesquisharp', 1.5):
-            self._name = 'one-and-a-half-sharp'
-            self._alter = 1.5
-        elif name in ('half-flat', accidentalNameToModifier['half-flat'],
-                      'quarter-flat', 'eh', 'semiflat', -0.5):
-            self._name = 'half-flat'
-            self._alter = -0.5
-        elif name in ('one-and-a-half-flat',
-                      accidentalNameToModifier['one-and-a-half-flat'],
-                      'three-quarter-flat', 'three-quarters-flat', 'eseh',
-                      'sesquiflat', -1.5):
-            self._name = 'one-and-a-half-flat'
-            self._alter = -1.5
-        elif name in ('triple-sharp', accidentalNameToModifier['triple-sharp'],
-                      'isisis', 3):
-            self._name = 'triple-sharp'
-            self._alter = 3.0
-        elif name in ('quadruple-sharp',
-                      accidentalNameToModifier['quadruple-sharp'], 'isisisis', 4):
-            self._name = 'quadruple-sharp'
-            self._alter = 4.0
-        elif name in ('triple-flat', accidentalNameToModifier['triple-flat'],
-                      'eseses', -3):
-            self._name = 'triple-flat'
-            self._alter = -3.0
-        elif name in ('quadruple-flat',
-                      accidentalNameToModifier['quadruple-flat'], 'eseseses', -4):
-            self._name = 'quadruple-flat'
-            self._alter = -4.0
+        try:
+            standardName = _accidentalSpecifierToName.get(name)
+        except TypeError:  # unhashable
+            standardName = None
+        if standardName is not None:
+            self._name = standardName
+            self._alter = accidentalNameToAlter[standardName]
         else:
             if not allowNonStandardValue:
                 raise AccidentalException(f'{name} is not a supported accidental type')
@@ -1609,10 +1701,92 @@ class Accidental(prebase.ProtoM21Object, style.StyleMixin):
         return self.name
 
 
+class FrozenAccidental(Accidental):
+    '''
+    An Accidental that cannot be changed after it is created, so that it
+    can be shared among many :class:`FrozenPitch` objects.
+
+    >>> fa = pitch.FrozenAccidental('sharp')
+    >>> fa
+    <music21.pitch.FrozenAccidental sharp>
+    >>> fa == pitch.Accidental('sharp')
+    True
+    >>> fa.displayStatus = True
+    Traceback (most recent call last):
+    TypeError: This FrozenAccidental instance is immutable.
+
+    Use `.unfrozen()` to get an Accidental that can be changed:
+
+    >>> a = fa.unfrozen()
+    >>> a.displayStatus = True
+    >>> a
+    <music21.pitch.Accidental sharp>
+
+    * New in v9.3.
+    '''
+    __slots__ = ('_frozen',)
+
+    def __init__(self, specifier: int | str | float = 'natural'):
+        super().__init__(specifier)
+        self._frozen = True
+
+    def __setattr__(self, key, value):
+        if getattr(self, '_frozen', False):
+            raise TypeError(f'This {self.__class__.__name__} instance is immutable.')
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key):
+        if getattr(self, '_frozen', False):
+            raise TypeError(f'This {self.__class__.__name__} instance is immutable.')
+        super().__delattr__(key)
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def unfrozen(self) -> Accidental:
+        '''
+        Return a new Accidental equal to this one that can be changed.
+        '''
+        new = Accidental.__new__(Accidental)
+        for slot in self._getSlotsRecursive():
+            if slot != '_frozen':
+                setattr(new, slot, getattr(self, slot))
+        new._client = None
+        return new
+
+    @classmethod
+    def fromAccidental(cls, accidental: Accidental) -> FrozenAccidental:
+        '''
+        Return a FrozenAccidental with the same values as `accidental`.
+
+        >>> a = pitch.Accidental('flat')
+        >>> a.displayType = 'always'
+        >>> fa = pitch.FrozenAccidental.fromAccidental(a)
+        >>> fa
+        <music21.pitch.FrozenAccidental flat>
+        >>> fa.displayType
+        'always'
+        '''
+        new = cls.__new__(cls)
+        for slot in accidental._getSlotsRecursive():
+            object.__setattr__(new, slot, getattr(accidental, slot))
+        object.__setattr__(new, '_client', None)
+        object.__setattr__(new, '_frozen', True)
+        return new
+
+
 
 # ------------------------------------------------------------------------------
-# tried as SlottedObjectMixin -- made creation time slower! Not worth the restrictions
-class Pitch(prebase.ProtoM21Object):
+# slotted to save memory per Pitch; '__dict__' stays in __slots__ so that
+# ad-hoc attributes set by users and subclasses still work.
+class Pitch(prebase.ProtoM21Object, common.SlottedObjectMixin):
     '''
     A fundamental object that represents a single pitch.
 
@@ -1836,7 +2010,25 @@ class Pitch(prebase.ProtoM21Object):
     Pitches are ProtoM21Objects, so they retain some attributes there
     such as .classes and .groups, but they don't have Duration or Sites objects
     and cannot be put into Streams
+
+    * Changed in v9.3: Pitch uses `__slots__` to save memory.  Other attributes
+      can still be set; their dictionary is only created when one is.
     '''
+    # CLASS VARIABLES #
+
+    __slots__ = (
+        '__dict__',
+        '_accidental',
+        '_client',
+        '_groups',
+        '_microtone',
+        '_octave',
+        '_overridden_freq440',
+        '_step',
+        'fundamental',
+        'spellingIsInferred',
+    )
+
     # define order for presenting names in documentation; use strings
     _DOC_ORDER = ['name', 'nameWithOctave', 'step', 'pitchClass', 'octave', 'midi', 'german',
                   'french', 'spanish', 'italian', 'dutch']
@@ -2060,7 +2252,13 @@ class Pitch(prebase.ProtoM21Object):
         '''
         if type(self) is Pitch:  # pylint: disable=unidiomatic-typecheck
             new = Pitch.__new__(Pitch)
-            for k in self.__dict__:
+            for k in Pitch.__slots__:
+                if k == '__dict__':
+                    # other attributes; only copied if there are any,
+                    # so as not to create a dictionary on the copy.
+                    if self.__dict__:
+                        new.__dict__.update(copy.deepcopy(self.__dict__, memo))
+                    continue
                 v = getattr(self, k, None)
                 if k in ('_step', '_overridden_freq440',
                          '_octave', 'spellingIsInferred'):
@@ -2075,6 +2273,13 @@ class Pitch(prebase.ProtoM21Object):
         else:  # pragma: no cover
             return common.defaultDeepcopy(self, memo)
 
+    def __getstate__(self):
+        state = super().__getstate__()
+        # do not give unpickled pitches an empty dictionary
+        if not state.get('__dict__'):
+            state.pop('__dict__', None)
+        return state
+
     def __hash__(self):
         hashValues = (
             self.accidental,
@@ -2706,17 +2911,7 @@ class Pitch(prebase.ProtoM21Object):
         >>> p.midi
         1
         '''
-        def schoolYardRounding(x):
-            '''
-            This is round "up" at 0.5 (regardless of negative or positive)
-
-            Python 3 now uses rounding mechanisms so that odd numbers round one way, even another.
-            But we needed a consistent direction for all half-sharps/flats to go,
-            and now long after Python 2 is no longer supported, this behavior is grandfathered in.
-            '''
-            return math.floor(x + 0.5)
-
-        roundedPS = schoolYardRounding(self.ps)
+        roundedPS = _schoolYardRounding(self.ps)
         if roundedPS > 127:
             value = (12 * 9) + (roundedPS % 12)
             if value < (127 - 12):
@@ -2781,6 +2976,17 @@ class Pitch(prebase.ProtoM21Object):
         Set name, which may be provided with or without octave values. C4 or D-3
         are both accepted.
         '''
+        spelling = _spelledPitchNames.get(usrStr) if isinstance(usrStr, str) else None
+        if spelling is not None:
+            step, modifier, octave = spelling
+            self._step = step
+            self.spellingIsInferred = False
+            self._accidental = Accidental(modifier) if modifier is not None else None
+            if octave is not None:
+                self._octave = octave
+            self.informClient()
+            return
+
         try:
             usrStr = usrStr.strip()
         except AttributeError:
@@ -3533,7 +3739,10 @@ class Pitch(prebase.ProtoM21Object):
             return self._overridden_freq440
         else:
             # works off of .ps values and thus will capture microtones
-            A4offset = self.ps - 69
+            ps = self.ps
+            if ps in _freq440FromPs:
+                return _freq440FromPs[ps]
+            A4offset = ps - 69
             return 440.0 * (self._twelfth_root_of_two ** A4offset)
 
     @freq440.setter
@@ -5441,6 +5650,181 @@ class Pitch(prebase.ProtoM21Object):
         return chordOut
 
 
+class FrozenPitch(Pitch):
+    '''
+    A Pitch that cannot be changed after it is created, so that one object
+    can be shared by many notes.  It takes the same arguments as Pitch.
+
+    >>> fp = pitch.FrozenPitch('C#4')
+    >>> fp
+    <music21.pitch.FrozenPitch C#4>
+    >>> fp.octave = 5
+    Traceback (most recent call last):
+    TypeError: This FrozenPitch instance is immutable.
+
+    Its accidental cannot be changed either:
+
+    >>> fp.accidental
+    <music21.pitch.FrozenAccidental sharp>
+    >>> fp.accidental.displayStatus = True
+    Traceback (most recent call last):
+    TypeError: This FrozenAccidental instance is immutable.
+
+    FrozenPitches equal Pitches with the same spelling, and `.unfrozen()`
+    gives a Pitch that can be changed:
+
+    >>> fp == pitch.Pitch('C#4')
+    True
+    >>> p = fp.unfrozen()
+    >>> p.octave = 5
+    >>> p, fp
+    (<music21.pitch.Pitch C#5>, <music21.pitch.FrozenPitch C#4>)
+
+    Copying a FrozenPitch returns the original:
+
+    >>> import copy
+    >>> copy.deepcopy(fp) is fp
+    True
+
+    A FrozenPitch can be given to many Notes.  Each Note makes its own
+    copy the first time its `.pitch` is accessed:
+
+    >>> n1 = note.Note(fp)
+    >>> n2 = note.Note(fp)
+    >>> n1.pitch.octave = 2
+    >>> n1.nameWithOctave, n2.nameWithOctave
+    ('C#2', 'C#4')
+
+    * New in v9.3.
+    '''
+    __slots__ = ('_frozen',)
+
+    def __init__(self, name: str | int | float | None = None, **keywords):
+        super().__init__(name, **keywords)
+        if self._accidental is not None:
+            self._accidental = internAccidental(self._accidental)
+        self._frozen = True
+
+    def __setattr__(self, key, value):
+        if getattr(self, '_frozen', False):
+            raise TypeError(f'This {self.__class__.__name__} instance is immutable.')
+        super().__setattr__(key, value)
+
+    def __delattr__(self, key):
+        if getattr(self, '_frozen', False):
+            raise TypeError(f'This {self.__class__.__name__} instance is immutable.')
+        super().__delattr__(key)
+
+    def __setstate__(self, state):
+        for slot, value in state.items():
+            object.__setattr__(self, slot, value)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __hash__(self):
+        return hash(self.unfrozen())
+
+    def _getFrozenMicrotone(self) -> Microtone:
+        # Pitch.microtone creates and stores a Microtone when there is none;
+        # a FrozenPitch gives a new one each time instead.
+        if self._microtone is None:
+            return Microtone(0)
+        return copy.deepcopy(self._microtone)
+
+    microtone = property(_getFrozenMicrotone, Pitch.microtone.fset)  # type: ignore
+
+    def unfrozen(self) -> Pitch:
+        '''
+        Return a new Pitch equal to this one that can be changed.
+
+        >>> fp = pitch.FrozenPitch('E-5')
+        >>> p = fp.unfrozen()
+        >>> p
+        <music21.pitch.Pitch E-5>
+        >>> p.accidental
+        <music21.pitch.Accidental flat>
+        '''
+        new = Pitch.__new__(Pitch)
+        for slot in Pitch.__slots__:
+            if slot == '__dict__':
+                continue
+            value = getattr(self, slot)
+            if slot == '_accidental' and value is not None:
+                value = value.unfrozen()
+            elif slot in ('_microtone', '_groups', 'fundamental') and value is not None:
+                value = copy.deepcopy(value)
+            setattr(new, slot, value)
+        new._client = None
+        return new
+
+
+_internedAccidentals: dict[tuple, FrozenAccidental] = {}
+
+
+def internAccidental(accidental: Accidental | str | int | float) -> FrozenAccidental:
+    '''
+    Return a shared :class:`FrozenAccidental` for a specifier (as given to
+    Accidental) or for an Accidental.  Asking again for an equivalent
+    accidental returns the same object.
+
+    >>> fa = pitch.internAccidental('sharp')
+    >>> fa
+    <music21.pitch.FrozenAccidental sharp>
+    >>> pitch.internAccidental(pitch.Accidental('sharp')) is fa
+    True
+
+    Accidentals with different display attributes are not the same:
+
+    >>> a = pitch.Accidental('sharp')
+    >>> a.displayStatus = True
+    >>> pitch.internAccidental(a) is fa
+    False
+
+    * New in v9.3.
+    '''
+    if isinstance(accidental, FrozenAccidental):
+        return accidental
+    if not isinstance(accidental, Accidental):
+        accidental = Accidental(accidental)
+    if accidental.hasStyleInformation or accidental.hasEditorialInformation:
+        return FrozenAccidental.fromAccidental(accidental)
+
+    key = accidental._hashValues()
+    try:
+        return _internedAccidentals[key]
+    except KeyError:
+        frozen = FrozenAccidental.fromAccidental(accidental)
+        _internedAccidentals[key] = frozen
+        return frozen
+
+
+@lru_cache(1024)
+def internPitch(name: str | int | float | None = None, **keywords) -> FrozenPitch:
+    '''
+    Return a shared :class:`FrozenPitch` for the same arguments as Pitch
+    takes, such as a name (with or without octave) or a MIDI number.
+    Asking again with the same arguments returns the same object, so notes
+    created in bulk need not each make (and parse) a Pitch.
+
+    >>> fp = pitch.internPitch('B-3')
+    >>> fp
+    <music21.pitch.FrozenPitch B-3>
+    >>> pitch.internPitch('B-3') is fp
+    True
+    >>> pitch.internPitch(midi=61)
+    <music21.pitch.FrozenPitch C#4>
+
+    See :func:`~music21.note.internedValues` for creating notes with shared pitches.
+
+    * New in v9.3.
+    '''
+    return FrozenPitch(name, **keywords)
+
+
 # ------------------------------------------------------------------------------
 # nearly all tests moved to test_pitch.py
 
@@ -18,11 +18,13 @@ the :class:`~music21.bar.Repeat` which represents a normal barline repeat.
 '''
 from __future__ import annotations
 
+import bisect
 import copy
 import string
 import typing as t
 
-from music21.common.types import StreamType
+from music21.common.numberTools import opFrac
+from music21.common.types import OffsetQL, StreamType
 from music21 import environment
 from music21 import exceptions21
 from music21 import expressions
@@ -32,6 +34,8 @@ from music21 import style
 
 
 if t.TYPE_CHECKING:
+    from collections.abc import Generator
+    from music21 import base
     from music21 import stream
 
 
@@ -650,6 +654,19 @@ class ExpanderException(exceptions21.Music21Exception):
     pass
 
 
+class PlaybackMeasure(t.NamedTuple):
+    '''
+    One entry in the performed order of a Stream with repeats, as given by
+    :meth:`~music21.repeat.Expander.playback`.  `measure` is the source
+    Measure itself (not a copy), `offset` is the offset at which it is
+    performed, and `passNumber` counts how many times this measure has been
+    played so far, starting with 1.
+    '''
+    measure: stream.Measure
+    offset: OffsetQL
+    passNumber: int
+
+
 class Expander(t.Generic[StreamType]):
     '''
     The Expander object can expand a single Part or Part-like Stream with repeats. Nested
@@ -760,6 +777,10 @@ class Expander(t.Generic[StreamType]):
         self._dsafCount = len(reStream.getElementsByClass(DalSegnoAlFine))
         self._dsacCount = len(reStream.getElementsByClass(DalSegnoAlCoda))
 
+        # performed order of source measure indices; see _playbackIndices()
+        self._playbackIndexCache: list[int] | None = None
+        self._playbackMeasureNumbers: list[str] = []
+
     def process(self, deepcopy: bool = True) -> StreamType:
         '''
         This is the main call for Expander
@@ -821,11 +842,6 @@ class Expander(t.Generic[StreamType]):
         of the original instead of the
         index of the original is used -- suffixes are important here for endings etc..
 
-        Inefficient, because the entire stream is expanded before making this call,
-        rather than just seeing
-        what needs to be expanded and returning that.
-
-
         >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.    G4 a b   c2.')
         >>> s.makeMeasures(inPlace=True)
         >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
@@ -837,36 +853,179 @@ class Expander(t.Generic[StreamType]):
         [0, 1, 1, 1, 2, 3, 3, 4]
         >>> e.measureMap(returnType='measureNumber')
         ['1', '2', '2a', '2b', '3', '4', '4a', '5']
+
+        * Changed in v9.3: the map is computed from a skeleton of the repeat
+          structure, so the contents of the measures are never copied.
         '''
-        from music21 import stream
+        indices = self._playbackIndices()
+        if returnType == 'measureNumber':
+            return list(self._playbackMeasureNumbers)
+        return list(indices)
 
-        measureNumberList = []
-        measureNumberNoSuffixList = []
-        post = self.process()
+    def _playbackIndices(self) -> list[int]:
+        '''
+        Return (and cache) the list of indices into the source measures in the
+        order in which they are performed.
 
-        measureContainingStreams = post
+        The repeat structure is expanded on a skeleton Part of empty measures that
+        carry only the barlines, repeat expressions, and repeat brackets of the
+        source, so no notes or other contents are copied.
 
-        for i, m in enumerate(measureContainingStreams.getElementsByClass(stream.Measure)):
-            measureNumberList.append(m.measureNumberWithSuffix())
-            measureNumberNoSuffixList.append(m.number)
+        >>> s = converter.parse('tinynotation: 2/4 c2 d2 e2')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> repeat.Expander(s)._playbackIndices()
+        [0, 1, 0, 1, 2]
+        '''
+        if self._playbackIndexCache is not None:
+            return self._playbackIndexCache
 
-        if returnType == 'measureNumber':
-            return measureNumberList
+        from music21 import stream
 
-        measureNumberDict = {}
-        measureNumberNoSuffixDict = {}
+        skeleton = stream.Part()
+        skeletonIndex: dict[int, int] = {}
+        skeletonMeasures = []
         for i, m in enumerate(self._srcMeasureStream):
-            measureNumberDict[m.measureNumberWithSuffix()] = i
-            measureNumberNoSuffixDict[m.number] = i
-            # could be overwritten if the same measureNumber is used multiple times.
+            mSkeleton = stream.Measure(number=m.number)
+            mSkeleton.numberSuffix = m.numberSuffix
+            if m.leftBarline is not None:
+                mSkeleton.leftBarline = copy.deepcopy(m.leftBarline)
+            if m.rightBarline is not None:
+                mSkeleton.rightBarline = copy.deepcopy(m.rightBarline)
+            for e in m.getElementsByClass(RepeatExpression):
+                mSkeleton.coreInsert(m.elementOffset(e), copy.deepcopy(e))
+            mSkeleton.coreElementsChanged()
+            skeletonIndex[id(mSkeleton)] = i
+            skeletonMeasures.append(mSkeleton)
+            skeleton.coreAppend(mSkeleton)
+
+        idToSkeleton = {id(m): mSkeleton
+                        for m, mSkeleton in zip(self._srcMeasureStream, skeletonMeasures)}
+        for rb in self._repeatBrackets:
+            spanned = [idToSkeleton[id(m)] for m in rb.getSpannedElements()
+                       if id(m) in idToSkeleton]
+            skeleton.coreInsert(0, spanner.RepeatBracket(spanned, number=rb.numberRange))
+        skeleton.coreElementsChanged()
+
+        expanded = Expander(skeleton).process()
+        indices = []
+        numbers = []
+        for m in expanded.getElementsByClass(stream.Measure):
+            source = m
+            for source in m.derivation.chain():
+                if id(source) in skeletonIndex:
+                    break
+            indices.append(skeletonIndex[id(source)])
+            numbers.append(m.measureNumberWithSuffix())
 
-        indexList = []
-        for i, measureNumberWithSuffix in enumerate(measureNumberList):
-            try:
-                indexList.append(measureNumberDict[measureNumberWithSuffix])
-            except KeyError:
-                indexList.append(measureNumberNoSuffixDict[measureNumberNoSuffixList[i]])
-        return indexList
+        self._playbackMeasureNumbers = numbers
+        self._playbackIndexCache = indices
+        return indices
+
+    def playback(self) -> Generator[PlaybackMeasure, None, None]:
+        '''
+        Lazily yield a :class:`~music21.repeat.PlaybackMeasure` for each measure in
+        performed order.  Unlike :meth:`process`, no measure is copied: the same
+        source Measure is yielded on each pass through a repeat.
+
+        >>> s = converter.parse('tinynotation: 3/4 A2.  C4 D E   F2.')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).leftBarline = bar.Repeat(direction='start')
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end', times=3)
+        >>> e = repeat.Expander(s)
+        >>> for pm in e.playback():
+        ...     print(pm.measure.number, pm.offset, pm.passNumber)
+        1 0.0 1
+        2 3.0 1
+        2 6.0 2
+        2 9.0 3
+        3 12.0 1
+
+        >>> [pm.measure for pm in e.playback()][1] is s.measure(2)
+        True
+
+        A Stream without repeats is played straight through:
+
+        >>> s2 = converter.parse('tinynotation: 3/4 A2.  C4 D E')
+        >>> s2.makeMeasures(inPlace=True)
+        >>> [pm.offset for pm in repeat.Expander(s2).playback()]
+        [0.0, 3.0]
+        '''
+        canExpand = self.isExpandable()
+        if canExpand is False:
+            raise ExpanderException(
+                'cannot expand Stream: badly formed repeats or repeat expressions')
+        if canExpand is None:
+            indices = list(range(self._srcMeasureCount))
+        else:
+            indices = self._playbackIndices()
+
+        # each measure lasts until the next source measure begins, so that notes
+        # extending past the end of a measure (e.g. after stripTies) do not shift time
+        measures = list(self._srcMeasureStream)
+        starts = [self._srcMeasureStream.elementOffset(m) for m in measures]
+        spans = [opFrac(nextStart - start) for start, nextStart in zip(starts, starts[1:])]
+        spans.append(measures[-1].duration.quarterLength)
+
+        passCounts = [0] * self._srcMeasureCount
+        offset: OffsetQL = starts[0]
+        for i in indices:
+            passCounts[i] += 1
+            yield PlaybackMeasure(measures[i], offset, passCounts[i])
+            offset = opFrac(offset + spans[i])
+
+    def playbackElements(
+        self,
+        srcFlat: stream.Stream | None = None,
+    ) -> Generator[tuple[base.Music21Object, OffsetQL, int], None, None]:
+        '''
+        Lazily yield (element, performed offset, passNumber) triples for every element
+        of `srcFlat` (by default the flattened source Stream), in performed order.
+
+        Each element is assigned to the source measure whose span contains its offset
+        in `srcFlat` and is yielded once for every time that measure is performed.
+        Elements placed directly in the source Stream rather than in a Measure (such
+        as a Part-level Instrument) are only yielded on the first pass.
+        Elements are never copied, so this is suited to playback (MIDI, seconds maps)
+        of long repeated forms.
+
+        >>> s = converter.parse('tinynotation: 2/4 c2 d4 e4 f2')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> e = repeat.Expander(s)
+        >>> for el, offset, passNumber in e.playbackElements(s.flatten().notes.stream()):
+        ...     print(el.name, offset, passNumber)
+        C 0.0 1
+        D 2.0 1
+        E 3.0 1
+        C 4.0 2
+        D 6.0 2
+        E 7.0 2
+        F 8.0 1
+        '''
+        if srcFlat is None:
+            srcFlat = self._src.flatten()
+        measureStarts = [self._srcMeasureStream.elementOffset(m)
+                         for m in self._srcMeasureStream]
+
+        # gather elements once per source measure, with offsets relative to the measure
+        buckets: list[list[tuple[base.Music21Object, OffsetQL]]] = [
+            [] for _ in range(self._srcMeasureCount)
+        ]
+        for el in srcFlat:
+            o = srcFlat.elementOffset(el)
+            i = max(bisect.bisect_right(measureStarts, o) - 1, 0)
+            buckets[i].append((el, opFrac(o - measureStarts[i])))
+
+        from music21 import stream
+        outsideMeasureIds = {id(e) for e in self._src.getElementsNotOfClass(stream.Measure)}
+
+        sourceIndices = {id(m): i for i, m in enumerate(self._srcMeasureStream)}
+        for pm in self.playback():
+            for el, delta in buckets[sourceIndices[id(pm.measure)]]:
+                if pm.passNumber > 1 and id(el) in outsideMeasureIds:
+                    continue
+                yield el, opFrac(pm.offset + delta), pm.passNumber
 
     def _stripRepeatBarlines(self, m, newType='double'):
         '''
@@ -1901,7 +2060,7 @@ class Expander(t.Generic[StreamType]):
         self._stripRepeatExpressions(new)
         return new
 
-    _DOC_ORDER = ['process', 'measureMap']
+    _DOC_ORDER = ['process', 'measureMap', 'playback', 'playbackElements']
 
 # ---------------------------------------------------------
 
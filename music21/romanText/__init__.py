@@ -17,9 +17,11 @@ Dmitri Tymoczko, Trevor De Clercq & David Temperley, and the DCMLab.
 '''
 from __future__ import annotations
 
-__all__ = ['clercqTemperley', 'rtObjects', 'translate', 'testFiles', 'tsvConverter', 'writeRoman']
+__all__ = ['clercqTemperley', 'records', 'rtObjects', 'translate', 'testFiles',
+           'tsvConverter', 'writeRoman']
 
 from music21.romanText import clercqTemperley
+from music21.romanText import records
 from music21.romanText import rtObjects
 from music21.romanText import testFiles
 from music21.romanText import translate
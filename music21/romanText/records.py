@@ -0,0 +1,812 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         romanText/records.py
+# Purpose:      Lightweight, record-level readers for harmonic analysis files
+#
+# Authors:      Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert and the music21
+#               Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Record-level readers for RomanText (.rntxt) and DCML tab-separated harmonic
+analyses.
+
+Parsing an analysis with :func:`~music21.converter.parse` builds a complete
+:class:`~music21.stream.Score` in which every chord is a
+:class:`~music21.roman.RomanNumeral` with its pitches realized.  For
+statistics over a large harmonic corpus, usually only the label, its
+position, and its key are needed.  The functions in this module read the
+file lazily, line by line, and yield one :class:`AnalysisRecord` per
+analysis event, without creating any Streams:
+
+>>> path = corpus.getWork('monteverdi/madrigal.3.1.rntxt')
+>>> records = romanText.records.iterRomanTextRecords(path)
+>>> for r in list(records)[:4]:
+...     print(r.measure, r.beat, r.key, r.figure, r.root, r.quality)
+1 1.0 F vi D minor
+1 4.0 F V[no3] C other
+2 1.0 F I F major
+2 4.0 F IV B- major
+
+Each distinct combination of figure and key is only analyzed once, so
+reading thousands of files costs little more than reading their lines.
+Pitches are included in each record only if requested:
+
+>>> records = romanText.records.iterRomanTextRecords(path, realizePitches=True)
+>>> next(records).pitches
+('D5', 'F5', 'A5')
+
+Records can be made into a Score later with :func:`recordsToScore`.
+
+* New in v9.3.
+'''
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import copy
+import csv
+from functools import lru_cache
+import pathlib
+import string
+import typing as t
+import unittest
+
+from music21 import common
+from music21 import environment
+from music21 import exceptions21
+from music21 import harmony
+from music21 import key
+from music21 import meter
+from music21 import roman
+from music21 import stream
+
+from music21.romanText import rtObjects
+from music21.romanText import translate
+from music21.romanText import tsvConverter
+
+environLocal = environment.Environment('romanText.records')
+
+
+class AnalysisRecord(t.NamedTuple):
+    '''
+    A single event of a harmonic analysis.
+
+    `measure` is the measure number, or a string such as '15a' if the measure
+    is one of several repeat endings.  `beat` is the beat as written
+    (1-indexed), and `offset` is the position of the event in the measure in
+    quarter lengths.  `key` is the local key as a tonic name in which
+    lowercase indicates minor, such as 'E-' or 'c#'.  `figure` is written
+    as in the RomanNumeral's `.figure`, so that 'ii/o7' becomes 'iiø7'.
+
+    `root` and `quality` are None if the figure cannot be parsed or if
+    the event is a no-chord ('N.C.').  `pitches` is empty unless pitch
+    realization was requested.
+
+    `isPivot` is True for the second chord of a pivot-chord pair
+    (such as 'IV' in 'V C: IV'), which occupies the same position as the
+    chord before it.
+    '''
+    measure: int | str
+    beat: float | common.types.OffsetQL
+    offset: common.types.OffsetQL
+    timeSignature: str
+    key: str
+    figure: str
+    root: str | None
+    quality: str | None
+    pitches: tuple[str, ...] = ()
+    isPivot: bool = False
+
+
+NO_CHORD_FIGURE = 'N.C.'
+
+
+@lru_cache(4096)
+def _analyzeFigure(
+    figure: str,
+    keyString: str,
+    sixthMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+    seventhMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+) -> tuple[str, str, str | None, str | None, tuple[str, ...], bool]:
+    '''
+    Return the key name, the figure as music21 writes it, the root name,
+    quality, pitch names, and whether the figure has a secondary Roman
+    numeral, for a figure in a key.  The result
+    is cached, since an analysis corpus uses relatively few combinations.
+
+    >>> romanText.records._analyzeFigure('V7/V', 'c')
+    ('c', 'V7/V', 'D', 'major', ('D5', 'F#5', 'A5', 'C6'), True)
+    >>> romanText.records._analyzeFigure('ii/o6/5', 'E-')
+    ('E-', 'iiø6/5', 'F', 'diminished', ('A-4', 'C-5', 'E-5', 'F5'), False)
+
+    Figures that cannot be parsed give None for the root and quality:
+
+    >>> romanText.records._analyzeFigure('xyz', 'C')
+    ('C', 'xyz', None, None, (), False)
+    '''
+    try:
+        rn = roman.RomanNumeral(figure,
+                                keyString,
+                                sixthMinor=sixthMinor,
+                                seventhMinor=seventhMinor)
+    except roman.RomanNumeralException:
+        return (keyString, figure, None, None, (), False)
+    rnKey = rn.key
+    keyName = rnKey.tonicPitchNameWithCase if isinstance(rnKey, key.Key) else keyString
+    root = rn.root()
+    return (keyName,
+            rn.figure,
+            root.name if root is not None else None,
+            rn.quality,
+            tuple(p.nameWithOctave for p in rn.pitches),
+            rn.secondaryRomanNumeral is not None)
+
+
+def _makeRecord(
+    measure: int | str,
+    beat: float | common.types.OffsetQL,
+    offset: common.types.OffsetQL,
+    timeSignature: str,
+    keyString: str,
+    figure: str,
+    *,
+    sixthMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+    seventhMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+    realizePitches: bool = False,
+    isNoChord: bool = False,
+    isPivot: bool = False,
+) -> AnalysisRecord:
+    if isNoChord:
+        return AnalysisRecord(measure, beat, offset, timeSignature, keyString,
+                              NO_CHORD_FIGURE, None, None, (), isPivot)
+    keyName, m21Figure, root, quality, pitches, unused_isSecondary = _analyzeFigure(
+        figure, keyString, sixthMinor, seventhMinor)
+    return AnalysisRecord(measure, beat, offset, timeSignature, keyName,
+                          m21Figure, root, quality,
+                          pitches if realizePitches else (),
+                          isPivot)
+
+
+# ------------------------------------------------------------------------------
+# RomanText
+
+class _RTEvent:
+    '''
+    The state the RomanText translator keeps on each RomanNumeral, Rest,
+    or NoChord that it places in a Measure, which is what measure copies
+    (such as "m5-6 = m1-2") need in order to follow keys in the same way.
+    '''
+    __slots__ = ('beat', 'offset', 'timeSignature', 'figure', 'keyString',
+                 'sixthMinor', 'seventhMinor', 'followsKeyChange', 'pivot',
+                 'isRomanNumeral', 'isNoChord', 'isCarry')
+
+    def __init__(self, beat, offset, timeSignature, figure='', keyString='C'):
+        self.beat = beat
+        self.offset = offset
+        self.timeSignature = timeSignature
+        self.figure = figure
+        self.keyString = keyString
+        self.sixthMinor = roman.Minor67Default.CAUTIONARY
+        self.seventhMinor = roman.Minor67Default.CAUTIONARY
+        self.followsKeyChange = False
+        self.pivot: _RTEvent | None = None
+        # False for rests, no-chords, and unparseable figures
+        self.isRomanNumeral = False
+        self.isNoChord = False
+        # True for a copy of the previous chord that continues over a barline
+        self.isCarry = False
+
+    def copy(self) -> _RTEvent:
+        return copy.copy(self)
+
+
+# key atom source, such as 'Bb:', to the tonic name with case, such as 'B-'
+_keyStringCache: dict[str, str] = {}
+
+
+class _RTMeasure(t.NamedTuple):
+    number: int
+    suffix: str
+    events: list[_RTEvent]
+
+
+class _RomanTextRecordReader:
+    '''
+    Follows the logic of :class:`~music21.romanText.translate.PartTranslator`
+    for keys, beats, pivot chords, repeat endings, and measure copies, but
+    records events instead of creating Measures and RomanNumerals.
+    '''
+    def __init__(self, realizePitches=False):
+        self.realizePitches = realizePitches
+        self.rtHandler = rtObjects.RTHandler()
+
+        self.tsCurrent = meter.TimeSignature('4/4')
+        self.timeSignatures: dict[str, meter.TimeSignature] = {}
+        self.keyString = 'C'
+        self.offsets: dict[tuple[str, str], tuple[t.Any, t.Any]] = {}
+        self.sixthMinor = roman.Minor67Default.CAUTIONARY
+        self.seventhMinor = roman.Minor67Default.CAUTIONARY
+
+        self.measures: list[_RTMeasure] = []
+        self.previousRn: _RTEvent | None = None
+        self.lastMeasureNumber = 0
+        self.lastMeasureToken: rtObjects.RTMeasure | None = None
+        self.inBody = False
+
+    def recordsFromLine(self, line: str, lineNumber: int = 0) -> Iterator[AnalysisRecord]:
+        line = line.strip()
+        if not line:
+            return
+        if rtObjects.reMeasureTag.match(line) is None:
+            self.processTag(rtObjects.RTTagged(line))
+            return
+        self.inBody = True
+        measureToken = rtObjects.RTMeasure(line)
+        measureToken.lineNumber = lineNumber
+        measureToken.atoms = self.rtHandler.tokenizeAtoms(measureToken.data,
+                                                          container=measureToken)
+        for m in self.processMeasureToken(measureToken):
+            yield from self.measureRecords(m)
+
+    def processTag(self, rtTagged: rtObjects.RTTagged):
+        if rtTagged.isTimeSignature():
+            try:
+                self.tsCurrent = self.getTimeSignature(rtTagged.data)
+            except exceptions21.Music21Exception:  # pragma: no cover
+                environLocal.warn(f'Could not parse TimeSignature tag: {rtTagged.data!r}')
+        elif rtTagged.isSixthMinor():
+            self.sixthMinor = translate._getMinor67Default(rtTagged)
+        elif rtTagged.isSeventhMinor():
+            self.seventhMinor = translate._getMinor67Default(rtTagged)
+        elif rtTagged.isMovement() and self.inBody:
+            # a new movement: measure numbers start again
+            self.measures = []
+            self.previousRn = None
+            self.lastMeasureNumber = 0
+            self.lastMeasureToken = None
+
+    def getTimeSignature(self, tsString: str) -> meter.TimeSignature:
+        if tsString not in self.timeSignatures:
+            self.timeSignatures[tsString] = meter.TimeSignature(tsString)
+        return self.timeSignatures[tsString]
+
+    @staticmethod
+    def getKeyString(keyAtom: rtObjects.RTKeyTypeAtom) -> str:
+        src = keyAtom.src
+        if src not in _keyStringCache:
+            k, unused_prefix = translate._getKeyAndPrefix(keyAtom)
+            _keyStringCache[src] = k.tonicPitchNameWithCase
+        return _keyStringCache[src]
+
+    def getBeatAndOffset(self, beatAtom: rtObjects.RTBeat):
+        cacheKey = (beatAtom.src, self.tsCurrent.ratioString)
+        if cacheKey not in self.offsets:
+            try:
+                offset = beatAtom.getOffset(self.tsCurrent)
+            except ValueError:  # pragma: no cover
+                raise translate.RomanTextTranslateException(
+                    f'cannot properly get an offset from beat data {beatAtom.src} '
+                    + f'under timeSignature {self.tsCurrent}')
+            self.offsets[cacheKey] = (beatAtom.getBeatFloatOrFrac(), offset)
+        return self.offsets[cacheKey]
+
+    def carryPreviousRn(self, offset=0.0) -> _RTEvent | None:
+        if self.previousRn is None:
+            return None
+        carry = self.previousRn.copy()
+        carry.offset = offset
+        carry.isCarry = True
+        self.previousRn = carry
+        return carry
+
+    def processMeasureToken(self, measureToken: rtObjects.RTMeasure) -> list[_RTMeasure]:
+        '''
+        Return the measures (usually just one) that a measure line defines.
+        '''
+        if measureToken.variantNumber is not None or measureToken.variantLetter is not None:
+            return []
+
+        newMeasures = []
+        if (measureToken.number[0] > self.lastMeasureNumber + 1
+                and self.previousRn is not None):
+            lastToken = self.lastMeasureToken
+            suffix = lastToken.repeatLetter[0] if lastToken and lastToken.repeatLetter else ''
+            for i in range(self.lastMeasureNumber + 1, measureToken.number[0]):
+                carry = self.carryPreviousRn()
+                newMeasures.append(_RTMeasure(i, suffix, [carry] if carry else []))
+            self.lastMeasureNumber = measureToken.number[0] - 1
+            self.lastMeasureToken = measureToken
+
+        if len(measureToken.number) > 1 or measureToken.isCopyDefinition:
+            copies = self.copyMeasures(measureToken)
+            if copies:
+                self.lastMeasureNumber = copies[-1].number
+                romans = [e for e in copies[-1].events if e.isRomanNumeral]
+                if romans:
+                    self.previousRn = romans[-1]
+            self.lastMeasureToken = measureToken
+            newMeasures.extend(copies)
+        else:
+            newMeasures.append(self.translateSingleMeasure(measureToken))
+
+        self.measures.extend(newMeasures)
+        return newMeasures
+
+    def copyMeasures(self, measureToken: rtObjects.RTMeasure) -> list[_RTMeasure]:
+        '''
+        Copy past measures as `_copySingleMeasure` and `_copyMultipleMeasures`
+        in translate do, updating keys as they go.
+        '''
+        targetNumbers, unused_targetRepeat = measureToken.getCopyTarget()
+        targetStart = targetNumbers[0]
+        targetEnd = targetNumbers[-1]
+        isRange = len(measureToken.number) > 1
+        copies = []
+        for mPast in self.measures:
+            if not targetStart <= mPast.number <= targetEnd:
+                continue
+            events = []
+            for event in mPast.events:
+                event = event.copy()
+                if event.isRomanNumeral:
+                    if event.followsKeyChange:
+                        self.keyString = event.keyString
+                    elif event.pivot is not None:
+                        self.keyString = event.pivot.keyString
+                    else:
+                        event.keyString = self.keyString
+                    if _analyzeFigure(event.figure, event.keyString,
+                                      event.sixthMinor, event.seventhMinor)[-1]:
+                        # secondary Roman numerals are remade in the current key
+                        #   with default settings
+                        event.keyString = self.keyString
+                        event.sixthMinor = roman.Minor67Default.CAUTIONARY
+                        event.seventhMinor = roman.Minor67Default.CAUTIONARY
+                        event.followsKeyChange = False
+                        event.pivot = None
+                events.append(event)
+            if isRange:
+                number = measureToken.number[0] + mPast.number - targetStart
+            else:
+                number = measureToken.number[0]
+            copies.append(_RTMeasure(number, mPast.suffix, events))
+            if mPast.number == targetEnd:
+                break
+        return copies
+
+    def translateSingleMeasure(self, measureToken: rtObjects.RTMeasure) -> _RTMeasure:
+        suffix = measureToken.repeatLetter[0] if measureToken.repeatLetter else ''
+        self.lastMeasureNumber = measureToken.number[0]
+        self.lastMeasureToken = measureToken
+
+        events: list[_RTEvent] = []
+        beat: t.Any = 1.0
+        offset: t.Any = 0.0
+        previousChordInMeasure: _RTEvent | None = None
+        pivotChordPossible = False
+        setKeyChangeToken = False
+        tsString = self.tsCurrent.ratioString
+
+        for a in measureToken.atoms:
+            if isinstance(a, (rtObjects.RTKey, rtObjects.RTAnalyticKey)):
+                self.keyString = self.getKeyString(a)
+                setKeyChangeToken = True
+            elif isinstance(a, rtObjects.RTBeat):
+                beat, offset = self.getBeatAndOffset(a)
+                if previousChordInMeasure is None and offset > 0:
+                    carry = self.carryPreviousRn()
+                    if carry is not None:
+                        events.insert(0, carry)
+                        previousChordInMeasure = carry
+                pivotChordPossible = False
+            elif isinstance(a, rtObjects.RTNoChord):
+                event = _RTEvent(beat, offset, tsString, NO_CHORD_FIGURE, self.keyString)
+                event.isNoChord = True
+                events.append(event)
+                if pivotChordPossible is False:
+                    previousChordInMeasure = event
+                    self.previousRn = event
+            elif isinstance(a, rtObjects.RTChord):
+                event = _RTEvent(beat, offset, tsString, a.src, self.keyString)
+                event.sixthMinor = self.sixthMinor
+                event.seventhMinor = self.seventhMinor
+                if _analyzeFigure(a.src, self.keyString,
+                                  self.sixthMinor, self.seventhMinor)[2] is not None:
+                    event.isRomanNumeral = True
+                    event.followsKeyChange = setKeyChangeToken
+                    setKeyChangeToken = False
+                if pivotChordPossible is False:
+                    events.append(event)
+                    previousChordInMeasure = event
+                    self.previousRn = event
+                    pivotChordPossible = True
+                else:
+                    if t.TYPE_CHECKING:
+                        assert previousChordInMeasure is not None
+                    previousChordInMeasure.pivot = event
+                    pivotChordPossible = False
+
+        if not events:
+            carry = self.carryPreviousRn()
+            if carry is not None:
+                events.append(carry)
+        return _RTMeasure(measureToken.number[0], suffix, events)
+
+    def measureRecords(self, m: _RTMeasure) -> Iterator[AnalysisRecord]:
+        measure: int | str = f'{m.number}{m.suffix}' if m.suffix else m.number
+        for event in m.events:
+            if event.isCarry:
+                continue
+            for thisEvent, isPivot in ((event, False), (event.pivot, True)):
+                if thisEvent is None:
+                    continue
+                yield _makeRecord(measure,
+                                  event.beat,
+                                  event.offset,
+                                  event.timeSignature,
+                                  thisEvent.keyString,
+                                  thisEvent.figure,
+                                  sixthMinor=thisEvent.sixthMinor,
+                                  seventhMinor=thisEvent.seventhMinor,
+                                  realizePitches=self.realizePitches,
+                                  isNoChord=thisEvent.isNoChord,
+                                  isPivot=isPivot)
+
+
+def iterRomanTextRecords(
+    filePath: str | pathlib.Path,
+    *,
+    realizePitches: bool = False,
+) -> Iterator[AnalysisRecord]:
+    '''
+    Read a RomanText file line by line, yielding an :class:`AnalysisRecord`
+    for each chord, pivot chord, and no-chord.
+
+    Keys, beats, pivot chords, measure copies (such as "m5-6 = m1-2"),
+    and repeat endings are interpreted just as
+    :func:`~music21.romanText.translate.romanTextToStreamScore` does, but
+    no Measures or RomanNumerals are created.  Variant measures are skipped.
+    If `realizePitches` is True, each record's `pitches` gives the pitches
+    of the chord.
+
+    >>> path = corpus.getWork('monteverdi/madrigal.3.1.rntxt')
+    >>> pivots = [r for r in romanText.records.iterRomanTextRecords(path) if r.isPivot]
+    >>> pivots[1]
+    AnalysisRecord(measure=10, beat=2.0, offset=1.0, timeSignature='4/4',
+        key='B-', figure='I6', root='B-', quality='major', pitches=(), isPivot=True)
+
+    A RomanText string can be read with :func:`iterRomanTextStringRecords`.
+    '''
+    rtf = rtObjects.RTFile()
+    rtf.open(filePath)
+    try:
+        yield from _iterRomanTextLines(rtf.file, realizePitches=realizePitches)
+    finally:
+        rtf.close()
+
+
+def iterRomanTextStringRecords(
+    rtString: str,
+    *,
+    realizePitches: bool = False,
+) -> Iterator[AnalysisRecord]:
+    '''
+    Yield :class:`AnalysisRecord` objects from RomanText given as a string.
+
+    >>> rtString = ('Time Signature: 3/4\\n'
+    ...             + 'm1 g: i b2 V6 b3 i\\n'
+    ...             + 'm2 iv6 b3 V C: IV\\n'
+    ...             + 'm3-4 = m1-2\\n')
+    >>> for r in romanText.records.iterRomanTextStringRecords(rtString):
+    ...     print(r.measure, r.beat, r.offset, r.key, r.figure, r.root, r.quality, r.isPivot)
+    1 1.0 0.0 g i G minor False
+    1 2.0 1.0 g V6 D major False
+    1 3.0 2.0 g i G minor False
+    2 1.0 0.0 g iv6 C minor False
+    2 3.0 2.0 g V D major False
+    2 3.0 2.0 C IV F major True
+    3 1.0 0.0 g i G minor False
+    3 2.0 1.0 g V6 D major False
+    3 3.0 2.0 g i G minor False
+    4 1.0 0.0 g iv6 C minor False
+    4 3.0 2.0 g V D major False
+    4 3.0 2.0 C IV F major True
+
+    Because the copied measure 1 begins with a key change, the copy
+    returns to g minor, just as in the Score made by
+    :func:`~music21.converter.parse`.
+    '''
+    return _iterRomanTextLines(rtString.splitlines(), realizePitches=realizePitches)
+
+
+def _iterRomanTextLines(
+    lines: Iterable[str],
+    *,
+    realizePitches: bool = False,
+) -> Iterator[AnalysisRecord]:
+    reader = _RomanTextRecordReader(realizePitches=realizePitches)
+    for i, line in enumerate(lines):
+        try:
+            yield from reader.recordsFromLine(line, i + 1)
+        except (rtObjects.RTTokenException, translate.RomanTextTranslateException) as e:
+            raise translate.RomanTextTranslateException(
+                f'At line {i + 1} ({line.strip()}) an exception was raised: {e}') from e
+
+
+# ------------------------------------------------------------------------------
+# DCML TSV
+
+def iterTsvRecords(
+    filePath: str | pathlib.Path,
+    dcml_version: int = 1,
+    *,
+    realizePitches: bool = False,
+) -> Iterator[AnalysisRecord]:
+    '''
+    Read a DCML tab-separated analysis row by row, yielding an
+    :class:`AnalysisRecord` for each row, interpreted as
+    :class:`~music21.romanText.tsvConverter.TsvHandler` does.
+
+    >>> path = common.getSourceFilePath() / 'romanText' / 'tsvEg_v2major.tsv'
+    >>> records = romanText.records.iterTsvRecords(path, dcml_version=2)
+    >>> for r in list(records)[:3]:
+    ...     print(r.measure, r.beat, r.offset, r.timeSignature, r.key, r.figure, r.root)
+    1 3.0 2.0 2/4 C I6 C
+    2 1.0 0.0 2/4 C #viio6/ii C#
+    3 1.0 0.0 2/4 C ii D
+
+    Measures in repeat endings have a suffix, as in the Score:
+
+    >>> path = common.getSourceFilePath() / 'romanText' / 'tsvEg_v2_repeats.tsv'
+    >>> [r.measure for r in romanText.records.iterTsvRecords(path, dcml_version=2)]
+    [1, '2a', '2b']
+    '''
+    if dcml_version == 1:
+        tabChordClass: type[tsvConverter.TabChordBase] = tsvConverter.TabChord
+    elif dcml_version == 2:
+        tabChordClass = tsvConverter.TabChordV2
+    else:
+        raise ValueError(f'dcml_version {dcml_version} is not in (1, 2)')
+
+    with open(filePath, 'r', encoding='utf-8') as f:
+        tsvReader = csv.reader(f, delimiter='\t', quotechar='"')
+        headIndices, extraIndices = tsvConverter.getHeadingIndices(
+            next(tsvReader), tsvConverter.HEADERS[dcml_version]
+        )
+        for row in tsvReader:
+            tabChord = tabChordClass()
+            tabChord.populateFromRow(row, headIndices, extraIndices)
+            tabChord.representationType = 'DCML'
+
+            beat = tabChord.beat
+            if isinstance(tabChord, tsvConverter.TabChordV2) and tabChord.volta:
+                measure: int | str = (
+                    f'{tabChord.measure}{string.ascii_lowercase[int(tabChord.volta) - 1]}'
+                )
+            else:
+                measure = tabChord.measure
+
+            figureAndKey = tabChord.figureAndKey()
+            if figureAndKey is None:
+                yield _makeRecord(measure, beat, beat - 1, tabChord.timesig,
+                                  tabChord.local_key, NO_CHORD_FIGURE, isNoChord=True)
+            else:
+                figure, localKey = figureAndKey
+                yield _makeRecord(measure, beat, beat - 1, tabChord.timesig,
+                                  localKey, figure,
+                                  sixthMinor=roman.Minor67Default.FLAT,
+                                  seventhMinor=roman.Minor67Default.FLAT,
+                                  realizePitches=realizePitches)
+
+
+# ------------------------------------------------------------------------------
+
+def recordsToScore(
+    records: Iterable[AnalysisRecord],
+    *,
+    sixthMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+    seventhMinor: roman.Minor67Default = roman.Minor67Default.CAUTIONARY,
+) -> stream.Score:
+    '''
+    Build a Score with a single Part from records, such as those of
+    :func:`iterRomanTextRecords` or :func:`iterTsvRecords`.
+
+    Each chord becomes a RomanNumeral (or NoChord) lasting until the next
+    record in the measure or the end of the measure.  Keys and
+    TimeSignatures are inserted where they change.  Pivot chords are
+    attached to the chord before them as `.pivotChord`.  `sixthMinor` and
+    `seventhMinor` are used for every RomanNumeral; TSV analyses
+    use `roman.Minor67Default.FLAT` for both.
+
+    >>> rtString = ('Time Signature: 3/4\\n'
+    ...             + 'm1 g: i b2 V6 b3 i\\n'
+    ...             + 'm2 iv6 b3 V C: IV\\n'
+    ...             + 'm3 V')
+    >>> records = romanText.records.iterRomanTextStringRecords(rtString)
+    >>> s = romanText.records.recordsToScore(records)
+    >>> s.show('text')
+    {0.0} <music21.stream.Part 0x...>
+        {0.0} <music21.stream.Measure 1 offset=0.0>
+            {0.0} <music21.key.Key of g minor>
+            {0.0} <music21.meter.TimeSignature 3/4>
+            {0.0} <music21.roman.RomanNumeral i in g minor>
+            {1.0} <music21.roman.RomanNumeral V6 in g minor>
+            {2.0} <music21.roman.RomanNumeral i in g minor>
+        {3.0} <music21.stream.Measure 2 offset=3.0>
+            {0.0} <music21.roman.RomanNumeral iv6 in g minor>
+            {2.0} <music21.key.Key of C major>
+            {2.0} <music21.roman.RomanNumeral V in g minor>
+        {6.0} <music21.stream.Measure 3 offset=6.0>
+            {0.0} <music21.roman.RomanNumeral V in C major>
+    >>> s[roman.RomanNumeral][4].pivotChord
+    <music21.roman.RomanNumeral IV in C major>
+    >>> s[roman.RomanNumeral].last().quarterLength
+    3.0
+    '''
+    s = stream.Score()
+    p = stream.Part()
+    keyObjects: dict[str, key.Key] = {}
+
+    measures: list[stream.Measure] = []
+    m: stream.Measure | None = None
+    previousHarmony: harmony.Harmony | None = None
+    currentMeasureLabel: int | str | None = None
+    currentTimeSignature: str | None = None
+    currentKey: str | None = None
+    barDuration: common.types.OffsetQL = 4.0
+
+    def finishMeasure():
+        if m is not None and previousHarmony is not None:
+            previousHarmony.quarterLength = barDuration - previousHarmony.offset
+
+    for record in records:
+        if record.measure != currentMeasureLabel or m is None:
+            finishMeasure()
+            previousHarmony = None
+            currentMeasureLabel = record.measure
+            m = stream.Measure(number=record.measure)
+            measures.append(m)
+            if record.timeSignature != currentTimeSignature:
+                ts = meter.TimeSignature(record.timeSignature)
+                m.coreInsert(0.0, ts)
+                currentTimeSignature = record.timeSignature
+                barDuration = ts.barDuration.quarterLength
+
+        if record.key not in keyObjects:
+            keyObjects[record.key] = key.Key(record.key)
+        if record.isPivot:
+            if isinstance(previousHarmony, roman.RomanNumeral) and record.root is not None:
+                previousHarmony.pivotChord = roman.RomanNumeral(
+                    record.figure,
+                    copy.copy(keyObjects[record.key]),
+                    sixthMinor=sixthMinor,
+                    seventhMinor=seventhMinor,
+                )
+            if record.key != currentKey:
+                m.coreInsert(record.offset, copy.deepcopy(keyObjects[record.key]))
+                currentKey = record.key
+            continue
+
+        if record.key != currentKey:
+            m.coreInsert(record.offset, copy.deepcopy(keyObjects[record.key]))
+            currentKey = record.key
+
+        thisHarmony: harmony.Harmony
+        if record.figure == NO_CHORD_FIGURE:
+            thisHarmony = harmony.NoChord()
+        else:
+            try:
+                thisHarmony = roman.RomanNumeral(
+                    record.figure,
+                    copy.copy(keyObjects[record.key]),
+                    sixthMinor=sixthMinor,
+                    seventhMinor=seventhMinor,
+                )
+            except roman.RomanNumeralException:
+                environLocal.warn(f'Could not parse figure {record.figure!r} '
+                                  + f'in measure {record.measure}')
+                continue
+            thisHarmony.writeAsChord = True
+        if previousHarmony is not None:
+            previousHarmony.quarterLength = record.offset - previousHarmony.offset
+        m.coreInsert(record.offset, thisHarmony)
+        previousHarmony = thisHarmony
+    finishMeasure()
+
+    for m in measures:
+        m.coreElementsChanged()
+        p.coreAppend(m)
+    p.coreElementsChanged()
+    s.coreInsert(0.0, p)
+    s.coreElementsChanged()
+    return s
+
+
+# ------------------------------------------------------------------------------
+
+
+class Test(unittest.TestCase):
+
+    def testRomanTextRecordsMatchScore(self):
+        from music21 import corpus
+        for name in ('monteverdi/madrigal.3.1.rntxt',
+                     'monteverdi/madrigal.4.12.rntxt',
+                     'bach/choraleAnalyses/riemenschneider001.rntxt'):
+            path = corpus.getWork(name)
+            expected = []
+            for rn in corpus.parse(name).recurse().getElementsByClass(roman.RomanNumeral):
+                if not rn.lyric:
+                    continue  # carried over from a previous measure
+                m = rn.getContextByClass(stream.Measure)
+                expected.append((m.number, rn.beat, rn.figure, rn.key.tonicPitchNameWithCase,
+                                 rn.root().name, rn.quality))
+                if rn.pivotChord is not None:
+                    pivot = rn.pivotChord
+                    expected.append((m.number, rn.beat, pivot.figure,
+                                     pivot.key.tonicPitchNameWithCase,
+                                     pivot.root().name, pivot.quality))
+            got = [(int(str(r.measure).rstrip(string.ascii_lowercase)),
+                    r.beat, r.figure, r.key, r.root, r.quality)
+                   for r in iterRomanTextRecords(path)
+                   if r.figure != NO_CHORD_FIGURE]
+            self.assertEqual(got, expected, name)
+
+    def testRealizePitches(self):
+        rtString = 'm1 G: I b3 V7/V\nm2 V'
+        plain = list(iterRomanTextStringRecords(rtString))
+        realized = list(iterRomanTextStringRecords(rtString, realizePitches=True))
+        self.assertEqual([r.pitches for r in plain], [(), (), ()])
+        self.assertEqual(realized[1].pitches, ('A4', 'C#5', 'E5', 'G5'))
+        self.assertEqual(realized[0]._replace(pitches=()), plain[0])
+
+    def testNoChordAndFilledMeasures(self):
+        rtString = 'Time Signature: 2/4\nm1 C: I b2 N.C.\nm4 b2 V\nm5 = m1'
+        records = list(iterRomanTextStringRecords(rtString))
+        self.assertEqual([(r.measure, r.beat, r.figure, r.root) for r in records],
+                         [(1, 1.0, 'I', 'C'), (1, 2.0, 'N.C.', None),
+                          (4, 2.0, 'V', 'G'),
+                          (5, 1.0, 'I', 'C'), (5, 2.0, 'N.C.', None)])
+
+    def testTsvRecordsMatchScore(self):
+        directory = common.getSourceFilePath() / 'romanText'
+        for name, version in (('tsvEg_v1.tsv', 1),
+                              ('tsvEg_v2major.tsv', 2),
+                              ('tsvEg_v2minor.tsv', 2)):
+            handler = tsvConverter.TsvHandler(directory / name, dcml_version=version)
+            s = handler.toM21Stream()
+            expected = []
+            for h in s.recurse().getElementsByClass(harmony.Harmony):
+                m = h.getContextByClass(stream.Measure)
+                if isinstance(h, roman.RomanNumeral):
+                    expected.append((m.measureNumberWithSuffix(), h.offset, h.figure,
+                                     h.key.tonicPitchNameWithCase, h.root().name, h.quality))
+                else:
+                    expected.append((m.measureNumberWithSuffix(), h.offset, NO_CHORD_FIGURE))
+            got = []
+            for r in iterTsvRecords(directory / name, version):
+                if r.figure == NO_CHORD_FIGURE:
+                    got.append((str(r.measure), r.offset, r.figure))
+                else:
+                    got.append((str(r.measure), r.offset, r.figure, r.key, r.root, r.quality))
+            self.assertEqual(got, expected, name)
+
+    def testRecordsToScore(self):
+        from music21 import converter
+        rtString = 'Time Signature: 3/4\nm1 F: I b2 V7/IV b3 IV\nm2 V\nm3 d: V b3 i'
+        records = list(iterRomanTextStringRecords(rtString))
+        s = recordsToScore(records)
+        s2 = converter.parse(rtString, format='romanText')
+        rns = list(s[roman.RomanNumeral])
+        rns2 = list(s2[roman.RomanNumeral])
+        self.assertEqual([(rn.figure, rn.key, rn.getOffsetInHierarchy(s), rn.quarterLength)
+                          for rn in rns],
+                         [(rn.figure, rn.key, rn.getOffsetInHierarchy(s2), rn.quarterLength)
+                          for rn in rns2])
+        self.assertEqual(s.highestTime, 9.0)
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
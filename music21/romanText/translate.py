@@ -331,6 +331,35 @@ def _getKeyAndPrefix(rtKeyOrString):
     return k, prefix
 
 
+def _getMinor67Default(rtTagged: rtObjects.RTTagged) -> roman.Minor67Default:
+    '''
+    Return the Minor67Default setting named by a 'Sixth Minor' or
+    'Seventh Minor' tag.
+
+    >>> tag = romanText.rtObjects.RTTagged('Seventh Minor: harmonic')
+    >>> romanText.translate._getMinor67Default(tag)
+    <Minor67Default.SHARP: 3>
+    '''
+    tData = rtTagged.data.lower()
+    if tData == 'flat':
+        tEnum = roman.Minor67Default.FLAT
+    elif tData == 'sharp':
+        tEnum = roman.Minor67Default.SHARP
+    elif tData == 'quality':
+        tEnum = roman.Minor67Default.QUALITY
+    elif tData in ('courtesy', 'cautionary'):
+        tEnum = roman.Minor67Default.CAUTIONARY
+    elif tData == 'harmonic':
+        if rtTagged.isSixthMinor():
+            tEnum = roman.Minor67Default.FLAT
+        else:
+            tEnum = roman.Minor67Default.SHARP
+    else:
+        raise RomanTextTranslateException(
+            f'Cannot parse setting vi or vii parsing: {tData!r}')
+    return tEnum
+
+
 # Cache each of the created keys so that we don't recreate them.
 _rnKeyCache: dict[tuple[str, str], roman.RomanNumeral] = {}
 
@@ -504,24 +533,7 @@ class PartTranslator:
         music21.romanText.translate.RomanTextTranslateException:
             Cannot parse setting vi or vii parsing: 'asdf'
         '''
-        tData = rtTagged.data.lower()
-        if tData == 'flat':
-            tEnum = roman.Minor67Default.FLAT
-        elif tData == 'sharp':
-            tEnum = roman.Minor67Default.SHARP
-        elif tData == 'quality':
-            tEnum = roman.Minor67Default.QUALITY
-        elif tData in ('courtesy', 'cautionary'):
-            tEnum = roman.Minor67Default.CAUTIONARY
-        elif tData == 'harmonic':
-            if rtTagged.isSixthMinor():
-                tEnum = roman.Minor67Default.FLAT
-            else:
-                tEnum = roman.Minor67Default.SHARP
-        else:
-            raise RomanTextTranslateException(
-                f'Cannot parse setting vi or vii parsing: {tData!r}')
-
+        tEnum = _getMinor67Default(rtTagged)
         if rtTagged.isSixthMinor():
             self.sixthMinor = tEnum
         else:
@@ -308,6 +308,56 @@ class TabChordBase(abc.ABC):
                                               minor=False,
                                               direction=direction)
 
+    def figureAndKey(self) -> tuple[str, str] | None:
+        '''
+        Return the music21 figure and the local key (as a pitch name, not
+        a Roman numeral) that :meth:`tabToM21` uses to make a RomanNumeral,
+        or None if the TabChord represents no chord.  Converts to the
+        music21 representation first if necessary.
+
+        >>> tabCd = romanText.tsvConverter.TabChord()
+        >>> tabCd.numeral = 'V'
+        >>> tabCd.figbass = '7'
+        >>> tabCd.relativeroot = 'V'
+        >>> tabCd.global_key = 'F'
+        >>> tabCd.local_key = 'vi'
+        >>> tabCd.representationType = 'DCML'
+        >>> tabCd.figureAndKey()
+        ('V7/V', 'd')
+
+        >>> tabCd.numeral = '@none'
+        >>> tabCd.figureAndKey() is None
+        True
+
+        * New in v9.3.
+        '''
+        if self.representationType == 'DCML':
+            self._changeRepresentation()
+        if self.numeral in ('@none', None):
+            return None
+        if self.dcml_version == 2 and self.chord:
+            combined = self.chord
+        else:
+            # previously this code only included figbass in combined if form
+            # was not falsy, which seems incorrect
+            combined = ''.join(
+                attr for attr in (self.numeral, self.form, self.figbass) if attr
+            )
+
+            if self.relativeroot:  # special case requiring '/'.
+                combined += '/' + self.relativeroot
+        if self.local_key is not None and re.match(
+            r'.*(i*v|v?i+).*', self.local_key, re.IGNORECASE
+        ):
+            # if self.local_key contains a roman numeral, express it
+            # as a pitch, relative to the global key
+            localKeyNonRoman = getLocalKey(self.local_key, self.global_key)
+        else:
+            # otherwise, we assume self.local_key is already a pitch and
+            # pass it through unchanged
+            localKeyNonRoman = self.local_key
+        return combined, localKeyNonRoman
+
     def tabToM21(self) -> harmony.Harmony:
         '''
         Creates and returns a music21.roman.RomanNumeral() object
@@ -327,32 +377,11 @@ class TabChordBase(abc.ABC):
         >>> m21Ch.figure
         'vii'
         '''
-        if self.representationType == 'DCML':
-            self._changeRepresentation()
-        if self.numeral in ('@none', None):
+        figureAndKey = self.figureAndKey()
+        if figureAndKey is None:
             thisEntry: harmony.Harmony = harmony.NoChord()
         else:
-            if self.dcml_version == 2 and self.chord:
-                combined = self.chord
-            else:
-                # previously this code only included figbass in combined if form
-                # was not falsy, which seems incorrect
-                combined = ''.join(
-                    attr for attr in (self.numeral, self.form, self.figbass) if attr
-                )
-
-                if self.relativeroot:  # special case requiring '/'.
-                    combined += '/' + self.relativeroot
-            if self.local_key is not None and re.match(
-                r'.*(i*v|v?i+).*', self.local_key, re.IGNORECASE
-            ):
-                # if self.local_key contains a roman numeral, express it
-                # as a pitch, relative to the global key
-                localKeyNonRoman = getLocalKey(self.local_key, self.global_key)
-            else:
-                # otherwise, we assume self.local_key is already a pitch and
-                # pass it through unchanged
-                localKeyNonRoman = self.local_key
+            combined, localKeyNonRoman = figureAndKey
             thisEntry = roman.RomanNumeral(
                 combined,
                 localKeyNonRoman,
@@ -546,14 +575,9 @@ class TsvHandler:
         attributes) are stored in self._head_indices. Others go in
         self._extra_indices.
         '''
-        self._head_indices = {}
-        self._extra_indices = {}
-        for i, col_name in enumerate(header_row):
-            if col_name in self.heading_names:
-                type_to_coerce_col_to = self.heading_names[col_name]
-                self._head_indices[col_name] = (i, type_to_coerce_col_to)
-            else:
-                self._extra_indices[i] = col_name
+        self._head_indices, self._extra_indices = getHeadingIndices(
+            header_row, self.heading_names
+        )
 
     def _importTsv(self) -> list[list[str]]:
         '''
@@ -927,6 +951,36 @@ class M21toTSV:
 
 # ------------------------------------------------------------------------------
 
+def getHeadingIndices(
+    header_row: list[str],
+    heading_names: t.Mapping[str, t.Any],
+) -> tuple[dict[str, tuple[int, t.Any]], dict[int, str]]:
+    '''
+    Return the column name/column index correspondences for a header row.
+
+    The first dictionary maps the expected column names (those in
+    `heading_names`) to their index and the type to coerce the column to;
+    the second maps the index of every other column to its name.
+
+    >>> headIndices, extraIndices = romanText.tsvConverter.getHeadingIndices(
+    ...     ['mn', 'numeral', 'ottava'], romanText.tsvConverter.HEADERS[2])
+    >>> headIndices
+    {'mn': (0, <class 'int'>), 'numeral': (1, <class 'str'>)}
+    >>> extraIndices
+    {2: 'ottava'}
+
+    * New in v9.3.
+    '''
+    head_indices: dict[str, tuple[int, t.Any]] = {}
+    extra_indices: dict[int, str] = {}
+    for i, col_name in enumerate(header_row):
+        if col_name in heading_names:
+            head_indices[col_name] = (i, heading_names[col_name])
+        else:
+            extra_indices[i] = col_name
+    return head_indices, extra_indices
+
+
 def getForm(rn: roman.RomanNumeral) -> str:
     '''
     Takes a music21.roman.RomanNumeral object and returns the string indicating
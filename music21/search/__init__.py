@@ -17,7 +17,7 @@ For searching a group of scores, see the search functions within
 from __future__ import annotations
 
 __all__ = [
-    'base', 'lyrics', 'segment', 'serial',
+    'base', 'lyrics', 'ngram', 'segment', 'serial', 'workIndex',
 
     'Wildcard', 'WildcardDuration', 'SearchMatch', 'StreamSearcher',
     'streamSearchBase', 'rhythmicSearch', 'noteNameSearch', 'noteNameRhythmicSearch',
@@ -36,7 +36,9 @@ __all__ = [
 
 from music21.search import base
 from music21.search import lyrics
+from music21.search import ngram
 from music21.search import segment
 from music21.search import serial
+from music21.search import workIndex
 
 from music21.search.base import *
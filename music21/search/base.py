@@ -15,11 +15,12 @@ See User's Guide, Chapter 43: Searching in and Among Scores for details.
 '''
 from __future__ import annotations
 
-from collections import namedtuple
-from collections.abc import Callable
+from collections import Counter, deque, namedtuple
+from collections.abc import Callable, Hashable, Sequence
 import copy
 import difflib
 import math
+import typing as t
 import unittest
 
 from more_itertools import windowed
@@ -94,6 +95,172 @@ class SearchMatch(namedtuple('SearchMatch', ['elStart', 'els', 'index', 'iterato
             repr(self.elStart), len(self.els), repr(self.index))
 
 
+# tokens used by the linear-time matching mode.  In a search token,
+# _ANY means "this algorithm has nothing to say" (returns None), _MATCH that the
+# algorithm accepts the element outright (returns True), and _NO_MATCH that it
+# rejects everything (returns False).  _NO_NAME is the stream key of an element
+# without a .name, which is never equal to a search key.
+_ANY = object()
+_MATCH = object()
+_NO_MATCH = object()
+_NO_NAME = object()
+
+
+def _exactMatchStarts(
+    streamTokens: Sequence[tuple],
+    patterns: Sequence[Sequence[tuple | None]],
+) -> list[list[int]]:
+    '''
+    Return, for each pattern, the sorted indices in `streamTokens` where it begins.
+
+    Each stream token is a tuple of keys; each pattern position is a tuple of
+    the same length whose entries are either a key that must be equal or `_ANY`,
+    or None if the position can never match.  The runs of positions without
+    any `_ANY` in them, across all patterns, are found in a single Aho-Corasick
+    pass over the stream; a start matches if every run of its pattern
+    was found at the right distance from it, and if the remaining (partially
+    wildcard) positions agree.
+
+    >>> from music21.search.base import _exactMatchStarts, _ANY
+    >>> stream = [('C',), ('D',), ('E',), ('C',), ('D',), ('F',)]
+    >>> _exactMatchStarts(stream, [[('C',), ('D',)],
+    ...                            [('C',), (_ANY,), ('F',)],
+    ...                            [('D',), ('G',)],
+    ...                            [(_ANY,)]])
+    [[0, 3], [3], [], [0, 1, 2, 3, 4, 5]]
+    '''
+    streamLength = len(streamTokens)
+    segmentIds: dict[tuple, int] = {}
+    segmentUsers: list[list[tuple[int, int]]] = []
+    # for each pattern: its number of segments and its partial positions
+    patternInfo: list[tuple[int, list[tuple[int, tuple]]] | None] = []
+
+    def addSegment(run: list[tuple], patternIndex: int, runStart: int):
+        segment = tuple(run)
+        if segment not in segmentIds:
+            segmentIds[segment] = len(segmentUsers)
+            segmentUsers.append([])
+        segmentUsers[segmentIds[segment]].append((patternIndex, runStart))
+
+    for patternIndex, pattern in enumerate(patterns):
+        if len(pattern) > streamLength or any(req is None for req in pattern):
+            patternInfo.append(None)
+            continue
+        numSegments = 0
+        partials: list[tuple[int, tuple]] = []
+        run: list[tuple] = []
+        runStart = 0
+        for position, req in enumerate(pattern):
+            if t.TYPE_CHECKING:
+                assert req is not None
+            if req and not any(k is _ANY for k in req):
+                if not run:
+                    runStart = position
+                run.append(req)
+                continue
+            if run:
+                addSegment(run, patternIndex, runStart)
+                numSegments += 1
+                run = []
+            if not all(k is _ANY for k in req):
+                partials.append((position, req))
+        if run:
+            addSegment(run, patternIndex, runStart)
+            numSegments += 1
+        patternInfo.append((numSegments, partials))
+
+    # build the Aho-Corasick automaton over the segments.
+    goto: list[dict[Hashable, int]] = [{}]
+    fail: list[int] = [0]
+    output: list[list[int]] = [[]]
+    segmentLengths = []
+    for segment, segmentId in segmentIds.items():
+        state = 0
+        for token in segment:
+            nextState = goto[state].get(token)
+            if nextState is None:
+                nextState = len(goto)
+                goto[state][token] = nextState
+                goto.append({})
+                fail.append(0)
+                output.append([])
+            state = nextState
+        output[state].append(segmentId)
+        segmentLengths.append(len(segment))
+
+    queue = deque(goto[0].values())
+    while queue:
+        state = queue.popleft()
+        for token, nextState in goto[state].items():
+            queue.append(nextState)
+            f = fail[state]
+            while f and token not in goto[f]:
+                f = fail[f]
+            fail[nextState] = goto[f].get(token, 0)
+            output[nextState] = output[nextState] + output[fail[nextState]]
+
+    counts: list[Counter] = [Counter() for _ in patterns]
+    if segmentIds:
+        state = 0
+        for i, token in enumerate(streamTokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for segmentId in output[state]:
+                segmentStart = i - segmentLengths[segmentId] + 1
+                for patternIndex, offset in segmentUsers[segmentId]:
+                    start = segmentStart - offset
+                    if 0 <= start <= streamLength - len(patterns[patternIndex]):
+                        counts[patternIndex][start] += 1
+
+    results: list[list[int]] = []
+    for patternIndex, info in enumerate(patternInfo):
+        if info is None:
+            results.append([])
+            continue
+        numSegments, partials = info
+        if numSegments:
+            candidates = sorted(start for start, count in counts[patternIndex].items()
+                                if count == numSegments)
+        else:
+            candidates = list(range(streamLength - len(patterns[patternIndex]) + 1))
+        if partials:
+            candidates = [
+                start for start in candidates
+                if all(k is _ANY or k == streamKey
+                       for position, req in partials
+                       for k, streamKey in zip(req, streamTokens[start + position]))
+            ]
+        results.append(candidates)
+    return results
+
+
+def _wildcardSearchToken(searchEl):
+    if isinstance(searchEl, Wildcard):
+        return _MATCH
+    return _ANY
+
+
+def _rhythmSearchToken(searchEl):
+    if isinstance(searchEl.duration, WildcardDuration):
+        return _MATCH
+    return searchEl.duration.quarterLength
+
+
+def _rhythmStreamKey(streamEl):
+    return streamEl.duration.quarterLength
+
+
+def _noteNameSearchToken(searchEl):
+    if not hasattr(searchEl, 'name'):
+        return _NO_MATCH
+    return searchEl.name
+
+
+def _noteNameStreamKey(streamEl):
+    return getattr(streamEl, 'name', _NO_NAME)
+
+
 class StreamSearcher:
     '''
     An object that can search through streams for a set of elements
@@ -184,6 +351,31 @@ class StreamSearcher:
     [0.5, 1.0, 1.5]
 
 
+    When every algorithm in `.algorithms` only tests one attribute of each
+    element for equality (as `wildcardAlgorithm`, `rhythmAlgorithm`, and
+    `noteNameAlgorithm` do; see `.tokenizers`) the stream and the search list are
+    turned into sequences of tokens once, and all the matches are found in a
+    single linear pass rather than by comparing every window from scratch.
+    The results are the same either way; set `.useTokens` to False to always
+    compare the elements pairwise.
+
+    Many search lists can be looked for in the same pass with `runMultiple`,
+    which returns a list of results for each:
+
+    >>> ss.algorithms = [search.StreamSearcher.wildcardAlgorithm,
+    ...                  search.StreamSearcher.noteNameAlgorithm]
+    >>> motifs = [[note.Note('C'), note.Note('D')],
+    ...           [note.Note('G'), search.Wildcard(), note.Note('F')],
+    ...           [note.Note('B')]]
+    >>> for results in ss.runMultiple(motifs):
+    ...     [sm.index for sm in results]
+    [0, 6]
+    [3]
+    []
+
+    * Changed in v9.3: added a linear-time mode for exact-equality algorithms,
+      `.useTokens`, `.tokenizers`, and `runMultiple()`.
+
     OMIT_FROM_DOCS
 
     >>> emptyS = stream.Stream()
@@ -208,8 +400,9 @@ class StreamSearcher:
         ] = [StreamSearcher.wildcardAlgorithm]
 
         self.activeIterator: iterator.StreamIterator | None = None
+        self.useTokens: bool = True
 
-    def run(self) -> list[SearchMatch]:
+    def _prepareIterator(self) -> iterator.StreamIterator:
         thisStreamIterator: iterator.StreamIterator
         if isinstance(self.streamSearch, iterator.StreamIterator):
             thisStreamIterator = self.streamSearch
@@ -229,22 +422,62 @@ class StreamSearcher:
                 )
 
         self.activeIterator = thisStreamIterator
+        return thisStreamIterator
 
-        streamIteratorEls: list[m21Base.Music21Object] = list(thisStreamIterator)
-        streamLength = len(streamIteratorEls)
-        searchLength = len(self.searchList)
+    def run(self) -> list[SearchMatch]:
+        return self.runMultiple([self.searchList])[0]
 
-        if searchLength == 0:
-            raise SearchException('the search Stream or list cannot be empty')
+    def runMultiple(
+        self,
+        searchLists: Sequence[Sequence[m21Base.Music21Object]]
+    ) -> list[list[SearchMatch]]:
+        '''
+        Run the search for each of `searchLists` over the stream, returning
+        a list of the SearchMatches for each.  In token mode (see `.useTokens`)
+        all the search lists are found in a single pass over the stream.
+
+        * New in v9.3.
+        '''
+        thisStreamIterator = self._prepareIterator()
+        streamIteratorEls: list[m21Base.Music21Object] = list(thisStreamIterator)
+        for searchList in searchLists:
+            if len(searchList) == 0:
+                raise SearchException('the search Stream or list cannot be empty')
 
-        foundEls: list[SearchMatch] = []
-        if searchLength > streamLength:
-            return foundEls
+        if self.useTokens and all(alg in self.tokenizers for alg in self.algorithms):
+            allStarts = self._tokenStarts(streamIteratorEls, searchLists)
+        else:
+            allStarts = [self._pairwiseStarts(streamIteratorEls, searchList)
+                         for searchList in searchLists]
+
+        allFound: list[list[SearchMatch]] = []
+        for searchList, starts in zip(searchLists, allStarts):
+            searchLength = len(searchList)
+            foundEls: list[SearchMatch] = []
+            for startPosition in starts:
+                streamEls = tuple(streamIteratorEls[startPosition:startPosition + searchLength])
+                foundEls.append(
+                    SearchMatch(streamEls[0], streamEls, startPosition, self.activeIterator))
+            allFound.append(foundEls)
+        return allFound
+
+    def _pairwiseStarts(
+        self,
+        streamIteratorEls: list[m21Base.Music21Object],
+        searchList: Sequence[m21Base.Music21Object],
+    ) -> list[int]:
+        '''
+        Compare each window of the stream to `searchList` element by element,
+        returning the start positions that match.
+        '''
+        searchLength = len(searchList)
+        starts: list[int] = []
+        if searchLength > len(streamIteratorEls):
+            return starts
 
         for startPosition, streamEls in enumerate(windowed(streamIteratorEls, searchLength)):
             result = None
             for j in range(searchLength):
-                # TODO: implement longest prefix that is also a suffix algorithm
                 streamEl = streamEls[j]
                 if streamEl is None:  # pragma: no cover
                     # I don't think this should ever happen, but mypy is convinced
@@ -252,7 +485,7 @@ class StreamSearcher:
                     result = False
                     break
 
-                searchEl = self.searchList[j]
+                searchEl = searchList[j]
                 for thisAlgorithm in self.algorithms:
                     result = thisAlgorithm(self, streamEl, searchEl)
                     if result is not None:  # break on True or False
@@ -263,10 +496,53 @@ class StreamSearcher:
                     result = None
 
             if result is not False:
-                sm = SearchMatch(streamEls[0], streamEls, startPosition, self.activeIterator)
-                foundEls.append(sm)
+                starts.append(startPosition)
 
-        return foundEls
+        return starts
+
+    def _tokenStarts(
+        self,
+        streamIteratorEls: list[m21Base.Music21Object],
+        searchLists: Sequence[Sequence[m21Base.Music21Object]],
+    ) -> list[list[int]]:
+        '''
+        Encode the stream and each search list as tokens using `.tokenizers`
+        and find all the start positions in one pass.
+        '''
+        tokenizers = [self.tokenizers[alg] for alg in self.algorithms]
+        streamKeyFunctions = [streamKey for unused, streamKey in tokenizers
+                              if streamKey is not None]
+        slots: list[int | None] = []
+        for unused, streamKey in tokenizers:
+            if streamKey is None:
+                slots.append(None)
+            else:
+                slots.append(len(slots) - slots.count(None))
+
+        streamTokens = [tuple(streamKey(el) for streamKey in streamKeyFunctions)
+                        for el in streamIteratorEls]
+
+        patterns: list[list[tuple | None]] = []
+        for searchList in searchLists:
+            pattern: list[tuple | None] = []
+            for searchEl in searchList:
+                req: list[t.Any] | None = [_ANY] * len(streamKeyFunctions)
+                for (searchToken, unused), slot in zip(tokenizers, slots):
+                    token = searchToken(searchEl)
+                    if token is _MATCH:
+                        break
+                    if token is _ANY:
+                        continue
+                    if token is _NO_MATCH or slot is None:
+                        req = None
+                        break
+                    if t.TYPE_CHECKING:
+                        assert req is not None
+                    req[slot] = token
+                pattern.append(tuple(req) if req is not None else None)
+            patterns.append(pattern)
+
+        return _exactMatchStarts(streamTokens, patterns)
 
     def wildcardAlgorithm(self, streamEl: m21Base.Music21Object, searchEl: m21Base.Music21Object):
         '''
@@ -293,6 +569,17 @@ class StreamSearcher:
             return False
         return None
 
+    # For each algorithm that can be run in token mode, a pair of functions:
+    # the first turns a search element into a key that stream elements must
+    # equal, or into _ANY, _MATCH, or _NO_MATCH if the algorithm would return
+    # None, True, or False for any stream element; the second (None if the
+    # algorithm never needs a key) gives the key of a stream element.
+    tokenizers: dict[Callable, tuple[Callable, Callable | None]] = {
+        wildcardAlgorithm: (_wildcardSearchToken, None),
+        rhythmAlgorithm: (_rhythmSearchToken, _rhythmStreamKey),
+        noteNameAlgorithm: (_noteNameSearchToken, _noteNameStreamKey),
+    }
+
 
 def streamSearchBase(thisStreamOrIterator, searchList, algorithm=None):
     '''
@@ -331,6 +618,27 @@ def streamSearchBase(thisStreamOrIterator, searchList, algorithm=None):
     return foundEls
 
 
+def _tokenSearch(thisStreamOrIterator, searchList, searchTokenFunction, streamKeyFunction):
+    '''
+    Like streamSearchBase, but for searches that can be expressed as
+    equality of keys: `streamKeyFunction` gives a tuple of keys for each stream
+    element, and `searchTokenFunction` gives, for each search element, a tuple of
+    keys (or `_ANY` for a key that does not matter) or None if the element
+    can never match.  All matches are found in one linear pass.
+    '''
+    if 'StreamIterator' in thisStreamOrIterator.classes:
+        thisStreamIterator = thisStreamOrIterator
+    else:
+        thisStreamIterator = thisStreamOrIterator.recurse()
+
+    if len(searchList) == 0:
+        raise SearchException('the search Stream or list cannot be empty')
+
+    streamTokens = [streamKeyFunction(el) for el in thisStreamIterator]
+    pattern = [searchTokenFunction(el) for el in searchList]
+    return _exactMatchStarts(streamTokens, [pattern])[0]
+
+
 def rhythmicSearch(thisStreamOrIterator, searchList):
     '''
     Takes two streams -- the first is the stream to be searched and the second
@@ -425,14 +733,15 @@ def rhythmicSearch(thisStreamOrIterator, searchList):
     >>> float(len(term1results)) / len(term2results)
     8.0
     '''
-    def rhythmAlgorithm(streamEl, searchEl):
+    def rhythmToken(searchEl):
         if 'WildcardDuration' in searchEl.duration.classes:
-            return True
-        if searchEl.duration.quarterLength != streamEl.duration.quarterLength:
-            return False
-        return True
+            return (_ANY,)
+        return (searchEl.duration.quarterLength,)
 
-    return streamSearchBase(thisStreamOrIterator, searchList, algorithm=rhythmAlgorithm)
+    def rhythmKey(streamEl):
+        return (streamEl.duration.quarterLength,)
+
+    return _tokenSearch(thisStreamOrIterator, searchList, rhythmToken, rhythmKey)
 
 
 def noteNameSearch(thisStreamOrIterator, searchList):
@@ -448,19 +757,17 @@ def noteNameSearch(thisStreamOrIterator, searchList):
     >>> search.noteNameSearch(thisStreamIter, searchList2)
     [0, 3, 7, 11]
     '''
-    def noteNameAlgorithm(streamEl, searchEl):
+    def noteNameToken(searchEl):
         if 'Wildcard' in searchEl.classes:
-            return True
+            return (_ANY,)
         if not hasattr(searchEl, 'name'):
-            return False
-        if not hasattr(streamEl, 'name'):
-            return False
+            return None
+        return (searchEl.name,)
 
-        if searchEl.name != streamEl.name:
-            return False
-        return True
+    def noteNameKey(streamEl):
+        return (_noteNameStreamKey(streamEl),)
 
-    return streamSearchBase(thisStreamOrIterator, searchList, algorithm=noteNameAlgorithm)
+    return _tokenSearch(thisStreamOrIterator, searchList, noteNameToken, noteNameKey)
 
 
 def noteNameRhythmicSearch(thisStreamOrIterator, searchList):
@@ -479,25 +786,20 @@ def noteNameRhythmicSearch(thisStreamOrIterator, searchList):
     >>> search.noteNameRhythmicSearch(thisStreamIter, searchList)
     [0, 3, 7]
     '''
-    def noteNameRhythmAlgorithm(streamEl, searchEl):
+    def noteNameRhythmToken(searchEl):
         if 'Wildcard' in searchEl.classes:
-            return True
+            return (_ANY, _ANY)
         if not hasattr(searchEl, 'name'):
-            return False
-        if not hasattr(streamEl, 'name'):
-            return False
-
-        if searchEl.name != streamEl.name:
-            return False
-
+            return None
         if 'WildcardDuration' in searchEl.duration.classes:
-            return True
-        if searchEl.duration.quarterLength != streamEl.duration.quarterLength:
-            return False
+            return (searchEl.name, _ANY)
+        return (searchEl.name, searchEl.duration.quarterLength)
 
-        return True
+    def noteNameRhythmKey(streamEl):
+        return (_noteNameStreamKey(streamEl), streamEl.duration.quarterLength)
 
-    return streamSearchBase(thisStreamOrIterator, searchList, algorithm=noteNameRhythmAlgorithm)
+    return _tokenSearch(thisStreamOrIterator, searchList,
+                        noteNameRhythmToken, noteNameRhythmKey)
 
 
 def approximateNoteSearch(thisStream, otherStreams):
@@ -1136,6 +1438,80 @@ class Test(unittest.TestCase):
         from music21.test.commonTest import testCopyAll
         testCopyAll(self, globals())
 
+    def _randomMotifs(self, els, number=60):
+        import random
+        rng = random.Random(41)
+        motifs = []
+        for _ in range(number):
+            length = rng.randint(1, 6)
+            start = rng.randint(0, len(els) - length)
+            motif = []
+            for el in els[start:start + length]:
+                choice = rng.random()
+                if choice < 0.15:
+                    motif.append(Wildcard())
+                    continue
+                el = copy.deepcopy(el)
+                if choice < 0.3:
+                    el.duration = WildcardDuration()
+                elif choice < 0.4 and isinstance(el, note.Note):
+                    el.pitch.transpose(rng.choice([-2, 1]), inPlace=True)
+                motif.append(el)
+            motifs.append(motif)
+        return motifs
+
+    def testTokenModeMatchesPairwise(self):
+        from music21 import corpus
+        part = corpus.parse('bwv66.6').parts[1]
+        els = list(part.recurse().notesAndRests)
+        motifs = self._randomMotifs(els)
+
+        def summary(results):
+            return [(sm.index, sm.els) for sm in results]
+
+        for algorithms in ([StreamSearcher.wildcardAlgorithm],
+                           [StreamSearcher.wildcardAlgorithm, StreamSearcher.rhythmAlgorithm],
+                           [StreamSearcher.noteNameAlgorithm, StreamSearcher.rhythmAlgorithm],
+                           [StreamSearcher.wildcardAlgorithm,
+                            StreamSearcher.rhythmAlgorithm,
+                            StreamSearcher.noteNameAlgorithm]):
+            ss = StreamSearcher(part, motifs[0])
+            ss.recurse = True
+            ss.filterNotesAndRests = True
+            ss.algorithms = algorithms
+            tokenResults = [summary(r) for r in ss.runMultiple(motifs)]
+            ss.useTokens = False
+            pairwiseResults = [summary(r) for r in ss.runMultiple(motifs)]
+            self.assertEqual(tokenResults, pairwiseResults)
+            self.assertTrue(any(len(r) > 1 for r in tokenResults))
+            for motif, results in zip(motifs, tokenResults):
+                ss.searchList = motif
+                ss.useTokens = True
+                self.assertEqual(summary(ss.run()), results)
+
+    def testTokenSearchFunctions(self):
+        from music21 import corpus
+        part = corpus.parse('bwv66.6').parts[0]
+        streamIter = part.recurse().notesAndRests
+        els = list(streamIter)
+
+        def noteNameRhythm(streamEl, searchEl):
+            if 'Wildcard' in searchEl.classes:
+                return True
+            if not hasattr(searchEl, 'name') or not hasattr(streamEl, 'name'):
+                return False
+            if searchEl.name != streamEl.name:
+                return False
+            if 'WildcardDuration' in searchEl.duration.classes:
+                return True
+            return searchEl.duration.quarterLength == streamEl.duration.quarterLength
+
+        for motif in self._randomMotifs(els):
+            self.assertEqual(noteNameRhythmicSearch(streamIter, motif),
+                             streamSearchBase(streamIter, motif, algorithm=noteNameRhythm))
+        with self.assertRaises(SearchException):
+            noteNameSearch(streamIter, [])
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
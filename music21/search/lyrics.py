@@ -13,6 +13,7 @@ Classes for searching for Lyric objects.
 '''
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from collections import namedtuple, OrderedDict
 import re
 import typing as t
@@ -20,6 +21,7 @@ import unittest
 
 from music21.exceptions21 import Music21Exception
 from music21 import note
+from music21.search import workIndex
 # from music21 import common
 
 if t.TYPE_CHECKING:
@@ -29,6 +31,20 @@ LINEBREAK_TOKEN = ' // '
 
 _attrList = 'el start end measure lyric text identifier absoluteStart absoluteEnd'.split()
 
+
+def _spanIndices(starts: list[int], ends: list[int], posStart: int, posEnd: int):
+    '''
+    Given the (increasing) absolute starts and ends of indexed lyrics, return
+    the slice bounds of the lyrics that overlap posStart to posEnd (inclusive).
+
+    >>> search.lyrics._spanIndices([0, 3, 6, 9], [2, 5, 9, 11], 4, 7)
+    (1, 3)
+    >>> search.lyrics._spanIndices([0, 3, 6, 9], [2, 5, 9, 11], 12, 20)
+    (4, 4)
+    '''
+    return bisect_left(ends, posStart), bisect_right(starts, posEnd)
+
+
 class IndexedLyric(namedtuple(
     'IndexedLyric',
     ['el', 'start', 'end', 'measure', 'lyric', 'text',
@@ -142,6 +158,11 @@ class LyricSearcher:
 
         self._indexText: str | None = None
         self._indexTuples: list[IndexedLyric] = []
+        # absolute starts and ends of _indexTuples, and the (start, end) slice
+        # of _indexTuples for each identifier, for bisecting.
+        self._absoluteStarts: list[int] = []
+        self._absoluteEnds: list[int] = []
+        self._identifierBlocks: list[tuple[int, int]] = []
 
     @property
     def indexText(self) -> str:
@@ -264,6 +285,13 @@ class LyricSearcher:
             index.append(newIndex)
 
         self._indexTuples = index
+        self._absoluteStarts = [i.absoluteStart for i in index]
+        self._absoluteEnds = [i.absoluteEnd for i in index]
+        self._identifierBlocks = []
+        blockStart = 0
+        for oneIdentifierIndex in indexByIdentifier.values():
+            self._identifierBlocks.append((blockStart, blockStart + len(oneIdentifierIndex)))
+            blockStart += len(oneIdentifierIndex)
         iText = LINEBREAK_TOKEN.join(iTextByIdentifier.values())
         self._indexText = iText
         return index
@@ -334,26 +362,42 @@ class LyricSearcher:
 
         Raises exception if no IndexedLyric for that position.
 
-        Runs in O(n) time on number of lyrics. Would not be
-        hard to do in O(log(n)) for very large lyrics
+        Within each identifier the lyrics are in order, so this
+        bisects each identifier's lyrics: O(log(n)) for a single verse.
+
+        >>> p0 = corpus.parse('luca/gloria').parts[0]
+        >>> ls = search.lyrics.LyricSearcher(p0)
+        >>> ls.indexText[6:16]
+        'terra pax '
+        >>> ls._findObjInIndexByPos(7)
+        IndexedLyric(el=<music21.note.Note F>, start=6, end=9, measure=2,
+            lyric=<music21.note.Lyric number=1 syllabic=begin text='ter'>, text='ter',
+            identifier=1)
+        >>> ls._findObjInIndexByPos(10).text
+        'ra'
+
+        * Changed in v9.3: runs in logarithmic rather than linear time.
         '''
-        for i in self._indexTuples:
-            if i.start <= pos <= i.end:
-                return i
+        index = self._indexTuples
+        for blockStart, blockEnd in self._identifierBlocks:
+            # relative ends are increasing within an identifier.
+            i = bisect_left(index, pos, blockStart, blockEnd, key=lambda il: il.end)
+            if i < blockEnd and index[i].start <= pos:
+                return index[i]
 
         raise LyricSearcherException(f'Could not find position {pos} in text')
 
     def _findObjsInIndexByPos(self, posStart, posEnd=999999) -> list[IndexedLyric]:
         '''
         Finds a list of objects in ._indexTuples by search position (inclusive)
+
+        * Changed in v9.3: bisects the absolute positions rather than scanning
+          every lyric.
         '''
-        indices = []
-        for i in self._indexTuples:
-            if i.absoluteEnd >= posStart and i.absoluteStart <= posEnd:
-                indices.append(i)
-        if not indices:
+        lo, hi = _spanIndices(self._absoluteStarts, self._absoluteEnds, posStart, posEnd)
+        if lo >= hi:
             raise LyricSearcherException(f'Could not find position {posStart} in text')
-        return indices
+        return self._indexTuples[lo:hi]
 
     # def _findLineBreakBeforePos(self, pos: int):
     #     '''
@@ -398,6 +442,204 @@ class LyricSearcher:
         return locations
 
 
+class LyricIndexMatch(t.NamedTuple):
+    '''
+    A match found by :meth:`LyricIndex.search`: the work, the measure
+    numbers of the first and last matching lyrics, the text that matched,
+    the identifier of the first matching lyric, and the offsets (from the start
+    of the indexed stream) of the first and last matching elements.
+    '''
+    work: str
+    mStart: int | None
+    mEnd: int | None
+    matchText: str
+    identifier: str | int
+    offsetStart: float | None
+    offsetEnd: float | None
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def _indexedWork(s) -> dict[str, t.Any]:
+    '''
+    Index the lyrics of a stream with LyricSearcher and keep only what can be
+    stored: the text and, for each lyric, its absolute start and end, its
+    measure number, identifier, and the offset of its element.
+    '''
+    ls = LyricSearcher(s)
+    indexTuples = ls.index()
+    offsets: list[float | None] = []
+    for il in indexTuples:
+        try:
+            offsets.append(float(il.el.getOffsetInHierarchy(s)))
+        except Music21Exception:
+            offsets.append(None)
+    return {
+        'text': ls.indexText,
+        'starts': [il.absoluteStart for il in indexTuples],
+        'ends': [il.absoluteEnd for il in indexTuples],
+        'measures': [il.measure for il in indexTuples],
+        'identifiers': [il.identifier for il in indexTuples],
+        'offsets': offsets,
+    }
+
+
+class LyricIndex(workIndex.WorkIndex):
+    '''
+    An index of the lyrics of many works, which can be searched with a string,
+    a regular expression, or a sequence of words without parsing or
+    re-indexing any of the works.
+
+    For each work this keeps the text that :class:`LyricSearcher` would
+    search and the position, measure number, identifier, and offset of each
+    lyric in it; positions in the text are mapped back to lyrics by
+    bisection.  An inverted index of the (lowercase) words in each work lets
+    :meth:`searchWords` skip works that do not contain them.
+
+    >>> li = search.lyrics.LyricIndex()
+    >>> li.addStream(corpus.parse('luca/gloria'), 'gloria')
+    >>> li
+    <music21.search.lyrics.LyricIndex works=1>
+    >>> li.search('pax')
+    [LyricIndexMatch(work='gloria', mStart=3, mEnd=3, matchText='pax', identifier=1,
+        offsetStart=6.5, offsetEnd=6.5)]
+    >>> li.searchWords('agnus dei')
+    [LyricIndexMatch(work='gloria', mStart=49, mEnd=51, matchText='Agnus Dei',
+         identifier=1, offsetStart=124.5, offsetEnd=127.5)]
+
+    Works can be added from file paths (in parallel), updated, removed,
+    saved, and loaded; see :meth:`~music21.search.workIndex.WorkIndex.addFilePaths`,
+    :meth:`~music21.search.workIndex.WorkIndex.removeWork`,
+    :meth:`~music21.search.workIndex.WorkIndex.save`, and
+    :meth:`~music21.search.workIndex.WorkIndex.load`.  Files that have not
+    changed are not indexed again:
+
+    >>> li.addFilePaths(['luca/gloria', 'monteverdi/madrigal.3.1'], runMulticore=False)
+    ['luca/gloria', 'monteverdi/madrigal.3.1']
+    >>> li.addFilePaths(['luca/gloria'], runMulticore=False)
+    []
+    >>> fp = li.save()
+    >>> li2 = search.lyrics.LyricIndex.load(fp)
+    >>> li2.search('pax') == li.search('pax')
+    True
+    >>> fp.unlink()
+
+    * New in v9.3.
+    '''
+    exceptionClass = LyricSearcherException
+
+    def __init__(self) -> None:
+        super().__init__()
+        # lowercase word -> ids of the works containing it
+        self._words: dict[str, set[str]] = {}
+
+    def indexFunction(self):
+        return _indexedWork
+
+    def _addIndexed(self, work: str, data: dict[str, t.Any], *,
+                    path: str | None = None, mtime: float | None = None):
+        data['path'] = path
+        data['mtime'] = mtime
+        self._works[work] = data
+        for word in set(_WORD_RE.findall(data['text'].lower())):
+            self._words.setdefault(word, set()).add(work)
+
+    def addStream(self, s, work: str, *, path: str | None = None):
+        '''
+        Index the lyrics of `s` under the id `work`, replacing anything
+        already indexed under that id.
+        '''
+        if work in self._works:
+            self.removeWork(work)
+        self._addIndexed(work, _indexedWork(s), path=path)
+
+    def _removeIndexed(self, work: str, info: dict[str, t.Any]):
+        for word in set(_WORD_RE.findall(info['text'].lower())):
+            works = self._words.get(word)
+            if works is not None:
+                works.discard(work)
+                if not works:
+                    del self._words[word]
+
+    def _saveWork(self, work: str) -> dict[str, t.Any]:
+        return self._works[work]
+
+    def _loadWork(self, work: str, info: dict[str, t.Any]):
+        self._addIndexed(work, info, path=info['path'], mtime=info['mtime'])
+
+    def _searchWork(self, work: str, r: re.Pattern) -> list[LyricIndexMatch]:
+        data = self._works[work]
+        starts = data['starts']
+        ends = data['ends']
+        out = []
+        for m in r.finditer(data['text']):
+            absoluteFoundPos, absoluteEndPos = m.span()
+            lo, hi = _spanIndices(starts, ends, absoluteFoundPos, absoluteEndPos - 1)
+            if lo >= hi:
+                continue
+            last = hi - 1
+            out.append(LyricIndexMatch(work,
+                                       data['measures'][lo],
+                                       data['measures'][last],
+                                       m.group(0),
+                                       data['identifiers'][lo],
+                                       data['offsets'][lo],
+                                       data['offsets'][last]))
+        return out
+
+    def search(self, textOrRe, works=None) -> list[LyricIndexMatch]:
+        '''
+        Return a LyricIndexMatch for each place where `textOrRe` (a string,
+        searched for literally, or a compiled regular expression) matches the
+        lyrics of the indexed works (or of the ids in `works`).
+        '''
+        if isinstance(textOrRe, str):
+            r = re.compile(re.escape(textOrRe))
+        elif hasattr(textOrRe, 'finditer'):
+            r = textOrRe
+        else:
+            raise LyricSearcherException(
+                f'{textOrRe} is not a string or RE with the finditer() function')
+        out = []
+        for work in (works if works is not None else self._works):
+            out.extend(self._searchWork(work, r))
+        return out
+
+    def searchWords(self, words: str | list[str]) -> list[LyricIndexMatch]:
+        '''
+        Find a sequence of whole words, ignoring case and any punctuation or
+        line breaks between them.  Only works that contain every word
+        (according to the inverted word index) are searched.
+
+        >>> li = search.lyrics.LyricIndex()
+        >>> li.addStream(corpus.parse('luca/gloria'), 'gloria')
+        >>> [m.matchText for m in li.searchWords(['filius', 'patris'])]
+        ['Filius Patris']
+        >>> li.searchWords('filius nobis')
+        []
+        '''
+        if isinstance(words, str):
+            words = _WORD_RE.findall(words)
+        words = [w.lower() for w in words]
+        if not words:
+            raise LyricSearcherException('no words to search for')
+
+        candidateWorks: set[str] | None = None
+        for word in words:
+            worksWithWord = self._words.get(word, set())
+            candidateWorks = (set(worksWithWord) if candidateWorks is None
+                              else candidateWorks & worksWithWord)
+            if not candidateWorks:
+                return []
+        if t.TYPE_CHECKING:
+            assert candidateWorks is not None
+
+        r = re.compile(r'\b' + r'\W+'.join(re.escape(w) for w in words) + r'\b',
+                       re.IGNORECASE)
+        return self.search(r, works=[w for w in self._works if w in candidateWorks])
+
+
 # -----------------------------------------------------------------------------
 
 
@@ -568,10 +810,61 @@ class Test(unittest.TestCase):
         self.assertEqual(match[0].mEnd, 2)
         self.assertEqual(match[0].identifier, 1)
 
+    def testBisectedPositionsMatchScan(self):
+        from music21 import corpus
+        ls = LyricSearcher(corpus.parse('luca/gloria'))
+        text = ls.indexText
+        for pos in range(len(text) + 2):
+            scanned = [i for i in ls.indexTuples if i.start <= pos <= i.end]
+            if scanned:
+                self.assertIs(ls._findObjInIndexByPos(pos), scanned[0])
+            else:
+                with self.assertRaises(LyricSearcherException):
+                    ls._findObjInIndexByPos(pos)
+            for posEnd in (pos, pos + 7):
+                scanned = [i for i in ls.indexTuples
+                           if i.absoluteEnd >= pos and i.absoluteStart <= posEnd]
+                if scanned:
+                    self.assertEqual(ls._findObjsInIndexByPos(pos, posEnd), scanned)
+
+    def testLyricIndexMatchesLyricSearcher(self):
+        from music21 import corpus
+        works = ['luca/gloria', 'monteverdi/madrigal.3.1', 'bach/bwv66.6']
+        li = LyricIndex()
+        li.addFilePaths(works)
+        self.assertEqual(li.works, works)
+        queries = ['pax', 'De', re.compile(r'[aeiou]s\b'), re.compile(r'\w+ \w+', re.IGNORECASE)]
+        for query in queries:
+            expected = []
+            for fp, work in zip(works, li.works):
+                for sm in LyricSearcher(corpus.parse(fp)).search(query):
+                    expected.append((work, sm.mStart, sm.mEnd, sm.matchText, sm.identifier))
+            self.assertEqual([(m.work, m.mStart, m.mEnd, m.matchText, m.identifier)
+                              for m in li.search(query)],
+                             expected)
+
+        self.assertEqual({m.work for m in li.searchWords('ma se')}, {'monteverdi/madrigal.3.1'})
+        self.assertEqual(li._words['in'], {'luca/gloria', 'monteverdi/madrigal.3.1'})
+        li.removeWork('luca/gloria')
+        self.assertEqual(li.searchWords('agnus dei'), [])
+        self.assertNotIn('luca/gloria', {w for ws in li._words.values() for w in ws})
+        with self.assertRaises(LyricSearcherException):
+            li.removeWork('luca/gloria')
+
+    def testLyricIndexSameFileNames(self):
+        from music21 import common
+        # two different works with the same file name must not replace each other.
+        beethoven = common.getCorpusFilePath() / 'beethoven'
+        fps = sorted(str(fp) for fp in beethoven.glob('*/movement1.mxl'))[:2]
+        li = LyricIndex()
+        self.assertEqual(len(li.addFilePaths(fps, runMulticore=False)), 2)
+        self.assertEqual(len(li), 2)
+        self.assertEqual(li.addFilePaths(fps, runMulticore=False), [])
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
-_DOC_ORDER = [LyricSearcher]
+_DOC_ORDER = [LyricSearcher, LyricIndex]
 
 
 if __name__ == '__main__':
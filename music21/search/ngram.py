@@ -0,0 +1,611 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         search/ngram.py
+# Purpose:      music21 inverted index of melodic n-grams for corpus search
+#
+# Authors:      Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+An inverted index of melodic n-grams for finding a motif across many scores
+without parsing and scanning each one.
+
+Each part of each indexed work is encoded with
+:func:`~music21.search.translateIntervalsAndSpeed` (or, optionally,
+:func:`~music21.search.translateDiatonicStreamToString`), and every
+substring of length `n` of that encoding is mapped to the places where it occurs.
+A query is encoded the same way; the postings of the n-grams covering it
+are intersected, so only the locations that agree with the whole query are
+ever looked at.  Those candidate locations can then be verified against the
+real streams, optionally with the same algorithms that
+:class:`~music21.search.StreamSearcher` uses.
+
+The encodings, not the streams, are what get stored, so an index can be saved
+and reloaded quickly, and works can be added, re-indexed, or removed
+one at a time.
+
+>>> bach = corpus.parse('bwv66.6')
+>>> index = search.ngram.NGramIndex()
+>>> index.addStream(bach, 'bwv66.6')
+>>> index
+<music21.search.ngram.NGramIndex n=4 encoding='intervals' works=1>
+
+>>> query = converter.parse('tinynotation: 4/4 e4 d c e')
+>>> index.search(query, streams={'bwv66.6': bach})
+[NGramPosting(work='bwv66.6', part=0, measure=2, offset=5.0)]
+'''
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from functools import partial
+import pathlib
+import typing as t
+import unittest
+
+from music21 import base as m21Base
+from music21 import chord
+from music21 import common
+from music21 import converter
+from music21 import corpus
+from music21 import environment
+from music21 import note
+from music21 import stream
+from music21.search import base as searchBase
+from music21.search import workIndex
+
+environLocal = environment.Environment('search.ngram')
+
+ENCODINGS: dict[str, Callable[..., t.Any]] = {
+    'intervals': searchBase.translateIntervalsAndSpeed,
+    'diatonic': searchBase.translateDiatonicStreamToString,
+}
+
+_ENCODED_CLASSES = (note.Note, chord.Chord, note.Rest)
+
+
+class NGramPosting(t.NamedTuple):
+    '''
+    One place in the index: the work id, the index of the part in the work,
+    and the measure number and offset (from the start of the part) of the
+    first element of the match.
+    '''
+    work: str
+    part: int
+    measure: int | None
+    offset: float
+
+
+class _EncodedPart(t.NamedTuple):
+    work: str
+    part: int
+    code: str
+    measures: list[int | None]
+    offsets: list[float]
+
+
+def codedElements(inputStreamOrList: Iterable[m21Base.Music21Object]) -> list[note.GeneralNote]:
+    '''
+    Return the elements of `inputStreamOrList` (Notes, Chords, and Rests)
+    that get one character each in the search encodings: all but the
+    first of a run of rests and all but the first of a tied group are skipped.
+
+    >>> s = converter.parse("tinynotation: 3/4 c4 d8~ d16 r16 r8 F8 a'8 b-4")
+    >>> search.ngram.codedElements(s.recurse().notesAndRests)
+    [<music21.note.Note C>, <music21.note.Note D>, <music21.note.Rest 16th>,
+     <music21.note.Note F>, <music21.note.Note A>, <music21.note.Note B->]
+    >>> len(search.translateIntervalsAndSpeed(s.flatten().notesAndRests.stream()))
+    6
+    '''
+    kept: list[note.GeneralNote] = []
+    previousRest = False
+    previousTie = False
+    for n in inputStreamOrList:
+        if not isinstance(n, _ENCODED_CLASSES):
+            continue
+        if n.isRest:
+            if not previousRest:
+                kept.append(n)
+            previousRest = True
+            continue
+        previousRest = False
+        if previousTie:
+            if n.tie is None or n.tie.type == 'stop':
+                previousTie = False
+            continue
+        if n.tie is not None:
+            previousTie = True
+        kept.append(n)
+    return kept
+
+
+def _partElements(part: stream.Stream) -> tuple[stream.Stream, list[note.GeneralNote]]:
+    flat = part.flatten()
+    return flat, codedElements(flat.getElementsByClass(_ENCODED_CLASSES))
+
+
+def _partsOf(score: stream.Stream) -> list[stream.Stream]:
+    parts: list[stream.Stream] = []
+    if isinstance(score, stream.Score):
+        parts = list(score.parts)
+    if not parts:
+        parts = [score]
+    return parts
+
+
+def encodeScore(
+    score: stream.Stream,
+    encoding: str = 'intervals'
+) -> list[tuple[str, list[int | None], list[float]]]:
+    '''
+    Encode each part of `score` with the search encoding named `encoding`
+    ('intervals' or 'diatonic'), returning for each part a tuple of the
+    encoded string, the measure number of each character, and the offset
+    from the start of the part of each character.
+
+    >>> s = converter.parse("tinynotation: 3/4 c4 d8~ d16 r16 F8 F#8 F8 a'8 b-2")
+    >>> code, measures, offsets = search.ngram.encodeScore(s)[0]
+    >>> code == search.translateIntervalsAndSpeed(s.flatten().notesAndRests.stream())
+    True
+    >>> measures
+    [1, 1, 1, 1, 1, 2, 2, 2]
+    >>> offsets
+    [0.0, 1.0, 1.75, 2.0, 2.5, 3.0, 3.5, 4.0]
+
+    A score without parts is treated as a single part:
+
+    >>> len(search.ngram.encodeScore(s, 'diatonic'))
+    1
+    '''
+    try:
+        translate = ENCODINGS[encoding]
+    except KeyError:
+        raise searchBase.SearchException(
+            f'encoding must be one of {sorted(ENCODINGS)}, not {encoding!r}')
+
+    out = []
+    for part in _partsOf(score):
+        flat = part.flatten()
+        els = list(flat.getElementsByClass(_ENCODED_CLASSES))
+        code = translate(els)
+        kept = codedElements(els)
+        measures = [n.measureNumber for n in kept]
+        offsets = [float(flat.elementOffset(n)) for n in kept]
+        out.append((code, measures, offsets))
+    return out
+
+
+class NGramIndex(workIndex.WorkIndex):
+    '''
+    An inverted index mapping each n-gram of a melodic encoding to the
+    places in a set of works where it appears.
+
+    `n` is the length of the n-grams; `encoding` is 'intervals'
+    (chromatic interval from the previous note and faster/slower/same rhythm,
+    see :func:`~music21.search.translateIntervalsAndSpeed`) or 'diatonic'
+    (step and relative rhythm, see
+    :func:`~music21.search.translateDiatonicStreamToString`).
+
+    >>> index = search.ngram.NGramIndex(n=3, encoding='diatonic')
+    >>> index.addStream(converter.parse('tinynotation: 4/4 c4 d e f g2 e'), 'scale')
+    >>> index.addStream(converter.parse('tinynotation: 4/4 g4 e d c e2 g'), 'descent')
+    >>> index.works
+    ['scale', 'descent']
+    >>> 'scale' in index
+    True
+
+    Candidates come straight from the index, without any streams:
+
+    >>> index.candidates(converter.parse('tinynotation: 4/4 e4 f g2'))
+    [NGramPosting(work='scale', part=0, measure=1, offset=2.0)]
+
+    Works can be removed or replaced one at a time:
+
+    >>> index.removeWork('scale')
+    >>> index.candidates(converter.parse('tinynotation: 4/4 e4 f g2'))
+    []
+    >>> len(index)
+    1
+
+    Works can also be indexed from files, in parallel, by
+    :meth:`~music21.search.workIndex.WorkIndex.addFilePaths`, which
+    only reparses files that are new or have changed:
+
+    >>> #_DOCS_SHOW searchResults = corpus.search('bwv190')
+    >>> searchResults = corpus.corpora.CoreCorpus().search('bwv190') #_DOCS_HIDE
+    >>> fps = sorted(str(sr.sourcePath) for sr in searchResults)
+    >>> index.addFilePaths(fps, runMulticore=False)
+    ['bach/bwv190.7-inst.mxl', 'bach/bwv190.7.mxl']
+    >>> index.addFilePaths(fps, runMulticore=False)
+    []
+
+    Only the encodings are saved, so an index loads quickly:
+
+    >>> fp = index.save()
+    >>> index2 = search.ngram.NGramIndex.load(fp)
+    >>> index2
+    <music21.search.ngram.NGramIndex n=3 encoding='diatonic' works=3>
+    >>> fp.unlink()
+
+    * New in v9.3.
+    '''
+    def __init__(self, n: int = 4, *, encoding: str = 'intervals'):
+        if n < 1:
+            raise searchBase.SearchException('n-gram length must be at least 1')
+        if encoding not in ENCODINGS:
+            raise searchBase.SearchException(
+                f'encoding must be one of {sorted(ENCODINGS)}, not {encoding!r}')
+        super().__init__()
+        self.n: int = n
+        self.encoding: str = encoding
+
+        # n-gram -> set of (docId, position in that document's code)
+        self._postings: dict[str, set[tuple[int, int]]] = {}
+        self._docs: dict[int, _EncodedPart] = {}
+        self._nextDocId: int = 0
+        # self._works: work id -> dict with 'path', 'mtime', and 'docs' (the docIds of its parts)
+
+    def _reprInternal(self) -> str:
+        return f'n={self.n} encoding={self.encoding!r} works={len(self._works)}'
+
+    # --------------------------------------------------------------------------
+    # building and updating
+
+    def indexFunction(self):
+        return partial(encodeScore, encoding=self.encoding)
+
+    def _addIndexed(
+        self,
+        work: str,
+        parts: list[tuple[str, list[int | None], list[float]]],
+        *,
+        path: str | None = None,
+        mtime: float | None = None,
+    ):
+        n = self.n
+        postings = self._postings
+        docIds = []
+        for partIndex, (code, measures, offsets) in enumerate(parts):
+            docId = self._nextDocId
+            self._nextDocId += 1
+            self._docs[docId] = _EncodedPart(work, partIndex, code, list(measures), list(offsets))
+            docIds.append(docId)
+            for i in range(len(code) - n + 1):
+                gram = code[i:i + n]
+                if gram in postings:
+                    postings[gram].add((docId, i))
+                else:
+                    postings[gram] = {(docId, i)}
+        self._works[work] = {'path': path, 'mtime': mtime, 'docs': docIds}
+
+    def addStream(self, score: stream.Stream, work: str, *, path: str | None = None):
+        '''
+        Index every part of `score` under the id `work`, replacing anything
+        already indexed under that id.  If `path` is given, it is stored so
+        that :meth:`search` can reparse the work for verification.
+        '''
+        if work in self._works:
+            self.removeWork(work)
+        self._addIndexed(work, encodeScore(score, self.encoding), path=path)
+
+    def _removeIndexed(self, work: str, info: dict[str, t.Any]):
+        n = self.n
+        postings = self._postings
+        for docId in info['docs']:
+            code = self._docs.pop(docId).code
+            for i in range(len(code) - n + 1):
+                gram = code[i:i + n]
+                entries = postings[gram]
+                entries.discard((docId, i))
+                if not entries:
+                    del postings[gram]
+
+    # --------------------------------------------------------------------------
+    # persistence
+
+    def _saveSettings(self) -> dict[str, t.Any]:
+        return {'n': self.n, 'encoding': self.encoding}
+
+    def _saveWork(self, work: str) -> dict[str, t.Any]:
+        # only the encodings are saved; load rebuilds the postings in one pass.
+        info = self._works[work]
+        parts = []
+        for docId in info['docs']:
+            doc = self._docs[docId]
+            parts.append([doc.code, doc.measures, doc.offsets])
+        return {'path': info['path'], 'mtime': info['mtime'], 'parts': parts}
+
+    def _loadWork(self, work: str, info: dict[str, t.Any]):
+        parts = [(code, measures, offsets) for code, measures, offsets in info['parts']]
+        self._addIndexed(work, parts, path=info['path'], mtime=info['mtime'])
+
+    # --------------------------------------------------------------------------
+    # searching
+
+    def _queryElements(self, query) -> list[note.GeneralNote]:
+        if isinstance(query, stream.Stream):
+            query = query.recurse()
+        queryEls = codedElements(query)
+        if len(queryEls) < 2:
+            raise searchBase.SearchException(
+                'the query must contain at least two notes or rests to search on')
+        return queryEls
+
+    def _candidateLocations(self, key: str) -> list[tuple[int, int]]:
+        '''
+        Return the sorted (docId, position) pairs where `key` appears in the
+        encoded parts.
+        '''
+        n = self.n
+        if len(key) < n:
+            # too short for the index: scan the stored codes, which is still
+            # much cheaper than parsing anything.
+            out = []
+            for docId, doc in self._docs.items():
+                i = doc.code.find(key)
+                while i != -1:
+                    out.append((docId, i))
+                    i = doc.code.find(key, i + 1)
+            return sorted(out)
+
+        # n-grams that cover the key: every n-th one, plus the last.
+        shifts = list(range(0, len(key) - n + 1, n))
+        if shifts[-1] != len(key) - n:
+            shifts.append(len(key) - n)
+        gramPostings = []
+        for shift in shifts:
+            entries = self._postings.get(key[shift:shift + n])
+            if not entries:
+                return []
+            gramPostings.append((len(entries), shift, entries))
+        gramPostings.sort(key=lambda x: x[0])
+
+        _, shift, entries = gramPostings[0]
+        candidates = {(docId, pos - shift) for docId, pos in entries if pos >= shift}
+        for _, shift, entries in gramPostings[1:]:
+            if not candidates:
+                break
+            candidates &= {(docId, pos - shift) for docId, pos in entries if pos >= shift}
+        return sorted(candidates)
+
+    def candidates(self, query) -> list[NGramPosting]:
+        '''
+        Return the postings of every location whose encoding agrees with
+        the encoding of `query` (a Stream or list of Notes, Chords, and Rests),
+        without looking at any stream.
+
+        The first element of the query is encoded relative to whatever came
+        before it, so only the characters after the first are matched; the
+        posting given is that of the element before the matched characters.
+        '''
+        queryEls = self._queryElements(query)
+        key = ENCODINGS[self.encoding](queryEls)[1:]
+        out = []
+        for docId, pos in self._candidateLocations(key):
+            start = pos - 1
+            if start < 0:
+                continue
+            doc = self._docs[docId]
+            out.append(NGramPosting(doc.work, doc.part, doc.measures[start], doc.offsets[start]))
+        return out
+
+    def search(
+        self,
+        query,
+        *,
+        algorithms: list[Callable[..., bool | None]] | None = None,
+        streams: Mapping[str, stream.Stream] | None = None,
+    ) -> list[NGramPosting]:
+        '''
+        Find `query` (a Stream or list of Notes, Chords, and Rests) in the
+        indexed works.  The candidates from :meth:`candidates` are checked
+        against the real streams: the whole query (including its first element)
+        must match with unclamped intervals ('intervals' encoding) or with the
+        same steps ('diatonic'), and in both cases with rests in the same places.
+
+        If `algorithms` is given, each element pair must also pass them in the
+        manner of :class:`~music21.search.StreamSearcher`, for instance
+        `[search.StreamSearcher.rhythmAlgorithm]` to require the exact rhythm.
+
+        Streams for verification come from `streams` (a mapping of work id to
+        Stream) or are parsed from the path each work was indexed from;
+        only works with candidates are parsed.
+
+        >>> index = search.ngram.NGramIndex(n=2)
+        >>> s = converter.parse("tinynotation: 4/4 c4 d e c  c8 d8 e8 f8 g2  a4 b c'2")
+        >>> index.addStream(s, 'tune')
+        >>> query = converter.parse('tinynotation: 4/4 f4 g a')
+        >>> index.search(query, streams={'tune': s})
+        [NGramPosting(work='tune', part=0, measure=1, offset=0.0),
+         NGramPosting(work='tune', part=0, measure=2, offset=4.0)]
+        >>> index.search(query, streams={'tune': s},
+        ...              algorithms=[search.StreamSearcher.rhythmAlgorithm])
+        [NGramPosting(work='tune', part=0, measure=1, offset=0.0)]
+        '''
+        queryEls = self._queryElements(query)
+        key = ENCODINGS[self.encoding](queryEls)[1:]
+        locations = self._candidateLocations(key)
+
+        searchList: list[m21Base.Music21Object] = list(queryEls)
+        searcher = searchBase.StreamSearcher(stream.Stream(), searchList)
+        if algorithms is not None:
+            searcher.algorithms = list(algorithms)
+
+        streamCache: dict[str, list[list[note.GeneralNote]]] = {}
+        out = []
+        for docId, pos in locations:
+            start = pos - 1
+            if start < 0:
+                continue
+            doc = self._docs[docId]
+            if doc.work not in streamCache:
+                streamCache[doc.work] = [
+                    _partElements(part)[1] for part in _partsOf(self._workStream(doc.work, streams))
+                ]
+            partEls = streamCache[doc.work][doc.part]
+            window = partEls[start:start + len(queryEls)]
+            if len(window) != len(queryEls) or not self._verify(window, queryEls, searcher):
+                continue
+            out.append(NGramPosting(doc.work, doc.part, doc.measures[start], doc.offsets[start]))
+        return out
+
+    def _workStream(self, work, streams) -> stream.Stream:
+        if streams is not None and work in streams:
+            return streams[work]
+        path = self._works[work]['path']
+        if path is None:
+            raise searchBase.SearchException(
+                f'no stream given for {work!r} and no path stored to parse it from')
+        return workIndex.parseWork(path)
+
+    def _verify(self, window, queryEls, searcher) -> bool:
+        previousStreamPitch = None
+        previousQueryPitch = None
+        for streamEl, searchEl in zip(window, queryEls):
+            if streamEl.isRest != searchEl.isRest:
+                return False
+            if not searchEl.isRest:
+                streamPitch = streamEl.pitches[0]
+                queryPitch = searchEl.pitches[0]
+                if self.encoding == 'diatonic':
+                    if streamPitch.step != queryPitch.step:
+                        return False
+                elif previousStreamPitch is not None and previousQueryPitch is not None:
+                    if (streamPitch.ps - previousStreamPitch.ps
+                            != queryPitch.ps - previousQueryPitch.ps):
+                        return False
+                previousStreamPitch = streamPitch
+                previousQueryPitch = queryPitch
+
+            result = None
+            for thisAlgorithm in searcher.algorithms:
+                result = thisAlgorithm(searcher, streamEl, searchEl)
+                if result is not None:  # break on True or False
+                    break
+            if result is False:
+                return False
+        return True
+
+
+# ------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def testSearchMatchesBruteForce(self):
+        from music21 import search
+        bach = corpus.parse('bwv66.6')
+        index = NGramIndex(n=3)
+        index.addStream(bach, 'bwv66.6')
+        partEls = [codedElements(p.flatten().notesAndRests) for p in bach.parts]
+
+        def signature(els):
+            return [(n.isRest, n.name if not n.isRest else None, n.quarterLength)
+                    for n in els]
+
+        for els in partEls:
+            # search for six-element windows and check that exactly the
+            # locations with the same names and rhythms are found.
+            for i in range(0, len(els) - 6, 5):
+                query = els[i:i + 6]
+                expected = []
+                for partIndex, otherEls in enumerate(partEls):
+                    for j in range(len(otherEls) - 5):
+                        window = otherEls[j:j + 6]
+                        if signature(window) != signature(query):
+                            continue
+                        expected.append((partIndex, window[0].measureNumber))
+                found = index.search(query, streams={'bwv66.6': bach},
+                                     algorithms=[search.StreamSearcher.rhythmAlgorithm,
+                                                 search.StreamSearcher.noteNameAlgorithm])
+                self.assertEqual([(p.part, p.measure) for p in found], expected)
+
+    def testTransposedQuery(self):
+        s = converter.parse("tinynotation: 4/4 c4 e g c'  d c B c  c2 r2  e4 g# b e'")
+        index = NGramIndex(n=2)
+        index.addStream(s, 'arp')
+        # transposition-invariant: found at C and at E
+        query = converter.parse("tinynotation: 4/4 d4 f# a d'")
+        found = index.search(query, streams={'arp': s})
+        self.assertEqual([p.measure for p in found], [1, 4])
+
+        # leaps larger than an octave are clamped in the encoding but not in verification
+        s = converter.parse("tinynotation: 4/4 c4 d' c")
+        index.addStream(s, 'leap')
+        query = converter.parse("tinynotation: 4/4 c4 e' c")
+        self.assertEqual(len(index.candidates(query)), 1)
+        self.assertEqual(index.search(query, streams={'leap': s}), [])
+
+    def testUpdateAndPersistence(self):
+        index = NGramIndex(n=2)
+        s1 = converter.parse('tinynotation: 4/4 c4 d e f')
+        s2 = converter.parse('tinynotation: 4/4 g4 f e d')
+        index.addStream(s1, 'one')
+        index.addStream(s2, 'two')
+        query = converter.parse('tinynotation: 4/4 c4 d e')
+        self.assertEqual(len(index.candidates(query)), 1)
+
+        # re-adding a work replaces it.
+        index.addStream(s2, 'one')
+        self.assertEqual([p.work for p in index.candidates(query)], [])
+        self.assertEqual(sorted(p.work for p in index.candidates(
+            converter.parse('tinynotation: 4/4 g4 f e'))), ['one', 'two'])
+        index.removeWork('one')
+        self.assertEqual(index.works, ['two'])
+        with self.assertRaises(searchBase.SearchException):
+            index.removeWork('one')
+        self.assertEqual(set(index._postings),
+                         {c[i:i + 2] for c in [index._docs[d].code for d in index._docs]
+                          for i in range(len(c) - 1)})
+
+        fp = index.save()
+        try:
+            index2 = NGramIndex.load(fp)
+        finally:
+            fp.unlink()
+        self.assertEqual(index2.works, index.works)
+        self.assertEqual(index2.candidates(s2), index.candidates(s2))
+        with self.assertRaises(searchBase.SearchException):
+            index2.search(s2)  # no path stored to verify from
+
+    def testAddFilePathsParallel(self):
+        fps = sorted(str(sr.sourcePath)
+                     for sr in corpus.corpora.CoreCorpus().search('bwv190'))
+        serial = NGramIndex()
+        serial.addFilePaths(fps, runMulticore=False)
+        parallel = NGramIndex()
+        parallel.addFilePaths(fps)
+        self.assertEqual(serial.works, parallel.works)
+        self.assertEqual(serial._postings, parallel._postings)
+
+        soprano = corpus.parse(fps[1]).parts[0]
+        query = codedElements(soprano.recurse().notesAndRests)[5:12]
+        found = parallel.search(query)
+        self.assertIn(NGramPosting('bach/bwv190.7.mxl', 0, query[0].measureNumber,
+                                   float(query[0].getOffsetInHierarchy(soprano))),
+                      found)
+
+    def testSameFileNames(self):
+        beethoven = common.getCorpusFilePath() / 'beethoven'
+        fps = sorted(str(fp) for fp in beethoven.glob('*/movement1.mxl'))[:2]
+        self.assertEqual(len(fps), 2)
+        self.assertEqual(pathlib.Path(fps[0]).name, pathlib.Path(fps[1]).name)
+        index = NGramIndex()
+        indexed = index.addFilePaths(fps, runMulticore=False)
+        self.assertEqual(len(indexed), 2)
+        self.assertEqual(index.works, indexed)
+        self.assertEqual(index.addFilePaths(fps, runMulticore=False), [])
+
+
+# ------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [
+    'NGramIndex',
+    'NGramPosting',
+    'encodeScore',
+    'codedElements',
+]
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
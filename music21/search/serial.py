@@ -14,6 +14,7 @@ from __future__ import annotations
 from collections import Counter
 import copy
 from operator import attrgetter
+import typing as t
 import unittest
 
 from music21 import base
@@ -208,6 +209,30 @@ class ContiguousSegmentOfNotes(base.Music21Object):
         return pitchClasses
 
 
+def _prependDistinct(pitchClasses, distinctPitchClasses):
+    '''
+    Return the distinct pitch classes of pitchClasses followed by those of
+    distinctPitchClasses (which holds each pitch class once) not already given.
+
+    >>> search.serial._prependDistinct((4, 0, 4), (7, 0, 2))
+    (4, 0, 7, 2)
+    '''
+    front = tuple(dict.fromkeys(pitchClasses))
+    return front + tuple(pc for pc in distinctPitchClasses if pc not in front)
+
+
+class _Window(t.NamedTuple):
+    '''
+    A segment found by a ContiguousSegmentSearcher before it is made into a
+    ContiguousSegmentOfNotes: its notes and chords, its part number, and its
+    pitch classes read from bottom to top -- or, for 'ignoreAll', each
+    distinct pitch class once, in order of first appearance.
+    '''
+    chords: list
+    partNumber: int | None
+    pitchClasses: tuple[int, ...]
+
+
 class ContiguousSegmentSearcher:
     '''
     Class that when given a :class:`~music21.stream.Stream`
@@ -567,6 +592,9 @@ class ContiguousSegmentSearcher:
         # of possibilities much faster if True
         self.trimToShortestLengthFast = False
 
+        self._windows: list[_Window] = []
+        self._pitchClasses: dict[int, tuple[int, ...]] = {}
+
     def getSearchBoundMethod(self):
         '''
         Return a search method based on the setting of reps (how to classify repetitions),
@@ -597,8 +625,23 @@ class ContiguousSegmentSearcher:
         Run the current setting for reps and includeChords to find all segments
         of length `length`.
         '''
+        self.listOfContiguousSegments = [
+            ContiguousSegmentOfNotes(window.chords, self.stream, window.partNumber)
+            for window in self._findWindows(length)
+        ]
+        return self.listOfContiguousSegments
+
+    def _findWindows(self, length):
+        '''
+        Does the work of :meth:`byLength`, but returns each segment as a
+        lightweight `_Window` carrying its pitch classes read from bottom to top,
+        so that the segment matchers only need to build a
+        :class:`~music21.search.serial.ContiguousSegmentOfNotes`
+        for the segments that actually match.
+        '''
         self.searchLength = length
-        self.listOfContiguousSegments = []
+        self._windows = []
+        self._pitchClasses = {}
         hasParts = True
         partList = self.stream[stream.Part]
         if not partList:
@@ -607,7 +650,6 @@ class ContiguousSegmentSearcher:
 
         searchMethod = self.getSearchBoundMethod()
 
-        self.listOfContiguousSegments = []
         for partNumber, partObj in enumerate(partList):
             if hasParts is False:
                 partNumber = None  #
@@ -618,24 +660,42 @@ class ContiguousSegmentSearcher:
                 if n.tie is not None and n.tie.type != 'start':
                     continue
                 searchMethod(n, partNumber)
-        return self.listOfContiguousSegments
+        return self._windows
 
-    def addActiveChords(self, partNumber):
-        csn = ContiguousSegmentOfNotes(self.activeChordList,
-                                       self.stream,
-                                       partNumber)
-        self.listOfContiguousSegments.append(csn)
-        return csn
+    def _pitchClassesOf(self, n):
+        '''
+        The pitch classes of a note or chord, bottom to top, computed once per search.
+        '''
+        key = id(n)
+        try:
+            return self._pitchClasses[key]
+        except KeyError:
+            pitchClasses = tuple(p.pitchClass for p in n.pitches)
+            self._pitchClasses[key] = pitchClasses
+            return pitchClasses
+
+    def addActiveChords(self, partNumber, pitchClasses=None):
+        '''
+        Record the current activeChordList as a found segment.  The pitch
+        classes of the segment are read from the chords unless given.
+        For 'ignoreAll', they are given with each pitch class only once.
+        '''
+        if pitchClasses is None:
+            pitchClasses = [pc for n in self.activeChordList for pc in self._pitchClassesOf(n)]
+        window = _Window(self.activeChordList, partNumber, tuple(pitchClasses))
+        self._windows.append(window)
+        return window
 
     def searchIncludeAllExclude(self, n, partNumber):
-        if len(n.pitches) > 1:
+        numPitches = len(self._pitchClassesOf(n))
+        if numPitches > 1:
             self.chordList = []
             return False
 
         chordList = self.chordList
 
         chordList.append(n)
-        self.totalLength = self.totalLength + len(n.pitches)
+        self.totalLength = self.totalLength + numPitches
 
         if len(chordList) == self.searchLength + 1:
             chordList.pop(0)
@@ -652,20 +712,21 @@ class ContiguousSegmentSearcher:
         Returns the number added.
         '''
         numCSNAdded = 0
+        pitchClassesOf = self._pitchClassesOf
 
         chordList = self.chordList
         chordList.append(n)
-        self.totalLength = self.totalLength + len(n.pitches)
+        self.totalLength = self.totalLength + len(pitchClassesOf(n))
 
         lengthOfActive = self.totalLength
         numChordsToDelete = 0
 
         for i in range(len(chordList)):
             activeChordList = chordList[i:]
-            firstChordNumPitches = len(activeChordList[0].pitches)
-            lastChordNumPitches = len(activeChordList[-1].pitches)
+            firstChordNumPitches = len(pitchClassesOf(activeChordList[0]))
+            lastChordNumPitches = len(pitchClassesOf(activeChordList[-1]))
             if i:
-                lengthOfActive -= len(chordList[i - 1].pitches)
+                lengthOfActive -= len(pitchClassesOf(chordList[i - 1]))
             numPitchesMinusFirstLast = lengthOfActive - (firstChordNumPitches + lastChordNumPitches)
             if (lengthOfActive >= self.searchLength
                     and numPitchesMinusFirstLast <= self.searchLength - 2):
@@ -679,7 +740,7 @@ class ContiguousSegmentSearcher:
 
         for unused_counter in range(numChordsToDelete):
             removedChord = chordList.pop(0)
-            self.totalLength -= len(removedChord.pitches)
+            self.totalLength -= len(pitchClassesOf(removedChord))
 
         return numCSNAdded
 
@@ -698,7 +759,8 @@ class ContiguousSegmentSearcher:
         return self.searchIncludeAllInclude(n, partNumber)
 
     def searchIgnoreAllExclude(self, n, partNumber):
-        if len(n.pitches) > 1:
+        pitchClassesOf = self._pitchClassesOf
+        if len(pitchClassesOf(n)) > 1:
             self.chordList = []
             return False
 
@@ -708,16 +770,20 @@ class ContiguousSegmentSearcher:
         chordList = self.chordList
         chordList.append(n)
 
-        for i in range(len(chordList)):
-            activeChordList = chordList[i:]
-            activePitches = []
-            for thisChord in activeChordList:
-                activePitches.extend(thisChord.pitches[:])
-            uniqueActivePitchClasses = {p.pitchClass for p in activePitches}
+        # distinct pitch classes of each chordList[i:], gathered from the end
+        distinctPitchClasses = []
+        uniqueActivePitchClasses = ()
+        for thisChord in reversed(chordList):
+            uniqueActivePitchClasses = _prependDistinct(pitchClassesOf(thisChord),
+                                                        uniqueActivePitchClasses)
+            distinctPitchClasses.append(uniqueActivePitchClasses)
+        distinctPitchClasses.reverse()
+
+        for i, uniqueActivePitchClasses in enumerate(distinctPitchClasses):
             numUniqueActivePitchClasses = len(uniqueActivePitchClasses)
             if numUniqueActivePitchClasses == self.searchLength:
-                self.activeChordList = activeChordList
-                self.addActiveChords(partNumber)
+                self.activeChordList = chordList[i:]
+                self.addActiveChords(partNumber, uniqueActivePitchClasses)
                 if self.trimToShortestLengthFast:
                     numChordsToDelete += 1
                 numCSNAdded += 1
@@ -726,43 +792,56 @@ class ContiguousSegmentSearcher:
 
         for unused_counter in range(numChordsToDelete):
             removedChord = chordList.pop(0)
-            self.totalLength -= len(removedChord.pitches)
+            self.totalLength -= len(pitchClassesOf(removedChord))
 
         return numCSNAdded
 
     def searchIgnoreAllInclude(self, n, partNumber):
+        pitchClassesOf = self._pitchClassesOf
         numCSNAdded = 0
         numChordsToDelete = 0
 
         chordList = self.chordList
         chordList.append(n)
-        for i in range(len(chordList)):
-            self.activeChordList = activeChordList = chordList[i:]
-            csn = self.addActiveChords(partNumber)
-            rowSuperset = set(csn.readPitchClassesFromBottom())
-            if len(rowSuperset) >= self.searchLength:
-                middleSegment = ContiguousSegmentOfNotes(activeChordList[1:-1], None, None)
-                middlePitchClassSet = set(middleSegment.readPitchClassesFromBottom())
-                setToCheck = middlePitchClassSet.union([activeChordList[0].pitches[-1].pitchClass,
-                                                        activeChordList[-1].pitches[0].pitchClass])
-                if (len(setToCheck)) > self.searchLength:
-                    self.listOfContiguousSegments.pop()
-                    numChordsToDelete += 1
-                elif self.trimToShortestLengthFast:
-                    numChordsToDelete += 1
 
-            else:
-                self.listOfContiguousSegments.pop()
+        # For each chordList[i:], gathered from the end: its distinct pitch
+        # classes, and the number of distinct pitch classes in its middle chords
+        # together with the top of its first chord and the bottom of its last chord.
+        numChords = len(chordList)
+        bottomOfLast = pitchClassesOf(chordList[-1])[0]
+        rowSuperset = ()
+        middlePitchClassSet = set()
+        suffixSets = []
+        for i in range(numChords - 1, -1, -1):
+            rowSuperset = _prependDistinct(pitchClassesOf(chordList[i]), rowSuperset)
+            if i < numChords - 2:
+                middlePitchClassSet.update(pitchClassesOf(chordList[i + 1]))
+            setToCheck = middlePitchClassSet.union([pitchClassesOf(chordList[i])[-1],
+                                                    bottomOfLast])
+            suffixSets.append((rowSuperset, len(setToCheck)))
+        suffixSets.reverse()
+
+        for i, (rowSuperset, setToCheckSize) in enumerate(suffixSets):
+            if len(rowSuperset) < self.searchLength:
                 break
+            if setToCheckSize > self.searchLength:
+                numChordsToDelete += 1
+                continue
+            self.activeChordList = chordList[i:]
+            self.addActiveChords(partNumber, rowSuperset)
+            numCSNAdded += 1
+            if self.trimToShortestLengthFast:
+                numChordsToDelete += 1
 
         for unused_counter in range(numChordsToDelete):
             removedChord = chordList.pop(0)
-            self.totalLength -= len(removedChord.pitches)
+            self.totalLength -= len(pitchClassesOf(removedChord))
 
         return numCSNAdded
 
     def searchRowsOnlyExclude(self, n, partNumber):
-        if len(n.pitches) > 1:
+        pitchClassesOf = self._pitchClassesOf
+        if len(pitchClassesOf(n)) > 1:
             self.chordList = []
             return False
 
@@ -771,7 +850,7 @@ class ContiguousSegmentSearcher:
         if len(chordList) == self.searchLength:
             chordList.pop(0)
 
-        if n.pitch.pitchClass not in [oldN.pitch.pitchClass for oldN in chordList]:
+        if pitchClassesOf(n)[0] not in [pitchClassesOf(oldN)[0] for oldN in chordList]:
             chordList.append(n)
         else:
             self.chordList = chordList = [n]
@@ -782,39 +861,37 @@ class ContiguousSegmentSearcher:
             self.addActiveChords(partNumber)
 
     def searchRowsOnlyInclude(self, n, partNumber):
+        pitchClassesOf = self._pitchClassesOf
         chordList = self.chordList
         chordList.append(n)
-        self.totalLength += len(n.pitches)
+        self.totalLength += len(pitchClassesOf(n))
         lengthOfActive = self.totalLength
         numChordsToDelete = 0
 
         for i in range(len(chordList)):
             activeChordList = chordList[i:]
-            firstChordNumPitches = len(activeChordList[0].pitches)
-            lastChordNumPitches = len(activeChordList[-1].pitches)
+            firstChordNumPitches = len(pitchClassesOf(activeChordList[0]))
+            lastChordNumPitches = len(pitchClassesOf(activeChordList[-1]))
             if i:
-                lengthOfActive -= len(chordList[i - 1].pitches)
+                lengthOfActive -= len(pitchClassesOf(chordList[i - 1]))
 
             numPitchesMinusFirstLast = lengthOfActive - (firstChordNumPitches + lastChordNumPitches)
             if (lengthOfActive >= self.searchLength
                     and numPitchesMinusFirstLast <= self.searchLength - 2):
-                self.activeChordList = activeChordList
-                csn = self.addActiveChords(partNumber)
-                rowSuperset = csn.readPitchClassesFromBottom()
+                rowSuperset = [pc for thisChord in activeChordList
+                               for pc in pitchClassesOf(thisChord)]
                 lowerBound = max([0,
                                   len(rowSuperset)
                                     - self.searchLength
-                                    - len(self.activeChordList[-1].pitches)
+                                    - lastChordNumPitches
                                     + 1])
-                upperBound = min([len(self.activeChordList[0].pitches),
+                upperBound = min([firstChordNumPitches,
                                   len(rowSuperset) - self.searchLength + 1])
                 for j in range(lowerBound, upperBound):
                     if len(set(rowSuperset[j:j + self.searchLength])) == self.searchLength:
+                        self.activeChordList = activeChordList
+                        self.addActiveChords(partNumber, rowSuperset)
                         break
-                else:
-                    # was not a match, should not have been added,
-                    # thus remove from listOfContiguousSegments
-                    self.listOfContiguousSegments.pop()
 
             elif lengthOfActive >= self.searchLength:
                 numChordsToDelete += 1
@@ -823,7 +900,7 @@ class ContiguousSegmentSearcher:
 
         for unused_counter in range(numChordsToDelete):
             removedChord = chordList.pop(0)
-            self.totalLength -= len(removedChord.pitches)
+            self.totalLength -= len(pitchClassesOf(removedChord))
 
 
 class SegmentMatcher:
@@ -1012,6 +1089,7 @@ class SegmentMatcher:
         self.matchedSegments = []
         self.currentSearchSegmentLength = 0
         self._contiguousSegmentsByLength = {}
+        self._windowsByLength = {}
 
     @property
     def reps(self):
@@ -1021,6 +1099,7 @@ class SegmentMatcher:
     def reps(self, newReps):
         self._reps = newReps
         self._contiguousSegmentsByLength = {}
+        self._windowsByLength = {}
 
     @property
     def includeChords(self):
@@ -1035,6 +1114,7 @@ class SegmentMatcher:
     def includeChords(self, newChords):
         self._includeChords = newChords
         self._contiguousSegmentsByLength = {}
+        self._windowsByLength = {}
 
     def getContiguousSegmentsByLength(self, searchSegmentLength):
         '''
@@ -1058,7 +1138,36 @@ class SegmentMatcher:
 
         return theseSegments
 
+    def getWindowsByLength(self, searchSegmentLength):
+        '''
+        Like :meth:`getContiguousSegmentsByLength` but returns the segments as
+        lightweight windows (notes and chords, part number, pitch classes), which
+        :meth:`find` turns into
+        :class:`~music21.search.serial.ContiguousSegmentOfNotes` objects only
+        when they match.  Cached for each length in the same way.
+        '''
+        if searchSegmentLength not in self._windowsByLength:
+            searcher = ContiguousSegmentSearcher(self.stream, self.reps, self.includeChords)
+            self._windowsByLength[searchSegmentLength] = searcher._findWindows(searchSegmentLength)
+        return self._windowsByLength[searchSegmentLength]
+
     def find(self, searchList):
+        '''
+        Find all the contiguous segments that match one of the segments in
+        searchList (or searchList itself, if it is a single segment).
+
+        Rather than comparing every contiguous segment in the stream with every
+        search segment, each search segment is reduced to its
+        :meth:`canonicalForm` and stored in a hash table; every
+        window of pitch classes in the stream is then reduced the same way and looked
+        up, so the search takes time proportional to the length of the
+        stream and a :class:`~music21.search.serial.ContiguousSegmentOfNotes` is
+        built only for the segments that match.
+        Subclasses that redefine :meth:`normalize` or :meth:`equalSubset`
+        without redefining :meth:`canonicalForm` are searched pairwise as before.
+
+        * Changed in v9.3: searches by hashing canonical forms.
+        '''
         if not searchList:
             return []
         elif not (common.isIterable(searchList[0])):
@@ -1068,7 +1177,104 @@ class SegmentMatcher:
         self.matchedSegments = []
         self.searchedAlready = []
         self._contiguousSegmentsByLength = {}
+        self._windowsByLength = {}
+
+        if not self._hasCanonicalForm():
+            return self._findPairwise(searchList)
+
+        # for each length: canonical form -> indices into searchList
+        lookupsByLength: dict[int, dict[t.Hashable, list[int]]] = {}
+        for searchIndex, unNormalizedCurrentSearchSegment in enumerate(searchList):
+            if self.checkSearchedAlready(unNormalizedCurrentSearchSegment):
+                continue
+            pitchClasses = pcToToneRow(unNormalizedCurrentSearchSegment).pitchClasses()
+            lookup = lookupsByLength.setdefault(len(unNormalizedCurrentSearchSegment), {})
+            lookup.setdefault(self.canonicalForm(pitchClasses), []).append(searchIndex)
+
+        found = []
+        for searchSegmentLength, lookup in lookupsByLength.items():
+            self.currentSearchSegmentLength = searchSegmentLength
+            windows = self.getWindowsByLength(searchSegmentLength)
+            for windowIndex, window in enumerate(windows):
+                for searchIndex, pitchClassSubset in self._matchWindow(window, lookup):
+                    found.append((searchIndex, windowIndex, searchSegmentLength, pitchClassSubset))
+
+        # report in the order of searchList, then of the stream, sharing one
+        # ContiguousSegmentOfNotes among the search segments that match a window
+        found.sort(key=lambda match: match[:2])
+        segmentsByWindow = {}
+        for searchIndex, windowIndex, searchSegmentLength, pitchClassSubset in found:
+            windowKey = (searchSegmentLength, windowIndex)
+            if windowKey not in segmentsByWindow:
+                window = self._windowsByLength[searchSegmentLength][windowIndex]
+                segmentsByWindow[windowKey] = ContiguousSegmentOfNotes(window.chords,
+                                                                       self.stream,
+                                                                       window.partNumber)
+            thisSegment = segmentsByWindow[windowKey]
+            thisSegment.activeSegment = self.normalize(list(pitchClassSubset))
+            thisSegment.matchedSegment = list(searchList[searchIndex])
+            self.matchedSegments.append(thisSegment)
+
+        return self.matchedSegments
+
+    def _hasCanonicalForm(self):
+        '''
+        True if canonicalForm is defined no higher in the class hierarchy than
+        normalize and equalSubset, and so still agrees with them.
+        '''
+        mro = type(self).__mro__
 
+        def definingClass(name):
+            return next(klass for klass in mro if name in vars(klass))
+
+        canonicalClass = definingClass('canonicalForm')
+        return (issubclass(canonicalClass, definingClass('normalize'))
+                and issubclass(canonicalClass, definingClass('equalSubset')))
+
+    def _matchWindow(self, window, lookup):
+        '''
+        Yield (index into the searchList, matching pitch classes) for each
+        search segment in lookup that the window matches, following the same
+        rules as :meth:`findOneIgnoreAll` and :meth:`findOneOtherReps`.
+        '''
+        length = self.currentSearchSegmentLength
+        canonicalForm = self.canonicalForm
+        chords = window.chords
+        pitchClassList = window.pitchClasses
+        matchedAlready = set()
+
+        if self.reps == 'ignoreAll':
+            # here the window already holds each pitch class once
+            starts = range(len(pitchClassList) - length + 1)
+        else:
+            lowerBound = max([0,
+                              len(pitchClassList) - length - len(chords[-1].pitches) + 1])
+            upperBound = min([len(chords[0].pitches),
+                              len(pitchClassList) + 1 - length])
+            starts = range(lowerBound, upperBound)
+
+        for i in starts:
+            pitchClassSubset = pitchClassList[i:i + length]
+            searchIndices = lookup.get(canonicalForm(pitchClassSubset))
+            if not searchIndices:
+                continue
+            if self.reps == 'ignoreAll':
+                if pitchClassSubset[0] not in [p.pitchClass for p in chords[0].pitches]:
+                    continue
+                if (not self.includeMultisetDuplicates
+                        and any(p.pitchClass == pitchClassSubset[-1]
+                                for thisChord in chords[:-1] for p in thisChord.pitches)):
+                    continue
+            for searchIndex in searchIndices:
+                if searchIndex not in matchedAlready:
+                    matchedAlready.add(searchIndex)
+                    yield searchIndex, pitchClassSubset
+
+    def _findPairwise(self, searchList):
+        '''
+        Compare every contiguous segment with every search segment, for
+        subclasses without a canonicalForm of their own.
+        '''
         for unNormalizedCurrentSearchSegment in searchList:
             # normalize and check.
             if self.checkSearchedAlready(unNormalizedCurrentSearchSegment):
@@ -1192,6 +1398,23 @@ class SegmentMatcher:
         '''
         return bool(searchSegment == subsetToCheck)
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        Return a hashable key for a sequence of pitch classes (integers 0-11),
+        such that two sequences have the same key exactly when
+        :meth:`equalSubset` finds them equal after :meth:`normalize`.
+        :meth:`find` uses it to look segments up in a hash table.
+
+        Here the key is the sequence itself:
+
+        >>> search.serial.SegmentMatcher.canonicalForm([3, 4, 5])
+        (3, 4, 5)
+
+        * New in v9.3.
+        '''
+        return tuple(pitchClasses)
+
 
 class TransposedSegmentMatcher(SegmentMatcher):
     '''
@@ -1334,6 +1557,21 @@ class TransposedSegmentMatcher(SegmentMatcher):
         '''
         return pcToToneRow(segment).getIntervalsAsString()
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        The key for transposition is the sequence of intervals mod 12:
+
+        >>> search.serial.TransposedSegmentMatcher.canonicalForm([0, 11, 7])
+        (11, 8)
+        >>> search.serial.TransposedSegmentMatcher.canonicalForm([5, 4, 0])
+        (11, 8)
+
+        * New in v9.3.
+        '''
+        return tuple((second - first) % 12
+                     for first, second in zip(pitchClasses, pitchClasses[1:]))
+
 
 class TransformedSegmentMatcher(SegmentMatcher):
     '''
@@ -1546,6 +1784,27 @@ class TransformedSegmentMatcher(SegmentMatcher):
         '''
         return bool(self.getTransformations(searchSegment, subsetToCheck))
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        The key for the serial transformations is the least of the interval
+        sequences of the prime, inverted, retrograde, and retrograde-inverted
+        forms, so any transformation of a row shares the row's key:
+
+        >>> TSM = search.serial.TransformedSegmentMatcher
+        >>> TSM.canonicalForm([0, 1, 3])
+        (1, 2)
+        >>> TSM.canonicalForm([3, 5, 6])  # RI of 0, 1, 3
+        (1, 2)
+        >>> TSM.canonicalForm([0, 1, 2])
+        (1, 1)
+
+        * New in v9.3.
+        '''
+        intervals = TransposedSegmentMatcher.canonicalForm(pitchClasses)
+        inverted = tuple(-interval % 12 for interval in intervals)
+        return min(intervals, inverted, inverted[::-1], intervals[::-1])
+
 
 class MultisetSegmentMatcher(SegmentMatcher):
     '''
@@ -1714,6 +1973,18 @@ class MultisetSegmentMatcher(SegmentMatcher):
         subsetCounter = Counter(subsetToCheck)
         return bool(searchSegmentCounter == subsetCounter)
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        The key for a multiset is its pitch classes in sorted order:
+
+        >>> search.serial.MultisetSegmentMatcher.canonicalForm([5, 4, 4])
+        (4, 4, 5)
+
+        * New in v9.3.
+        '''
+        return tuple(sorted(pitchClasses))
+
 
 class TransposedMultisetMatcher(SegmentMatcher):
     '''
@@ -1826,6 +2097,22 @@ class TransposedMultisetMatcher(SegmentMatcher):
                 return True
         return False
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        The key for a multiset under transposition is the least of its twelve
+        transpositions, each in sorted order:
+
+        >>> TMM = search.serial.TransposedMultisetMatcher
+        >>> TMM.canonicalForm([7, 11, 2])
+        (0, 3, 8)
+        >>> TMM.canonicalForm([4, 7, 0])
+        (0, 3, 8)
+
+        * New in v9.3.
+        '''
+        return min(tuple(sorted((p + i) % 12 for p in pitchClasses)) for i in range(12))
+
 
 class TransposedInvertedMultisetMatcher(TransposedMultisetMatcher):
     '''
@@ -1935,6 +2222,24 @@ class TransposedInvertedMultisetMatcher(TransposedMultisetMatcher):
                 return True
         return False
 
+    @staticmethod
+    def canonicalForm(pitchClasses):
+        '''
+        Here the inversions are also considered, so major and minor triads
+        share a key:
+
+        >>> TIMM = search.serial.TransposedInvertedMultisetMatcher
+        >>> TIMM.canonicalForm([4, 7, 0])
+        (0, 3, 7)
+        >>> TIMM.canonicalForm([7, 10, 2])
+        (0, 3, 7)
+
+        * New in v9.3.
+        '''
+        inversion = [-p % 12 for p in pitchClasses]
+        return min(TransposedMultisetMatcher.canonicalForm(pitchClasses),
+                   TransposedMultisetMatcher.canonicalForm(inversion))
+
 
 def _labelGeneral(segmentsToLabel, inputStream, segmentDict, reps, includeChords,
                   labelTransformations=False):
@@ -2408,7 +2713,41 @@ def labelTransposedAndInvertedMultisets(inputStream,
 
 
 class Test(unittest.TestCase):
-    pass
+
+    def testCanonicalFormMatchesPairwise(self):
+        import random
+        from music21 import chord
+        from music21 import note
+
+        random.seed(5)
+        sc = stream.Score()
+        for unused_part in range(2):
+            p = stream.Part()
+            for unused_counter in range(30):
+                pc = random.choice([0, 1, 2, 4, 5, 7, 11])
+                if random.random() < 0.2:
+                    p.append(chord.Chord([60 + pc, 60 + random.randrange(24)]))
+                else:
+                    p.append(note.Note(60 + pc + 12 * random.randrange(2)))
+            sc.insert(0, p.makeMeasures())
+
+        searchList = [[0, 1, 2], [4, 5, 7, 0], [2, 2, 4], [11, 0], [0, 4, 7], [5, 4, 4]]
+        for matcherClass in (SegmentMatcher,
+                             TransposedSegmentMatcher,
+                             TransformedSegmentMatcher,
+                             MultisetSegmentMatcher,
+                             TransposedMultisetMatcher,
+                             TransposedInvertedMultisetMatcher):
+            for reps in ('skipConsecutive', 'ignoreAll', 'includeAll', 'rowsOnly'):
+                for includeChords in (True, False):
+                    matcher = matcherClass(sc, reps, includeChords)
+                    hashed = [(seg.segment, seg.partNumber, seg.matchedSegment)
+                              for seg in matcher.find(searchList)]
+                    matcher.searchedAlready = []
+                    matcher.matchedSegments = []
+                    pairwise = [(seg.segment, seg.partNumber, seg.matchedSegment)
+                                for seg in matcher._findPairwise(searchList)]
+                    self.assertEqual(hashed, pairwise, (matcherClass, reps, includeChords))
 
 
 # ------------------------------------------------------------------------------
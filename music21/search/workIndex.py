@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         search/workIndex.py
+# Purpose:      shared bookkeeping for corpus-scale search indexes
+#
+# Authors:      Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+The bookkeeping shared by the indexes that search many works without
+parsing them each time, :class:`~music21.search.ngram.NGramIndex` and
+:class:`~music21.search.lyrics.LyricIndex`: work ids, adding files in
+parallel and skipping those that have not changed, removing works, and
+saving and loading.
+'''
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from functools import partial
+import json
+import os
+import pathlib
+import typing as t
+import unittest
+
+from music21 import common
+from music21 import environment
+from music21.search import base as searchBase
+
+environLocal = environment.Environment('search.workIndex')
+
+
+def workIdForPath(path: str | pathlib.Path) -> str:
+    '''
+    The work id that :meth:`WorkIndex.addFilePaths` gives the file at `path`:
+    the path relative to the core corpus for corpus files, otherwise the path
+    as given, so that files with the same name in different directories
+    (such as the many corpus files called 'movement1.mxl') stay apart.
+
+    >>> search.workIndex.workIdForPath('bach/bwv66.6')
+    'bach/bwv66.6'
+    >>> search.workIndex.workIdForPath(common.getCorpusFilePath() / 'bach' / 'bwv66.6.mxl')
+    'bach/bwv66.6.mxl'
+    >>> search.workIndex.workIdForPath('/tmp/other/bwv66.6.mxl')
+    '/tmp/other/bwv66.6.mxl'
+    '''
+    filePath = pathlib.Path(path)
+    if filePath.is_absolute():
+        try:
+            filePath = filePath.relative_to(common.getCorpusFilePath())
+        except ValueError:
+            return str(path)
+    return filePath.as_posix()
+
+
+def parseWork(path: str | pathlib.Path):
+    '''
+    Parse the work stored at `path`: relative paths are corpus paths,
+    as in :mod:`~music21.search.segment`.
+    '''
+    from music21 import converter
+    from music21 import corpus
+
+    filePath = pathlib.Path(path)
+    if not filePath.is_absolute():
+        return corpus.parse(filePath)
+    return converter.parse(filePath)
+
+
+def modificationTime(path: str) -> float | None:
+    '''
+    The modification time of the file at `path` (a corpus path if relative),
+    or None if it cannot be found.
+    '''
+    from music21 import corpus
+    try:
+        if not pathlib.Path(path).is_absolute():
+            path = str(corpus.getWork(path))
+        return os.path.getmtime(path)
+    except (OSError, corpus.CorpusException):
+        return None
+
+
+def _indexFileMulticore(filePath, indexFunction=None, failFast=False):
+    '''
+    Parse one path and index it with `indexFunction` in the context of multicore.
+    '''
+    filePath = pathlib.Path(filePath)
+    try:
+        data = indexFunction(parseWork(filePath))
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        if failFast:
+            raise e
+        print(f'Failed on parse/index for, {filePath}: {e}')
+        data = None
+    return (workIdForPath(filePath), str(filePath), data)
+
+
+def _giveUpdatesMulticore(numRun, totalRun, latestOutput):
+    print(f'Indexed {latestOutput[0]} ({numRun}/{totalRun})')
+
+
+class WorkIndex:
+    '''
+    Base class for indexes of many works.  Each work is stored under its id in
+    a dict which holds (at least) the path it was indexed from and that file's
+    modification time.
+
+    Subclasses say how to index a parsed work (:meth:`indexFunction`, which must
+    return something that can be pickled), how to add and remove what was
+    indexed (:meth:`_addIndexed` and :meth:`_removeIndexed`), and how to turn a
+    work into JSON and back (:meth:`_saveWork` and :meth:`_loadWork`).
+    Settings needed to recreate an empty index go in :meth:`_saveSettings`.
+
+    * New in v9.3.
+    '''
+    exceptionClass: type[Exception] = searchBase.SearchException
+
+    def __init__(self) -> None:
+        # work id -> dict with at least 'path' and 'mtime'
+        self._works: dict[str, dict[str, t.Any]] = {}
+
+    def _reprInternal(self) -> str:
+        return f'works={len(self._works)}'
+
+    def __repr__(self):
+        return (f'<{self.__class__.__module__}.{self.__class__.__name__} '
+                f'{self._reprInternal()}>')
+
+    def __len__(self):
+        return len(self._works)
+
+    def __contains__(self, work):
+        return work in self._works
+
+    @property
+    def works(self) -> list[str]:
+        '''
+        The ids of the indexed works, in the order they were added.
+        '''
+        return list(self._works)
+
+    # --------------------------------------------------------------------------
+    # to be defined by subclasses
+
+    def indexFunction(self) -> Callable[[t.Any], t.Any]:
+        '''
+        Return a picklable function that indexes one parsed work.
+        '''
+        raise NotImplementedError
+
+    def _addIndexed(self, work: str, data, *, path: str | None, mtime: float | None):
+        raise NotImplementedError
+
+    def _removeIndexed(self, work: str, info: dict[str, t.Any]):
+        raise NotImplementedError
+
+    def _saveSettings(self) -> dict[str, t.Any]:
+        return {}
+
+    def _saveWork(self, work: str) -> dict[str, t.Any]:
+        raise NotImplementedError
+
+    def _loadWork(self, work: str, info: dict[str, t.Any]):
+        raise NotImplementedError
+
+    # --------------------------------------------------------------------------
+
+    def addFilePaths(
+        self,
+        filePaths: Iterable[str | pathlib.Path],
+        *,
+        update: bool = True,
+        giveUpdates: bool = False,
+        runMulticore: bool = True,
+        failFast: bool = False,
+    ) -> list[str]:
+        '''
+        Parse and index each file in `filePaths` (in parallel unless
+        `runMulticore` is False).  Each work id is the path relative to the
+        core corpus, or the full path for other files (see :func:`workIdForPath`).
+
+        If `update` is True (default), files that are already indexed from the
+        same path and have not been modified since are skipped, so calling
+        this again on a corpus only parses what is new or changed.
+
+        Returns the list of work ids that were (re)indexed.
+        '''
+        toRun = []
+        for fp in filePaths:
+            fpStr = str(fp)
+            if update:
+                info = self._works.get(workIdForPath(fpStr))
+                if (info is not None
+                        and info['path'] == fpStr
+                        and info['mtime'] is not None
+                        and info['mtime'] == modificationTime(fpStr)):
+                    continue
+            toRun.append(fpStr)
+
+        if not toRun:
+            return []
+
+        updateFunction = _giveUpdatesMulticore if giveUpdates else None
+        indexFunc = partial(_indexFileMulticore,
+                            indexFunction=self.indexFunction(),
+                            failFast=failFast)
+        if runMulticore:
+            results = common.runParallel(toRun, indexFunc, updateFunction=updateFunction)
+        else:
+            results = common.runNonParallel(toRun, indexFunc, updateFunction=updateFunction)
+
+        byPath = {fullPath: (work, data) for work, fullPath, data in results}
+        indexed = []
+        for fpStr in toRun:  # keep the order of filePaths whatever order the cores finished.
+            work, data = byPath[fpStr]
+            if data is None:
+                continue
+            if work in self._works:
+                self.removeWork(work)
+            self._addIndexed(work, data, path=fpStr, mtime=modificationTime(fpStr))
+            indexed.append(work)
+        return indexed
+
+    def removeWork(self, work: str):
+        '''
+        Remove everything indexed under `work`.  Raises an exception (a
+        SearchException unless the subclass says otherwise) if `work` is
+        not in the index.
+        '''
+        try:
+            info = self._works.pop(work)
+        except KeyError:
+            raise self.exceptionClass(f'{work!r} is not in the index')
+        self._removeIndexed(work, info)
+
+    # --------------------------------------------------------------------------
+    # persistence
+
+    def save(self, filePath=None) -> pathlib.Path:
+        '''
+        Save the index as a .json file and return its path (a temporary file
+        if `filePath` is None).
+        '''
+        if filePath is None:
+            filePath = environLocal.getTempFile('.json')
+        filePath = pathlib.Path(filePath)
+
+        data = self._saveSettings()
+        data['works'] = {work: self._saveWork(work) for work in self._works}
+        with filePath.open('w', encoding='utf-8') as f:
+            json.dump(data, f)
+        return filePath
+
+    @classmethod
+    def load(cls, filePath):
+        '''
+        Load an index saved with :meth:`save`.
+        '''
+        filePath = pathlib.Path(filePath)
+        with filePath.open('r', encoding='utf-8') as f:
+            data = json.load(f)
+        works = data.pop('works')
+        index = cls(**data)
+        for work, info in works.items():
+            index._loadWork(work, info)
+        return index
+
+
+# ------------------------------------------------------------------------------
+class Test(unittest.TestCase):
+    pass
+
+
+# ------------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = [WorkIndex, workIdForPath]
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
@@ -14,7 +14,6 @@ sites.py -- Objects for keeping track of relationships among Music21Objects
 '''
 from __future__ import annotations
 
-import collections
 from collections.abc import Generator, MutableMapping
 import typing as t
 from typing import overload  # for some reason does not work in PyCharm if not directly imported
@@ -196,7 +195,7 @@ class Sites(common.SlottedObjectMixin):
 
     def __init__(self):
         # .siteDict is a dictionary of siteRefs.  None is a singleton.
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
+        self.siteDict = {None: _NoneSiteRef}
 
         # store an index of numbers for tagging the order of creation of defined contexts;
         # this is used to be able to discern the order of context as added
@@ -385,7 +384,7 @@ class Sites(common.SlottedObjectMixin):
         '''
         Clear all stored data.
         '''
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
+        self.siteDict = {None: _NoneSiteRef}
         self._lastID = -1  # cannot be None
 
     @overload
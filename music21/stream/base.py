@@ -42,7 +42,7 @@ from music21 import common
 from music21.common.enums import GatherSpanners, OffsetSpecial
 from music21.common.numberTools import opFrac
 from music21.common.types import (
-    StreamType, M21ObjType, ChangedM21ObjType, OffsetQL, OffsetQLSpecial
+    StreamType, M21ObjType, ChangedM21ObjType, OffsetQL, OffsetQLIn, OffsetQLSpecial
 )
 from music21 import clef
 from music21 import chord
@@ -59,6 +59,7 @@ from music21 import meter
 from music21 import note
 from music21 import pitch
 from music21 import tie
+from music21 import tree
 from music21 import repeat
 from music21 import sites
 from music21 import style
@@ -100,6 +101,71 @@ class StreamDeprecationWarning(UserWarning):
 OffsetMap = namedtuple('OffsetMap', ['element', 'offset', 'endTime', 'voiceIndex'])
 
 
+def _greatestDivisor(quarterLengths) -> OffsetQL:
+    '''
+    Return the greatest common divisor of `quarterLengths`, exactly (in integer
+    ticks) if possible, otherwise approximately.
+
+    >>> from fractions import Fraction
+    >>> stream.base._greatestDivisor([Fraction(1, 3), Fraction(1, 5), 0.25])
+    Fraction(1, 60)
+    >>> stream.base._greatestDivisor([Fraction(1, 11), 0.5])
+    0.0454...
+    '''
+    try:
+        return common.quarterLengthGCD(quarterLengths)
+    except ValueError:
+        return common.approximateGCD(quarterLengths)
+
+
+def _quarterLengthsFillingTicks(
+    quarterLengthList: Sequence[OffsetQLIn],
+    tickList: Sequence[int],
+    quarterLength: OffsetQL,
+) -> list[OffsetQLIn] | None:
+    '''
+    Helper for sliceByQuarterLengths: given `quarterLengthList` and the same values
+    in ticks, return the values (repeated cyclically if need be) that
+    exactly fill `quarterLength`, or None if the values in the list together are
+    already longer than `quarterLength`.  Raises a StreamException if the list
+    cannot fill `quarterLength` exactly.
+
+    >>> from fractions import Fraction
+    >>> third = Fraction(1, 3)
+    >>> ticks = [common.quarterLengthToTicks(third)]
+    >>> stream.base._quarterLengthsFillingTicks([third], ticks, 1.0)
+    [Fraction(1, 3), Fraction(1, 3), Fraction(1, 3)]
+    >>> stream.base._quarterLengthsFillingTicks([third], ticks, 0.25) is None
+    True
+    >>> stream.base._quarterLengthsFillingTicks([third], ticks, 1.5)
+    Traceback (most recent call last):
+    music21.exceptions21.StreamException: cannot map quarterLength list into
+        element Duration: 5/3, 1.5
+    '''
+    # Fractions and floats multiply exactly by an int, so the target does not
+    # itself need to be a whole number of ticks.
+    target = quarterLength * common.TICKS_PER_QUARTER
+    total = sum(tickList)
+    if total > target:
+        return None
+    if total == target:
+        return list(quarterLengthList)
+
+    qlProcess = []
+    total = 0
+    i = 0
+    numQuarterLengths = len(quarterLengthList)
+    while total < target:
+        qlProcess.append(quarterLengthList[i % numQuarterLengths])
+        total += tickList[i % numQuarterLengths]
+        i += 1
+    if total != target:
+        raise StreamException(
+            'cannot map quarterLength list into element Duration: %s, %s' % (
+                common.ticksToQuarterLength(total), quarterLength))
+    return qlProcess
+
+
 # -----------------------------------------------------------------------------
 class Stream(core.StreamCore, t.Generic[M21ObjType]):
     '''
@@ -1825,7 +1891,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                     del self._offsetDict[id(match)]
                 except KeyError:  # pragma: no cover
                     pass
-                self.coreElementsChanged(clearIsSorted=False)
+                self.coreElementsChanged(clearIsSorted=False, changedElement=match)
                 match.sites.remove(self)
                 match.activeSite = None
 
@@ -1850,7 +1916,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                         self.coreSetElementOffset(e, elementOffset - shiftDur)
             # if renumberMeasures is True and matchedEndElement is False:
             #     pass  # This should maybe just call a function renumberMeasures
-        self.coreElementsChanged(clearIsSorted=False)
+        if shiftOffsets is True:
+            self.coreElementsChanged(clearIsSorted=False)
 
     def pop(self, index: int | None = None) -> base.Music21Object:
         '''
@@ -2143,7 +2210,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                                   offset,
                                   )
         # might change sorting, but not flatness.  Maybe other things can be False too.
-        self.coreElementsChanged(updateIsFlat=False)
+        self.coreElementsChanged(updateIsFlat=False, changedElement=element)
 
     def elementOffset(self, element, returnSpecial=False):
         '''
@@ -2348,7 +2415,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         updateIsFlat = False
         if element.isStream:
             updateIsFlat = True
-        self.coreElementsChanged(updateIsFlat=updateIsFlat)
+        self.coreElementsChanged(updateIsFlat=updateIsFlat, changedElement=element)
         if ignoreSort is False:
             self.isSorted = storeSorted
 
@@ -2649,12 +2716,13 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             self.coreSelfActiveSite(e)
             self._elements.append(e)
 
-            if e.duration.quarterLength != 0:
+            eQuarterLength = e.quarterLength
+            if eQuarterLength != 0:
                 # environLocal.printDebug(['incrementing highest time',
                 #                         'e.duration.quarterLength',
                 #                          e.duration.quarterLength])
-                highestTime += e.duration.quarterLength
-            if lastElement is not None and not lastElement.duration.quarterLength:
+                highestTime += eQuarterLength
+            if lastElement is not None and not lastElement.quarterLength:
                 if (e.priority < lastElement.priority
                         or e.classSortOrder < lastElement.classSortOrder):
                     clearIsSorted = True
@@ -6211,6 +6279,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         removeRedundantPitches=True,
         toSoundingPitch=True,
         copyPitches=True,
+        pitchClassSetsOnly=False,
     ):
         # noinspection PyShadowingNames
         '''
@@ -6369,6 +6438,29 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
           - no longer supported: displayTiedAccidentals=False,
         * Changed in v6.3: Added copyPitches
 
+        For analysis that needs only the pitch classes sounding at each moment,
+        `pitchClassSetsOnly=True` skips making Chords and Rests (and Measures)
+        altogether.  Instead, a list of `(offset, quarterLength, pitchClasses)` tuples
+        is returned, where `pitchClasses` is a frozenset of pitch-class integers
+        (empty where the chordified stream would have a rest).  Offsets are measured
+        from the start of the stream, and moments are not split at barlines:
+
+        >>> s = stream.Score()
+        >>> p0 = stream.Part()
+        >>> p0.append([note.Note('C4', type='half'), note.Note('E4')])
+        >>> p1 = stream.Part()
+        >>> p1.append([note.Rest(), note.Note('G3', type='half')])
+        >>> s.insert(0, p0)
+        >>> s.insert(0, p1)
+        >>> for offset, quarterLength, pitchClasses in s.chordify(pitchClassSetsOnly=True):
+        ...     (offset, quarterLength, sorted(pitchClasses))
+        (0.0, 1.0, [0])
+        (1.0, 1.0, [0, 7])
+        (2.0, 1.0, [4, 7])
+
+        * Changed in v9.3: verticalities are found in a single sweep
+          through each measure; added pitchClassSetsOnly.
+
         OMIT_FROM_DOCS
 
         Test that chordifying works on a single stream.
@@ -6382,19 +6474,28 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         >>> cn[0].pitches
         (<music21.pitch.Pitch C4>, <music21.pitch.Pitch D#4>)
         '''
-        def chordifyOneMeasure(templateInner, streamToChordify):
+        def iterateVerticalities(timespanTree):
             '''
-            streamToChordify is either a Measure or a Score=MeasureSlice
+            Yield each verticality of timespanTree from offset 0 onward, with the
+            offset where it ends, sweeping through the tree once.
             '''
-            timespanTree = streamToChordify.asTimespans(classList=(note.GeneralNote,))
             allTimePoints = timespanTree.allTimePoints()
             if 0 not in allTimePoints:
                 allTimePoints = (0,) + allTimePoints
 
-            for offset, endTime in zip(allTimePoints, allTimePoints[1:]):
-                if isclose(offset, endTime, abs_tol=1e-7):
+            verticalities = timespanTree.iterateVerticalitiesAtTimePoints(allTimePoints)
+            for vert, endTime in zip(verticalities, allTimePoints[1:]):
+                if isclose(vert.offset, endTime, abs_tol=1e-7):
                     continue
-                vert = timespanTree.getVerticalityAt(offset)
+                yield vert, endTime
+
+        def chordifyOneMeasure(templateInner, streamToChordify):
+            '''
+            streamToChordify is either a Measure or a Score=MeasureSlice
+            '''
+            timespanTree = streamToChordify.asTimespans(classList=(note.GeneralNote,))
+            for vert, endTime in iterateVerticalities(timespanTree):
+                offset = vert.offset
                 quarterLength = endTime - offset
                 if quarterLength < 0:  # pragma: no cover
                     environLocal.warn(
@@ -6435,6 +6536,52 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             rNew.duration.quarterLength = totalDuration
             templateInner.insert(startOffset, rNew)
 
+        def iterateMeasureSlices(streamToSlice):
+            '''
+            Yield streamToSlice.measure(i, collect=(), indicesNotNumbers=True) for
+            i = 0, 1, 2...  For a Score, the measures of each Part are found only once,
+            rather than once for every measure slice.
+            '''
+            if not isinstance(streamToSlice, Score):
+                # endless, like the Score slices below: zip() with the template's
+                # measures decides where to stop.
+                for i in itertools.count():
+                    yield streamToSlice.measure(i, collect=(), indicesNotNumbers=True)
+                return
+
+            measuresByPart = [(p, list(p.getElementsByClass(Measure)))
+                              for p in streamToSlice.getElementsByClass(Part)]
+            for i in itertools.count():
+                measureSlice = streamToSlice.__class__()
+                measureSlice.mergeAttributes(streamToSlice)
+                for p, partMeasures in measuresByPart:
+                    partSlice = p.cloneEmpty(derivationMethod='measures')
+                    if i < len(partMeasures):
+                        partSlice.coreInsert(0, partMeasures[i])
+                        partSlice.coreElementsChanged()
+                    measureSlice.coreInsert(0, partSlice)
+                measureSlice.coreElementsChanged()
+                yield measureSlice
+
+        def pitchClassSetsOf(streamToChordify):
+            timespanTree = streamToChordify.asTimespans(classList=(note.GeneralNote,))
+            pitchClassSets = []
+            for vert, endTime in iterateVerticalities(timespanTree):
+                offset = opFrac(vert.offset)
+                pitchClasses = frozenset(
+                    p.pitchClass
+                    for ts in vert.startAndOverlapTimespans
+                    if isinstance(ts, tree.spans.PitchedTimespan)
+                    for p in ts.pitches
+                )
+                if (not pitchClasses
+                        and pitchClassSets
+                        and not pitchClassSets[-1][2]):
+                    # consolidate rests, as chordify does.
+                    offset = pitchClassSets.pop()[0]
+                pitchClassSets.append((offset, opFrac(endTime - offset), pitchClasses))
+            return pitchClassSets
+
         # --------------------------------------
         if toSoundingPitch:
             # environLocal.printDebug(['at sounding pitch', allParts[0].atSoundingPitch])
@@ -6448,6 +6595,9 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         else:
             workObj = self
 
+        if pitchClassSetsOnly:
+            return pitchClassSetsOf(workObj)
+
         if self.hasPartLikeStreams():
             # use the measure boundaries of the first Part as a template.
             templateStream = workObj.getElementsByClass(Stream).first()
@@ -6460,9 +6610,10 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
 
         if template.hasMeasures():
             measureIterator = template.getElementsByClass(Measure)
-            for i, templateMeasure in enumerate(measureIterator):
+            for i, (templateMeasure, measurePart) in enumerate(
+                zip(measureIterator, iterateMeasureSlices(workObj))
+            ):
                 # measurePart is likely a Score (MeasureSlice), not a measure
-                measurePart = workObj.measure(i, collect=(), indicesNotNumbers=True)
                 if measurePart is not None:
                     chordifyOneMeasure(templateMeasure, measurePart)
                 else:
@@ -7027,42 +7178,24 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 raise StreamException(
                     f'no measures found in stream with {len(self)} elements')
 
-        # for now, calling makeAccidentals once per measures
-        # pitches from last measure are passed
-        # this needs to be called before makeTies
-        # note that this functionality is also placed in Part
-        if not returnStream.streamStatus.accidentals:
-            makeNotation.makeAccidentalsInMeasureStream(
-                returnStream,
-                pitchPast=pitchPast,
-                pitchPastMeasure=pitchPastMeasure,
-                useKeySignature=useKeySignature,
-                alteredPitches=alteredPitches,
-                cautionaryPitchClass=cautionaryPitchClass,
-                cautionaryAll=cautionaryAll,
-                overrideStatus=overrideStatus,
-                cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
-                tiePitchSet=tiePitchSet)
-
-        makeNotation.makeTies(returnStream, meterStream=meterStream, inPlace=True)
-
-        for m in returnStream.getElementsByClass(Measure):
-            makeNotation.splitElementsToCompleteTuplets(m, recurse=True, addTies=True)
-            makeNotation.consolidateCompletedTuplets(m, recurse=True, onlyIfTied=True)
-
-        if not returnStream.streamStatus.beams:
-            try:
-                makeNotation.makeBeams(returnStream, inPlace=True)
-            except meter.MeterException as me:
-                warnings.warn(str(me))
-
-        # note: this needs to be after makeBeams, as placing this before
-        # makeBeams was causing the duration's tuplet to lose its type setting
-        # check for tuplet brackets one measure at a time
-        # this means that they will never extend beyond one measure
-        for m in returnStream.getElementsByClass(Measure):
-            if not m.streamStatus.tuplets:
-                makeNotation.makeTupletBrackets(m, inPlace=True)
+        # accidentals (when not already made), ties, tuplets, beams (when not
+        # already made), and tuplet brackets, one measure at a time.
+        # Accidentals are made before ties, so that the notes tied into a
+        # measure do not affect its accidentals.
+        makeNotation.makeNotationInMeasureStream(
+            returnStream,
+            meterStream=meterStream,
+            accidentals=not returnStream.streamStatus.accidentals,
+            beams=not returnStream.streamStatus.beams,
+            pitchPast=pitchPast,
+            pitchPastMeasure=pitchPastMeasure,
+            useKeySignature=useKeySignature,
+            alteredPitches=alteredPitches,
+            cautionaryPitchClass=cautionaryPitchClass,
+            cautionaryAll=cautionaryAll,
+            overrideStatus=overrideStatus,
+            cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
+            tiePitchSet=tiePitchSet)
 
         if not inPlace:
             return returnStream
@@ -7655,6 +7788,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 updateIsFlat=False,
                 clearIsSorted=False,
                 keepIndex=False,  # this is False by default, but just to be sure for later
+                keepTimespanTrees=True,  # positions have not changed
             )
             self.isSorted = True
             # environLocal.printDebug(['_elements', self._elements])
@@ -8441,8 +8575,8 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             #     textExpression (ql=0) at 0.25 --
             #     isSorted would be true, but highestTime should be 4.0 not 0.25
             for e in self._elements:
-                candidateOffset = (self.elementOffset(e)
-                                   + e.duration.quarterLength)
+                # .quarterLength does not copy a shared (frozen) duration
+                candidateOffset = self.elementOffset(e) + e.quarterLength
                 if candidateOffset > highestTimeSoFar:
                     highestTimeSoFar = candidateOffset
             self._cache['HighestTime'] = opFrac(highestTimeSoFar)
@@ -8701,56 +8835,48 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # using flat here may not always be desirable
         # may want to do a recursive upward search as well
         srcFlat = srcObj.flatten()
-        tiStream = srcFlat.getElementsByClass(tempo.TempoIndication)
-        mmBoundaries = []  # a  list of (start, end, mm)
-
+        offsetPairs = []
+        for ti in srcFlat.getElementsByClass(tempo.TempoIndication):
+            offsetPairs.append((ti.getOffsetBySite(srcFlat), ti.getSoundingMetronomeMark()))
         # not sure if this should be taken from the flat representation
-        highestTime = srcFlat.highestTime
-        lowestOffset = srcFlat.lowestOffset
+        return self._metronomeMarkBoundariesFromPairs(offsetPairs,
+                                                      srcFlat.lowestOffset,
+                                                      srcFlat.highestTime)
+
+    @staticmethod
+    def _metronomeMarkBoundariesFromPairs(offsetPairs, lowestOffset, highestTime):
+        '''
+        Given a sorted list of (offset, MetronomeMark) pairs, return the list of
+        (start, end, MetronomeMark) triples used by :meth:`metronomeMarkBoundaries`,
+        supplying a default of quarter equal to 120 before the first mark.
+
+        >>> mm = tempo.MetronomeMark(number=60)
+        >>> stream.Stream._metronomeMarkBoundariesFromPairs([(2.0, mm)], 0.0, 8.0)
+        [(0.0, 2.0, <music21.tempo.MetronomeMark animato Quarter=120>),
+         (2.0, 8.0, <music21.tempo.MetronomeMark larghetto Quarter=60>)]
+        '''
+        mmBoundaries = []  # a  list of (start, end, mm)
 
         # if no tempo
-        if not tiStream:
+        if not offsetPairs:
             mmDefault = tempo.MetronomeMark(number=120)  # a default
             mmBoundaries.append((lowestOffset, highestTime, mmDefault))
-        # if just one tempo
-        elif len(tiStream) == 1:
-            # get offset from flat source
-            o = tiStream[0].getOffsetBySite(srcFlat)
-            mm = tiStream[0].getSoundingMetronomeMark()
-            if o > lowestOffset:
-                mmDefault = tempo.MetronomeMark(number=120)  # a default
-                mmBoundaries.append((lowestOffset, o, mmDefault))
-                mmBoundaries.append((o, highestTime, mm))
-            else:
-                mmBoundaries.append((lowestOffset, highestTime, mm))
-        # one or more tempi
-        else:
-            offsetPairs = []
-            for ti in tiStream:
-                o = ti.getOffsetBySite(srcFlat)
-                offsetPairs.append([o, ti.getSoundingMetronomeMark()])
-            # fill boundaries
-            # if lowest region not defined, supply as default
-            if offsetPairs[0][0] > lowestOffset:
-                mmDefault = tempo.MetronomeMark(number=120)  # a default
-                mmBoundaries.append((lowestOffset, offsetPairs[0][0],
-                                     mmDefault))
-                mmBoundaries.append((offsetPairs[0][0], offsetPairs[1][0],
-                                     offsetPairs[0][1]))
-            else:  # just add the first range
-                mmBoundaries.append((offsetPairs[0][0], offsetPairs[1][0],
-                                     offsetPairs[0][1]))
-            # add any remaining ranges, starting from the second; if last,
-            # use the highest time as the boundary
-            for i, (o, mm) in enumerate(offsetPairs):
-                if i == 0:
-                    continue  # already added first
-                elif i == len(offsetPairs) - 1:  # last index
-                    mmBoundaries.append((offsetPairs[i][0], highestTime,
-                                         offsetPairs[i][1]))
-                else:  # add with next boundary
-                    mmBoundaries.append((offsetPairs[i][0], offsetPairs[i + 1][0],
-                                         offsetPairs[i][1]))
+            return mmBoundaries
+
+        # if lowest region not defined, supply as default
+        if offsetPairs[0][0] > lowestOffset:
+            mmDefault = tempo.MetronomeMark(number=120)  # a default
+            mmBoundaries.append((lowestOffset, offsetPairs[0][0], mmDefault))
+        # add each range; if last, use the highest time as the boundary
+        for i, (o, mm) in enumerate(offsetPairs):
+            if i == len(offsetPairs) - 1:  # last index
+                end = highestTime
+            else:  # add with next boundary
+                end = offsetPairs[i + 1][0]
+            # a single mark at the start governs the whole region
+            if i == 0 and len(offsetPairs) == 1 and o <= lowestOffset:
+                o = lowestOffset
+            mmBoundaries.append((o, end, mm))
 
         # environLocal.printDebug(['self.metronomeMarkBoundaries()',
         # 'got mmBoundaries:', mmBoundaries])
@@ -8783,7 +8909,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 activeStart = activeEnd
         return totalSeconds
 
-    def _getSecondsMap(self, srcObj=None):
+    def _getSecondsMap(self, srcObj=None, *, expandRepeats=False):
         '''
         Return a list of dictionaries for all elements in this Stream,
         where each dictionary defines the real-time characteristics of
@@ -8791,9 +8917,28 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         all :class:`~music21.tempo.TempoIndication` subclasses and use these
         values to realize tempi. If no initial tempo is found,
         a tempo of 120 BPM will be provided.
+
+        If `expandRepeats` is True and the Stream has measures, the map follows
+        the performed order given by :meth:`~music21.repeat.Expander.playbackElements`:
+        elements in repeated measures appear once per pass (the same object each
+        time), and nothing is copied.
+
+        >>> s = converter.parse('tinynotation: 2/4 c2 d2 e2')
+        >>> s.makeMeasures(inPlace=True)
+        >>> s.measure(2).rightBarline = bar.Repeat(direction='end')
+        >>> sm = s._getSecondsMap(expandRepeats=True)
+        >>> notesMap = [d for d in sm if isinstance(d['element'], note.Note)]
+        >>> [(d['element'].name, d['offsetSeconds']) for d in notesMap]
+        [('C', 0.0), ('D', 1.0), ('C', 2.0), ('D', 3.0), ('E', 4.0)]
+        >>> notesMap[0]['element'] is notesMap[2]['element']
+        True
+
+        * New in v9.3: expandRepeats
         '''
         if srcObj is None:
             srcObj = self
+        if expandRepeats and srcObj.hasMeasures():
+            return self._getPlaybackSecondsMap(srcObj)
         mmBoundaries = self.metronomeMarkBoundaries(srcObj=srcObj)
 
         # not sure if this should be taken from the flat representation
@@ -8831,6 +8976,39 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                 secondsMap.append(secondsDict)
         return secondsMap
 
+    def _getPlaybackSecondsMap(self, srcObj):
+        '''
+        Helper for :meth:`_getSecondsMap` that realizes seconds over the performed
+        order of a Stream of measures without expanding (and so copying) its repeats.
+        '''
+        expander = repeat.Expander(srcObj)
+        srcFlat = srcObj.flatten()
+        performed = list(expander.playbackElements(srcFlat))
+
+        highestTime = 0.0
+        for pm in expander.playback():
+            highestTime = opFrac(pm.offset + pm.measure.duration.quarterLength)
+        offsetPairs = [(o, e.getSoundingMetronomeMark()) for e, o, unused_pass in performed
+                       if isinstance(e, tempo.TempoIndication)]
+        mmBoundaries = self._metronomeMarkBoundariesFromPairs(offsetPairs, 0.0, highestTime)
+
+        secondsMap = []
+        for e, offset, unused_pass in performed:
+            if isinstance(e, bar.Barline):
+                continue
+            offset = round(offset, 8)
+            dur = e.duration.quarterLength
+            offsetSeconds = self._accumulatedSeconds(mmBoundaries, 0.0, offset)
+            durationSeconds = self._accumulatedSeconds(mmBoundaries, offset, offset + dur)
+            secondsMap.append({
+                'offsetSeconds': offsetSeconds,
+                'durationSeconds': durationSeconds,
+                'endTimeSeconds': offsetSeconds + durationSeconds,
+                'element': e,
+                'voiceIndex': None,
+            })
+        return secondsMap
+
     # do not make a property decorator since _getSecondsMap takes arguments
     secondsMap = property(_getSecondsMap, doc='''
         Returns a list where each element is a dictionary
@@ -9419,6 +9597,10 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             {1.0 - 1.5} <music21.note.Note C>
             {1.5 - 1.8333} <music21.note.Note C>
 
+        * Changed in v9.3: whether a divisor fills the gap to the next note is
+          tested exactly (in integer ticks), so triplets are no longer passed over
+          for gaps such as 1.0.
+
         OMIT_FROM_DOCS
 
         Test changing defaults, running, and changing back...
@@ -9450,6 +9632,11 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # this presently is not trying to avoid overlaps that
         # result from quantization; this may be necessary
 
+        # the grid unit of each divisor in integer ticks, where ticks can express it.
+        divisorTicks = {div: common.TICKS_PER_QUARTER // div
+                        for div in quarterLengthDivisors
+                        if isinstance(div, int) and common.TICKS_PER_QUARTER % div == 0}
+
         def bestMatch(
             target,
             divisors,
@@ -9457,6 +9644,15 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             gapToFill=0.0
         ) -> BestQuantizationMatch:
             found: list[BestQuantizationMatch] = []
+            # whether the gap is a whole number of grid units is tested on
+            # integer ticks: with floats, 1.0 % (1 / 3) is not 0.
+            if not gapToFill:
+                gapTicks: int | None = 0
+            else:
+                try:
+                    gapTicks = common.quarterLengthToTicks(gapToFill)
+                except ValueError:
+                    gapTicks = None
             for div in divisors:
                 tick = 1 / div  # divisor expressed as QL, e.g. 0.25
                 match, error, signedErrorInner = common.nearestMultiple(target, tick)
@@ -9464,7 +9660,12 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
                     match = tick
                     signedErrorInner = round(target - match, 7)
                     error = abs(signedErrorInner)
-                if gapToFill % tick == 0:
+                unitTicks = divisorTicks.get(div)
+                if gapTicks is not None and unitTicks is not None:
+                    gapIsFilled = gapTicks % unitTicks == 0
+                else:
+                    gapIsFilled = gapToFill % tick == 0
+                if gapIsFilled:
                     remainingGap = 0.0
                 else:
                     remainingGap = max(gapToFill - match, 0.0)
@@ -9641,9 +9842,22 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         else:  # get elements list from Stream
             eToProcess = returnObj.notesAndRests
 
+        try:
+            # work in integer ticks where possible: summing Fractions
+            # (for tuplets) over and over is very slow.
+            tickList = [common.quarterLengthToTicks(ql) for ql in quarterLengthList]
+        except ValueError:
+            tickList = []
+
         for e in eToProcess:
+            if tickList:
+                qlProcess = _quarterLengthsFillingTicks(quarterLengthList,
+                                                        tickList,
+                                                        e.quarterLength)
+                if qlProcess is None:
+                    continue
             # if qlList values are greater than the found duration, skip
-            if opFrac(sum(quarterLengthList)) > e.quarterLength:
+            elif opFrac(sum(quarterLengthList)) > e.quarterLength:
                 continue
             elif not opFrac(sum(quarterLengthList)) == e.quarterLength:
                 # try to map a list that is of sufficient duration
@@ -9662,7 +9876,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             # environLocal.printDebug(['got qlProcess', qlProcess,
             # 'for element', e, e.quarterLength])
 
-            if not opFrac(sum(qlProcess)) == e.quarterLength:
+            if not tickList and not opFrac(sum(qlProcess)) == e.quarterLength:
                 raise StreamException(
                     'cannot map quarterLength list into element Duration: %s, %s' % (
                         sum(qlProcess), e.quarterLength))
@@ -9671,8 +9885,10 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
             # remove e from the source
             oInsert = e.getOffsetBySite(returnObj)
             returnObj.remove(e)
+            # the stream is marked unsorted by coreElementsChanged below, so there
+            # is no need for coreInsert to recompute highestTime for each new element.
             for eNew in post:
-                returnObj.coreInsert(oInsert, eNew)
+                returnObj.coreInsert(oInsert, eNew, ignoreSort=True)
                 oInsert = opFrac(oInsert + eNew.quarterLength)
 
         returnObj.coreElementsChanged()
@@ -9707,7 +9923,7 @@ class Stream(core.StreamCore, t.Generic[M21ObjType]):
         # environLocal.printDebug(['unique quarter lengths', uniqueQuarterLengths])
 
         # will raise an exception if no gcd can be found
-        divisor = common.approximateGCD(uniqueQuarterLengths)
+        divisor = _greatestDivisor(uniqueQuarterLengths)
 
         # process in place b/c a copy, if necessary, has already been made
         returnObj.sliceByQuarterLengths(quarterLengthList=[divisor],
@@ -14149,7 +14365,7 @@ class Score(Stream):
                         uniqueQuarterLengths.append(e.quarterLength)
 
             # after ql for all parts, find divisor
-            divisor = common.approximateGCD(uniqueQuarterLengths)
+            divisor = _greatestDivisor(uniqueQuarterLengths)
             # environLocal.printDebug(['Score.sliceByGreatestDivisor:
             # got divisor from unique ql:', divisor, uniqueQuarterLengths])
 
@@ -23,6 +23,8 @@ All functions here will eventually begin with `.core`.
 '''
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
 import copy
 from fractions import Fraction
 import typing as t
@@ -39,6 +41,7 @@ from music21.stream.iterator import StreamIterator, RecursiveIterator
 
 
 if t.TYPE_CHECKING:
+    from music21.sorting import SortTuple
     from music21.stream import Stream
 
 
@@ -160,7 +163,7 @@ class StreamCore(Music21Object):
         # Make this faster
         # self._elementTree.insert(self.highestTime, element)
         # does not change sorted state
-        self._setHighestTime(ht + element.duration.quarterLength)    # type: ignore
+        self._setHighestTime(ht + element.quarterLength)    # type: ignore
     # --------------------------------------------------------------------------
     # adding and editing Elements and Streams -- all need to call coreElementsChanged
     # most will set isSorted to False
@@ -214,6 +217,8 @@ class StreamCore(Music21Object):
         clearIsSorted: bool = True,
         memo: list[int] | None = None,
         keepIndex: bool = False,
+        changedElement: Music21Object | None = None,
+        keepTimespanTrees: bool = False,
     ) -> None:
         '''
         NB -- a "core" stream method that is not necessary for most users.
@@ -240,6 +245,28 @@ class StreamCore(Music21Object):
         >>> a.coreElementsChanged()
         >>> a.isFlat
         False
+
+        If the change was to a single element directly in this Stream (it was inserted,
+        removed, moved, or its duration changed), pass it as `changedElement` so that
+        the trees cached by :meth:`asTimespans` can be updated in place instead of
+        being rebuilt:
+
+        >>> b = stream.Stream([note.Note(type='whole')])
+        >>> n = note.Note(type='half')
+        >>> b.insert(0, n)
+        >>> tsTree = b.asTimespans(classList=(note.Note,))
+        >>> b.setElementOffset(n, 1.0)
+        >>> b.asTimespans(classList=(note.Note,)) is tsTree
+        True
+        >>> tsTree
+        <TimespanTree {2} (0.0 to 4.0) <music21.stream.Stream ...>>
+        >>> tsTree[1]
+        <PitchedTimespan (1.0 to 3.0) <music21.note.Note C>>
+
+        If only the order of the elements has changed, not their positions (as when
+        sorting), `keepTimespanTrees=True` keeps those trees as they are.
+
+        * Changed in v9.3: added `changedElement` and `keepTimespanTrees`.
         '''
         # experimental
         if not getattr(self, '_mutable', True):
@@ -296,11 +323,122 @@ class StreamCore(Music21Object):
             indexCache = None
             if keepIndex and 'index' in self._cache:
                 indexCache = self._cache['index']
+            timespanCache = None
+            if 'timespanTrees' not in self._cache:
+                pass
+            elif keepTimespanTrees:
+                timespanCache = {key: self._cache[key]
+                                 for key in ('timespanTrees', 'timespanTreeSpans',
+                                             'timespanTreeEndTimes', 'HighestTime')
+                                 if key in self._cache}
+            elif changedElement is not None:
+                timespanCache = self._coreUpdateTimespanTrees(changedElement)
             # always clear cache when elements have changed
             # for instance, Duration will change.
             self.clearCache()
             if keepIndex and indexCache is not None:
                 self._cache['index'] = indexCache
+            if timespanCache is not None:
+                self._cache.update(timespanCache)
+
+    def _coreUpdateTimespanTrees(self, element: Music21Object) -> dict[str, t.Any] | None:
+        '''
+        Called by coreElementsChanged before the cache is cleared, when only
+        `element`, directly in this Stream, has been inserted, removed, moved or
+        had its duration changed.  Updates the TimespanTrees cached by
+        :meth:`asTimespans` in place (O(log n) each) and returns the cache entries to
+        keep, or None if the trees must be rebuilt.
+
+        The trees are only kept if the highestTime of the Stream, and thus the
+        parentEndTime of every timespan, is unchanged, and if no other element's
+        end time has changed without this Stream being told (zero-length objects
+        such as Dynamics and Clefs do not notify their sites when their
+        quarterLength is set).  Both are checked in one pass over the elements,
+        which is far cheaper than rebuilding the trees; the highestTime it finds
+        is cached.
+        '''
+        oldHighestTime = self._cache.get('HighestTime')
+        if oldHighestTime is None or element.isStream:
+            return None
+        if any(e is element for e in self._endElements):
+            return None
+
+        endTimesById = self._cache.get('timespanTreeEndTimes')
+        if endTimesById is None:
+            return None
+        # built lazily on the first edit, then kept up to date
+        spansByKey = self._cache.get('timespanTreeSpans')
+        if spansByKey is None:
+            spansByKey = {}
+        unlinkedDuration = getattr(self, '_unlinkedDuration', None)
+        if unlinkedDuration is not None:
+            parentEndTime = unlinkedDuration.quarterLength
+        else:
+            parentEndTime = oldHighestTime
+
+        idEl = id(element)
+        endTimesById.pop(idEl, None)
+        if idEl in self._offsetDict:
+            offset = self._offsetDict[idEl][0]
+            if isinstance(offset, OffsetSpecial):
+                return None
+            endTimesById[idEl] = offset + element.quarterLength
+        else:
+            offset = None  # removed
+
+        highestTime = 0.0
+        for e in self._elements:
+            endTime = self._offsetDict[id(e)][0] + e.quarterLength
+            if endTimesById.get(id(e)) != endTime:
+                return None  # changed without telling this Stream
+            if endTime > highestTime:
+                highestTime = endTime
+        if len(endTimesById) != len(self._elements) or opFrac(highestTime) != oldHighestTime:
+            return None
+
+        def sortKey(ts):
+            return ts.element.sortTuple(self)
+
+        timespanTrees = self._cache['timespanTrees']
+        for cacheKey, timespanTree in timespanTrees.items():
+            spansById = spansByKey.get(cacheKey)
+            if spansById is None:
+                spansById = {id(ts.element): ts for ts in timespanTree
+                             if len(getattr(ts, 'parentage', ())) == 1}
+                spansByKey[cacheKey] = spansById
+            oldSpan = spansById.pop(idEl, None)
+            if oldSpan is not None:
+                timespanTree.removeIncremental(oldSpan)
+
+            classList = cacheKey[0]
+            if offset is None or (classList and element.classSet.isdisjoint(classList)):
+                continue
+            node = timespanTree.getNodeByPosition(offset)
+            if node is not None and any(len(getattr(ts, 'parentage', ())) != 1
+                                        for ts in node.payload):
+                # timespans from substreams share the offset: their order
+                # relative to this element is only known by rebuilding.
+                return None
+            spanClass: type[tree.spans.ElementTimespan]
+            if 'NotRest' in element.classSet:
+                spanClass = tree.spans.PitchedTimespan
+            else:
+                spanClass = tree.spans.ElementTimespan
+            newSpan = spanClass(element=element,
+                                parentage=(self,),
+                                parentOffset=0.0,
+                                parentEndTime=parentEndTime,
+                                offset=offset,
+                                endTime=offset + element.duration.quarterLength)
+            # keep the timespans at this offset in the order of the Stream
+            # (priority, classSortOrder, insertion order), as a rebuilt tree has them.
+            timespanTree.insertIncremental(newSpan, payloadSortKey=sortKey)
+            spansById[idEl] = newSpan
+
+        return {'timespanTrees': timespanTrees,
+                'timespanTreeSpans': spansByKey,
+                'timespanTreeEndTimes': endTimesById,
+                'HighestTime': opFrac(highestTime)}
 
     # core method that has to live in Stream itself for typing purposes.
     def coreCopyAsDerivation(self: M21ObjType,
@@ -495,14 +633,19 @@ class StreamCore(Music21Object):
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
         '''
-        hashedAttributes = hash((tuple(classList or ()), flatten))
-        cacheKey = 'timespanTree' + str(hashedAttributes)
-        if cacheKey not in self._cache or self._cache[cacheKey] is None:
-            hashedTimespanTree = tree.fromStream.asTimespans(self,
-                                                             flatten=flatten,
-                                                             classList=classList)
-            self._cache[cacheKey] = hashedTimespanTree
-        return self._cache[cacheKey]
+        cacheKey = (tuple(classList or ()), flatten)
+        timespanTrees = self._cache.setdefault('timespanTrees', {})
+        if cacheKey not in timespanTrees:
+            timespanTrees[cacheKey] = tree.fromStream.asTimespans(self,
+                                                                  flatten=flatten,
+                                                                  classList=classList)
+            if 'timespanTreeEndTimes' not in self._cache:
+                # lets coreElementsChanged update the trees in place after an edit
+                self._cache['timespanTreeEndTimes'] = {
+                    id(e): self._offsetDict[id(e)][0] + e.quarterLength
+                    for e in self._elements
+                }
+        return timespanTrees[cacheKey]
 
     def coreSelfActiveSite(self, el):
         '''
@@ -540,6 +683,50 @@ class StreamCore(Music21Object):
             self._cache[cacheKey] = hashedElementTree
         return self._cache[cacheKey]
 
+    def coreContextMap(self, className=None, *, flatten=False) -> ContextMap:
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns a :class:`ContextMap` of every element matching `className`
+        (a class or a class name, or None for all elements) in this Stream, or
+        in the Stream and its substreams if `flatten` is True or 'semiFlat',
+        sorted by its position in the hierarchy.  The map is cached on the Stream
+        and dropped by `.coreElementsChanged()`, so repeated calls
+        to `.getContextByClass()` need only a binary search.
+
+        >>> p = converter.parse('tinynotation: 3/4 C4 D E 2/4 F G A B 1/4 c')
+        >>> tsMap = p.coreContextMap(meter.TimeSignature, flatten='semiFlat')
+        >>> tsMap
+        <music21.stream.core.ContextMap 3 elements>
+        >>> tsMap is p.coreContextMap(meter.TimeSignature, flatten='semiFlat')
+        True
+
+        >>> n = p.recurse().notes[5]
+        >>> n
+        <music21.note.Note A>
+        >>> position = n.sortTuple(p.measure(2)).modify(offset=n.getOffsetInHierarchy(p))
+        >>> tsMap.before(position)
+        <music21.meter.TimeSignature 2/4>
+        >>> tsMap.after(position)
+        <music21.meter.TimeSignature 1/4>
+
+        Changing the Stream clears the map:
+
+        >>> p.measure(1).insert(2.0, meter.TimeSignature('1/8'))
+        >>> p.coreContextMap(meter.TimeSignature, flatten='semiFlat')
+        <music21.stream.core.ContextMap 4 elements>
+
+        * New in v9.3.
+        '''
+        classList = (className,) if className else None
+        cacheKey = 'contextMap' + str(hash((classList, flatten)))
+        if cacheKey not in self._cache or self._cache[cacheKey] is None:
+            siteTree = self.asTree(flatten=flatten, classList=classList)
+            self._cache[cacheKey] = ContextMap(
+                (node.position, node.payload) for node in siteTree.iterNodes()
+            )
+        return self._cache[cacheKey]
+
     def coreGatherMissingSpanners(
         self,
         *,
@@ -726,6 +913,72 @@ class StreamCore(Music21Object):
             self.coreElementsChanged(updateIsFlat=False)
         return None
 
+
+class ContextMap:
+    '''
+    A static, sorted map from hierarchy position (as a
+    :class:`~music21.sorting.SortTuple`) to element, used by
+    :meth:`~music21.base.Music21Object.getContextByClass` to find the
+    closest matching element before or after a position with a binary search.
+
+    Usually obtained from :meth:`StreamCore.coreContextMap`, which keeps it up to date.
+
+    >>> cm = stream.core.ContextMap([
+    ...     (sorting.SortTuple(0, 0.0, 0, 4, 1, 1), 'a'),
+    ...     (sorting.SortTuple(0, 2.0, 0, 4, 1, 2), 'b'),
+    ... ])
+    >>> len(cm)
+    2
+    >>> cm.before(sorting.SortTuple(0, 2.0, 0, 20, 1, 3))
+    'b'
+    >>> cm.before(sorting.SortTuple(0, 2.0, 0, 0, 1, 3))
+    'a'
+    >>> print(cm.before(sorting.SortTuple(0, 0.0, 0, 4, 1, 1)))
+    None
+    >>> cm.after(sorting.SortTuple(0, 0.0, 0, 4, 1, 1))
+    'b'
+    >>> print(cm.after(sorting.SortTuple(0, 2.0, 0, 4, 1, 2)))
+    None
+
+    * New in v9.3.
+    '''
+    __slots__ = ('_positions', '_elements')
+
+    def __init__(self, positionsAndElements: Iterable[tuple[SortTuple, t.Any]] = ()) -> None:
+        # positions are stored as plain tuples so that bisect compares them in C
+        self._positions: list[tuple] = []
+        self._elements: list[t.Any] = []
+        for position, element in positionsAndElements:
+            self._positions.append(tuple(position))
+            self._elements.append(element)
+
+    def __repr__(self):
+        return f'<{self.__module__}.{self.__class__.__name__} {len(self)} elements>'
+
+    def __len__(self):
+        return len(self._elements)
+
+    def before(self, position):
+        '''
+        Return the last element whose position is strictly before
+        `position`, or None.
+        '''
+        i = bisect_left(self._positions, tuple(position))
+        if i == 0:
+            return None
+        return self._elements[i - 1]
+
+    def after(self, position):
+        '''
+        Return the first element whose position is strictly after
+        `position`, or None.
+        '''
+        i = bisect_right(self._positions, tuple(position))
+        if i == len(self._elements):
+            return None
+        return self._elements[i]
+
+
 # timing before: Macbook Air 2012, i7
 # In [3]: timeit('s = stream.Stream()', setup='from music21 import stream', number=100000)
 # Out[3]: 1.6291376419831067
@@ -736,7 +989,90 @@ class StreamCore(Music21Object):
 
 
 class Test(unittest.TestCase):
-    pass
+
+    def testTimespanTreesUpdatedInPlace(self):
+        import random
+        from music21 import chord
+        from music21 import dynamics
+        from music21 import note
+        from music21 import stream
+
+        random.seed(47)
+
+        def spanData(tsTree):
+            return sorted((ts.offset, ts.endTime, id(ts.element), ts.parentEndTime)
+                          for ts in tsTree)
+
+        def elementsInOrder(s, classList):
+            # the order of a tree built from the sorted Stream
+            return [el for el in sorted(s._elements, key=lambda el: el.sortTuple(s))
+                    if not classList or not el.classSet.isdisjoint(classList)]
+
+        s = stream.Stream()
+        s.insert(0, note.Note(quarterLength=40))  # keeps highestTime constant
+        for unused_counter in range(30):
+            s.insert(random.randrange(60) / 2, random.choice([note.Note, note.Rest])())
+        classLists = ((note.Note,), None)
+        trees = [s.asTimespans(classList=classList) for classList in classLists]
+
+        for unused_counter in range(150):
+            candidates = [el for el in s if el.quarterLength < 4]
+            action = random.randrange(5)
+            if action == 0 or not candidates:
+                s.insert(random.randrange(60) / 2, random.choice([note.Note, note.Rest])())
+            elif action == 1:
+                s.remove(random.choice(candidates))
+            elif action == 2:
+                s.setElementOffset(random.choice(candidates), random.randrange(60) / 2)
+            elif action == 3:
+                random.choice(candidates).quarterLength = random.randrange(1, 8) / 2
+            else:
+                random.choice(candidates).priority = random.randrange(-2, 3)
+
+            for classList, tsTree in zip(classLists, trees):
+                self.assertIs(s.asTimespans(classList=classList), tsTree)
+                rebuilt = tree.fromStream.asTimespans(s, flatten=True, classList=classList)
+                self.assertEqual(spanData(tsTree), spanData(rebuilt))
+                self.assertEqual([ts.element for ts in tsTree], elementsInOrder(s, classList))
+                self.assertEqual(len(tsTree), len(rebuilt))
+                self.assertEqual(tsTree.endTime, rebuilt.endTime)
+
+        # changing the highestTime rebuilds the trees
+        s.append(note.Note())
+        s.coreElementsChanged()
+        self.assertIsNot(s.asTimespans(classList=(note.Note,)), trees[0])
+
+        # a zero-length object does not tell the stream when its length changes,
+        # but the next edit finds out.
+        s = stream.Stream()
+        s.insert(0, note.Note(quarterLength=4))
+        d = dynamics.Dynamic('p')
+        s.insert(1, d)
+        tsTree = s.asTimespans()
+        d.quarterLength = 10
+        s.insert(2, note.Note())
+        self.assertEqual(s.highestTime, 11.0)
+        self.assertIsNot(s.asTimespans(), tsTree)
+        self.assertEqual(s.asTimespans().endTime, 11.0)
+
+        # a moved element goes in its sorted place among those at its new offset
+        s = stream.Stream()
+        cNote = note.Note('C', quarterLength=8)
+        s.insert(0, cNote)
+        g = note.Note('G')
+        s.insert(2, g)
+        c = chord.Chord('E4 B4')
+        s.insert(4, c)
+        tsTree = s.asTimespans()
+        s.setElementOffset(g, 4)
+        self.assertIs(s.asTimespans(), tsTree)
+        self.assertEqual([ts.element for ts in tsTree], [cNote, g, c])
+        self.assertEqual([ts.element for ts in tsTree.getVerticalityAt(4).startTimespans],
+                         [g, c])
+        g.priority = 1
+        self.assertIs(s.asTimespans(), tsTree)
+        self.assertEqual([ts.element for ts in tsTree], [cNote, c, g])
+        self.assertEqual(tsTree.index(tsTree[2]), 2)
 
 
 if __name__ == '__main__':
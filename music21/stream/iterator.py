@@ -16,6 +16,7 @@ StreamIterators are explicitly allowed to access private methods on streams.
 '''
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable, Iterable, Sequence
 import copy
 import typing as t
@@ -44,6 +45,15 @@ StreamIteratorType = t.TypeVar('StreamIteratorType', bound='StreamIterator')
 # pipe | version not passing mypy.
 FilterType = t.Union[Callable[[t.Any, t.Optional[t.Any]], t.Any], filters.StreamFilter]
 
+# filters (exact types, not subclasses) that keep no state between calls
+_STATELESS_FILTER_TYPES = frozenset([
+    filters.ClassFilter,
+    filters.ClassNotFilter,
+    filters.GroupFilter,
+    filters.IdFilter,
+    filters.OffsetFilter,
+])
+
 
 # -----------------------------------------------------------------------------
 class StreamIteratorInefficientWarning(UserWarning):
@@ -168,6 +178,12 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         self.filters: list[FilterType] = filterList
         self._len: int | None = None
         self._matchingElements: dict[bool | None, list[M21ObjType]] = {}
+        # for filter chains that allow it, the indices of matching elements
+        # are found in one pass; see _findMatchingIndices
+        self._statelessFilters: bool | None = None
+        self._checkedFilters: list[FilterType] = []
+        self._matchingIndices: list[int] | None = None
+        self._stopIndex: int | None = None
         # keep track of where we are in the parse.
         # esp important for recursive streams...
         if activeInformation is not None:
@@ -192,6 +208,17 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         return self
 
     def __next__(self) -> M21ObjType:
+        if self._matchingIndices is None and self._filtersAreStateless():
+            self._findMatchingIndices()
+        if self._matchingIndices is not None:
+            return self._nextFromMatchingIndices()
+        return self._nextByFilters()
+
+    def _nextByFilters(self) -> M21ObjType:
+        '''
+        Return the next element by running the filters on each element
+        in turn.  The general path for `__next__`.
+        '''
         while self.elementIndex < self.streamLength:
             if self.elementIndex >= self.elementsLength:
                 self.iterSection = '_endElements'
@@ -220,6 +247,111 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         self.cleanup()
         raise StopIteration
 
+    def _filtersAreStateless(self) -> bool:
+        '''
+        Returns True if every filter is one whose result depends only on the element
+        (and its offset in srcStream), so that all matching elements can be found
+        in a single pass.  This is true of the chains made by `.notes`,
+        `.getElementsByClass()`, `.getElementsByOffset()`, etc.
+
+        >>> s = stream.Stream()
+        >>> s.notes._filtersAreStateless()
+        True
+        >>> s.iter().getElementsByOffset(1, 2)._filtersAreStateless()
+        True
+        >>> s.iter().addFilter(lambda el, it: True)._filtersAreStateless()
+        False
+        '''
+        if self._statelessFilters is None:
+            self._checkedFilters = list(self.filters)
+            self._statelessFilters = all(type(f) in _STATELESS_FILTER_TYPES
+                                         for f in self.filters)
+        return self._statelessFilters
+
+    def _findMatchingIndices(self) -> None:
+        '''
+        Run the (stateless) filters over all elements in one pass, storing
+        the indices in srcStreamElements of the matching elements in
+        `._matchingIndices` (kept until the next `.reset()`).
+
+        If a filter raises StopIteration then no later element can match; the
+        index where that happened is stored in `._stopIndex`.
+        '''
+        elements = self.srcStreamElements
+        indices: Iterable[int] = range(len(elements))
+        stopIndex: int | None = None
+        for f in self.filters:
+            filterType = type(f)
+            if filterType is filters.ClassFilter:
+                classList = f.classList  # type: ignore
+                indices = [i for i in indices
+                           if not elements[i].classSet.isdisjoint(classList)]
+            elif filterType is filters.ClassNotFilter:
+                classList = f.classList  # type: ignore
+                indices = [i for i in indices
+                           if elements[i].classSet.isdisjoint(classList)]
+            else:
+                kept = []
+                for i in indices:
+                    try:
+                        if f(elements[i], self) is not False:
+                            kept.append(i)
+                    except StopIteration:
+                        # as in __next__, nothing from here on is examined
+                        if stopIndex is None or i < stopIndex:
+                            stopIndex = i
+                        break
+                indices = kept
+        if stopIndex is not None:
+            indices = [i for i in indices if i < stopIndex]
+        self._matchingIndices = list(indices)
+        self._stopIndex = stopIndex
+
+    def _setIndexInformation(self, i: int) -> None:
+        '''
+        Set elementIndex, iterSection, and sectionIndex as `_nextByFilters`
+        does after examining the element at index `i`.
+        '''
+        self.elementIndex = i + 1
+        if i >= self.elementsLength:
+            self.iterSection = '_endElements'
+            self.sectionIndex = i - self.elementsLength
+        else:
+            self.sectionIndex = i
+
+    def _nextFromMatchingIndices(self) -> M21ObjType:
+        '''
+        Return the next element using the indices found by
+        `_findMatchingIndices`, leaving the iterator (and activeInformation)
+        in the same state that `_nextByFilters` would.
+        '''
+        indices = t.cast(list[int], self._matchingIndices)
+        elementIndex = self.elementIndex
+        position = bisect.bisect_left(indices, elementIndex)
+        if position < len(indices):
+            i = indices[position]
+            self.elementIndex = i + 1
+            if i >= self.elementsLength:
+                self.iterSection = '_endElements'
+                self.sectionIndex = i - self.elementsLength
+            else:
+                self.sectionIndex = i
+            e = self.srcStreamElements[i]
+            if self.restoreActiveSites is True:
+                self.srcStream.coreSelfActiveSite(e)
+            self.updateActiveInformation()
+            self.activeInformation['lastYielded'] = e
+            return e
+
+        if self._stopIndex is not None:
+            # a filter raised StopIteration at this element
+            self._setIndexInformation(self._stopIndex)
+            raise StopIteration
+        if elementIndex < self.streamLength:
+            self._setIndexInformation(self.streamLength - 1)
+        self.cleanup()
+        raise StopIteration
+
     def __getattr__(self, attr):
         '''
         DEPRECATED in v8 -- will be removed in v9.
@@ -440,7 +572,13 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         '''
         if self._len is not None:
             return self._len
-        lenMatching = len(self.matchingElements(restoreActiveSites=False))
+        if (type(self).__next__ is StreamIterator.__next__
+                and self._filtersAreStateless()):
+            if self._matchingIndices is None:
+                self._findMatchingIndices()
+            lenMatching = len(t.cast(list[int], self._matchingIndices))
+        else:
+            lenMatching = len(self.matchingElements(restoreActiveSites=False))
         self._len = lenMatching
         self.reset()
         return lenMatching
@@ -570,6 +708,10 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         '''
         iter(self)
         try:
+            if (self._matchingIndices is None
+                    and type(self).__next__ is StreamIterator.__next__):
+                # do not find all the matches just to return the first one.
+                return self._nextByFilters()
             return next(self)
         except StopIteration:
             return None
@@ -639,6 +781,13 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         for f in self.filters:
             if isinstance(f, filters.StreamFilter):
                 f.reset()
+        if self._statelessFilters is not None and self._checkedFilters != self.filters:
+            # .filters was changed directly rather than through addFilter()
+            self.resetCaches()
+        # find the matches again on the next pass: elements may have been added,
+        # moved, or (as with groups) changed without the stream knowing.
+        self._matchingIndices = None
+        self._stopIndex = None
 
     def resetCaches(self) -> None:
         '''
@@ -649,6 +798,9 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
         '''
         self._len = None
         self._matchingElements = {}
+        self._statelessFilters = None
+        self._matchingIndices = None
+        self._stopIndex = None
 
     def cleanup(self) -> None:
         '''
@@ -666,6 +818,7 @@ class StreamIterator(prebase.ProtoM21Object, Sequence[M21ObjType]):
             del self.srcStreamElements
             self.srcStream = SrcStreamClass()
             self.srcStreamElements = ()
+            self.resetCaches()
 
     # ---------------------------------------------------------------
     # getting items
@@ -2206,7 +2359,113 @@ class Test(unittest.TestCase):
         child = sIter.childRecursiveIterator
         self.assertIsInstance(child, ImportedRecursiveIterator)
 
+    def testMatchingIndicesSameAsFilters(self):
+        '''
+        Iterating with the indices found in one pass should yield the same elements
+        and leave the iterator in the same state as running each filter on each element.
+        '''
+        from music21 import bar
+        from music21 import clef
+        from music21 import stream
 
+        s = stream.Stream()
+        s.insert(0, clef.TrebleClef())
+        for i in range(8):
+            n = note.Note(quarterLength=1) if i % 3 else note.Rest(quarterLength=1)
+            if i == 2:
+                n.groups.append('x')
+            s.append(n)
+        s.storeAtEnd(bar.Barline('final'))
+
+        def states(sIter):
+            out = []
+            for el in sIter:
+                out.append((el, sIter.elementIndex, sIter.iterSection, sIter.sectionIndex,
+                            sIter.activeInformation['lastYielded']))
+            out.append((sIter.elementIndex, sIter.iterSection, sIter.sectionIndex))
+            return out
+
+        def generic(sIter):
+            sIter._statelessFilters = False
+            sIter._checkedFilters = list(sIter.filters)
+            return sIter
+
+        makers = [
+            lambda: s.iter(),
+            lambda: s.iter().notes,
+            lambda: s.iter().getElementsByClass(note.Rest),
+            lambda: s.iter().getElementsNotOfClass(note.Note),
+            lambda: s.iter().getElementsByClass(bar.Barline),
+            lambda: s.iter().getElementsByGroup('x'),
+            lambda: s.iter().getElementsByOffset(2, 5),
+            lambda: s.iter().notesAndRests.getElementsByOffset(3, 20),
+            lambda: s.iter().getElementsByOffset(3, 20).getElementsByClass(note.Note),
+            lambda: s.iter().getElementsByOffset(0, 0, mustBeginInSpan=False),
+            lambda: s.iter().getElementsByClass(note.Unpitched),
+        ]
+        for maker in makers:
+            fast = maker()
+            slow = generic(maker())
+            self.assertEqual(states(fast), states(slow))
+            self.assertIsNotNone(fast._matchingIndices)
+            self.assertIsNone(slow._matchingIndices)
+            # and a second time through
+            self.assertEqual(states(fast), states(generic(maker())))
+            self.assertEqual(len(fast), len(generic(maker())))
+            self.assertIs(fast.first(), generic(maker()).first())
+            self.assertIs(fast.last(), generic(maker()).last())
+            self.assertEqual(fast.matchingElements(restoreActiveSites=False),
+                             generic(maker()).matchingElements(restoreActiveSites=False))
+
+            fastOffsets = maker()
+            fastOffsets.__class__ = OffsetIterator
+            slowOffsets = generic(maker())
+            slowOffsets.__class__ = OffsetIterator
+            self.assertEqual(list(fastOffsets), list(slowOffsets))
+
+    def testMatchingIndicesActiveSites(self):
+        from music21 import stream
+        s1 = stream.Stream(id='s1')
+        s2 = stream.Stream(id='s2')
+        notes = [note.Note() for _ in range(3)]
+        s1.append(notes)
+        s2.append(notes)
+        self.assertEqual({n.activeSite.id for n in notes}, {'s2'})
+
+        sIter = s1.iter().notes
+        sIter.restoreActiveSites = False
+        self.assertEqual(list(sIter), notes)
+        self.assertEqual({n.activeSite.id for n in notes}, {'s2'})
+        sIter.restoreActiveSites = True
+        self.assertEqual(list(sIter), notes)
+        self.assertEqual({n.activeSite.id for n in notes}, {'s1'})
+
+    def testMatchingIndicesCustomFilter(self):
+        from music21 import stream
+        s = stream.Stream()
+        s.append([note.Note(p) for p in 'CDEF'])
+        sIter = s.iter().notes.addFilter(filters.IsNotFilter(s[1]))
+        self.assertEqual(len(list(sIter)), 3)
+        self.assertIsNone(sIter._matchingIndices)
+
+    def testMatchingIndicesAfterChanges(self):
+        # re-iterating the same iterator finds the matches again.
+        from music21 import stream
+        s = stream.Stream()
+        ns = [note.Note(p) for p in 'CDEF']
+        s.append(ns)
+        ns[0].groups.append('x')
+
+        groupIter = s.iter().getElementsByGroup('x')
+        self.assertEqual(list(groupIter), [ns[0]])
+        ns[1].groups.append('x')
+        self.assertEqual(list(groupIter), [ns[0], ns[1]])
+
+        offsetIter = s.iter().getElementsByOffset(0, 1.5)
+        self.assertEqual(list(offsetIter), [ns[0], ns[1]])
+        ns[3].offset = 1.0
+        s.coreElementsChanged()
+        self.assertEqual(list(offsetIter), [ns[0], ns[1], ns[3]])
 
 
 _DOC_ORDER = [StreamIterator, RecursiveIterator, OffsetIterator]
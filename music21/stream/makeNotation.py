@@ -13,11 +13,13 @@
 # -----------------------------------------------------------------------------
 from __future__ import annotations
 
+import bisect
 from collections.abc import Iterable, Generator
 import contextlib
 import copy
 import typing as t
 import unittest
+import warnings
 
 from music21 import beam
 from music21 import clef
@@ -156,77 +158,85 @@ def makeBeams(
                 raise stream.StreamException(
                     'cannot process beams in a Measure without a time signature')
             continue
-        noteGroups = []
-        if m.hasVoices():
-            for v in m.voices:
-                noteGroups.append(v.notesAndRests.stream())
-        else:
-            noteGroups.append(m.notesAndRests.stream())
+        _makeBeamsInOneMeasure(m, lastTimeSignature)
 
-        # environLocal.printDebug([
-        #    'noteGroups', noteGroups, 'len(noteGroups[0])',
-        #    len(noteGroups[0])])
-
-        for noteStream in noteGroups:
-            if len(noteStream) <= 1:
-                continue  # nothing to beam
-            durList = []
-            for n in noteStream:
-                if n.duration.isGrace:
-                    noteStream.remove(n)
-                    continue
-                durList.append(n.duration)
-            # environLocal.printDebug([
-            #    'beaming with ts', lastTimeSignature, 'measure', m, durList,
-            #    noteStream[0], noteStream[1]])
+    del mColl  # remove Stream no longer needed
+    if setStemDirections:
+        setStemDirectionForBeamGroups(returnObj)
 
-            # error check; call before sending to time signature, as, if this
-            # fails, it represents a problem that happens before time signature
-            # processing
-            summed = sum([d.quarterLength for d in durList])
-            # note, this ^^ is faster than a generator expression
+    returnObj.streamStatus.beams = True
+    if inPlace is not True:
+        return returnObj
 
-            # the double call below corrects for tiny errors in adding
-            # floats and Fractions in the sum() call -- the first opFrac makes it
-            # impossible to have 4.00000000001, but returns Fraction(4, 1). The
-            # second call converts Fraction(4, 1) to 4.0
-            durSum = opFrac(opFrac(summed))
 
-            barQL = lastTimeSignature.barDuration.quarterLength
+def _makeBeamsInOneMeasure(m: stream.Measure, timeSignature: meter.TimeSignature) -> None:
+    '''
+    Helper for :func:`makeBeams`: set the beams of the notes and rests in
+    Measure `m` (or in each of its voices) according to `timeSignature`.
+    '''
+    noteGroups = []
+    if m.hasVoices():
+        for v in m.voices:
+            noteGroups.append(v.notesAndRests.stream())
+    else:
+        noteGroups.append(m.notesAndRests.stream())
 
-            if durSum > barQL:
-                # environLocal.printDebug([
-                #    'attempting makeBeams with a bar that contains durations
-                #    that sum greater than bar duration (%s > %s)' %
-                #    (durSum, barQL)])
+    # environLocal.printDebug([
+    #    'noteGroups', noteGroups, 'len(noteGroups[0])',
+    #    len(noteGroups[0])])
+
+    for noteStream in noteGroups:
+        if len(noteStream) <= 1:
+            continue  # nothing to beam
+        durList = []
+        for n in noteStream:
+            if n.duration.isGrace:
+                noteStream.remove(n)
                 continue
+            durList.append(n.duration)
+        # environLocal.printDebug([
+        #    'beaming with ts', timeSignature, 'measure', m, durList,
+        #    noteStream[0], noteStream[1]])
 
-            # getBeams
-            offset: float | Fraction = 0.0
-            if m.paddingLeft != 0.0:
-                offset = opFrac(m.paddingLeft)
-            elif m.paddingRight != 0.0:
-                pass
-            # Incomplete measure without any padding set: assume paddingLeft
-            elif noteStream.highestTime < barQL:
-                offset = barQL - noteStream.highestTime
-
-            beamsList = lastTimeSignature.getBeams(noteStream, measureStartOffset=offset)
-
-            for i, n in enumerate(noteStream):
-                thisBeams = beamsList[i]
-                if thisBeams is not None:
-                    n.beams = thisBeams
-                else:
-                    n.beams = beam.Beams()
+        # error check; call before sending to time signature, as, if this
+        # fails, it represents a problem that happens before time signature
+        # processing
+        summed = sum([d.quarterLength for d in durList])
+        # note, this ^^ is faster than a generator expression
 
-    del mColl  # remove Stream no longer needed
-    if setStemDirections:
-        setStemDirectionForBeamGroups(returnObj)
+        # the double call below corrects for tiny errors in adding
+        # floats and Fractions in the sum() call -- the first opFrac makes it
+        # impossible to have 4.00000000001, but returns Fraction(4, 1). The
+        # second call converts Fraction(4, 1) to 4.0
+        durSum = opFrac(opFrac(summed))
 
-    returnObj.streamStatus.beams = True
-    if inPlace is not True:
-        return returnObj
+        barQL = timeSignature.barDuration.quarterLength
+
+        if durSum > barQL:
+            # environLocal.printDebug([
+            #    'attempting makeBeams with a bar that contains durations
+            #    that sum greater than bar duration (%s > %s)' %
+            #    (durSum, barQL)])
+            continue
+
+        # getBeams
+        offset: float | Fraction = 0.0
+        if m.paddingLeft != 0.0:
+            offset = opFrac(m.paddingLeft)
+        elif m.paddingRight != 0.0:
+            pass
+        # Incomplete measure without any padding set: assume paddingLeft
+        elif noteStream.highestTime < barQL:
+            offset = barQL - noteStream.highestTime
+
+        beamsList = timeSignature.getBeams(noteStream, measureStartOffset=offset)
+
+        for i, n in enumerate(noteStream):
+            thisBeams = beamsList[i]
+            if thisBeams is not None:
+                n.beams = thisBeams
+            else:
+                n.beams = beam.Beams()
 
 
 def makeMeasures(
@@ -596,6 +606,8 @@ def makeMeasures(
     # cache information about each measure (we used to do this once per element)
     postLen = len(post)
     postMeasureList = []
+    # measure starts, for finding the measure for each element by bisection
+    postMeasureStarts = []
     lastTimeSignature = meter.TimeSignature('4/4')  # default.
 
     for i in range(postLen):
@@ -611,6 +623,7 @@ def makeMeasures(
         postMeasureList.append({'measure': m,
                                 'mStart': mStart,
                                 'mEnd': mEnd})
+        postMeasureStarts.append(mStart)
 
     # populate measures with elements
     for oneOffsetMap in offsetMapList:
@@ -627,17 +640,29 @@ def makeMeasures(
 
         match = False
 
-        for i in range(postLen):
+        # measures are in order, so the last one starting at or before
+        # the element is almost always the one that contains it
+        i = bisect.bisect_right(postMeasureStarts, start) - 1
+        if i >= 0:
             postMeasureInfo = postMeasureList[i]
             mStart = postMeasureInfo['mStart']
             mEnd = postMeasureInfo['mEnd']
             m = postMeasureInfo['measure']
-
             if mStart <= start < mEnd:
                 match = True
-                # environLocal.printDebug([
-                #    'found measure match', i, mStart, mEnd, start, end, e])
-                break
+
+        if not match:
+            for i in range(postLen):
+                postMeasureInfo = postMeasureList[i]
+                mStart = postMeasureInfo['mStart']
+                mEnd = postMeasureInfo['mEnd']
+                m = postMeasureInfo['measure']
+
+                if mStart <= start < mEnd:
+                    match = True
+                    # environLocal.printDebug([
+                    #    'found measure match', i, mStart, mEnd, start, end, e])
+                    break
 
         if not match:
             if start == end == oMax:
@@ -1246,114 +1271,13 @@ def makeTies(
     mCount = 0
     measureList = list(returnObj.getElementsByClass(stream.Measure))
 
-    while mCount < len(measureList):  # pylint: disable=too-many-nested-blocks
-        # get the current measure to look for notes that need ties
-        m = measureList[mCount]
-        activeTS = meterStream.getElementAtOrBefore(m.offset)
-
-        # get next measure; we may not need it, but have it ready
-        if mCount + 1 < len(measureList):
-            mNext = measureList[mCount + 1]
-            mNextAdd = False  # already present; do not append
-        else:  # create a new measure
-            mNext = stream.Measure()
-            # set offset to last offset plus total length
-            mOffset = m.offset
-            mNext.offset = (mOffset
-                            + activeTS.barDuration.quarterLength)
-            # increment measure number
-            mNext.number = m.number + 1
-            mNextAdd = True  # new measure, needs to be appended
-
-        if mNext.hasVoices():
-            mNextHasVoices = True
-        else:
-            mNextHasVoices = False
-
-        # environLocal.printDebug([
-        #    'makeTies() dealing with measure', m, 'mNextAdd', mNextAdd])
-        # for each measure, go through each element and see if its
-        # duration fits in the bar that contains it
-
-        mEnd = activeTS.barDuration.quarterLength
-        # if there are voices, we must look at voice id values to only
-        # connect ties to components in the same voice, assuming there
-        # are voices in the next measure
-        if m.hasVoices():
-            bundle = m.voices
-            mHasVoices = True
-        else:
-            bundle = [m]
-            mHasVoices = False
-        # bundle components may be voices, or just a measure
-        for v in bundle:
-            for e in v:
-                if e.classSet.isdisjoint(classFilterList):
-                    continue
-                vId = v.id
-                # environLocal.printDebug([
-                #    'Stream.makeTies() iterating over elements in measure',
-                #    m, e])
-                # check to see if duration is within Measure
-                eOffset = v.elementOffset(e)
-                eEnd = opFrac(eOffset + e.duration.quarterLength)
-                # assume end can be at boundary of end of measure
-                overshot = eEnd - mEnd
-
-                if overshot <= 0:
-                    continue
-                if eOffset >= mEnd:
-                    continue  # skip elements that begin past measure boundary.
-                    # TODO: put them entirely in the next measure.
-                    # raise stream.StreamException(
-                    #     'element (%s) has offset %s within a measure '
-                    #     'that ends at offset %s' % (e, eOffset, mEnd))
-
-                qLenWithinMeasure = mEnd - eOffset
-                e, eRemain = e.splitAtQuarterLength(
-                    qLenWithinMeasure,
-                    retainOrigin=True,
-                    displayTiedAccidentals=displayTiedAccidentals
-                )
-
-                # manage bridging voices
-                if mNextHasVoices:
-                    if mHasVoices:  # try to match voice id
-                        if not isinstance(vId, int):
-                            dst = mNext.voices[vId]
-                        else:
-                            dst = mNext.getElementById(vId)
-                    # src does not have voice, but dst does
-                    else:  # place in top-most voice
-                        dst = mNext.voices[0]
-                else:
-                    # mNext has no voices but this one does
-                    if mHasVoices:
-                        # internalize all components in a voice
-                        moveNotesToVoices(mNext)
-                        # place in first voice
-                        dst = mNext.voices[0]
-                    else:  # no voices in either
-                        dst = None
-
-                if dst is None:
-                    dst = mNext
-
-                # mNext.coreSelfActiveSite(eRemain)
-                # manually set activeSite
-                # cannot use coreInsert here
-                dst.insert(0, eRemain)
-
-                # we are not sure that this element fits
-                # completely in the next measure, thus, need to
-                # continue processing each measure
-                if mNextAdd:
-                    # environLocal.printDebug([
-                    #    'makeTies() inserting mNext into returnObj',
-                    #    mNext])
-                    returnObj.insert(mNext.offset, mNext)
-                    # need to make sure that the new measure is processed.
-                    measureList.append(mNext)
+    while mCount < len(measureList):
+        _makeTiesInOneMeasure(returnObj,
+                              measureList,
+                              mCount,
+                              meterStream,
+                              displayTiedAccidentals=displayTiedAccidentals,
+                              classFilterList=classFilterList)
         mCount += 1
 
     for measure in returnObj.getElementsByClass(stream.Measure):
@@ -1365,6 +1289,242 @@ def makeTies(
         return None
 
 
+def _makeTiesInOneMeasure(
+    s: StreamType,
+    measureList: list[stream.Measure],
+    mCount: int,
+    meterStream,
+    *,
+    displayTiedAccidentals=False,
+    classFilterList=(note.GeneralNote,),
+) -> None:
+    '''
+    Helper for :func:`makeTies`: split the elements of `measureList[mCount]` that
+    extend beyond its end, putting the remainders in the next measure.  If this is
+    the last measure and a new one is needed, it is inserted in `s` and appended
+    to `measureList`.
+    '''
+    from music21 import stream
+
+    # get the current measure to look for notes that need ties
+    m = measureList[mCount]
+    activeTS = meterStream.getElementAtOrBefore(m.offset)
+
+    # get next measure; we may not need it, but have it ready
+    if mCount + 1 < len(measureList):
+        mNext = measureList[mCount + 1]
+        mNextAdd = False  # already present; do not append
+    else:  # create a new measure
+        mNext = stream.Measure()
+        # set offset to last offset plus total length
+        mOffset = m.offset
+        mNext.offset = (mOffset
+                        + activeTS.barDuration.quarterLength)
+        # increment measure number
+        mNext.number = m.number + 1
+        mNextAdd = True  # new measure, needs to be appended
+
+    if mNext.hasVoices():
+        mNextHasVoices = True
+    else:
+        mNextHasVoices = False
+
+    # environLocal.printDebug([
+    #    'makeTies() dealing with measure', m, 'mNextAdd', mNextAdd])
+    # for each measure, go through each element and see if its
+    # duration fits in the bar that contains it
+
+    mEnd = activeTS.barDuration.quarterLength
+    # if there are voices, we must look at voice id values to only
+    # connect ties to components in the same voice, assuming there
+    # are voices in the next measure
+    if m.hasVoices():
+        bundle = m.voices
+        mHasVoices = True
+    else:
+        bundle = [m]
+        mHasVoices = False
+    # bundle components may be voices, or just a measure
+    for v in bundle:
+        for e in v:
+            if e.classSet.isdisjoint(classFilterList):
+                continue
+            vId = v.id
+            # environLocal.printDebug([
+            #    'Stream.makeTies() iterating over elements in measure',
+            #    m, e])
+            # check to see if duration is within Measure
+            eOffset = v.elementOffset(e)
+            eEnd = opFrac(eOffset + e.duration.quarterLength)
+            # assume end can be at boundary of end of measure
+            overshot = eEnd - mEnd
+
+            if overshot <= 0:
+                continue
+            if eOffset >= mEnd:
+                continue  # skip elements that begin past measure boundary.
+                # TODO: put them entirely in the next measure.
+                # raise stream.StreamException(
+                #     'element (%s) has offset %s within a measure '
+                #     'that ends at offset %s' % (e, eOffset, mEnd))
+
+            qLenWithinMeasure = mEnd - eOffset
+            e, eRemain = e.splitAtQuarterLength(
+                qLenWithinMeasure,
+                retainOrigin=True,
+                displayTiedAccidentals=displayTiedAccidentals
+            )
+
+            # manage bridging voices
+            if mNextHasVoices:
+                if mHasVoices:  # try to match voice id
+                    if not isinstance(vId, int):
+                        dst = mNext.voices[vId]
+                    else:
+                        dst = mNext.getElementById(vId)
+                # src does not have voice, but dst does
+                else:  # place in top-most voice
+                    dst = mNext.voices[0]
+            else:
+                # mNext has no voices but this one does
+                if mHasVoices:
+                    # internalize all components in a voice
+                    moveNotesToVoices(mNext)
+                    # place in first voice
+                    dst = mNext.voices[0]
+                else:  # no voices in either
+                    dst = None
+
+            if dst is None:
+                dst = mNext
+
+            # mNext.coreSelfActiveSite(eRemain)
+            # manually set activeSite
+            # cannot use coreInsert here
+            dst.insert(0, eRemain)
+
+            # we are not sure that this element fits
+            # completely in the next measure, thus, need to
+            # continue processing each measure
+            if mNextAdd:
+                # environLocal.printDebug([
+                #    'makeTies() inserting mNext into s',
+                #    mNext])
+                s.insert(mNext.offset, mNext)
+                # need to make sure that the new measure is processed.
+                measureList.append(mNext)
+
+
+def makeNotationInMeasureStream(
+    s: StreamType,
+    *,
+    meterStream=None,
+    accidentals: bool = True,
+    beams: bool = True,
+    **accidentalKeywords,
+) -> None:
+    # noinspection PyShadowingNames
+    '''
+    Makes accidentals (if `accidentals` is True), ties, complete tuplets, beams
+    (if `beams` is True), and tuplet brackets in place on a stream that contains
+    Measures, going through the measures once.  Helper for Stream.makeNotation.
+
+    The result is the same as calling :func:`makeAccidentalsInMeasureStream`
+    (with `accidentalKeywords`), :func:`makeTies`,
+    :func:`splitElementsToCompleteTuplets` and :func:`consolidateCompletedTuplets`
+    on each measure, :func:`makeBeams`, and :func:`makeTupletBrackets` on each
+    measure, one after the other, but each measure is finished as soon as the
+    ties from it have been made, and the time signature in effect is carried
+    from measure to measure instead of being searched for in each one.
+
+    >>> p = stream.Part()
+    >>> p.append(meter.TimeSignature('3/4'))
+    >>> p.append(note.Note('F#4', type='half'))
+    >>> p.append(note.Note('F#4', type='half'))
+    >>> p.repeatAppend(note.Note('F#4', type='eighth'), 2)
+    >>> p.makeMeasures(inPlace=True)
+    >>> stream.makeNotation.makeNotationInMeasureStream(p)
+    >>> p.show('text')
+    {0.0} <music21.stream.Measure 1 offset=0.0>
+        {0.0} <music21.clef.TrebleClef>
+        {0.0} <music21.meter.TimeSignature 3/4>
+        {0.0} <music21.note.Note F#>
+        {2.0} <music21.note.Note F#>
+    {3.0} <music21.stream.Measure 2 offset=3.0>
+        {0.0} <music21.note.Note F#>
+        {1.0} <music21.note.Note F#>
+        {1.5} <music21.note.Note F#>
+        {2.0} <music21.bar.Barline type=final>
+    >>> [n.pitch.accidental.displayStatus for n in p.recurse().notes]
+    [True, False, False, True, False]
+    >>> [str(n.tie) for n in p.recurse().notes]
+    ['None', '<music21.tie.Tie start>', '<music21.tie.Tie stop>', 'None', 'None']
+    >>> p.measure(2).notes[1].beams
+    <music21.beam.Beams <music21.beam.Beam 1/start>>
+
+    * New in v9.3.
+    '''
+    from music21 import stream
+
+    if meterStream is None:
+        meterStream = s.getTimeSignatures(sortByCreationTime=True,
+                                          searchContext=False)
+    elif not meterStream:
+        # an empty stream
+        ts = meter.TimeSignature(
+            f'{defaults.meterNumerator}/{defaults.meterDenominatorBeatType}'
+        )
+        meterStream.insert(0, ts)
+
+    measureList = list(s.getElementsByClass(stream.Measure))
+    if not measureList:
+        raise stream.StreamException('cannot process a stream without measures')
+
+    # accidentals are made one measure ahead of ties, so that (as when all the
+    # accidentals are made first) a measure does not yet contain the notes
+    # tied into it when its accidentals are made.
+    measuresWithAccidentals: Iterable[stream.Measure] = ()
+    if accidentals:
+        measuresWithAccidentals = _makeAccidentalsByMeasure(list(measureList),
+                                                            **accidentalKeywords)
+    accidentalSteps = iter(measuresWithAccidentals)
+    next(accidentalSteps, None)
+
+    lastTimeSignature: meter.TimeSignature | None = None
+    mCount = 0
+    while mCount < len(measureList):
+        next(accidentalSteps, None)
+        _makeTiesInOneMeasure(s, measureList, mCount, meterStream)
+
+        # nothing more will be tied into or out of this measure
+        m = measureList[mCount]
+        m.flattenUnnecessaryVoices(inPlace=True)
+        splitElementsToCompleteTuplets(m, recurse=True, addTies=True)
+        consolidateCompletedTuplets(m, recurse=True, onlyIfTied=True)
+
+        if m.timeSignature is not None:
+            lastTimeSignature = m.timeSignature
+        elif lastTimeSignature is None:
+            lastTimeSignature = m.getContextByClass(meter.TimeSignature)
+        if beams and lastTimeSignature is not None:
+            try:
+                _makeBeamsInOneMeasure(m, lastTimeSignature)
+            except meter.MeterException as me:
+                # as in Stream.makeNotation, leave this and later measures unbeamed
+                warnings.warn(str(me))
+                beams = False
+
+        if not m.streamStatus.tuplets:
+            makeTupletBrackets(m, inPlace=True)
+        mCount += 1
+
+    if accidentals:
+        s.streamStatus.accidentals = True
+    if beams:
+        setStemDirectionForBeamGroups(s)
+        s.streamStatus.beams = True
+
+
 def makeTupletBrackets(s: StreamType, *, inPlace=False) -> StreamType | None:
     # noinspection PyShadowingNames
     '''
@@ -1677,6 +1837,47 @@ def makeAccidentalsInMeasureStream(
         will still work.
     '''
     from music21.stream import Measure, Stream
+
+    measuresOnly: list[Measure] = list(s.getElementsByClass(Measure))
+    for unused_m in _makeAccidentalsByMeasure(
+        measuresOnly,
+        pitchPast=pitchPast,
+        pitchPastMeasure=pitchPastMeasure,
+        useKeySignature=useKeySignature,
+        alteredPitches=alteredPitches,
+        cautionaryPitchClass=cautionaryPitchClass,
+        cautionaryAll=cautionaryAll,
+        overrideStatus=overrideStatus,
+        cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
+        tiePitchSet=tiePitchSet,
+    ):
+        pass
+    if isinstance(s, Stream):
+        s.streamStatus.accidentals = True
+
+
+def _makeAccidentalsByMeasure(
+    measures: Iterable[stream.Measure],
+    *,
+    pitchPast: list[pitch.Pitch] | None = None,
+    pitchPastMeasure: list[pitch.Pitch] | None = None,
+    useKeySignature: bool | key.KeySignature = True,
+    alteredPitches: list[pitch.Pitch] | None = None,
+    cautionaryPitchClass: bool = True,
+    cautionaryAll: bool = False,
+    overrideStatus: bool = False,
+    cautionaryNotImmediateRepeat: bool = True,
+    tiePitchSet: set[str] | None = None
+) -> Generator[stream.Measure, None, None]:
+    '''
+    Generator that makes accidentals on each of `measures` in turn (see
+    :func:`makeAccidentalsInMeasureStream`) and then yields it.
+
+    What is needed from a measure to process the next one (its pitches and
+    the tie status of its last note) is gathered before the measure is yielded,
+    so the caller may make ties into or otherwise change the measure
+    before asking for the next one without changing the result.
+    '''
     # bool values for useKeySignature are not helpful here
     # because we are definitely searching key signature contexts
     # only key.KeySignature values are interesting
@@ -1688,36 +1889,32 @@ def makeAccidentalsInMeasureStream(
         ksLast = useKeySignature
         ksLastDiatonic = [p.name for p in ksLast.getScale().pitches]
 
-    measuresOnly: list[Measure] = list(s.getElementsByClass(Measure))
-    for i, m in enumerate(measuresOnly):
+    previousPitches: list[pitch.Pitch] | None = None
+    previousHasNotRest = False
+    previousTiePitchSet: set[str] | None = None
+    for m in measures:
         # if beyond the first measure, use the pitches from the last
         # measure for context (cautionary accidentals)
         # unless this measure has a key signature object
-        if i > 0:
+        if previousPitches is not None:
             if m.keySignature is None:
-                pitchPastMeasure = (
-                    measuresOnly[i - 1].pitches + ornamentalPitches(measuresOnly[i - 1])
-                )
+                pitchPastMeasure = previousPitches
             elif ksLast:
                 # If there is any key signature object to the left,
                 # just get the chromatic pitches from previous measure
                 # G-naturals in C major following G-flats in F major need cautionary
                 # G-naturals in C major following G-flats in Db major don't
-                pitchPastMeasure = [p for p in
-                    measuresOnly[i - 1].pitches + ornamentalPitches(measuresOnly[i - 1])
-                    if p.name not in ksLastDiatonic]
+                pitchPastMeasure = [p for p in previousPitches
+                                    if p.name not in ksLastDiatonic]
             # Get tiePitchSet from previous measure
-            try:
-                previousNoteOrChord = measuresOnly[i - 1][note.NotRest][-1]
-                tiePitchSet = getTiePitchSet(previousNoteOrChord)
+            if previousHasNotRest:
+                tiePitchSet = previousTiePitchSet
                 if tiePitchSet is not None and m.keySignature is not None:
                     # Get the diatonic pitches in this (new) key
                     # and limit tiePitchSet to just those
                     # Disregard tie continuation on pitches foreign to new key
                     ksNewDiatonic = [p.name for p in m.keySignature.getScale().pitches]
                     tiePitchSet = {tp for tp in tiePitchSet if tp in ksNewDiatonic}
-            except (IndexError, StreamException):
-                pass
 
         if m.keySignature is not None:
             ksLast = m.keySignature
@@ -1736,8 +1933,15 @@ def makeAccidentalsInMeasureStream(
             cautionaryNotImmediateRepeat=cautionaryNotImmediateRepeat,
             tiePitchSet=tiePitchSet,
         )
-    if isinstance(s, Stream):
-        s.streamStatus.accidentals = True
+
+        previousPitches = m.pitches + ornamentalPitches(m)
+        try:
+            previousNoteOrChord = m[note.NotRest][-1]
+            previousTiePitchSet = getTiePitchSet(previousNoteOrChord)
+            previousHasNotRest = True
+        except (IndexError, StreamException):
+            previousHasNotRest = False
+        yield m
 
 def ornamentalPitches(s: StreamType) -> list[pitch.Pitch]:
     '''
@@ -2446,6 +2650,78 @@ class Test(unittest.TestCase):
         op.makeTies(inPlace=True)
         self.assertEqual(op.scores[1][note.Note][2].tie, tie.Tie('stop'))
 
+    def testMakeNotationInMeasureStreamSameAsSteps(self):
+        '''
+        Making notation one measure at a time gives the same result as
+        making accidentals, ties, beams, and tuplet brackets one after the other.
+        '''
+        from fractions import Fraction
+        from music21 import stream
+
+        def makeMeasuredPart():
+            p = stream.Part()
+            p.insert(0, meter.TimeSignature('3/4'))
+            p.insert(0, key.KeySignature(2))
+            qls = [0.5, 2, Fraction(1, 3), Fraction(1, 3), 5, 0.25, 1.5, Fraction(2, 3),
+                   1, 0.5, 3, 0.25, 0.25, Fraction(1, 3), 2]
+            names = ['C#4', 'F4', 'F#4', 'B-4', 'G#4', 'C5', 'C#5', 'F4']
+            offset = 0.0
+            for i, ql in enumerate(qls * 4):
+                n = note.Note(names[i % len(names)], quarterLength=ql)
+                if i % 7 == 3:
+                    n = chord.Chord([n.pitch, 'E4', 'A#4'], quarterLength=ql)
+                elif i % 11 == 5:
+                    n = note.Rest(quarterLength=ql)
+                p.insert(offset, n)
+                if i % 13 == 6:
+                    # overlapping note, to make voices
+                    p.insert(offset, note.Note('D-5', quarterLength=ql + 1))
+                offset = opFrac(offset + ql)
+                if i == 20:
+                    p.insert(offset, meter.TimeSignature('5/8'))
+                if i == 35:
+                    p.insert(offset, key.KeySignature(-3))
+            p.makeVoices(inPlace=True, fillGaps=True)
+            p.makeMeasures(inPlace=True)
+            return p
+
+        def notation(p):
+            out = []
+            for el in p.recurse():
+                row = [el.classes[0], el.getOffsetInHierarchy(p), el.quarterLength]
+                if isinstance(el, note.GeneralNote):
+                    row += [el.tie,
+                            repr(el.beams) if isinstance(el, note.NotRest) else None,
+                            el.stemDirection if isinstance(el, note.NotRest) else None,
+                            [(tup.type, tup.bracket) for tup in el.duration.tuplets],
+                            [(pp.nameWithOctave, pp.accidental and pp.accidental.displayStatus)
+                             for pp in el.pitches]]
+                out.append(row)
+            return out
+
+        stepByStep = makeMeasuredPart()
+        makeAccidentalsInMeasureStream(stepByStep)
+        makeTies(stepByStep, inPlace=True)
+        for m in stepByStep.getElementsByClass(stream.Measure):
+            splitElementsToCompleteTuplets(m, recurse=True, addTies=True)
+            consolidateCompletedTuplets(m, recurse=True, onlyIfTied=True)
+        makeBeams(stepByStep, inPlace=True)
+        for m in stepByStep.getElementsByClass(stream.Measure):
+            makeTupletBrackets(m, inPlace=True)
+
+        oneMeasureAtATime = makeMeasuredPart()
+        makeNotationInMeasureStream(oneMeasureAtATime)
+
+        self.assertTrue(stepByStep.hasVoices() or stepByStep[stream.Voice])
+        self.assertEqual(notation(oneMeasureAtATime), notation(stepByStep))
+        self.assertTrue(oneMeasureAtATime.streamStatus.accidentals)
+        self.assertTrue(oneMeasureAtATime.streamStatus.beams)
+
+        unbeamed = makeMeasuredPart()
+        makeNotationInMeasureStream(unbeamed, accidentals=False, beams=False)
+        self.assertFalse(unbeamed.streamStatus.beams)
+        self.assertTrue(all(not n.beams for n in unbeamed.recurse().notes))
+
 
 # -----------------------------------------------------------------------------
 if __name__ == '__main__':
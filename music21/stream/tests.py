@@ -12,6 +12,7 @@
 from __future__ import annotations
 
 import copy
+from fractions import Fraction
 import os
 import random
 import unittest
@@ -4118,6 +4119,17 @@ class Test(unittest.TestCase):
         s2.quantize(inPlace=True, quarterLengthDivisors=[2])
         self.assertEqual(len(s2.notesAndRests), 3)
 
+    def testQuantizeTripletFillsGap(self):
+        '''
+        A gap of one quarter is filled by triplet eighths as well as by sixteenths,
+        so the nearer triplet value should win.
+        '''
+        s = Stream()
+        s.insert(0, note.Note(quarterLength=0.31))
+        s.insert(1, note.Note(quarterLength=1))
+        s.quantize((4, 3), inPlace=True)
+        self.assertEqual([n.quarterLength for n in s.notes], [Fraction(1, 3), 1.0])
+
     def testAnalyze(self):
 
         s = corpus.parse('bach/bwv66.6')
@@ -5340,6 +5352,42 @@ class Test(unittest.TestCase):
                           'stop', 'start', 'continue', 'continue', 'continue', 'continue',
                           'continue', 'continue', 'continue', 'stop'])
 
+    def testSliceByGreatestDivisorMixedTuplets(self):
+        # triplets, quintuplets, and sixteenths have an exact divisor of 1/60
+        s = Stream()
+        for ql in (Fraction(1, 3), Fraction(1, 5), 0.25, Fraction(13, 60)):
+            s.append(note.Note(quarterLength=ql))
+        post = s.sliceByGreatestDivisor(inPlace=False)
+        notes = post.notesAndRests
+        self.assertEqual(len(notes), 60)
+        self.assertTrue(all(n.quarterLength == Fraction(1, 60) for n in notes))
+        self.assertEqual(post.highestTime, 1.0)
+        self.assertEqual(post.elementOffset(notes[20]), Fraction(1, 3))
+        self.assertEqual([n.tie.type for n in notes[18:22]],
+                         ['continue', 'stop', 'start', 'continue'])
+
+    def testSliceFinerThanTicks(self):
+        # 2 ** -11 is binary expressible but not a whole number of ticks,
+        # so slicing falls back to float arithmetic.
+        s = Stream()
+        s.append(note.Note(quarterLength=2 ** -11))
+        s.append(note.Note(quarterLength=1.0))
+        post = s.sliceByGreatestDivisor(inPlace=False)
+        self.assertEqual(len(post.notes), 2049)
+        self.assertEqual(post.highestTime, 1 + 2 ** -11)
+
+        s = Stream()
+        s.append(note.Note(quarterLength=1.0))
+        s.sliceByQuarterLengths([2 ** -11], inPlace=True)
+        self.assertEqual(len(s.notes), 2048)
+        self.assertEqual(s.highestTime, 1.0)
+
+    def testSliceByQuarterLengthsCannotFill(self):
+        s = Stream()
+        s.append(note.Note(quarterLength=1.5))
+        with self.assertRaises(StreamException):
+            s.sliceByQuarterLengths([Fraction(1, 3)], inPlace=True)
+
     def testSliceByGreatestDivisorImported(self):
 
         s = corpus.parse('bwv66.6')
@@ -30,6 +30,7 @@ import warnings
 import music21
 from music21 import environment
 from music21 import common
+from music21.test import testRunner
 
 environLocal = environment.Environment('test.commonTest')
 
@@ -108,7 +109,7 @@ def testImports():
         raise ImportError('lilypond must be installed to run test suites') from e
 
 def defaultDoctestSuite(name=None):
-    globs = __import__('music21').__dict__.copy()
+    globs = testRunner.defaultGlobals()
     docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
     keywords = {
         'globs': globs,
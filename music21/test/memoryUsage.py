@@ -1,18 +1,115 @@
 # -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         memoryUsage.py
+# Purpose:      measure how much memory music21 objects and scores use
+#
+# Authors:      Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2011-2023 Michael Scott Asato Cuthbert
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+# pragma: no cover
+'''
+Memory benchmark: reports the bytes allocated per note for parsing typical
+scores and for creating notes outside of any stream, measured with tracemalloc.
+
+Run as `python -m music21.test.memoryUsage`.  Pass `--heap` to also print
+a breakdown of the heap by type (requires guppy3).
+
+This file is not run with the standard test battery.
+'''
 from __future__ import annotations
 
-from music21 import exceptions21
+import gc
+import sys
+import tracemalloc
+
+from music21 import chord
 from music21 import corpus
+from music21 import exceptions21
+from music21 import note
 
-if __name__ == '__main__':
+DEFAULT_WORKS = [
+    ('bach/bwv66.6', None),
+    ('beethoven/opus18no1', 1),
+    ('schoenberg/opus19', 2),
+    ('monteverdi/madrigal.3.1.rntxt', None),
+]
+
+
+def measure(function):
+    '''
+    Run function and return a tuple of what it returns and the number of
+    bytes that remain allocated (while the return value is kept alive).
+    '''
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = function()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def bytesPerNoteForWork(workName, movementNumber=None):
+    '''
+    Return the number of notes in a corpus work and the bytes that remain
+    allocated for the score parsed from its source file, per note.
+    '''
+    corpus.parse(workName, movementNumber, forceSource=True)  # load modules, etc.
+    score, usedBytes = measure(lambda: corpus.parse(workName, movementNumber,
+                                                    forceSource=True))
+    numNotes = len(score.recurse().notes)
+    return numNotes, usedBytes / max(numNotes, 1)
+
+
+def bytesPerLooseObject(maker, number=10_000):
+    '''
+    Return the bytes allocated per object made by `maker`, when not in a stream.
+    '''
+    def makeAll():
+        return [maker() for _ in range(number)]
+    _, usedBytes = measure(makeAll)
+    return usedBytes / number
+
+
+def main(works=None):
+    if works is None:
+        works = DEFAULT_WORKS
+    print(f'{"work":40} {"notes":>7} {"bytes/note":>11}')
+    for workName, movementNumber in works:
+        numNotes, perNote = bytesPerNoteForWork(workName, movementNumber)
+        label = workName if movementNumber is None else f'{workName} ({movementNumber})'
+        print(f'{label:40} {numNotes:7d} {perNote:11.0f}')
+
+    print()
+    print(f'{"loose object":40} {"bytes/object":>19}')
+    for label, maker in (
+        ('note.Note()', note.Note),
+        ("note.Note('C#4', quarterLength=1.5)", lambda: note.Note('C#4', quarterLength=1.5)),
+        ('note.Rest()', note.Rest),
+        ("chord.Chord('C4 E4 G4')", lambda: chord.Chord('C4 E4 G4')),
+    ):
+        print(f'{label:40} {bytesPerLooseObject(maker):19.0f}')
+
+
+def heap():
     try:
         # noinspection PyPackageRequirements
         import guppy  # type: ignore
     except ImportError:
-        raise exceptions21.Music21Exception('memoryUsage.py requires guppy')
+        raise exceptions21.Music21Exception('memoryUsage.py --heap requires guppy')
 
     hp = guppy.hpy()
     hp.setrelheap()
-    x = corpus.parse('bwv66.6')
+    unused = corpus.parse('bwv66.6')
     h = hp.heap()
     print(h)
+
+
+if __name__ == '__main__':
+    if '--heap' in sys.argv:
+        heap()
+    else:
+        main()
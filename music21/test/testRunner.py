@@ -29,6 +29,22 @@ from music21.common.stringTools import parenthesesMatch, ParenthesesMatch
 defaultImports = ['music21']
 
 
+def defaultGlobals(moduleName: str = 'music21') -> dict:
+    '''
+    Return a copy of the namespace of the module named `moduleName` for
+    doctests to run in.  Names in the module's `__all__` that are loaded
+    lazily (such as the submodules of music21) are imported first.
+
+    >>> globs = test.testRunner.defaultGlobals()
+    >>> globs['corpus']
+    <module 'music21.corpus' from '...'>
+    '''
+    module = __import__(moduleName)
+    for name in getattr(module, '__all__', ()):
+        getattr(module, name)
+    return module.__dict__.copy()
+
+
 # ALL_OUTPUT = []
 
 # test related functions
@@ -61,7 +77,7 @@ def addDocAttrTestsToSuite(suite,
     '''
     dtp = doctest.DocTestParser()
     if globs is False:
-        globs = __import__(defaultImports[0]).__dict__.copy()
+        globs = defaultGlobals(defaultImports[0])
 
     elif globs is None:
         globs = {}
@@ -239,7 +255,7 @@ def mainTest(*testClasses, **keywords):
             pass
         else:
             for di in defaultImports:
-                globs = __import__(di).__dict__.copy()
+                globs = defaultGlobals(di)
             if ('importPlusRelative' in testClasses
                     or 'importPlusRelative' in sys.argv
                     or bool(keywords.get('importPlusRelative', False))):
@@ -99,7 +99,7 @@ def main(testGroup: Sequence[str] = ('test',),
 
         allLocals = [getattr(moduleObject, x) for x in dir(moduleObject)]
 
-        globs = __import__('music21').__dict__.copy()
+        globs = testRunner.defaultGlobals()
         docTestOptions = (doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
         testRunner.addDocAttrTestsToSuite(s1,
                                           allLocals,
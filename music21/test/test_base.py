@@ -1042,6 +1042,75 @@ class Test(unittest.TestCase):
         mCopy.remove(mCopy.notes.last())
         self.assertIsNone(mCopy.notes.first().next(activeSiteOnly=True))
 
+    def testContextMapMatchesTreeSearch(self):
+        s = corpus.parse('bach/bwv66.6')
+        sCompare = corpus.parse('bach/bwv66.6')
+        notes = list(s.recurse().notes)
+        notesCompare = list(sCompare.recurse().notes)
+        searches = [
+            ElementSearch.AT_OR_BEFORE,
+            ElementSearch.BEFORE,
+            ElementSearch.AFTER,
+            ElementSearch.AT_OR_BEFORE_OFFSET,
+            ElementSearch.AFTER_OFFSET,
+        ]
+        for n, nCompare in zip(notes, notesCompare):
+            for className in (meter.TimeSignature, key.KeySignature, clef.Clef,
+                              'Instrument', note.Note, stream.Measure):
+                for search in searches:
+                    found = n.getContextByClass(className, getElementMethod=search)
+                    foundCompare = nCompare.getContextByClass(className,
+                                                              getElementMethod=search,
+                                                              useContextMap=False)
+                    self.assertEqual(repr(found), repr(foundCompare))
+                    if found is not None and foundCompare is not None:
+                        self.assertEqual(found.getOffsetInHierarchy(s),
+                                         foundCompare.getOffsetInHierarchy(sCompare))
+
+    def testContextMapInvalidation(self):
+        p = converter.parse('tinynotation: 4/4 c4 d e f g a b c')
+        n = p.recurse().notes[5]
+        self.assertEqual(n.getContextByClass(meter.TimeSignature).ratioString, '4/4')
+        self.assertIsNone(n.getContextByClass(key.KeySignature))
+        p.measure(1).insert(1.0, key.KeySignature(2))
+        p.measure(2).insert(0.0, meter.TimeSignature('2/4'))
+        self.assertEqual(n.getContextByClass(key.KeySignature).sharps, 2)
+        self.assertEqual(n.getContextByClass(meter.TimeSignature).ratioString, '2/4')
+        p.measure(2).remove(p.measure(2).timeSignature)
+        self.assertEqual(n.getContextByClass(meter.TimeSignature).ratioString, '4/4')
+
+    def testLazyAttributes(self):
+        n = note.Note('C#4')
+        self.assertIsNone(n._sites)
+        self.assertIsNone(n._groups)
+        self.assertIsNone(n._articulations)
+        self.assertIsNone(n._beams)
+        self.assertEqual(len(n.sites), 1)
+        self.assertIsNotNone(n._sites)
+
+        nCopy = copy.deepcopy(n)
+        self.assertIsNone(nCopy._groups)
+        n.groups.append('flute')
+        nCopy = copy.deepcopy(n)
+        self.assertEqual(list(nCopy.groups), ['flute'])
+        self.assertIsNot(nCopy.groups, n.groups)
+
+    def testSetStateFromOlderVersions(self):
+        n = note.Note('D4')
+        state = n.__getstate__()
+        state['sites'] = state.pop('_sites')
+        state['groups'] = base.Groups(['oboe'])
+        del state['_groups']
+        state['articulations'] = []
+        del state['_articulations']
+        state['beams'] = state.pop('_beams')
+        n2 = note.Note.__new__(note.Note)
+        n2.__setstate__(state)
+        self.assertEqual(list(n2.groups), ['oboe'])
+        self.assertEqual(n2.articulations, [])
+        self.assertEqual(len(n2.beams), 0)
+        self.assertEqual(len(n2.sites), 1)
+
     def testContextInconsistentArguments(self):
         obj = Music21Object()
         with self.assertRaises(ValueError):
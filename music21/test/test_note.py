@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import pickle
 import unittest
 
 from music21 import articulations
@@ -10,6 +11,7 @@ from music21 import expressions
 from music21.lily.translate import LilypondConverter
 from music21 import meter
 from music21 import note
+from music21 import pitch
 from music21 import stream
 from music21 import tie
 from music21 import volume
@@ -332,6 +334,71 @@ class Test(unittest.TestCase):
         self.assertEqual(n1Copy.volume.client, n1Copy)
 
 
+    def testInternedValuesSharing(self):
+        with note.internedValues():
+            n1 = note.Note('C#4', quarterLength=0.5)
+            n2 = note.Note('C#4', quarterLength=0.5)
+            c = note.Note('E-4', quarterLength=0.5)
+            e = note.Note('E-4', type='eighth')
+        self.assertIs(n1._pitch, n2._pitch)
+        self.assertIs(n1._duration, n2._duration)
+        self.assertIsInstance(n1._pitch, pitch.FrozenPitch)
+        self.assertIs(c._duration, n1._duration)
+        self.assertIs(e._pitch, c._pitch)
+        # an explicit type is kept apart from an inferred one
+        self.assertFalse(e._duration.expressionIsInferred)
+
+        # reads that do not hand out the object do not copy it
+        self.assertEqual(n1.quarterLength, 0.5)
+        self.assertEqual(n1.nameWithOctave, 'C#4')
+        self.assertLess(n2, c)
+        self.assertIs(n1._pitch, n2._pitch)
+
+        s = stream.Stream()
+        s.append([n1, n2, c])
+        self.assertEqual(s.highestTime, 1.5)
+        self.assertIs(n1._duration, n2._duration)
+
+        # accessing .pitch or .duration gives each note its own object
+        n1.pitch.octave = 5
+        n1.duration.quarterLength = 2.0
+        self.assertEqual(n1.nameWithOctave, 'C#5')
+        self.assertEqual(n2.nameWithOctave, 'C#4')
+        self.assertEqual(n2.quarterLength, 0.5)
+        self.assertIs(n1.pitch._client, n1)
+        self.assertIs(n1.duration.client, n1)
+        self.assertNotIsInstance(n1.pitch, pitch.FrozenPitch)
+
+        # interning is off again outside the context manager
+        n3 = note.Note('C#4', quarterLength=0.5)
+        self.assertIsNot(n3._pitch, n2._pitch)
+
+    def testInternedValuesCopyAndPickle(self):
+        with note.internedValues():
+            n1 = note.Note('G4', quarterLength=1.5)
+        n2 = copy.deepcopy(n1)
+        self.assertIs(n2._pitch, n1._pitch)
+        self.assertIs(n2._duration, n1._duration)
+        n2.pitch.step = 'A'
+        self.assertEqual(n1.name, 'G')
+
+        n3 = pickle.loads(pickle.dumps(n1))
+        self.assertEqual(n3.nameWithOctave, 'G4')
+        self.assertEqual(n3.quarterLength, 1.5)
+        n3.duration.dots = 0
+        self.assertEqual(n3.quarterLength, 1.0)
+        self.assertEqual(n1.quarterLength, 1.5)
+
+    def testInternedValuesKeywords(self):
+        # pitch keywords cannot be shared, and tuplet-bearing durations are not interned
+        with note.internedValues():
+            n1 = note.Note('C4', octave=5)
+            n2 = note.Note('D4', quarterLength=1 / 3)
+        self.assertNotIsInstance(n1._pitch, pitch.FrozenPitch)
+        self.assertEqual(n1.nameWithOctave, 'C5')
+        self.assertEqual(n2.duration.tuplets[0].numberNotesActual, 3)
+
+
 if __name__ == '__main__':
     import music21
     music21.mainTest(Test)
@@ -637,6 +637,37 @@ class Test(unittest.TestCase):
             str(pList)
         )
 
+    def testSpelledPitchNameTable(self):
+        # names in the precomputed table must parse as the general parser does
+        for name in ('C', 'c#4', 'B--0', 'E`9', 'F#~5', 'A-1', 'G####'):
+            p1 = pitch.Pitch(name)
+            p2 = pitch.Pitch(' ' + name + ' ')  # not in the table
+            self.assertEqual(p1, p2)
+            self.assertEqual(p1.accidental, p2.accidental)
+            self.assertEqual(p1.frequency, p2.frequency)
+        n = note.Note('C4')
+        n.pitch.name = 'D-5'
+        self.assertEqual(n.nameWithOctave, 'D-5')
+        self.assertFalse(n.pitch.spellingIsInferred)
+
+    def testSimplifyMultipleEnharmonicsRepeated(self):
+        def simplify():
+            pList = [pitch.Pitch('D--3'), pitch.Pitch('F-3'), pitch.Pitch('A--3')]
+            return pList, pitch.simplifyMultipleEnharmonics(pList, keyContext=key.Key('C'))
+
+        pList1, simple1 = simplify()
+        pList2, simple2 = simplify()
+        self.assertEqual([p.nameWithOctave for p in simple1], ['C3', 'E3', 'G3'])
+        self.assertEqual(simple1, simple2)
+        for p1, p2 in zip(simple2, pList2):
+            self.assertIsNot(p1, p2)
+        simple2[0].accidental = pitch.Accidental('sharp')
+        self.assertIsNone(simple1[0].accidental)
+
+        pList = [pitch.Pitch('A3'), pitch.Pitch('C4'), pitch.Pitch('E4')]
+        simple = pitch.simplifyMultipleEnharmonics(pList)
+        self.assertIs(simple[1], pList[1])
+
 
 if __name__ == '__main__':
     import music21
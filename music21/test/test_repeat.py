@@ -1672,6 +1672,29 @@ class Test(unittest.TestCase):
         self.assertEqual(exp.partName, 'my_part_name')
         self.assertEqual(exp.partAbbreviation, 'my_part_abbreviation')
 
+    def testPlaybackMatchesProcess(self):
+        s = corpus.parse('ryansMammoth/BanjoReel')
+        src = s.parts[0]
+        post = repeat.Expander(copy.deepcopy(src)).process()
+        expandedMeasures = list(post.getElementsByClass(stream.Measure))
+
+        ex = repeat.Expander(src)
+        playback = list(ex.playback())
+        self.assertEqual(len(playback), len(expandedMeasures))
+        for pm, mExpanded in zip(playback, expandedMeasures):
+            self.assertEqual(pm.offset, post.elementOffset(mExpanded))
+            self.assertEqual(pm.measure.number, mExpanded.number)
+        # nothing is copied: each pass yields the source measure itself
+        srcMeasureIds = {id(m) for m in src.getElementsByClass(stream.Measure)}
+        self.assertTrue(all(id(pm.measure) in srcMeasureIds for pm in playback))
+        firstPasses = [pm.passNumber for pm in playback if pm.measure is playback[0].measure]
+        self.assertEqual(firstPasses, [1, 2])
+
+        performedNames = [el.nameWithOctave
+                          for el, unused_o, unused_pass in ex.playbackElements(
+                              src.flatten().notes.stream())]
+        self.assertEqual(performedNames, [n.nameWithOctave for n in post.flatten().notes])
+
 
 if __name__ == '__main__':
     import music21
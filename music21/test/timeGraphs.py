@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import copy
 import cProfile
+import pathlib
 import pstats
 # import time
 
@@ -451,6 +452,143 @@ class TestChordifySchumann(Test):
         self.schumann.chordify()
 
 
+class TestSliceTuplets(Test):
+    '''
+    Slicing a score full of triplets, quintuplets, and sixteenths
+    by its greatest common divisor (1/60).
+    '''
+    def __init__(self):
+        from fractions import Fraction
+        import random
+        random.seed(3)
+        qls = [Fraction(1, 3), Fraction(1, 5), 0.25, 1.0]
+        self.score = music21.stream.Score()
+        for unused_part in range(2):
+            p = music21.stream.Part()
+            for mNumber in range(1, 41):
+                m = music21.stream.Measure(number=mNumber)
+                total = Fraction(0)
+                while total < 4:
+                    ql = min(Fraction(random.choice(qls)), 4 - total)
+                    m.append(music21.note.Note(quarterLength=ql))
+                    total += ql
+                p.append(m)
+            self.score.insert(0, p)
+
+    def testFocus(self):
+        self.score.sliceByGreatestDivisor(inPlace=False)
+
+
+class TestABCTokenize(Test):
+    '''
+    Tokenizing every ABC file in the corpus.
+    '''
+    def __init__(self):
+        from music21 import common
+        self.data = []
+        for fp in sorted((common.getSourceFilePath() / 'corpus').rglob('*.abc')):
+            self.data.append(fp.read_text(encoding='utf-8'))
+
+    def testFocus(self):
+        for abcData in self.data:
+            music21.abcFormat.ABCHandler().tokenize(abcData)
+
+
+
+class TestHumdrumParseLarge(Test):
+    '''
+    Parsing a large four-spine kern file.
+    '''
+    def __init__(self):
+        fp = music21.corpus.getWork('beethoven/opus18no1/movement1', fileExtensions=('krn',))
+        with open(fp, encoding='latin-1') as f:
+            self.data = f.read()
+
+    def testFocus(self):
+        music21.humdrum.spineParser.HumdrumDataCollection(self.data).parse()
+
+
+class TestRomanTextRecords(Test):
+    '''
+    Reading analysis records from every RomanText file in the corpus.
+    '''
+    def __init__(self):
+        from music21 import common
+        self.paths = sorted((common.getSourceFilePath() / 'corpus').rglob('*.rntxt'))
+
+    def testFocus(self):
+        for fp in self.paths:
+            for unused_record in music21.romanText.records.iterRomanTextRecords(fp):
+                pass
+
+
+
+class TestNGramIndexSearch(Test):
+    '''
+    Finding the four-note windows of one chorale in an index of forty
+    chorales, verifying only the candidate locations.
+    '''
+    def __init__(self):
+        from music21 import corpus
+        from music21.search import ngram
+        paths = [str(p) for p in corpus.getComposer('bach')][:40]
+        self.index = ngram.NGramIndex()
+        self.index.addFilePaths(paths)
+        self.streams = {fp.name: corpus.parse(fp) for fp in map(pathlib.Path, paths)}
+        soprano = self.streams[pathlib.Path(paths[0]).name].parts[0]
+        els = ngram.codedElements(soprano.recurse().notesAndRests)
+        self.queries = [els[i:i + 4] for i in range(0, len(els) - 4, 4)]
+
+    def testFocus(self):
+        for query in self.queries:
+            self.index.search(query, streams=self.streams)
+
+
+class TestSegmentSimilarity(Test):
+    '''
+    Finding similar segments among sixty chorales, comparing only the
+    candidate pairs chosen by MinHash.
+    '''
+    def __init__(self):
+        from music21 import corpus
+        from music21.search import segment
+        paths = [p for p in corpus.getComposer('bach') if p.suffix == '.mxl'][:60]
+        self.scoreDict = segment.indexScoreFilePaths(paths)
+
+    def testFocus(self):
+        from music21.search import segment
+        for unused_result in segment.iterSegmentSimilarity(self.scoreDict,
+                                                           forceDifflib=True,
+                                                           runMulticore=False):
+            pass
+
+
+class TestSerialTransformedSegments(Test):
+    '''
+    Labelling every form of a twelve-tone row, and its trichords, in a
+    four-hundred-eighty note part.
+    '''
+    def __init__(self):
+        from music21 import note
+        from music21 import serial
+        from music21 import stream
+        self.row = [0, 11, 7, 8, 3, 1, 2, 10, 6, 5, 4, 9]
+        toneRow = serial.pcToToneRow(self.row)
+        p = stream.Part()
+        for i in range(40):
+            transformation = ('P', 'I', 'R', 'RI')[i % 4]
+            transformed = toneRow.zeroCenteredTransformation(transformation, (i * 5) % 12)
+            for pc in transformed.pitchClasses():
+                p.append(note.Note(60 + pc))
+        self.part = p.makeMeasures()
+
+    def testFocus(self):
+        from music21.search import serial
+        serial.labelTransformedSegments(self.part, {'row': self.row,
+                                                    'first': self.row[:3],
+                                                    'last': self.row[9:]})
+
+
 def main(TestClass):
     MIN_FRACTION_TO_REPORT = 0.3
 
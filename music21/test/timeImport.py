@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:          timeImport.py
+# Purpose:       time cold imports of music21 and report time per subsystem
+#
+# Authors:       Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert and the music21
+#               Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+# pragma: no cover
+'''
+Time how long a cold `import music21` takes in a fresh interpreter, and use
+`python -X importtime` to report how much of that time each music21
+subsystem (top-level submodule or subpackage) is responsible for.
+
+Run as `python -m music21.test.timeImport`, optionally followed by other
+statements to time, such as `"from music21 import *"`.
+'''
+from __future__ import annotations
+
+import collections
+import statistics
+import subprocess
+import sys
+
+DEFAULT_STATEMENTS = (
+    'import music21',
+    'from music21 import note, stream',
+    'from music21 import converter',
+    'from music21 import *',
+)
+
+
+def coldImportTime(statement: str, repeat: int = 5) -> float:
+    '''
+    Return the median number of seconds that running `statement` takes
+    in a new interpreter.
+    '''
+    program = ('import time; t = time.perf_counter(); '
+               + statement
+               + '; print(time.perf_counter() - t)')
+    times = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', program],
+                             capture_output=True, text=True, check=True)
+        times.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(times)
+
+
+def importTimeBySubsystem(statement: str) -> dict[str, int]:
+    '''
+    Return a dictionary mapping each music21 subsystem imported by
+    `statement` to the microseconds spent importing it (self time of the
+    subsystem and all of its submodules, as reported by `-X importtime`).
+    '''
+    out = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                         capture_output=True, text=True, check=True)
+    totals: dict[str, int] = collections.Counter()
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        try:
+            selfTime, unused_cumulative, name = line[len('import time:'):].split('|')
+            selfMicroseconds = int(selfTime)
+        except ValueError:  # header line
+            continue
+        name = name.strip()
+        if name == 'music21':
+            totals['music21'] += selfMicroseconds
+        elif name.startswith('music21.'):
+            totals['music21.' + name.split('.')[1]] += selfMicroseconds
+        else:
+            totals['(other)'] += selfMicroseconds
+    return dict(totals)
+
+
+def main(statements=DEFAULT_STATEMENTS, minMicroseconds=5000):
+    for statement in statements:
+        seconds = coldImportTime(statement)
+        print(f'{statement!r}: {seconds:.3f}s (median of cold runs)')
+        bySubsystem = importTimeBySubsystem(statement)
+        for name, micro in sorted(bySubsystem.items(), key=lambda x: -x[1]):
+            if micro >= minMicroseconds:
+                print(f'    {name:32} {micro / 1e6:.3f}s')
+        print()
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:] or DEFAULT_STATEMENTS)
@@ -26,6 +26,7 @@ __all__ = [
     'fromStream',
     'node',
     'spans',
+    'staticTree',
     'toStream',
     'trees',
     'verticality',
@@ -45,6 +46,14 @@ from music21.tree import trees
 from music21.tree import verticality
 
 
+def __getattr__(name: str):
+    # staticTree needs NumPy, so it is only loaded when first used.
+    if name == 'staticTree':
+        import importlib
+        return importlib.import_module('music21.tree.staticTree')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 # -----------------------------------------------------------------------------
 
 # TODO: Test with scores with Voices: cpebach/h186
@@ -530,6 +530,44 @@ class OffsetNode(ElementNode):
         self.endTimeLow = endTimeLow
         self.endTimeHigh = endTimeHigh
 
+    def updateEndTimesFromChildren(self):
+        r'''
+        Updates the cached maximum and minimum endTime values of this node
+        from its own payload and the values already cached on its children,
+        without descending into the subtrees.
+
+        Used by OffsetTree and TimespanTree when a single node has changed, so that only
+        the nodes on the path to the change need to be recomputed.
+
+        >>> offsetNode = tree.node.OffsetNode(40)
+        >>> offsetNode.payload.append(tree.spans.Timespan(40, 44))
+        >>> offsetNode.updateEndTimesFromChildren()
+        >>> offsetNode.endTimeLow, offsetNode.endTimeHigh
+        (44.0, 44.0)
+
+        * New in v9.3.
+        '''
+        payload = self.payload
+        if payload:
+            try:
+                endTimeLow = min(x.endTime for x in payload)
+                endTimeHigh = max(x.endTime for x in payload)
+            except AttributeError:  # see updateEndTimes
+                endTimeLow = self.position + min(x.duration.quarterLength for x in payload)
+                endTimeHigh = self.position + max(x.duration.quarterLength for x in payload)
+        else:
+            endTimeLow = endTimeHigh = None
+
+        for child in (self.leftChild, self.rightChild):
+            if child is None or child.endTimeLow is None:
+                continue
+            if endTimeLow is None or child.endTimeLow < endTimeLow:
+                endTimeLow = child.endTimeLow
+            if endTimeHigh is None or endTimeHigh < child.endTimeHigh:
+                endTimeHigh = child.endTimeHigh
+        self.endTimeLow = endTimeLow
+        self.endTimeHigh = endTimeHigh
+
     def payloadEndTimes(self):
         '''
         returns a (potentially unsorted) list of all the end times for all TimeSpans or
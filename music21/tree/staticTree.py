@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Name:         tree/staticTree.py
+# Purpose:      An array-backed, read-only alternative to TimespanTree
+#
+# Authors:      Michael Scott Asato Cuthbert
+#
+# Copyright:    Copyright © 2026 Michael Scott Asato Cuthbert and the music21
+#               Project
+# License:      BSD, see license.txt
+# -----------------------------------------------------------------------------
+'''
+A read-only interval index over timespans, for analyses that build a
+:class:`~music21.tree.timespanTree.TimespanTree` once and then only query it.
+
+Instead of a tree of node objects, a :class:`StaticTimespanTree` keeps the
+timespans in a single sorted tuple alongside NumPy arrays of their start and
+end times, plus a running maximum of the end times, so that every query
+is a binary search (or a vectorized comparison over a contiguous slice)
+and nothing needs to be rebalanced or re-indexed.
+'''
+from __future__ import annotations
+
+from collections.abc import Iterable
+import random
+import unittest
+
+import numpy as np
+
+from music21 import common
+from music21 import environment
+from music21 import exceptions21
+
+from music21.tree import spans
+from music21.tree import timespanTree
+from music21.tree import trees
+
+environLocal = environment.Environment('tree.staticTree')
+
+
+# -----------------------------------------------------------------------------
+class StaticTimespanTreeException(exceptions21.TreeException):
+    pass
+
+
+# -----------------------------------------------------------------------------
+class StaticTimespanTree:
+    r'''
+    A static, array-backed interval index of timespans which answers the same
+    queries as a :class:`~music21.tree.timespanTree.TimespanTree`, but cannot be changed
+    after it is created.
+
+    It can be made from a TimespanTree (or any iterable of timespans):
+
+    >>> score = corpus.parse('bwv66.6')
+    >>> scoreTree = score.asTimespans(classList=(note.Note,))
+    >>> staticTree = tree.staticTree.StaticTimespanTree(scoreTree)
+    >>> staticTree
+    <StaticTimespanTree {165} (0.0 to 36.0) <music21.stream.Score bach/bwv66.6.mxl>>
+
+    >>> for ts in staticTree.elementsOverlappingOffset(0.75):
+    ...     ts
+    <PitchedTimespan (0.0 to 1.0) <music21.note.Note E>>
+    <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+    <PitchedTimespan (0.5 to 1.0) <music21.note.Note B>>
+    <PitchedTimespan (0.5 to 1.0) <music21.note.Note G#>>
+    >>> print(staticTree.getVerticalityAt(17.0))
+    <music21.tree.verticality.Verticality 17.0 {F#3 C#4 A4}>
+
+    Verticalities made from a StaticTimespanTree can find their neighbors like
+    those from a TimespanTree:
+
+    >>> print(staticTree.getVerticalityAt(17.0).nextVerticality)
+    <music21.tree.verticality.Verticality 17.5 {F#3 D4 F#4 A4}>
+
+    Timespans are ordered by offset and then by endTime, as in a TimespanTree:
+
+    >>> ts = [tree.spans.Timespan(x, y) for x, y in ((3, 4), (0, 9), (0, 2))]
+    >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+    >>> list(staticTree)
+    [<Timespan 0.0 2.0>, <Timespan 0.0 9.0>, <Timespan 3.0 4.0>]
+
+    Only timespans can be stored, so trees made with `flatten=False`, which
+    hold other trees, cannot be converted:
+
+    >>> tree.staticTree.StaticTimespanTree([tree.timespanTree.TimespanTree()])
+    Traceback (most recent call last):
+    music21.tree.staticTree.StaticTimespanTreeException:
+        <TimespanTree {0} (-inf to inf)> is not a Timespan.
+
+    * New in v9.3.
+    '''
+    __slots__ = (
+        '_ends',
+        '_endOrder',
+        '_maxEnds',
+        '_offsets',
+        '_source',
+        '_starts',
+        '_timespans',
+    )
+
+    def __init__(self, timespans: Iterable[spans.Timespan] = (), source=None):
+        if isinstance(timespans, trees.ElementTree) and source is None:
+            source = timespans.source
+        timespanList = list(timespans)
+        for ts in timespanList:
+            if not isinstance(ts, spans.Timespan):
+                raise StaticTimespanTreeException(f'{ts!r} is not a Timespan.')
+        # stable, so a TimespanTree's order among equal timespans is kept.
+        timespanList.sort(key=lambda ts: (ts.offset, ts.endTime))
+        self._timespans: tuple[spans.Timespan, ...] = tuple(timespanList)
+
+        self._starts = np.array([ts.offset for ts in timespanList], dtype=np.float64)
+        self._ends = np.array([ts.endTime for ts in timespanList], dtype=np.float64)
+        # _maxEnds[i] is the latest endTime of the first i + 1 timespans.  It never
+        # decreases, so the first timespan that could reach past an offset is a
+        # binary search away.
+        self._maxEnds = np.maximum.accumulate(self._ends) if timespanList else self._ends
+        self._endOrder = np.argsort(self._ends, kind='stable')
+        self._offsets = np.unique(self._starts)
+        self._source = None
+        self.source = source
+
+    # SPECIAL METHODS #
+
+    def __contains__(self, span):
+        return any(ts is span for ts in self.elementsStartingAt(span.offset))
+
+    def __getitem__(self, i):
+        '''
+        Gets timespans by integer index or slice.
+
+        >>> ts = [tree.spans.Timespan(x, x + 1) for x in range(5)]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree[-1]
+        <Timespan 4.0 5.0>
+        >>> staticTree[1:3]
+        [<Timespan 1.0 2.0>, <Timespan 2.0 3.0>]
+        '''
+        if isinstance(i, slice):
+            return list(self._timespans[i])
+        return self._timespans[i]
+
+    def __iter__(self):
+        return iter(self._timespans)
+
+    def __len__(self):
+        return len(self._timespans)
+
+    def __repr__(self):
+        o = self.source
+        msg = (f'<{type(self).__name__} {{{len(self)}}} '
+               + f'({self.lowestPosition()} to {self.endTime})')
+        if o is not None:
+            msg += f' {o!r}'
+        msg += '>'
+        return msg
+
+    # PROPERTIES #
+
+    @property
+    def source(self):
+        '''
+        the original stream. (stored as a weakref but returned unwrapped)
+        '''
+        return common.unwrapWeakref(self._source)
+
+    @source.setter
+    def source(self, expr):
+        self._source = common.wrapWeakref(expr)
+
+    @property
+    def endTime(self):
+        '''
+        Gets the latest stop position in this tree, or infinity if it is empty.
+        '''
+        if not self._timespans:
+            return trees.INFINITY
+        return float(self._maxEnds[-1])
+
+    # PUBLIC METHODS #
+
+    def index(self, span):
+        '''
+        Gets the index of a timespan in this tree.
+
+        >>> ts = [tree.spans.Timespan(x, x + 1) for x in range(5)]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.index(ts[3])
+        3
+        >>> staticTree.index(tree.spans.Timespan(-100, 100))
+        Traceback (most recent call last):
+        ValueError: <Timespan -100.0 100.0> not in Tree at offset -100.0.
+        '''
+        offset = span.offset
+        lo = int(np.searchsorted(self._starts, offset, side='left'))
+        hi = int(np.searchsorted(self._starts, offset, side='right'))
+        for i in range(lo, hi):
+            if self._timespans[i] is span:
+                return i
+        raise ValueError(f'{span} not in Tree at offset {offset}.')
+
+    def lowestPosition(self):
+        '''
+        Gets the earliest offset in this tree, or negative infinity if it is empty.
+        '''
+        if not self._timespans:
+            return trees.NEGATIVE_INFINITY
+        return float(self._offsets[0])
+
+    def highestPosition(self):
+        '''
+        Gets the latest offset in this tree, or negative infinity if it is empty.
+        '''
+        if not self._timespans:
+            return trees.NEGATIVE_INFINITY
+        return float(self._offsets[-1])
+
+    def getPositionAfter(self, position):
+        '''
+        Gets the first offset after `position`, or None if there is none.
+
+        >>> ts = [tree.spans.Timespan(x, x + 1) for x in range(5)]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.getPositionAfter(1.5)
+        2.0
+        >>> staticTree.getPositionAfter(4.0) is None
+        True
+        '''
+        i = int(np.searchsorted(self._offsets, position, side='right'))
+        if i == len(self._offsets):
+            return None
+        return float(self._offsets[i])
+
+    def getPositionBefore(self, position):
+        '''
+        Gets the last offset before `position`, or None if there is none.
+
+        >>> ts = [tree.spans.Timespan(x, x + 1) for x in range(5)]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.getPositionBefore(1.0)
+        0.0
+        >>> staticTree.getPositionBefore(0.0) is None
+        True
+        '''
+        i = int(np.searchsorted(self._offsets, position, side='left'))
+        if i == 0:
+            return None
+        return float(self._offsets[i - 1])
+
+    def allOffsets(self):
+        '''
+        Gets all unique offsets of all timespans in this tree.
+        '''
+        return tuple(self._offsets.tolist())
+
+    def allTimePoints(self):
+        '''
+        Gets all unique offsets and endTimes of all timespans in this tree.
+
+        >>> ts = [tree.spans.Timespan(x, y) for x, y in ((0, 2), (1, 2), (1, 3.5))]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.allTimePoints()
+        (0.0, 1.0, 2.0, 3.5)
+        '''
+        return tuple(np.union1d(self._starts, self._ends).tolist())
+
+    def elementsStartingAt(self, offset):
+        '''
+        Finds timespans in this tree which start at `offset`.
+        '''
+        lo = int(np.searchsorted(self._starts, offset, side='left'))
+        hi = int(np.searchsorted(self._starts, offset, side='right'))
+        return self._timespans[lo:hi]
+
+    def elementsStoppingAt(self, offset):
+        '''
+        Finds timespans in this tree which stop at `offset`, ordered by offset.
+        '''
+        sortedEnds = self._ends[self._endOrder]
+        lo = int(np.searchsorted(sortedEnds, offset, side='left'))
+        hi = int(np.searchsorted(sortedEnds, offset, side='right'))
+        return tuple(self._timespans[i] for i in self._endOrder[lo:hi].tolist())
+
+    def elementsOverlappingOffset(self, offset):
+        '''
+        Finds timespans in this tree which start before and end after `offset`.
+
+        >>> ts = [tree.spans.Timespan(x, y) for x, y in ((0, 2), (0, 9), (1, 1), (5, 8))]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.elementsOverlappingOffset(1.0)
+        (<Timespan 0.0 2.0>, <Timespan 0.0 9.0>)
+        >>> staticTree.elementsOverlappingOffset(6.0)
+        (<Timespan 0.0 9.0>, <Timespan 5.0 8.0>)
+        '''
+        return tuple(self._timespans[i] for i in self._overlappingIndices(offset))
+
+    def _overlappingIndices(self, offset):
+        '''
+        The indices of the timespans overlapping `offset`: only those between the
+        first one whose running maximum endTime passes `offset` and the last one
+        starting before it need to be checked.
+        '''
+        lo = int(np.searchsorted(self._maxEnds, offset, side='right'))
+        hi = int(np.searchsorted(self._starts, offset, side='left'))
+        if lo >= hi:
+            return []
+        return (lo + np.flatnonzero(self._ends[lo:hi] > offset)).tolist()
+
+    def getVerticalityAt(self, offset):
+        '''
+        Gets the :class:`~music21.tree.verticality.Verticality` in this tree
+        at `offset`.
+        '''
+        from music21.tree.verticality import Verticality
+        return Verticality(
+            overlapTimespans=self.elementsOverlappingOffset(offset),
+            startTimespans=self.elementsStartingAt(offset),
+            offset=offset,
+            stopTimespans=self.elementsStoppingAt(offset),
+            timespanTree=self,
+        )
+
+    def iterateVerticalitiesAtTimePoints(self, timePoints=None):
+        '''
+        Iterates the :class:`~music21.tree.verticality.Verticality` at each
+        offset in `timePoints` (by default every offset and endTime in the tree),
+        searching for all of them at once.  Unlike the TimespanTree version,
+        `timePoints` need not be in order.
+
+        >>> ts = [tree.spans.Timespan(x, y) for x, y in ((0, 2), (0, 9), (1, 1), (5, 8))]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> for v in staticTree.iterateVerticalitiesAtTimePoints([8.0, 1.0]):
+        ...     v.offset, v.startTimespans, v.overlapTimespans, v.stopTimespans
+        (8.0, (), (<Timespan 0.0 9.0>,), (<Timespan 5.0 8.0>,))
+        (1.0, (<Timespan 1.0 1.0>,), (<Timespan 0.0 2.0>, <Timespan 0.0 9.0>),
+            (<Timespan 1.0 1.0>,))
+        '''
+        from music21.tree.verticality import Verticality
+
+        if timePoints is None:
+            timePoints = self.allTimePoints()
+        timePoints = list(timePoints)
+        points = np.asarray(timePoints, dtype=np.float64)
+        timespans = self._timespans
+        ends = self._ends
+        endOrder = self._endOrder.tolist()
+        sortedEnds = self._ends[self._endOrder]
+
+        startLows = np.searchsorted(self._starts, points, side='left').tolist()
+        startHighs = np.searchsorted(self._starts, points, side='right').tolist()
+        stopLows = np.searchsorted(sortedEnds, points, side='left').tolist()
+        stopHighs = np.searchsorted(sortedEnds, points, side='right').tolist()
+        overlapLows = np.searchsorted(self._maxEnds, points, side='right').tolist()
+
+        for i, offset in enumerate(timePoints):
+            lo = overlapLows[i]
+            hi = startLows[i]
+            if lo < hi:
+                overlapIndices = (lo + np.flatnonzero(ends[lo:hi] > points[i])).tolist()
+            else:
+                overlapIndices = []
+            yield Verticality(
+                offset=offset,
+                overlapTimespans=tuple(timespans[j] for j in overlapIndices),
+                startTimespans=timespans[hi:startHighs[i]],
+                stopTimespans=tuple(timespans[j]
+                                    for j in endOrder[stopLows[i]:stopHighs[i]]),
+                timespanTree=self,
+            )
+
+    def iterateVerticalities(self, reverse=False):
+        '''
+        Iterates the :class:`~music21.tree.verticality.Verticality` at each
+        offset in this tree, or in reverse order if `reverse` is True.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> staticTree = tree.staticTree.StaticTimespanTree(
+        ...     score.asTimespans(classList=(note.Note,)))
+        >>> for v in staticTree.iterateVerticalities(reverse=True):
+        ...     print(v)
+        ...     break
+        <music21.tree.verticality.Verticality 35.0 {F#3 A#3 C#4 F#4}>
+        '''
+        offsets = self.allOffsets()
+        if not offsets:
+            # like a TimespanTree, an empty tree still has an empty verticality
+            offsets = (trees.NEGATIVE_INFINITY,)
+        if reverse:
+            offsets = offsets[::-1]
+        yield from self.iterateVerticalitiesAtTimePoints(offsets)
+
+    def simultaneityDict(self):
+        '''
+        Creates a dictionary of offsets that have more than one timespan starting
+        at that time, where the values are lists of those timespans.
+
+        >>> ts = [tree.spans.Timespan(x, y) for x, y in ((0, 2), (0, 9), (1, 1), (5, 8))]
+        >>> staticTree = tree.staticTree.StaticTimespanTree(ts)
+        >>> staticTree.simultaneityDict()
+        {0.0: [<Timespan 0.0 2.0>, <Timespan 0.0 9.0>]}
+        '''
+        offsets, firstIndices, counts = np.unique(
+            self._starts, return_index=True, return_counts=True)
+        simultaneityDict = {}
+        for offset, first, count in zip(offsets.tolist(),
+                                        firstIndices.tolist(),
+                                        counts.tolist()):
+            if count > 1:
+                simultaneityDict[offset] = list(self._timespans[first:first + count])
+        return simultaneityDict
+
+    def maximumOverlap(self):
+        '''
+        The maximum number of timespans overlapping at any given moment in this tree,
+        or None if the tree is empty.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> staticTree = tree.staticTree.StaticTimespanTree(
+        ...     score.asTimespans(classList=(note.Note,)))
+        >>> staticTree.maximumOverlap()
+        4
+        '''
+        if not self._timespans:
+            return None
+        return max(len(v.startTimespans) + len(v.overlapTimespans)
+                   for v in self.iterateVerticalities())
+
+    getVerticalityAtOrBefore = timespanTree.TimespanTree.getVerticalityAtOrBefore
+    iterateVerticalitiesNwise = timespanTree.TimespanTree.iterateVerticalitiesNwise
+    overlapTimePoints = trees.OffsetTree.overlapTimePoints
+
+
+# -----------------------------------------------------------------------------
+class Test(unittest.TestCase):
+
+    def testMatchesTimespanTree(self):
+        from music21.tree.staticTree import StaticTimespanTree
+        rng = random.Random(48)
+        tsTree = timespanTree.TimespanTree()
+        for unused_counter in range(150):
+            start = rng.randrange(40) / 2
+            tsTree.insert(spans.Timespan(start, start + rng.randrange(12) / 4))
+        staticTree = StaticTimespanTree(tsTree)
+
+        self.assertEqual(list(staticTree), list(tsTree))
+        self.assertEqual(staticTree.allOffsets(), tsTree.allOffsets())
+        self.assertEqual(staticTree.allTimePoints(), tsTree.allTimePoints())
+        self.assertEqual(staticTree.endTime, tsTree.endTime)
+        self.assertEqual(staticTree.simultaneityDict(), tsTree.simultaneityDict())
+        self.assertEqual(staticTree.maximumOverlap(), tsTree.maximumOverlap())
+
+        timePoints = sorted({-1.0, 3.125, 30.0}.union(tsTree.allTimePoints()))
+        for static, timePoint in zip(staticTree.iterateVerticalitiesAtTimePoints(timePoints),
+                                     timePoints):
+            expected = tsTree.getVerticalityAt(timePoint)
+            self.assertEqual(static.startTimespans, expected.startTimespans)
+            self.assertEqual(static.overlapTimespans, expected.overlapTimespans)
+            self.assertEqual(static.stopTimespans, expected.stopTimespans)
+            self.assertEqual(staticTree.getPositionAfter(timePoint),
+                             tsTree.getPositionAfter(timePoint))
+            self.assertEqual(staticTree.getPositionBefore(timePoint),
+                             tsTree.getPositionBefore(timePoint))
+
+        self.assertEqual([v.offset for v in staticTree.iterateVerticalities(reverse=True)],
+                         [v.offset for v in tsTree.iterateVerticalities(reverse=True)])
+
+    def testEmpty(self):
+        from music21.tree.staticTree import StaticTimespanTree
+        staticTree = StaticTimespanTree()
+        tsTree = timespanTree.TimespanTree()
+        self.assertEqual(len(staticTree), 0)
+        self.assertEqual(staticTree.endTime, tsTree.endTime)
+        self.assertEqual(staticTree.lowestPosition(), tsTree.lowestPosition())
+        self.assertEqual(staticTree.elementsOverlappingOffset(1.0), ())
+        self.assertIsNone(staticTree.maximumOverlap())
+        self.assertEqual(len(list(staticTree.iterateVerticalities())), 1)
+
+
+# -----------------------------------------------------------------------------
+# define presented order in documentation
+_DOC_ORDER = (StaticTimespanTree,)
+
+
+if __name__ == '__main__':
+    import music21
+    music21.mainTest(Test)
@@ -219,6 +219,7 @@ class TimespanTree(trees.OffsetTree):
         node = self.getNodeByPosition(offset)
         if node is None or span not in node.payload:
             raise ValueError(f'{span} not in Tree at offset {offset}.')
+        self._refreshIndices()
         index = node.payload.index(span) + node.payloadElementsStartIndex
         return index
 
@@ -244,6 +245,120 @@ class TimespanTree(trees.OffsetTree):
         '''
         self.removeElements(elements, offsets, runUpdate)
 
+    def insertIncremental(self, span, *, payloadSortKey=None):
+        r'''
+        Inserts a single timespan into the tree, updating only the
+        cached endTimes of the nodes on the path to its offset,
+        so that the insertion costs O(log n) rather than the O(n) of
+        :meth:`~music21.tree.trees.ElementTree.insert`, which walks the
+        whole tree afterwards.  Element indices are recomputed the next time they
+        are needed.
+
+        >>> tsTree = tree.timespanTree.TimespanTree()
+        >>> tsTree.insert([tree.spans.Timespan(0, 2), tree.spans.Timespan(3, 4)])
+        >>> tsTree.insertIncremental(tree.spans.Timespan(1, 6))
+        >>> tsTree
+        <TimespanTree {3} (0.0 to 6.0)>
+        >>> tsTree[1]
+        <Timespan 1.0 6.0>
+
+        Timespans at the same offset are ordered by endTime, as with
+        :meth:`~music21.tree.trees.ElementTree.insert`, unless a
+        `payloadSortKey` function is given to order them by:
+
+        >>> tsTree.insertIncremental(tree.spans.Timespan(1, 2),
+        ...                          payloadSortKey=lambda ts: -ts.endTime)
+        >>> tsTree[1:3]
+        [<Timespan 1.0 6.0>, <Timespan 1.0 2.0>]
+
+        Parent trees are not informed of the change.
+
+        * New in v9.3.
+        '''
+        offset = span.offset
+        if payloadSortKey is None:
+            self._insertCore(offset, span)
+        else:
+            self.createNodeAtPosition(offset)
+            node = self.getNodeByPosition(offset)
+            node.payload.append(span)
+            node.payload.sort(key=payloadSortKey)
+        self._updateEndTimesOnPath(offset)
+        self._indicesAreStale = True
+
+    def removeIncremental(self, span):
+        r'''
+        Removes a single timespan from the tree in O(log n), the
+        counterpart of :meth:`insertIncremental`.  Returns True if the timespan
+        was found and removed, False if it was not in the tree.
+
+        >>> ts = [tree.spans.Timespan(x, y) for x, y in ((0, 2), (1, 6), (3, 4))]
+        >>> tsTree = tree.timespanTree.TimespanTree()
+        >>> tsTree.insert(ts)
+        >>> tsTree.removeIncremental(ts[1])
+        True
+        >>> tsTree
+        <TimespanTree {2} (0.0 to 4.0)>
+        >>> tsTree.removeIncremental(ts[1])
+        False
+
+        * New in v9.3.
+        '''
+        offset = span.offset
+        node = self.getNodeByPosition(offset)
+        if node is None:
+            return False
+        for i, payloadSpan in enumerate(node.payload):
+            if payloadSpan is span:
+                break
+        else:
+            return False
+
+        del node.payload[i]
+        self._indicesAreStale = True
+        if node.payload:
+            self._updateEndTimesOnPath(offset)
+            return True
+
+        successorPosition = None
+        if node.leftChild is not None and node.rightChild is not None:
+            # removeNode will move the successor's position and payload into this node.
+            successor = node.rightChild
+            while successor.leftChild is not None:
+                successor = successor.leftChild
+            successorPosition = successor.position
+        self.removeNode(offset)
+        self._updateEndTimesOnPath(offset)
+        if successorPosition is not None:
+            self._updateEndTimesOnPath(successorPosition, passEqual=True)
+        return True
+
+    def _updateEndTimesOnPath(self, position, passEqual=False):
+        '''
+        Recomputes the cached endTimes of the nodes on the path from the root
+        toward `position`, bottom-up, along with the children of those nodes
+        (which may have been rotated into place while rebalancing).
+
+        If `passEqual` is True, the path continues to the right at a node
+        whose position is `position` instead of stopping there.
+        '''
+        path = []
+        node = self.rootNode
+        while node is not None:
+            path.append(node)
+            if node.position == position and not passEqual:
+                break
+            if position < node.position:
+                node = node.leftChild
+            else:
+                node = node.rightChild
+
+        for node in reversed(path):
+            for child in (node.leftChild, node.rightChild):
+                if child is not None:
+                    child.updateEndTimesFromChildren()
+            node.updateEndTimesFromChildren()
+
     def findNextPitchedTimespanInSameStreamByClass(self, pitchedTimespan, classList=None):
         r'''
         Finds next element timespan in the same stream class as `PitchedTimespan`.
@@ -634,6 +749,76 @@ class TimespanTree(trees.OffsetTree):
         #         if len(verticalities) == n:
         #             yield VerticalitySequence(reversed(verticalities))
 
+    def iterateVerticalitiesAtTimePoints(self, timePoints=None):
+        r'''
+        Iterates the :class:`~music21.tree.verticality.Verticality` at each
+        offset in `timePoints` (which must be in ascending order; by default
+        :meth:`allTimePoints`).
+
+        The result is the same as calling :meth:`getVerticalityAt` for each offset,
+        but the verticalities are found in a single sweep through the tree
+        which keeps track of the timespans still sounding, rather than
+        by searching the tree again at every offset.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> iterator = scoreTree.iterateVerticalitiesAtTimePoints()
+        >>> for _ in range(3):
+        ...     next(iterator)
+        <music21.tree.verticality.Verticality 0.0 {A3 E4 C#5}>
+        <music21.tree.verticality.Verticality 0.5 {G#3 B3 E4 B4}>
+        <music21.tree.verticality.Verticality 1.0 {F#3 C#4 F#4 A4}>
+
+        >>> v = list(scoreTree.iterateVerticalitiesAtTimePoints([6.25, 6.5]))[-1]
+        >>> v
+        <music21.tree.verticality.Verticality 6.5 {E3 D4 G#4 B4}>
+        >>> v.startTimespans
+        (<PitchedTimespan (6.5 to 7.0) <music21.note.Note D>>,)
+        >>> v.stopTimespans
+        (<PitchedTimespan (6.0 to 6.5) <music21.note.Note E>>,)
+        >>> v.overlapTimespans == scoreTree.getVerticalityAt(6.5).overlapTimespans
+        True
+
+        * New in v9.3.
+        '''
+        from music21.tree.verticality import Verticality
+
+        if timePoints is None:
+            timePoints = self.allTimePoints()
+
+        nodes = self.iterNodes()
+        node = next(nodes, None)
+        # timespans starting before the current offset that have not yet stopped,
+        # in the same order as in the tree.
+        activeTimespans = []
+        for offset in timePoints:
+            while node is not None and node.position < offset:
+                activeTimespans.extend(node.payload)
+                node = next(nodes, None)
+            if node is not None and node.position == offset:
+                startTimespans = tuple(node.payload)
+            else:
+                startTimespans = ()
+
+            overlapTimespans = []
+            stopTimespans = []
+            for timespan in activeTimespans:
+                endTime = timespan.endTime
+                if offset < endTime:
+                    overlapTimespans.append(timespan)
+                elif endTime == offset:
+                    stopTimespans.append(timespan)
+            activeTimespans = overlapTimespans
+            stopTimespans.extend(ts for ts in startTimespans if ts.endTime == offset)
+
+            yield Verticality(
+                offset=offset,
+                overlapTimespans=tuple(overlapTimespans),
+                startTimespans=startTimespans,
+                stopTimespans=tuple(stopTimespans),
+                timespanTree=self,
+            )
+
     def splitAt(self, offsets):
         r'''
         Splits all timespans in this TimespanTree at `offsets`, operating in
@@ -818,6 +1003,48 @@ class Test(unittest.TestCase):
         ps = v.pitchSet
         self.assertEqual(len(ps), 1)
 
+    def testInsertAndRemoveIncremental(self):
+        tsTree = TimespanTree()
+        present = []
+        for unused_counter in range(300):
+            if present and random.random() < 0.4:
+                span = present.pop(random.randrange(len(present)))
+                self.assertTrue(tsTree.removeIncremental(span))
+            else:
+                start = random.randrange(40) / 2
+                span = spans.Timespan(start, start + random.randrange(12) / 4)
+                tsTree.insertIncremental(span)
+                present.append(span)
+
+            # compare the cached endTimes with a full recomputation
+            cached = [(n.endTimeLow, n.endTimeHigh) for n in tsTree.iterNodes()]
+            if tsTree.rootNode is not None:
+                tsTree.rootNode.updateEndTimes()
+            self.assertEqual(cached, [(n.endTimeLow, n.endTimeHigh) for n in tsTree.iterNodes()])
+
+        self.assertEqual(len(tsTree), len(present))
+        rebuilt = TimespanTree()
+        rebuilt.insert(present)
+        self.assertEqual(list(tsTree), list(rebuilt))
+        for i, span in enumerate(tsTree):
+            self.assertIs(tsTree[i], span)
+            self.assertEqual(tsTree[tsTree.index(span)], span)
+        self.assertFalse(tsTree.removeIncremental(spans.Timespan(0, 1)))
+
+    def testIterateVerticalitiesAtTimePoints(self):
+        tsTree = TimespanTree()
+        for unused_counter in range(60):
+            start = random.randrange(20) / 2
+            tsTree.insert(spans.Timespan(start, start + random.randrange(8) / 4))
+        timePoints = sorted({-1.0, 3.125, 30.0}.union(tsTree.allTimePoints()))
+        for swept, timePoint in zip(tsTree.iterateVerticalitiesAtTimePoints(timePoints),
+                                    timePoints):
+            expected = tsTree.getVerticalityAt(timePoint)
+            self.assertEqual(swept.offset, timePoint)
+            self.assertEqual(swept.startTimespans, expected.startTimespans)
+            self.assertEqual(swept.overlapTimespans, expected.overlapTimespans)
+            self.assertEqual(swept.stopTimespans, expected.stopTimespans)
+
     def testTimespanTree(self):
         for attempt in range(100):
             starts = list(range(20))
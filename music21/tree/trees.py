@@ -102,6 +102,7 @@ class ElementTree(core.AVLTree):
     nodeClass = nodeModule.ElementNode
 
     __slots__ = (
+        '_indicesAreStale',
         '_source',
         'parentTrees',
     )
@@ -110,6 +111,7 @@ class ElementTree(core.AVLTree):
         super().__init__()
         self.parentTrees = weakref.WeakSet()
         self._source = None
+        self._indicesAreStale = False
         if elements and elements is not None:
             self.insert(elements)
 
@@ -273,6 +275,7 @@ class ElementTree(core.AVLTree):
         '''
         if self.rootNode is None:
             return 0
+        self._refreshIndices()
         return self.rootNode.subtreeElementsStopIndex
 
     def __repr__(self):
@@ -422,11 +425,24 @@ class ElementTree(core.AVLTree):
         if self.rootNode is not None:
             self.rootNode.updateIndices()
             self.rootNode.updateEndTimes()
+        self._indicesAreStale = False
 
         if (self.lowestPosition() != initialPosition
                 or self.endTime != initialEndTime):
             self._updateParents(initialPosition, visitedParents=visitedParents)
 
+    def _refreshIndices(self):
+        '''
+        Recomputes the element indices on the nodes if an incremental insert or
+        removal (see :meth:`~music21.tree.timespanTree.TimespanTree.insertIncremental`)
+        has left them out of date.  Called before anything that reads the indices.
+        '''
+        if not self._indicesAreStale:
+            return
+        if self.rootNode is not None:
+            self.rootNode.updateIndices()
+        self._indicesAreStale = False
+
     def _updateParents(self, oldPosition, visitedParents=None):
         '''
         Tells all parents that the position of this tree has
@@ -635,6 +651,7 @@ class ElementTree(core.AVLTree):
                 result.extend(recurseBySlice(node.rightChild, start, stop))
             return result
 
+        self._refreshIndices()
         if isinstance(i, int):
             if self.rootNode is None:
                 raise IndexError
@@ -731,6 +748,7 @@ class ElementTree(core.AVLTree):
                     return i
 
             raise ValueError(f'{element} not in Tree at position {position}.')
+        self._refreshIndices()
         return node.payloadElementIndex
 
     def _getPositionsFromElements(self, elements):
@@ -988,6 +1006,7 @@ class OffsetTree(ElementTree):
                 result.extend(recurseBySlice(node.rightChild, start, stop))
             return result
 
+        self._refreshIndices()
         if isinstance(i, int):
             if self.rootNode is None:
                 raise IndexError
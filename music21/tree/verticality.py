@@ -210,8 +210,11 @@ class Verticality(prebase.ProtoM21Object):
     ):
         from music21.tree import trees
         if timespanTree is not None and not isinstance(timespanTree, trees.OffsetTree):
-            raise VerticalityException(
-                f'timespanTree {timespanTree!r} is not a OffsetTree or None')
+            from music21.tree import staticTree
+            if not isinstance(timespanTree, staticTree.StaticTimespanTree):
+                raise VerticalityException(
+                    f'timespanTree {timespanTree!r} is not a OffsetTree, '
+                    + 'StaticTimespanTree, or None')
 
         self.timespanTree = timespanTree
         self.offset = offset
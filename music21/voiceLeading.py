@@ -2414,6 +2414,308 @@ class TwoChordLinearSegment(NChordLinearSegment):
         return interval.notesToChromatic(self.chordList[0].bass(), self.chordList[1].bass())
 
 
+# ------------------------------------------------------------------------------
+# Checking whole scores at once
+
+VOICE_LEADING_RULES = (
+    'parallelFifth',
+    'parallelOctave',
+    'parallelUnison',
+    'hiddenFifth',
+    'hiddenOctave',
+    'voiceCrossing',
+    'voiceOverlap',
+)
+
+
+class VoiceLeadingError(t.NamedTuple):
+    '''
+    One voice-leading error found by :func:`findVoiceLeadingErrors`: the
+    measure number (or None) and offset where it occurs, the voices
+    (numbered from 1, highest part first) and the name of the rule, which is
+    the name of the :class:`VoiceLeadingQuartet` method that would also find it.
+    '''
+    measure: int | None
+    offset: float
+    voices: tuple[int, int]
+    rule: str
+
+
+def getVoicePitchArrays(music21Stream):
+    '''
+    Returns the pitches of each Part of `music21Stream` as NumPy arrays sampled at every
+    offset where any part has an onset, for :func:`findVoiceLeadingErrorsInArrays`.
+
+    Returns a tuple of four arrays: the offsets, the measure number at each offset
+    (from the first part, or -1 where there is none), and two arrays of shape
+    (number of parts, number of offsets) giving the pitch space value (`ps`, NaN
+    where a part is resting) and diatonic note number (0 where resting) sounding in
+    each part at each offset.  Chords contribute their highest pitch.
+
+    >>> s = converter.parse('tinyNotation: 2/4 c2 d4 e4', makeNotation=False)
+    >>> sc = stream.Score([s, converter.parse('tinyNotation: 2/4 C4 r4 E2')])
+    >>> offsets, measures, ps, steps = voiceLeading.getVoicePitchArrays(sc)
+    >>> offsets
+    array([0., 1., 2., 3.])
+    >>> ps
+    array([[60., 60., 62., 64.],
+           [48., nan, 52., 52.]])
+    >>> steps
+    array([[29, 29, 30, 31],
+           [22,  0, 24, 24]])
+    >>> measures
+    array([-1, -1, -1, -1])
+
+    * New in v9.3.
+    '''
+    import numpy as np
+
+    parts = list(music21Stream.getElementsByClass('Stream'))
+    partData = []
+    for p in parts:
+        onsets = []
+        ends = []
+        pitchSpaces = []
+        diatonicNumbers = []
+        for n in p.flatten().notesAndRests:
+            offset = float(n.offset)
+            quarterLength = float(n.quarterLength)
+            if quarterLength == 0.0 or (onsets and onsets[-1] == offset):
+                continue  # grace notes, and later voices at the same offset
+            if n.isRest:
+                pitchSpaces.append(np.nan)
+                diatonicNumbers.append(0)
+            else:
+                highest = max(n.pitches)
+                pitchSpaces.append(highest.ps)
+                diatonicNumbers.append(highest.diatonicNoteNum)
+            onsets.append(offset)
+            ends.append(offset + quarterLength)
+        partData.append((np.array(onsets), np.array(ends),
+                         np.array(pitchSpaces, dtype=np.float64),
+                         np.array(diatonicNumbers, dtype=np.int64)))
+
+    if partData:
+        offsets = np.unique(np.concatenate([data[0] for data in partData]))
+    else:
+        offsets = np.array([], dtype=np.float64)
+    ps = np.full((len(parts), len(offsets)), np.nan)
+    steps = np.zeros((len(parts), len(offsets)), dtype=np.int64)
+    for i, (onsets, ends, pitchSpaces, diatonicNumbers) in enumerate(partData):
+        if not len(onsets):
+            continue
+        sounding = np.searchsorted(onsets, offsets, side='right') - 1
+        clipped = np.maximum(sounding, 0)
+        valid = (sounding >= 0) & (offsets < ends[clipped])
+        ps[i] = np.where(valid, pitchSpaces[clipped], np.nan)
+        steps[i] = np.where(valid & ~np.isnan(ps[i]), diatonicNumbers[clipped], 0)
+
+    measures = np.full(len(offsets), -1, dtype=np.int64)
+    if parts:
+        measureObjs = list(parts[0].getElementsByClass('Measure'))
+        if measureObjs:
+            measureOffsets = np.array([float(m.offset) for m in measureObjs])
+            measureNumbers = np.array([m.number for m in measureObjs], dtype=np.int64)
+            found = np.searchsorted(measureOffsets, offsets, side='right') - 1
+            measures = np.where(found >= 0, measureNumbers[np.maximum(found, 0)], -1)
+    return offsets, measures, ps, steps
+
+
+def _perfectIntervalFlags(ps, steps):
+    '''
+    Given the semitones and diatonic steps from the upper to the lower note of
+    intervals (as arrays), returns a dict of boolean arrays: whether each interval's
+    semiSimpleName is P1, P5 or P8, whether its simpleName is P1 or P5,
+    and its generic semiSimpleUndirected number under 'semiSimpleGeneric'.
+    '''
+    import numpy as np
+
+    undirected = np.abs(steps) + 1
+    # semitones measured in the direction of the generic interval
+    semitones = np.where(steps < 0, -ps, np.where(steps > 0, ps, np.abs(ps)))
+
+    simpleGeneric = (undirected - 1) % 7 + 1
+    simpleSemitones = semitones - 12 * ((undirected - 1) // 7)
+    semiSimpleGeneric = np.where(undirected <= 8, undirected, (undirected - 2) % 7 + 2)
+    semiSimpleSemitones = semitones - 12 * ((undirected - semiSimpleGeneric) // 7)
+    return {
+        'semiSimpleGeneric': semiSimpleGeneric,
+        'semiSimpleP1': (semiSimpleGeneric == 1) & (semiSimpleSemitones == 0),
+        'semiSimpleP5': (semiSimpleGeneric == 5) & (semiSimpleSemitones == 7),
+        'semiSimpleP8': (semiSimpleGeneric == 8) & (semiSimpleSemitones == 12),
+        'simpleP1': (simpleGeneric == 1) & (simpleSemitones == 0),
+        'simpleP5': (simpleGeneric == 5) & (simpleSemitones == 7),
+    }
+
+
+def findVoiceLeadingErrorsInArrays(
+    offsets,
+    ps,
+    steps,
+    measures=None,
+    *,
+    rules=VOICE_LEADING_RULES,
+    hiddenOuterVoicesOnly=True,
+) -> list[VoiceLeadingError]:
+    '''
+    Finds voice-leading errors in every pair of voices at once, given the
+    arrays returned by :func:`getVoicePitchArrays`: `ps` and `steps`
+    have one row per voice, highest first, and one column per offset.
+
+    Each rule gives the same answer as the :class:`VoiceLeadingQuartet` method
+    of the same name on the notes of two voices at two consecutive offsets,
+    except that `voiceCrossing` is reported at each offset where the voices are
+    crossed, and hidden fifths and octaves are only reported between the
+    highest and lowest voices unless `hiddenOuterVoicesOnly` is False.
+    Errors found between two offsets are reported at the second one.
+
+    Voices where either note is a rest are skipped.
+
+    >>> import numpy as np
+    >>> nan = np.nan
+    >>> ps = np.array([[67, 69, 67], [60, 62, nan]])
+    >>> steps = np.array([[32, 33, 32], [28, 29, 0]])
+    >>> for e in voiceLeading.findVoiceLeadingErrorsInArrays(np.array([0.0, 1.0, 2.0]), ps, steps):
+    ...     e
+    VoiceLeadingError(measure=None, offset=1.0, voices=(1, 2), rule='parallelFifth')
+
+    * New in v9.3.
+    '''
+    import numpy as np
+
+    ps = np.asarray(ps, dtype=np.float64)
+    steps = np.asarray(steps, dtype=np.int64)
+    offsets = np.asarray(offsets, dtype=np.float64)
+    unknownRules = set(rules) - set(VOICE_LEADING_RULES)
+    if unknownRules:
+        raise VoiceLeadingQuartetException(f'Unknown voice-leading rules: {sorted(unknownRules)}')
+    if ps.ndim != 2 or ps.shape[0] < 2 or ps.shape[1] == 0:
+        return []
+
+    numVoices = ps.shape[0]
+    upper, lower = np.triu_indices(numVoices, k=1)
+    sounding = ~np.isnan(ps)
+
+    # harmonic intervals, one row per pair of voices
+    harmonic = _perfectIntervalFlags(ps[lower] - ps[upper], steps[lower] - steps[upper])
+    bothSounding = sounding[upper] & sounding[lower]
+
+    # melodic motion of each voice from one offset to the next
+    melodicPs = ps[:, 1:] - ps[:, :-1]
+    stays = (steps[:, 1:] == steps[:, :-1]) & (melodicPs == 0)
+    direction = np.sign(melodicPs)
+
+    noMotion = stays[upper] & stays[lower]
+    oblique = ~noMotion & (stays[upper] | stays[lower])
+    sameDirection = direction[upper] == direction[lower]
+    similar = ~noMotion & sameDirection
+    contrary = ~noMotion & ~oblique & ~sameDirection
+    allSounding = bothSounding[:, :-1] & bothSounding[:, 1:]
+
+    def before(flag):
+        return harmonic[flag][:, :-1]
+
+    def after(flag):
+        return harmonic[flag][:, 1:]
+
+    parallel = similar & (before('semiSimpleGeneric') == after('semiSimpleGeneric'))
+    antiParallelOctave = contrary & before('simpleP1') & after('simpleP1')
+
+    consecutive = {}
+    if 'parallelFifth' in rules:
+        consecutive['parallelFifth'] = (
+            (parallel & before('semiSimpleP5') & after('semiSimpleP5'))
+            | (contrary & before('simpleP5') & after('simpleP5'))
+        )
+    if 'parallelOctave' in rules:
+        consecutive['parallelOctave'] = (
+            (parallel & before('semiSimpleP8') & after('semiSimpleP8'))
+            | antiParallelOctave
+        )
+    if 'parallelUnison' in rules:
+        consecutive['parallelUnison'] = (
+            (parallel & before('semiSimpleP1') & after('semiSimpleP1'))
+            | antiParallelOctave
+        )
+    hiddenPairs = np.ones(len(upper), dtype=bool)
+    if hiddenOuterVoicesOnly:
+        hiddenPairs = (upper == 0) & (lower == numVoices - 1)
+    if 'hiddenFifth' in rules:
+        consecutive['hiddenFifth'] = (
+            ~parallel & similar & after('simpleP5') & hiddenPairs[:, np.newaxis])
+    if 'hiddenOctave' in rules:
+        consecutive['hiddenOctave'] = (
+            ~parallel & similar & after('simpleP1') & hiddenPairs[:, np.newaxis])
+    if 'voiceOverlap' in rules:
+        consecutive['voiceOverlap'] = (
+            (ps[upper, 1:] < ps[lower, :-1]) | (ps[lower, 1:] > ps[upper, :-1]))
+
+    found = []
+    for rule, errors in consecutive.items():
+        pairIndices, offsetIndices = np.nonzero(errors & allSounding)
+        found.append((rule, pairIndices, offsetIndices + 1))
+    if 'voiceCrossing' in rules:
+        pairIndices, offsetIndices = np.nonzero(bothSounding & (ps[upper] < ps[lower]))
+        found.append(('voiceCrossing', pairIndices, offsetIndices))
+
+    ruleOrder = {rule: i for i, rule in enumerate(VOICE_LEADING_RULES)}
+    errorList = []
+    for rule, pairIndices, offsetIndices in found:
+        for pairIndex, offsetIndex in zip(pairIndices.tolist(), offsetIndices.tolist()):
+            measure = None
+            if measures is not None and measures[offsetIndex] >= 0:
+                measure = int(measures[offsetIndex])
+            errorList.append(VoiceLeadingError(
+                measure,
+                float(offsets[offsetIndex]),
+                (int(upper[pairIndex]) + 1, int(lower[pairIndex]) + 1),
+                rule,
+            ))
+    errorList.sort(key=lambda e: (e.offset, ruleOrder[e.rule], e.voices))
+    return errorList
+
+
+def findVoiceLeadingErrors(
+    music21Stream,
+    *,
+    rules=VOICE_LEADING_RULES,
+    hiddenOuterVoicesOnly=True,
+) -> list[VoiceLeadingError]:
+    '''
+    Finds voice-leading errors between the Parts of a Score (see
+    :func:`findVoiceLeadingErrorsInArrays` for the rules) with vectorized
+    interval arithmetic, without creating any :class:`VoiceLeadingQuartet`
+    or :class:`~music21.interval.Interval` objects, so that whole corpora can be
+    checked quickly.
+
+    >>> bach = corpus.parse('bwv66.6')
+    >>> errors = voiceLeading.findVoiceLeadingErrors(bach)
+    >>> for e in errors:
+    ...     print(e.measure, e.offset, e.voices, e.rule)
+    2 7.0 (1, 4) hiddenOctave
+    3 11.0 (1, 4) hiddenOctave
+    4 15.5 (3, 4) voiceOverlap
+    5 17.5 (2, 3) voiceOverlap
+    7 26.5 (2, 3) voiceCrossing
+    7 26.5 (2, 3) voiceOverlap
+    9 35.0 (1, 4) hiddenOctave
+
+    >>> voiceLeading.findVoiceLeadingErrors(bach, rules=('parallelFifth', 'voiceCrossing'))
+    [VoiceLeadingError(measure=7, offset=26.5, voices=(2, 3), rule='voiceCrossing')]
+
+    >>> hidden = voiceLeading.findVoiceLeadingErrors(bach, rules=('hiddenFifth',),
+    ...                                              hiddenOuterVoicesOnly=False)
+    >>> len(hidden)
+    6
+
+    * New in v9.3.
+    '''
+    offsets, measures, ps, steps = getVoicePitchArrays(music21Stream)
+    return findVoiceLeadingErrorsInArrays(offsets, ps, steps, measures,
+                                          rules=rules,
+                                          hiddenOuterVoicesOnly=hiddenOuterVoicesOnly)
+
+
 # ------------------------------------------------------------------------------
 
 class Test(unittest.TestCase):
@@ -2462,6 +2764,40 @@ class Test(unittest.TestCase):
         assert d.hiddenInterval(interval.Interval('A4')) is False
         assert d.hiddenInterval(interval.Interval('AA4')) is False
 
+    def testFindErrorsMatchesVoiceLeadingQuartet(self):
+        import random
+        import numpy as np
+
+        rng = random.Random(5)
+        names = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
+        accidentals = ['', '', '#', '-']
+        rules = ('parallelFifth', 'parallelOctave', 'parallelUnison',
+                 'hiddenFifth', 'hiddenOctave', 'voiceOverlap')
+
+        def randomPitch():
+            return pitch.Pitch(rng.choice(names) + rng.choice(accidentals)
+                               + str(rng.randint(2, 5)))
+
+        for unused_i in range(400):
+            pitches = [randomPitch() for unused_j in range(4)]
+            if rng.random() < 0.3:
+                # make perfect intervals and repeated notes common
+                pitches[2] = pitches[0].transpose(rng.choice(['-P5', '-P8', '-P12', 'P1']))
+                pitches[3] = pitches[1].transpose(rng.choice(['-P5', '-P8', '-P15', 'P1']))
+            v1n1, v1n2, v2n1, v2n2 = pitches
+            vlq = VoiceLeadingQuartet(v1n1, v1n2, v2n1, v2n2)
+            ps = np.array([[v1n1.ps, v1n2.ps], [v2n1.ps, v2n2.ps]])
+            steps = np.array([[v1n1.diatonicNoteNum, v1n2.diatonicNoteNum],
+                              [v2n1.diatonicNoteNum, v2n2.diatonicNoteNum]])
+            found = {e.rule for e in findVoiceLeadingErrorsInArrays(
+                np.array([0.0, 1.0]), ps, steps, rules=rules)}
+            for rule in rules:
+                self.assertEqual(rule in found, getattr(vlq, rule)(),
+                                 f'{rule} for {pitches}')
+
+        with self.assertRaises(VoiceLeadingQuartetException):
+            findVoiceLeadingErrorsInArrays(np.array([0.0]), ps, steps, rules=('nothing',))
+
 
 class TestExternal(unittest.TestCase):
     pass